@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Measure Cypher parse throughput over the openCypher TCK query corpus.
+
+Extracts every query from the TCK feature files (the docstring blocks after
+"executing query:" / "having executed:" steps), then parses the corpus with
+the Earley-only parser and with the LALR fast path, reporting queries per
+second, the speedup, and how many queries fell back to Earley.
+
+Usage:
+    python3 scripts/benchmark_parser.py [--features DIR] [--rounds N] [--check]
+
+    --check  also verify that both parsers produce identical ASTs
+
+The Earley baseline is slow (several minutes per round over the full corpus),
+so --rounds defaults to 1.
+
+Exits 1 if --check finds a mismatch, 0 otherwise.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+import time
+from typing import Any
+
+from graphforge.parser.parser import CypherParser, _get_lalr_parser
+
+DEFAULT_FEATURES = Path(__file__).resolve().parent.parent / "tests" / "tck" / "features"
+QUERY_STEPS = ("executing query:", "having executed:", "executing control query:")
+
+
+def extract_queries(features_dir: Path) -> list[str]:
+    """Collect the query docstrings from all .feature files under features_dir."""
+    queries: list[str] = []
+    for path in sorted(features_dir.rglob("*.feature")):
+        lines = path.read_text(encoding="utf-8").splitlines()
+        i = 0
+        while i < len(lines):
+            if lines[i].strip().endswith(QUERY_STEPS) and i + 1 < len(lines):
+                if lines[i + 1].strip() == '"""':
+                    body = []
+                    i += 2
+                    while i < len(lines) and lines[i].strip() != '"""':
+                        body.append(lines[i].strip())
+                        i += 1
+                    queries.append("\n".join(body))
+            i += 1
+    return queries
+
+
+def parses(parser: Any, query: str) -> bool:
+    """Return True if the query parses without error."""
+    try:
+        parser.parse(query)
+    except Exception:
+        return False
+    return True
+
+
+def time_corpus(parser: CypherParser, queries: list[str], rounds: int) -> float:
+    """Return the best wall-clock time to parse all queries once."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for query in queries:
+            parser.parse(query)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    arg_parser.add_argument("--features", type=Path, default=DEFAULT_FEATURES)
+    arg_parser.add_argument("--rounds", type=int, default=1)
+    arg_parser.add_argument("--check", action="store_true")
+    args = arg_parser.parse_args()
+
+    earley = CypherParser(use_lalr=False)
+    fast = CypherParser()
+
+    corpus = extract_queries(args.features)
+    # Benchmark only queries the Earley grammar accepts; the TCK corpus also
+    # contains syntax-error scenarios and features GraphForge does not support.
+    queries = [q for q in corpus if parses(earley, q)]
+
+    lalr = _get_lalr_parser()
+    fallbacks = sum(1 for query in queries if not parses(lalr, query))
+
+    mismatches = 0
+    if args.check:
+        for query in queries:
+            if earley.parse(query) != fast.parse(query):
+                mismatches += 1
+                print(f"AST mismatch:\n{query}\n")
+
+    earley_time = time_corpus(earley, queries, args.rounds)
+    fast_time = time_corpus(fast, queries, args.rounds)
+
+    print(f"Corpus:           {len(corpus)} queries ({len(queries)} parseable)")
+    print(f"LALR coverage:    {len(queries) - fallbacks}/{len(queries)} ({fallbacks} fall back)")
+    print(f"Earley only:      {earley_time:.3f}s ({len(queries) / earley_time:,.0f} queries/s)")
+    print(f"LALR + fallback:  {fast_time:.3f}s ({len(queries) / fast_time:,.0f} queries/s)")
+    print(f"Speedup:          {earley_time / fast_time:.1f}x")
+    if args.check:
+        print(f"AST mismatches:   {mismatches}")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
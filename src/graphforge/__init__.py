@@ -3,7 +3,7 @@
 This package provides an embedded graph database with openCypher query support.
 """
 
-from graphforge.api import GraphForge
+from graphforge.api import GraphForge, PreparedQuery, QueryResult
 
 __version__ = "0.3.4"
-__all__ = ["GraphForge"]
+__all__ = ["GraphForge", "PreparedQuery", "QueryResult"]
@@ -4,8 +4,10 @@ This module provides the main public interface for GraphForge.
 """
 
 from collections import defaultdict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 import copy
 import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +15,7 @@ from pydantic import BaseModel, Field, field_validator
 
 from graphforge.executor.executor import QueryExecutor
 from graphforge.optimizer.optimizer import QueryOptimizer
+from graphforge.optimizer.plan_cache import PlanCache
 from graphforge.parser.parser import CypherParser
 from graphforge.planner.planner import QueryPlanner
 from graphforge.storage.memory import Graph
@@ -31,6 +34,7 @@ from graphforge.types.values import (
     CypherPoint,
     CypherString,
     CypherTime,
+    CypherValue,
 )
 
 # Pydantic models for API validation
@@ -109,6 +113,177 @@ class DatasetNameInput(BaseModel):
     model_config = {"frozen": True}
 
 
+class QueryResult:
+    """Lazily produced result rows of a query, returned by execute_iter().
+
+    Rows are computed as they are pulled, so only the current row (or batch)
+    and the state of pipeline breakers such as ORDER BY are held in memory.
+    Closing the result stops execution and releases the executor pipeline;
+    it is closed automatically once exhausted or when used as a context
+    manager. Mutating the graph while a result is open is not supported.
+
+    Attributes:
+        batch_size: Number of rows per yielded batch, or None to yield
+            single rows
+
+    Examples:
+        >>> gf = GraphForge()
+        >>> for row in gf.execute_iter("UNWIND range(1, 3) AS i RETURN i"):
+        ...     print(row["i"])
+        >>> with gf.execute_iter("MATCH (n) RETURN n", batch_size=500) as batches:
+        ...     for batch in batches:
+        ...         export(batch)
+    """
+
+    def __init__(self, rows: Iterator[dict], batch_size: int | None = None):
+        """Wrap a row iterator.
+
+        Args:
+            rows: Iterator of result rows from QueryExecutor.execute_iter()
+            batch_size: Rows per yielded batch, or None for single rows
+
+        Raises:
+            ValueError: If batch_size is less than 1
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        self.batch_size = batch_size
+        self._rows: Iterator[dict] | None = rows
+
+    @property
+    def closed(self) -> bool:
+        """Whether the result has been exhausted or closed."""
+        return self._rows is None
+
+    def __iter__(self) -> "QueryResult":
+        """Return the result itself; rows can only be iterated once."""
+        return self
+
+    def __next__(self) -> dict | list[dict]:
+        """Return the next row, or the next batch of rows if batch_size is set.
+
+        Raises:
+            StopIteration: Once all rows have been produced or the result is closed
+        """
+        if self._rows is None:
+            raise StopIteration
+        try:
+            if self.batch_size is None:
+                return next(self._rows)
+            batch = list(islice(self._rows, self.batch_size))
+        except BaseException:
+            self.close()
+            raise
+        if not batch:
+            self.close()
+            raise StopIteration
+        return batch
+
+    def close(self) -> None:
+        """Stop execution and release the pipeline; further pulls produce nothing."""
+        rows, self._rows = self._rows, None
+        close = getattr(rows, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> "QueryResult":
+        """Enter a context that closes the result on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close the result."""
+        self.close()
+
+
+class PreparedQuery:
+    """A compiled query that can be executed repeatedly with different parameters.
+
+    Created by GraphForge.prepare(). The query is parsed, planned and optimized
+    once; each execute() call only binds parameter values and runs the plan.
+    When the optimizer is enabled, the plan is recompiled if the graph
+    statistics drift past the plan cache's threshold or a property index is
+    created or dropped.
+
+    Examples:
+        >>> gf = GraphForge()
+        >>> find = gf.prepare("MATCH (p:Person {name: $name}) RETURN p.age AS age")
+        >>> find.execute({"name": "Alice"})
+        >>> find.execute({"name": "Bob"})
+    """
+
+    def __init__(self, graphforge: "GraphForge", query: str):
+        """Compile a query for repeated execution.
+
+        Args:
+            graphforge: GraphForge instance the query runs against
+            query: openCypher query string
+        """
+        self._graphforge = graphforge
+        self.query = query
+        self._statistics = graphforge.graph.get_statistics() if graphforge.optimizer else None
+        self._index_version = graphforge.graph.index_version
+        self._operators = graphforge._compile(query)
+
+    def execute(self, params: dict[str, Any] | None = None) -> list[dict]:
+        """Execute the compiled plan.
+
+        Args:
+            params: Values for the $name parameters referenced by the query
+
+        Returns:
+            List of result rows as dictionaries
+
+        Raises:
+            TypeError: If params is not a dict with string keys, or a value
+                cannot be converted to a CypherValue
+            ValueError: If the query references a parameter missing from params
+        """
+        gf = self._graphforge
+        return gf.executor.execute(self._current_plan(), gf._convert_parameters(params))
+
+    def execute_iter(
+        self, params: dict[str, Any] | None = None, batch_size: int | None = None
+    ) -> QueryResult:
+        """Execute the compiled plan, producing result rows lazily.
+
+        As with GraphForge.execute_iter(), a plan with updating clauses is
+        executed in full before this method returns.
+
+        Args:
+            params: Values for the $name parameters referenced by the query
+            batch_size: Yield lists of up to this many rows instead of single rows
+
+        Returns:
+            QueryResult iterating over rows (or batches of rows)
+
+        Raises:
+            TypeError: If params is not a dict with string keys, or a value
+                cannot be converted to a CypherValue
+            ValueError: If batch_size is less than 1
+        """
+        gf = self._graphforge
+        parameters = gf._convert_parameters(params)
+        return QueryResult(gf.executor.execute_iter(self._current_plan(), parameters), batch_size)
+
+    def _current_plan(self) -> list:
+        """Return the compiled plan, recompiling it if it has gone stale."""
+        gf = self._graphforge
+        if gf.graph.index_version != self._index_version:
+            self._index_version = gf.graph.index_version
+            if self._statistics is not None:
+                self._statistics = gf.graph.get_statistics()
+            self._operators = gf._compile(self.query)
+        elif self._statistics is not None:
+            statistics = gf.graph.get_statistics()
+            if (
+                statistics is not self._statistics
+                and self._statistics.drift(statistics) > gf.plan_cache.drift_threshold
+            ):
+                self._statistics = statistics
+                self._operators = gf._compile(self.query)
+        return self._operators
+
+
 class GraphForge:
     """Main GraphForge interface for graph operations.
 
@@ -125,7 +300,13 @@ class GraphForge:
         >>> results = gf.execute("MATCH (p:Person) WHERE p.age > 25 RETURN p.name")
     """
 
-    def __init__(self, path: str | Path | None = None, enable_optimizer: bool = True):
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        enable_optimizer: bool = True,
+        plan_cache_size: int = 256,
+        scan_batch_size: int | None = None,
+    ):
         """Initialize GraphForge.
 
         Args:
@@ -135,9 +316,19 @@ class GraphForge:
             enable_optimizer: Enable query optimization (default: True).
                   When enabled, applies filter pushdown and predicate reordering
                   for better performance.
+            plan_cache_size: Maximum number of compiled query plans kept in the
+                  LRU plan cache (default: 256, 0 disables caching).
+            scan_batch_size: Enable batched execution of node scans with this
+                  many nodes per batch (default: None, row-at-a-time
+                  execution). Label scans and the filters and projection that
+                  follow them are evaluated a column at a time; 1024
+                  (graphforge.executor.batch.DEFAULT_SCAN_BATCH_SIZE) suits
+                  analytical queries over large scans. This does not batch
+                  results; see execute_iter(batch_size=...) for that.
 
         Raises:
-            ValueError: If path is empty string or whitespace only
+            ValueError: If path is empty string or whitespace only, or
+                scan_batch_size is less than 1
 
         Examples:
             >>> # In-memory graph (lost on exit)
@@ -153,6 +344,9 @@ class GraphForge:
 
             >>> # Disable optimizer for debugging
             >>> gf = GraphForge(enable_optimizer=False)
+
+            >>> # Batched scans for analytical queries
+            >>> gf = GraphForge(scan_batch_size=1024)
         """
         # Validate path if provided
         if path is not None:
@@ -178,15 +372,19 @@ class GraphForge:
         # Track if database has been closed
         self._closed = False
 
-        # Transaction state
+        # Transaction state (the undo log itself lives on the graph)
         self._in_transaction = False
-        self._transaction_snapshot = None
 
         # Initialize query execution components
         self.parser = CypherParser()
         self.planner = QueryPlanner()
         self.optimizer = QueryOptimizer() if enable_optimizer else None
-        self.executor = QueryExecutor(self.graph, graphforge=self, planner=self.planner)
+        self.executor = QueryExecutor(
+            self.graph, graphforge=self, planner=self.planner, scan_batch_size=scan_batch_size
+        )
+        self.plan_cache = PlanCache(max_size=plan_cache_size)
+        # Graph.index_version the cached plans were compiled against
+        self._plan_index_version = self.graph.index_version
 
     @classmethod
     def from_dataset(cls, name: str, path: str | Path | None = None) -> "GraphForge":
@@ -237,38 +435,193 @@ class GraphForge:
         """
         self.executor.custom_functions[name.upper()] = func
 
-    def execute(self, query: str) -> list[dict]:
+    def execute(self, query: str, params: dict[str, Any] | None = None) -> list[dict]:
         """Execute an openCypher query.
 
         Args:
             query: openCypher query string
+            params: Optional values for $name parameters referenced by the query.
+                Python values are converted to CypherValue types as in
+                create_node(); CypherValues, nodes and relationships are
+                passed through unchanged.
 
         Returns:
             List of result rows as dictionaries
 
         Raises:
-            ValueError: If query is empty or whitespace only
+            ValueError: If query is empty or whitespace only, or references a
+                parameter missing from params
+            TypeError: If params is not a dict with string keys, or a value
+                cannot be converted to a CypherValue
             pydantic.ValidationError: If query fails validation
 
         Examples:
             >>> gf = GraphForge()
             >>> results = gf.execute("MATCH (n) RETURN n LIMIT 10")
+            >>> results = gf.execute(
+            ...     "MATCH (p:Person) WHERE p.age > $min_age RETURN p.name",
+            ...     params={"min_age": 21},
+            ... )
         """
         # Validate query input
         QueryInput(query=query)
 
+        parameters = self._convert_parameters(params)
+        operators = self._compile(query)
+
+        # Execute
+        results = self.executor.execute(operators, parameters)
+
+        return results
+
+    def execute_iter(
+        self,
+        query: str,
+        params: dict[str, Any] | None = None,
+        batch_size: int | None = None,
+    ) -> QueryResult:
+        """Execute an openCypher query, producing result rows lazily.
+
+        Unlike execute(), rows are computed only as they are pulled, so large
+        results can be exported or paginated without holding every row in
+        memory, and a LIMIT-free scan stops as soon as the caller does. The
+        query is parsed and its parameters converted immediately; errors
+        raised while evaluating rows surface during iteration. Traversals
+        read adjacency lists in place, so adding or removing relationships
+        before the result is exhausted or closed makes the next pull raise
+        RuntimeError.
+
+        Queries with updating clauses (CREATE, MERGE, SET, REMOVE, DELETE,
+        CREATE/DROP INDEX) are executed in full before this method returns:
+        their writes are applied even if the result is never iterated or is
+        closed early, errors they raise surface here, and their RETURN rows
+        are buffered.
+
+        Args:
+            query: openCypher query string
+            params: Optional values for $name parameters referenced by the query
+            batch_size: Yield lists of up to this many rows instead of single rows
+
+        Returns:
+            QueryResult iterating over rows (or batches of rows). Close it, or
+            use it as a context manager, to stop early and release executor state.
+
+        Raises:
+            ValueError: If query is empty or whitespace only, or batch_size is
+                less than 1
+            TypeError: If params is not a dict with string keys, or a value
+                cannot be converted to a CypherValue
+            pydantic.ValidationError: If query fails validation
+
+        Examples:
+            >>> gf = GraphForge()
+            >>> for row in gf.execute_iter("MATCH (p:Person) RETURN p.name AS name"):
+            ...     print(row["name"])
+            >>> with gf.execute_iter("MATCH (n) RETURN n", batch_size=1000) as batches:
+            ...     first_page = next(batches)
+        """
+        QueryInput(query=query)
+
+        parameters = self._convert_parameters(params)
+        operators = self._compile(query)
+
+        return QueryResult(self.executor.execute_iter(operators, parameters), batch_size)
+
+    def prepare(self, query: str) -> PreparedQuery:
+        """Compile a query once for repeated execution with different parameters.
+
+        Args:
+            query: openCypher query string, typically referencing $name parameters
+
+        Returns:
+            PreparedQuery whose execute(params) runs the compiled plan
+
+        Raises:
+            ValueError: If query is empty or whitespace only
+            pydantic.ValidationError: If query fails validation
+            lark.exceptions.LarkError: If query has a syntax error
+
+        Examples:
+            >>> gf = GraphForge()
+            >>> add = gf.prepare("CREATE (:Person {name: $name, age: $age})")
+            >>> for name, age in [("Alice", 30), ("Bob", 25)]:
+            ...     add.execute({"name": name, "age": age})
+        """
+        QueryInput(query=query)
+        return PreparedQuery(self, query)
+
+    def _convert_parameters(self, params: dict[str, Any] | None) -> dict[str, Any]:
+        """Convert query parameter values to CypherValue types.
+
+        Args:
+            params: Parameter values keyed by name (without the $), or None
+
+        Returns:
+            Dict mapping parameter names to CypherValues, NodeRefs or EdgeRefs
+
+        Raises:
+            TypeError: If params is not a dict with string keys, or a value
+                cannot be converted
+        """
+        if params is None:
+            return {}
+        if not isinstance(params, dict):
+            raise TypeError(f"params must be a dict, got {type(params).__name__}")
+
+        parameters = {}
+        for name, value in params.items():
+            if not isinstance(name, str):
+                raise TypeError(f"Parameter names must be strings, got {type(name).__name__}")
+            if isinstance(value, (CypherValue, NodeRef, EdgeRef)):
+                parameters[name] = value
+            else:
+                parameters[name] = self._to_cypher_value(value)
+        return parameters
+
+    def _compile(self, query: str) -> list:
+        """Parse, plan and optimize a query, reusing cached plans when possible.
+
+        Plans are cached by normalized query text. When the optimizer is enabled,
+        a cached plan is recompiled once the graph statistics have drifted past
+        the plan cache's threshold since the plan was optimized. Creating or
+        dropping a property index invalidates every cached plan.
+
+        Args:
+            query: openCypher query string
+
+        Returns:
+            Optimized list of logical plan operators
+        """
+        if self.graph.index_version != self._plan_index_version:
+            self.plan_cache.invalidate_all()
+            self._plan_index_version = self.graph.index_version
+
+        statistics = self.graph.get_statistics() if self.optimizer else None
+        key = PlanCache.normalize(query)
+        cached = self.plan_cache.get(key, statistics)
+        if cached is not None:
+            return cached
+
         # Parse query
         ast = self.parser.parse(query)
 
+        # Give the optimizer the current statistics and property indexes
+        if self.optimizer:
+            self.optimizer.update_statistics(statistics)
+            indexes = self.graph.property_indexes()
+            self.optimizer.update_property_indexes(
+                [(index.label, index.property) for index in indexes],
+                ordered=[
+                    (index.label, index.property) for index in indexes if index.kind == "range"
+                ],
+            )
+
         # Check if this is a UNION query
         from graphforge.ast.query import UnionQuery
 
         if isinstance(ast, UnionQuery):
             # Handle UNION query: plan and optimize each branch separately
             branch_operators = []
-            # Update optimizer statistics for cost-based optimization
-            if self.optimizer:
-                self.optimizer.update_statistics(self.graph.get_statistics())
             for branch_ast in ast.branches:
                 branch_ops = self.planner.plan(branch_ast)
                 # Optimize each branch independently
@@ -287,13 +640,10 @@ class GraphForge:
 
             # Optimize query plan with current graph statistics
             if self.optimizer:
-                self.optimizer.update_statistics(self.graph.get_statistics())
                 operators = self.optimizer.optimize(operators)
 
-        # Execute
-        results = self.executor.execute(operators)
-
-        return results
+        self.plan_cache.put(key, operators, statistics)
+        return operators
 
     def create_node(self, labels: list[str] | None = None, **properties: Any) -> NodeRef:
         """Create a node with labels and properties.
@@ -425,6 +775,199 @@ class GraphForge:
 
         return edge
 
+    def create_nodes(
+        self,
+        nodes: Iterable[tuple[list[str] | None, Mapping[str, Any]]] | None = None,
+        *,
+        labels: list[str] | None = None,
+        columns: Mapping[str, Sequence[Any]] | None = None,
+    ) -> list[NodeRef]:
+        """Create many nodes in one batch.
+
+        Accepts either an iterable of ``(labels, properties)`` rows, or a
+        columnar batch where every node shares ``labels`` and ``columns`` maps
+        each property name to a sequence holding one value per node. Each
+        distinct label set is validated once per batch, and the graph's label
+        index and statistics are updated once at the end (see
+        Graph.add_nodes_bulk). Nothing is added if any row fails validation.
+
+        Args:
+            nodes: Iterable of (labels, properties) tuples
+            labels: Labels shared by every node of a columnar batch
+            columns: Property name -> equal-length sequence of values.
+                Values are converted to CypherValue types as in create_node().
+
+        Returns:
+            NodeRefs for the created nodes, in input order
+
+        Raises:
+            ValueError: If both or neither of nodes/columns are given, columns
+                have different lengths, or labels are invalid
+            pydantic.ValidationError: If labels fail validation
+            TypeError: If property values are unsupported types
+
+        Examples:
+            >>> gf = GraphForge()
+            >>> people = gf.create_nodes([(["Person"], {"name": "Alice"}), (["Person"], {})])
+            >>> cities = gf.create_nodes(
+            ...     labels=["City"], columns={"name": ["Paris", "Rome"], "pop": [2.1, 2.8]}
+            ... )
+        """
+        label_sets: dict[tuple[str, ...], frozenset[str]] = {}
+
+        def label_set(node_labels: Iterable[str] | None) -> frozenset[str]:
+            key = tuple(node_labels or ())
+            result = label_sets.get(key)
+            if result is None:
+                NodeInput(labels=list(key))
+                result = label_sets[key] = frozenset(key)
+            return result
+
+        convert = self._to_cypher_value
+        next_id = self._next_node_id
+        created: list[NodeRef] = []
+
+        if columns is not None:
+            if nodes is not None:
+                raise ValueError("Pass either nodes or columns, not both")
+            names = list(columns)
+            lengths = {len(columns[name]) for name in names}
+            if len(lengths) > 1:
+                raise ValueError("All columns must have the same length")
+            shared_labels = label_set(labels)
+            converted = [[convert(value) for value in columns[name]] for name in names]
+            for offset, values in enumerate(zip(*converted, strict=True)):
+                created.append(
+                    NodeRef(
+                        id=next_id + offset,
+                        labels=shared_labels,
+                        properties=dict(zip(names, values, strict=True)),
+                    )
+                )
+        else:
+            if nodes is None:
+                raise ValueError("Either nodes or columns must be provided")
+            if labels is not None:
+                raise ValueError("labels applies only to columnar batches")
+            for offset, (node_labels, properties) in enumerate(nodes):
+                created.append(
+                    NodeRef(
+                        id=next_id + offset,
+                        labels=label_set(node_labels),
+                        properties={key: convert(value) for key, value in properties.items()},
+                    )
+                )
+
+        self.graph.add_nodes_bulk(created)
+        self._next_node_id = next_id + len(created)
+        return created
+
+    def create_relationships(
+        self,
+        relationships: Iterable[tuple] | None = None,
+        *,
+        rel_type: str | None = None,
+        src: Sequence[NodeRef] | None = None,
+        dst: Sequence[NodeRef] | None = None,
+        columns: Mapping[str, Sequence[Any]] | None = None,
+    ) -> list[EdgeRef]:
+        """Create many relationships in one batch.
+
+        Accepts either an iterable of ``(src, dst, rel_type)`` or
+        ``(src, dst, rel_type, properties)`` rows, or a columnar batch of one
+        ``rel_type`` with parallel ``src``/``dst`` node sequences and optional
+        property ``columns``. Each distinct type is validated once per batch,
+        and the graph's type index and statistics are updated once at the end
+        (see Graph.add_edges_bulk). Nothing is added if any row fails validation.
+
+        Args:
+            relationships: Iterable of (src, dst, rel_type[, properties]) tuples
+            rel_type: Relationship type of every edge in a columnar batch
+            src: Source nodes of a columnar batch
+            dst: Destination nodes of a columnar batch (same length as src)
+            columns: Property name -> sequence with one value per relationship.
+                Values are converted to CypherValue types as in create_node().
+
+        Returns:
+            EdgeRefs for the created relationships, in input order
+
+        Raises:
+            ValueError: If both or neither batch forms are given, sequences have
+                different lengths, rel_type is invalid, or an endpoint is not
+                in the graph
+            TypeError: If an endpoint is not a NodeRef or a property value is
+                an unsupported type
+            pydantic.ValidationError: If rel_type fails validation
+
+        Examples:
+            >>> gf = GraphForge()
+            >>> a, b, c = gf.create_nodes(labels=["Person"], columns={"n": [1, 2, 3]})
+            >>> gf.create_relationships([(a, b, "KNOWS", {"since": 2020}), (b, c, "KNOWS")])
+            >>> gf.create_relationships(
+            ...     rel_type="LIKES", src=[a, b], dst=[c, c], columns={"score": [0.5, 0.9]}
+            ... )
+        """
+        validated_types: set[str] = set()
+
+        def check(edge_src: Any, edge_dst: Any, edge_type: str) -> None:
+            if not isinstance(edge_src, NodeRef):
+                raise TypeError(f"src must be a NodeRef, got {type(edge_src).__name__}")
+            if not isinstance(edge_dst, NodeRef):
+                raise TypeError(f"dst must be a NodeRef, got {type(edge_dst).__name__}")
+            if edge_type not in validated_types:
+                RelationshipInput(rel_type=edge_type)
+                validated_types.add(edge_type)
+
+        convert = self._to_cypher_value
+        next_id = self._next_edge_id
+        created: list[EdgeRef] = []
+
+        if src is not None or dst is not None or rel_type is not None:
+            if relationships is not None:
+                raise ValueError("Pass either relationships or rel_type/src/dst, not both")
+            if rel_type is None or src is None or dst is None:
+                raise ValueError("Columnar batches require rel_type, src and dst")
+            property_columns = columns or {}
+            names = list(property_columns)
+            lengths = {len(src), len(dst)} | {len(property_columns[name]) for name in names}
+            if len(lengths) > 1:
+                raise ValueError("src, dst and all columns must have the same length")
+            converted = [[convert(value) for value in property_columns[name]] for name in names]
+            rows = zip(*converted, strict=True) if names else [()] * len(src)
+            for offset, (edge_src, edge_dst, values) in enumerate(zip(src, dst, rows, strict=True)):
+                check(edge_src, edge_dst, rel_type)
+                created.append(
+                    EdgeRef(
+                        id=next_id + offset,
+                        type=rel_type,
+                        src=edge_src,
+                        dst=edge_dst,
+                        properties=dict(zip(names, values, strict=True)),
+                    )
+                )
+        else:
+            if relationships is None:
+                raise ValueError("Either relationships or rel_type/src/dst must be provided")
+            if columns is not None:
+                raise ValueError("columns applies only to columnar batches")
+            for offset, row in enumerate(relationships):
+                edge_src, edge_dst, edge_type, *rest = row
+                properties = rest[0] if rest else {}
+                check(edge_src, edge_dst, edge_type)
+                created.append(
+                    EdgeRef(
+                        id=next_id + offset,
+                        type=edge_type,
+                        src=edge_src,
+                        dst=edge_dst,
+                        properties={key: convert(value) for key, value in properties.items()},
+                    )
+                )
+
+        self.graph.add_edges_bulk(created)
+        self._next_edge_id = next_id + len(created)
+        return created
+
     def _to_cypher_value(self, value):
         """Convert Python value to CypherValue type.
 
@@ -524,8 +1067,9 @@ class GraphForge:
     def begin(self):
         """Begin an explicit transaction.
 
-        Starts a new transaction by taking a snapshot of the current graph state.
-        Changes made after begin() can be committed or rolled back.
+        Starts a new transaction. The graph records the inverse of each change
+        in an undo log, so begin() is O(1) regardless of graph size. Changes
+        made after begin() can be committed or rolled back.
 
         Raises:
             RuntimeError: If already in a transaction
@@ -543,15 +1087,58 @@ class GraphForge:
         if self._in_transaction:
             raise RuntimeError("Already in a transaction. Commit or rollback first.")
 
-        # Take snapshot of current state
-        self._transaction_snapshot = self.graph.snapshot()  # type: ignore[assignment]
+        self.graph.begin_transaction()
         self._in_transaction = True
 
+    def savepoint(self) -> int:
+        """Mark a point in the current transaction to roll back to.
+
+        Savepoints are O(1) and can be nested: rolling back to an earlier
+        savepoint also discards every later one.
+
+        Returns:
+            Savepoint to pass to rollback_to_savepoint()
+
+        Raises:
+            RuntimeError: If not in a transaction
+
+        Examples:
+            >>> gf = GraphForge()
+            >>> gf.begin()
+            >>> alice = gf.create_node(['Person'], name='Alice')
+            >>> sp = gf.savepoint()
+            >>> bob = gf.create_node(['Person'], name='Bob')
+            >>> gf.rollback_to_savepoint(sp)  # Bob is removed, Alice stays
+            >>> gf.commit()
+        """
+        if not self._in_transaction:
+            raise RuntimeError("Not in a transaction. Call begin() first.")
+
+        return self.graph.savepoint()
+
+    def rollback_to_savepoint(self, savepoint: int) -> None:
+        """Revert changes made since a savepoint, keeping the transaction open.
+
+        Only the graph is reverted; nothing is written to the database until
+        commit().
+
+        Args:
+            savepoint: Savepoint returned by savepoint()
+
+        Raises:
+            RuntimeError: If not in a transaction
+            ValueError: If the savepoint was already rolled back past
+        """
+        if not self._in_transaction:
+            raise RuntimeError("Not in a transaction. Call begin() first.")
+
+        self.graph.rollback_to_savepoint(savepoint)
+
     def commit(self):
         """Commit the current transaction.
 
         Saves all changes made since begin() to the database (if using persistence).
-        Clears the transaction snapshot.
+        Discards the transaction's undo log.
 
         Raises:
             RuntimeError: If not in a transaction
@@ -570,13 +1157,14 @@ class GraphForge:
             self._save_graph_to_backend()
 
         # Clear transaction state
+        self.graph.commit_transaction()
         self._in_transaction = False
-        self._transaction_snapshot = None
 
     def rollback(self):
         """Roll back the current transaction.
 
-        Reverts all changes made since begin() by restoring the snapshot.
+        Reverts all changes made since begin() by replaying the undo log, so
+        only the elements touched by the transaction are visited.
         Works for both in-memory and persistent graphs.
 
         Raises:
@@ -595,8 +1183,8 @@ class GraphForge:
         if not self._in_transaction:
             raise RuntimeError("Not in a transaction. Call begin() first.")
 
-        # Restore graph from snapshot
-        self.graph.restore(self._transaction_snapshot)  # type: ignore[arg-type]
+        # Revert the graph changes
+        self.graph.rollback_transaction()
 
         # Rollback SQLite transaction if using persistence
         if self.backend:
@@ -604,7 +1192,6 @@ class GraphForge:
 
         # Clear transaction state
         self._in_transaction = False
-        self._transaction_snapshot = None
 
     def close(self):
         """Save graph and close database.
@@ -663,7 +1250,7 @@ class GraphForge:
                 "Use in-memory instances only (GraphForge() without path)."
             )
 
-        # Reset graph data
+        # Reset graph data (also discards any open transaction)
         self.graph.clear()
 
         # Reset ID counters
@@ -672,19 +1259,22 @@ class GraphForge:
 
         # Reset transaction state
         self._in_transaction = False
-        self._transaction_snapshot = None
 
         # Clear any custom functions registered on the executor
         self.executor.custom_functions.clear()
 
+        # Drop cached plans compiled against the old graph
+        self.plan_cache.clear()
+
     def clone(self) -> "GraphForge":
         """Create a deep copy of this GraphForge instance.
 
         Creates a new GraphForge instance with a deep copy of graph state
         (nodes, edges, properties, indexes, ID counters) and fresh
         CypherParser, QueryPlanner, QueryOptimizer, and QueryExecutor
-        instances.  Only the compiled Lark grammar is shared, via the
-        module-level ``@lru_cache`` on ``_get_lark_parser``.
+        instances.  Only the compiled Lark grammars are shared, via the
+        module-level ``@lru_cache`` on ``_get_lark_parser`` and
+        ``_get_lalr_parser``.
 
         Returns:
             GraphForge: A new instance with copied graph state
@@ -715,20 +1305,25 @@ class GraphForge:
         # Create new instance with same configuration
         cloned = GraphForge(
             enable_optimizer=self.optimizer is not None,
+            plan_cache_size=self.plan_cache.max_size,
+            scan_batch_size=self.executor.scan_batch_size,
         )
 
-        # Manually copy graph state (deepcopy doesn't work well with defaultdicts)
-        cloned.graph._nodes = copy.deepcopy(self.graph._nodes)
-        cloned.graph._edges = copy.deepcopy(self.graph._edges)
+        # Manually copy graph state (deepcopy doesn't work well with defaultdicts).
+        # A shared memo keeps every reference to an element (adjacency lists,
+        # edge endpoints, undo log entries) pointing at the same copy.
+        memo: dict[int, Any] = {}
+        cloned.graph._nodes = copy.deepcopy(self.graph._nodes, memo)
+        cloned.graph._edges = copy.deepcopy(self.graph._edges, memo)
 
         # Copy adjacency lists
-        cloned.graph._outgoing = defaultdict(list)
-        for node_id, edges in self.graph._outgoing.items():
-            cloned.graph._outgoing[node_id] = copy.deepcopy(edges)
+        cloned.graph._outgoing = defaultdict(dict)
+        for node_id, buckets in self.graph._outgoing.items():
+            cloned.graph._outgoing[node_id] = copy.deepcopy(buckets, memo)
 
-        cloned.graph._incoming = defaultdict(list)
-        for node_id, edges in self.graph._incoming.items():
-            cloned.graph._incoming[node_id] = copy.deepcopy(edges)
+        cloned.graph._incoming = defaultdict(dict)
+        for node_id, buckets in self.graph._incoming.items():
+            cloned.graph._incoming[node_id] = copy.deepcopy(buckets, memo)
 
         # Copy indexes
         cloned.graph._label_index = defaultdict(set)
@@ -739,8 +1334,14 @@ class GraphForge:
         for edge_type, edge_ids in self.graph._type_index.items():
             cloned.graph._type_index[edge_type] = copy.copy(edge_ids)
 
+        # Property indexes hold node IDs only; the memo keeps the index
+        # objects referenced by undo log entries pointing at these copies
+        cloned.graph._property_indexes = copy.deepcopy(self.graph._property_indexes, memo)
+        cloned.graph._index_version = self.graph._index_version
+
         # Copy statistics
         cloned.graph._statistics = copy.deepcopy(self.graph._statistics)
+        cloned.graph._statistics_counters = self.graph._statistics_counters.copy()
 
         # Copy ID counters
         cloned._next_node_id = self._next_node_id
@@ -748,9 +1349,7 @@ class GraphForge:
 
         # Copy transaction state (should be False/None in typical usage)
         cloned._in_transaction = self._in_transaction
-        cloned._transaction_snapshot = (
-            copy.deepcopy(self._transaction_snapshot) if self._transaction_snapshot else None
-        )
+        cloned.graph._undo_log = copy.deepcopy(self.graph._undo_log, memo)
 
         # Note: Custom functions are intentionally NOT copied. Each clone gets
         # its own executor instance; custom functions must be re-registered on
@@ -758,58 +1357,112 @@ class GraphForge:
 
         return cloned
 
-    def _load_graph_from_backend(self) -> Graph:
-        """Load graph from SQLite backend.
+    def freeze(self) -> "GraphForge":
+        """Create a read-only instance over a CSR snapshot of this graph.
+
+        The returned instance runs read queries against a CSRGraph built by
+        Graph.freeze(), which keeps adjacency in flat integer arrays and uses
+        a fraction of the memory. Queries that write raise RuntimeError.
+        Property indexes are not carried over, so lookups that used them
+        scan by label instead.
+
+        The snapshot shares nodes and property maps with this instance but
+        not structure: nodes and relationships created or deleted here later
+        are not seen by it.
 
         Returns:
-            Graph instance populated with nodes and edges from database
-        """
-        assert self.backend is not None
-        graph = Graph()
+            GraphForge: A new read-only instance
 
-        # Load all nodes
-        nodes = self.backend.load_all_nodes()
-        node_map = {}  # Map node_id to NodeRef
+        Raises:
+            RuntimeError: If the instance has been closed
 
-        for node in nodes:
-            graph.add_node(node)
-            node_map[node.id] = node
+        Examples:
+            >>> gf = GraphForge()
+            >>> gf.execute("CREATE (:Person {name: 'Alice'})-[:KNOWS]->(:Person)")
+            >>> frozen = gf.freeze()
+            >>> frozen.execute("MATCH ()-[r:KNOWS]->() RETURN count(r) AS c")[0]['c'].value
+            1
+        """
+        if self._closed:
+            raise RuntimeError("Cannot freeze a closed GraphForge instance")
 
-        # Load all edges (returns dict of edge data)
-        edges_data = self.backend.load_all_edges()
+        frozen = GraphForge(
+            enable_optimizer=self.optimizer is not None,
+            plan_cache_size=self.plan_cache.max_size,
+            scan_batch_size=self.executor.scan_batch_size,
+        )
+        frozen.graph = self.graph.freeze()  # type: ignore[assignment]
+        frozen.executor = QueryExecutor(
+            frozen.graph,
+            graphforge=frozen,
+            planner=frozen.planner,
+            scan_batch_size=self.executor.scan_batch_size,
+        )
+        frozen._plan_index_version = frozen.graph.index_version
+        return frozen
 
-        # Reconstruct EdgeRef instances with actual NodeRef objects
-        for edge_id, (edge_type, src_id, dst_id, properties) in edges_data.items():
-            src_node = node_map[src_id]
-            dst_node = node_map[dst_id]
+    def _load_graph_from_backend(self) -> Graph:
+        """Load graph from SQLite backend.
 
-            edge = EdgeRef(
-                id=edge_id,
-                type=edge_type,
-                src=src_node,
-                dst=dst_node,
-                properties=properties,
-            )
+        Rows are streamed in batches straight into Graph.load_elements(), and
+        the persisted statistics are used instead of being recomputed.
 
-            graph.add_edge(edge)
+        Returns:
+            Graph instance populated with nodes and edges from database
+        """
+        assert self.backend is not None
+        graph = Graph()
+        node_map = graph._nodes
+
+        # Edges are only built once every node is loaded into node_map
+        graph.load_elements(
+            nodes=(node for batch in self.backend.iter_node_batches() for node in batch),
+            edges=(
+                EdgeRef(
+                    id=edge_id,
+                    type=edge_type,
+                    src=node_map[src_id],
+                    dst=node_map[dst_id],
+                    properties=properties,
+                )
+                for batch in self.backend.iter_edge_batches()
+                for edge_id, edge_type, src_id, dst_id, properties in batch
+            ),
+            statistics=self.backend.load_statistics(),
+        )
+        for name, label, property_name, kind in self.backend.load_property_indexes():
+            graph.create_property_index(label, property_name, name=name, kind=kind)
 
-        # Load statistics
-        loaded_stats = self.backend.load_statistics()
-        if loaded_stats is not None:
-            graph._statistics = loaded_stats
+        # Everything loaded is already persisted; track only later changes
+        graph.enable_change_tracking()
 
         return graph
 
     def _save_graph_to_backend(self):
-        """Save graph to SQLite backend."""
-        assert self.backend is not None
-        # Save all nodes
-        for node in self.graph.get_all_nodes():
-            self.backend.save_node(node)
+        """Save the changes made since the last save to the SQLite backend.
 
-        # Save all edges
-        for edge in self.graph.get_all_edges():
-            self.backend.save_edge(edge)
+        Only elements written or deleted since the last save are touched, so
+        the cost scales with the size of the change, not the graph.
+        """
+        assert self.backend is not None
+        changes = self.graph.take_changes()
+        if not changes:
+            return
+
+        # Deletes first: edges before the nodes they reference
+        self.backend.delete_edges(changes.deleted_edges)
+        self.backend.delete_nodes(changes.deleted_nodes)
+
+        # Then upserts: nodes before the edges that reference them
+        nodes = self.graph._nodes
+        edges = self.graph._edges
+        self.backend.save_nodes(nodes[node_id] for node_id in changes.nodes)
+        self.backend.save_edges(edges[edge_id] for edge_id in changes.edges)
+        if changes.indexes_changed:
+            self.backend.save_property_indexes(
+                (index.name, index.label, index.property, index.kind)
+                for index in self.graph.property_indexes()
+            )
 
         # Save statistics
         stats = self.graph.get_statistics()
@@ -18,6 +18,7 @@ from graphforge.ast.clause import (
 from graphforge.ast.expression import (
     BinaryOp,
     Literal,
+    Parameter,
     PropertyAccess,
     Subscript,
     UnaryOp,
@@ -38,6 +39,7 @@ __all__ = [
     "MatchClause",
     "MergeClause",
     "NodePattern",
+    "Parameter",
     "PropertyAccess",
     "RelationshipPattern",
     "ReturnClause",
@@ -15,11 +15,15 @@ This module defines the major query clauses:
 - WithClause: WITH query chaining
 - LimitClause: LIMIT row count
 - SkipClause: SKIP offset
+- CreateIndexClause: CREATE INDEX property index declaration
+- DropIndexClause: DROP INDEX property index removal
 """
 
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from graphforge.ast.expression import Parameter
 
 
 class MatchClause(BaseModel):
@@ -234,9 +238,18 @@ class LimitClause(BaseModel):
         LIMIT 10
         LIMIT 100
         LIMIT 0  (valid - returns no rows)
+        LIMIT $pageSize  (resolved when the query runs)
     """
 
-    count: int = Field(..., ge=0, description="Maximum number of rows")
+    count: int | Parameter = Field(..., description="Maximum number of rows")
+
+    @field_validator("count")
+    @classmethod
+    def validate_count(cls, v: int | Parameter) -> int | Parameter:
+        """Validate a literal count is non-negative."""
+        if isinstance(v, int) and v < 0:
+            raise ValueError(f"LIMIT count must be non-negative, got {v}")
+        return v
 
     model_config = {"frozen": True}
 
@@ -247,9 +260,18 @@ class SkipClause(BaseModel):
     Examples:
         SKIP 5
         SKIP 20
+        SKIP $offset  (resolved when the query runs)
     """
 
-    count: int = Field(..., ge=0, description="Number of rows to skip")
+    count: int | Parameter = Field(..., description="Number of rows to skip")
+
+    @field_validator("count")
+    @classmethod
+    def validate_count(cls, v: int | Parameter) -> int | Parameter:
+        """Validate a literal count is non-negative."""
+        if isinstance(v, int) and v < 0:
+            raise ValueError(f"SKIP count must be non-negative, got {v}")
+        return v
 
     model_config = {"frozen": True}
 
@@ -300,6 +322,27 @@ class CallClause(BaseModel):
     model_config = {"frozen": True, "arbitrary_types_allowed": True}
 
 
+class ProcedureCallClause(BaseModel):
+    """CALL clause invoking a procedure.
+
+    Each output record of the procedure becomes a row. YIELD selects (and
+    optionally renames) the output fields to bind; without YIELD, every field
+    is bound under its own name.
+
+    Examples:
+        CALL graphforge.shortestPath.dijkstra(a, b, {weightProperty: 'cost'})
+        CALL graphforge.shortestPath.singleSource(a) YIELD node, cost AS distance
+    """
+
+    name: str = Field(..., min_length=1, description="Dotted procedure name")
+    arguments: list[Any] = Field(default_factory=list, description="Argument expressions")
+    yield_items: list[tuple[str, str]] | None = Field(
+        default=None, description="(field, alias) pairs to bind, None for all fields"
+    )
+
+    model_config = {"frozen": True, "arbitrary_types_allowed": True}
+
+
 class WithClause(BaseModel):
     """WITH clause for query chaining and subqueries.
 
@@ -321,3 +364,46 @@ class WithClause(BaseModel):
     limit: "LimitClause | None" = Field(default=None, description="Optional LIMIT")
 
     model_config = {"frozen": True}
+
+
+class CreateIndexClause(BaseModel):
+    """CREATE INDEX clause declaring a property index on a node label.
+
+    Examples:
+        CREATE INDEX FOR (p:Person) ON (p.name)
+        CREATE INDEX person_name IF NOT EXISTS FOR (p:Person) ON (p.name)
+        CREATE INDEX ON :Person(name)
+        CREATE RANGE INDEX FOR (e:Event) ON (e.ts)
+    """
+
+    label: str = Field(..., min_length=1, description="Indexed node label")
+    property: str = Field(..., min_length=1, description="Indexed property name")
+    name: str | None = Field(default=None, description="Index name (generated if omitted)")
+    if_not_exists: bool = Field(default=False, description="True for IF NOT EXISTS")
+    kind: str = Field(default="hash", description="Index kind: 'hash' or 'range'")
+
+    model_config = {"frozen": True}
+
+
+class DropIndexClause(BaseModel):
+    """DROP INDEX clause removing a property index by name or by label/property.
+
+    Examples:
+        DROP INDEX person_name
+        DROP INDEX person_name IF EXISTS
+        DROP INDEX ON :Person(name)
+    """
+
+    name: str | None = Field(default=None, description="Index name")
+    label: str | None = Field(default=None, description="Indexed node label")
+    property: str | None = Field(default=None, description="Indexed property name")
+    if_exists: bool = Field(default=False, description="True for IF EXISTS")
+
+    @model_validator(mode="after")
+    def validate_target(self) -> "DropIndexClause":
+        """Ensure the index is identified by name or by label and property."""
+        if self.name is None and (self.label is None or self.property is None):
+            raise ValueError("DROP INDEX requires an index name or a label and property")
+        return self
+
+    model_config = {"frozen": True}
@@ -65,6 +65,30 @@ class Variable(BaseModel):
     model_config = {"frozen": True}
 
 
+class Parameter(BaseModel):
+    """Query parameter reference expression.
+
+    Parameters are written ``$name`` (or positionally, ``$0``) and are bound
+    to values supplied at execution time, so a single compiled plan can be
+    reused for different values.
+
+    Examples:
+        Parameter(name="name"), Parameter(name="0")
+    """
+
+    name: str = Field(..., min_length=1, description="Parameter name (without the $)")
+
+    @field_validator("name")
+    @classmethod
+    def validate_name(cls, v: str) -> str:
+        """Validate parameter name format."""
+        if not v.replace("_", "").isalnum():
+            raise ValueError(f"Parameter name must contain only alphanumeric and underscore: {v}")
+        return v
+
+    model_config = {"frozen": True}
+
+
 class PropertyAccess(BaseModel):
     """Property access expression.
 
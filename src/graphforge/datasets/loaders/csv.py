@@ -87,7 +87,8 @@ class CSVLoader(DatasetLoader):
             gf: GraphForge instance
             file: File handle to read from
         """
-        node_cache = {}  # Cache node IDs to avoid duplicate creates
+        node_ids: dict[str, int] = {}  # Node ID -> position in creation order
+        edges: list[tuple[str, str, float | None]] = []
         delimiter = None  # Auto-detect delimiter
         skip_next_line = False  # Flag to skip MTX dimension line after comments
 
@@ -137,22 +138,22 @@ class CSVLoader(DatasetLoader):
                 except ValueError as e:
                     raise ValueError(f"Invalid weight at line {line_num}: {e}") from e
 
-            # Create or get source node
-            if source_id not in node_cache:
-                node_cache[source_id] = gf.create_node(["Node"], id=source_id)
-
-            # Create or get target node
-            if target_id not in node_cache:
-                node_cache[target_id] = gf.create_node(["Node"], id=target_id)
-
-            # Create edge
-            edge_props = {}
-            if weight is not None:
-                edge_props["weight"] = weight
-
-            gf.create_relationship(
-                node_cache[source_id], node_cache[target_id], "CONNECTED_TO", **edge_props
+            # Register source and target nodes in first-seen order
+            node_ids.setdefault(source_id, len(node_ids))
+            node_ids.setdefault(target_id, len(node_ids))
+            edges.append((source_id, target_id, weight))
+
+        # Create all nodes, then all edges, in two bulk batches
+        nodes = gf.create_nodes(labels=["Node"], columns={"id": list(node_ids)})
+        gf.create_relationships(
+            (
+                nodes[node_ids[source_id]],
+                nodes[node_ids[target_id]],
+                "CONNECTED_TO",
+                {} if weight is None else {"weight": weight},
             )
+            for source_id, target_id, weight in edges
+        )
 
     def _detect_delimiter(self, line: str) -> str:
         """Detect the delimiter used in the CSV file.
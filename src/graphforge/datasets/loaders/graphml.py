@@ -191,15 +191,18 @@ class GraphMLLoader(DatasetLoader):
         Raises:
             ValueError: If duplicate node IDs found
         """
-        node_map = {}
+        node_ids: list[str] = []
+        rows: list[tuple[list[str], dict[str, Any]]] = []
+        seen: set[str] = set()
 
         for node_elem in graph.findall("graphml:node" if ns else "node", ns):
             node_id = node_elem.get("id")
             if not node_id:
                 continue
 
-            if node_id in node_map:
+            if node_id in seen:
                 raise ValueError(f"Duplicate node ID: {node_id}")
+            seen.add(node_id)
 
             # Parse properties
             properties = self._parse_data_elements(node_elem, keys, "node", ns)
@@ -211,9 +214,11 @@ class GraphMLLoader(DatasetLoader):
             if self.label_key in properties:
                 del properties[self.label_key]
 
-            # Create node
-            node_ref = gf.create_node(labels, **properties)
-            node_map[node_id] = node_ref
+            node_ids.append(node_id)
+            rows.append((labels, properties))
+
+        # Create all nodes in one batch
+        node_map = dict(zip(node_ids, gf.create_nodes(rows), strict=True))
 
         return node_map
 
@@ -239,6 +244,8 @@ class GraphMLLoader(DatasetLoader):
         Raises:
             ValueError: If edge references invalid node
         """
+        rows: list[tuple[Any, Any, str, dict[str, Any]]] = []
+
         for edge_elem in graph.findall("graphml:edge" if ns else "edge", ns):
             source_id = edge_elem.get("source")
             target_id = edge_elem.get("target")
@@ -254,20 +261,14 @@ class GraphMLLoader(DatasetLoader):
             # Parse properties
             properties = self._parse_data_elements(edge_elem, keys, "edge", ns)
 
-            # Create edge(s) based on directedness
-            if is_directed:
-                # Directed: create single relationship
-                gf.create_relationship(
-                    node_map[source_id], node_map[target_id], "RELATED_TO", **properties
-                )
-            else:
-                # Undirected: create reciprocal relationships
-                gf.create_relationship(
-                    node_map[source_id], node_map[target_id], "RELATED_TO", **properties
-                )
-                gf.create_relationship(
-                    node_map[target_id], node_map[source_id], "RELATED_TO", **properties
-                )
+            # Collect edge(s) based on directedness
+            rows.append((node_map[source_id], node_map[target_id], "RELATED_TO", properties))
+            if not is_directed:
+                # Undirected: add the reciprocal relationship
+                rows.append((node_map[target_id], node_map[source_id], "RELATED_TO", properties))
+
+        # Create all edges in one batch
+        gf.create_relationships(rows)
 
     def _parse_data_elements(
         self,
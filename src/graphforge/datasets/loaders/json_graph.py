@@ -180,29 +180,22 @@ class JSONGraphLoader(DatasetLoader):
         except ValidationError as e:
             raise ValueError(f"Invalid JSON Graph format: {e}") from e
 
-        # Track node ID mapping (JSON ID -> GraphForge NodeRef)
-        node_map = {}
-
-        # Create nodes
-        for node in graph.nodes:
-            # Convert properties
-            props = convert_properties(node.properties)
-
-            # Create node with labels and properties
-            node_ref = gf.create_node(labels=node.labels, **props)
-            node_map[node.id] = node_ref
-
-        # Create edges
-        for edge in graph.edges:
-            # Get source and target node references
-            source_ref = node_map[edge.source]
-            target_ref = node_map[edge.target]
-
-            # Convert properties
-            props = convert_properties(edge.properties)
-
-            # Create relationship
-            gf.create_relationship(source_ref, target_ref, edge.type, **props)
+        # Create nodes in one batch and map JSON IDs to GraphForge NodeRefs
+        node_refs = gf.create_nodes(
+            (node.labels, convert_properties(node.properties)) for node in graph.nodes
+        )
+        node_map = {node.id: ref for node, ref in zip(graph.nodes, node_refs, strict=True)}
+
+        # Create edges in one batch
+        gf.create_relationships(
+            (
+                node_map[edge.source],
+                node_map[edge.target],
+                edge.type,
+                convert_properties(edge.properties),
+            )
+            for edge in graph.edges
+        )
 
     def get_format(self) -> str:
         """Return the format name this loader handles.
@@ -96,18 +96,17 @@ class LDBCLoader(DatasetLoader):
             with csv_path.open(encoding="utf-8") as f:
                 reader = csv.DictReader(f, delimiter=self.delimiter)
 
+                node_ids: list[str] = []
+                rows: list[tuple[list[str], dict[str, Any]]] = []
                 for row in reader:
-                    # Extract node ID
-                    node_id = row[schema.id_column]
+                    # Extract node ID and parse properties
+                    node_ids.append(row[schema.id_column])
+                    rows.append(([schema.label], self._parse_properties(row, schema.properties)))
 
-                    # Parse properties
-                    properties = self._parse_properties(row, schema.properties)
-
-                    # Create node
-                    node = gf.create_node([schema.label], **properties)
-
-                    # Cache for relationship loading
-                    node_cache[(schema.label, node_id)] = node
+            # Create the nodes of this type in one batch and cache them for
+            # relationship loading
+            for node_id, node in zip(node_ids, gf.create_nodes(rows), strict=True):
+                node_cache[(schema.label, node_id)] = node
 
         return node_cache
 
@@ -133,6 +132,7 @@ class LDBCLoader(DatasetLoader):
             with csv_path.open(encoding="utf-8") as f:
                 reader = csv.DictReader(f, delimiter=self.delimiter)
 
+                relationships: list[tuple[Any, Any, str, dict[str, Any]]] = []
                 for row in reader:
                     # Get source and target node IDs
                     source_id = row[schema.source_id_column]
@@ -152,13 +152,10 @@ class LDBCLoader(DatasetLoader):
                     # Parse properties
                     properties = self._parse_properties(row, schema.properties)
 
-                    # Create relationship
-                    gf.create_relationship(
-                        source_node,
-                        target_node,
-                        schema.type,
-                        **properties,
-                    )
+                    relationships.append((source_node, target_node, schema.type, properties))
+
+            # Create the relationships of this type in one batch
+            gf.create_relationships(relationships)
 
     def _parse_properties(
         self,
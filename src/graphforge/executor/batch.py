@@ -0,0 +1,321 @@
+"""Column-at-a-time evaluation for batched node scans.
+
+In batched execution mode, QueryExecutor runs a ScanNodes operator together
+with the Filter and Project operators directly after it as one segment. The
+scanned nodes move through that segment in batches, one list per column,
+instead of one ExecutionContext per row. Each filter narrows the batch with a
+single call, each RETURN item is evaluated as a whole column, and rows are
+built only for the nodes that survive.
+
+BatchCompiler turns expressions over the scanned variable into functions of
+a batch of nodes:
+
+- Columns return one value per node
+- Predicates return one truth value per node: True, False, None (NULL) or
+  NOT_BOOLEAN
+
+Property lookups, literals, parameters, comparisons, arithmetic and the
+boolean operators are evaluated column-wise. Numeric and string comparisons
+compare raw Python values. Any other expression is evaluated node by node
+with the row-at-a-time compiled closure, so every expression can be batched.
+Operands of AND and OR are evaluated only for the rows that would evaluate
+them row-at-a-time, so batching raises no error that row-at-a-time
+execution would not.
+"""
+
+from collections.abc import Callable
+import operator
+from typing import Any
+
+from graphforge.ast.expression import (
+    BinaryOp,
+    Literal,
+    Parameter,
+    PropertyAccess,
+    UnaryOp,
+    Variable,
+)
+from graphforge.executor.evaluator import BINARY_OPERATORS, ExecutionContext
+from graphforge.types.graph import NodeRef
+from graphforge.types.values import CypherBool, CypherFloat, CypherInt, CypherNull, CypherString
+
+# Rows per batch when batched execution is enabled without an explicit size
+DEFAULT_SCAN_BATCH_SIZE = 1024
+
+# Truth value of a predicate that evaluated to something other than a boolean
+NOT_BOOLEAN = object()
+
+ColumnFunction = Callable[[list[NodeRef], ExecutionContext], list[Any]]
+PredicateFunction = Callable[[list[NodeRef], ExecutionContext], list[Any]]
+
+_NUMERIC_TYPES = (CypherInt, CypherFloat)
+
+_COMPARISON_OPERATORS = {"=", "<>", "<", ">", "<=", ">="}
+
+# Integer arithmetic computed on raw values when both operands are integers
+_INTEGER_ARITHMETIC = {"+": operator.add, "-": operator.sub, "*": operator.mul}
+
+
+def _compare(op: str, left: Any, right: Any) -> bool:
+    """Compare two raw values as CypherValue.equals()/less_than() would."""
+    if op == "=":
+        return bool(left == right)
+    if op == "<>":
+        return bool(left != right)
+    if op == "<":
+        return bool(left < right)
+    if op == ">":
+        return bool(right < left)
+    if op == "<=":
+        return not right < left
+    return not left < right
+
+
+def _natively_comparable(left: Any, right: Any) -> bool:
+    """Whether two values compare like their raw Python values."""
+    left_type = type(left)
+    right_type = type(right)
+    if left_type in _NUMERIC_TYPES:
+        return right_type in _NUMERIC_TYPES
+    return left_type is CypherString and right_type is CypherString
+
+
+def _truth(value: Any) -> Any:
+    """Truth value of a CypherValue in a predicate."""
+    if isinstance(value, CypherBool):
+        return value.value
+    if isinstance(value, CypherNull):
+        return None
+    return NOT_BOOLEAN
+
+
+def _and(left: Any, right: Any) -> Any:
+    """Three-valued AND of truth values, raising as _logical_and() does."""
+    if right is NOT_BOOLEAN or left is NOT_BOOLEAN:
+        raise TypeError("AND requires boolean operands")
+    if left is None:
+        return False if right is False else None
+    return right
+
+
+def _or(left: Any, right: Any) -> Any:
+    """Three-valued OR of truth values, raising as _logical_or() does."""
+    if right is NOT_BOOLEAN or left is NOT_BOOLEAN:
+        raise TypeError("OR requires boolean operands")
+    if left is None:
+        return True if right is True else None
+    return right
+
+
+def _not(value: Any) -> Any:
+    """Three-valued NOT of a truth value."""
+    if value is None:
+        return None
+    if value is NOT_BOOLEAN:
+        raise TypeError("NOT requires boolean operand")
+    return not value
+
+
+class BatchCompiler:
+    """Compiles expressions over batches of nodes bound to one variable.
+
+    Args:
+        executor: QueryExecutor running the batched segment
+        variable: Name of the scanned variable
+    """
+
+    def __init__(self, executor: Any, variable: str):
+        self.executor = executor
+        self.variable = variable
+
+    def column(self, expr: Any) -> ColumnFunction:
+        """Compile ``expr`` into a function returning its value for each node.
+
+        Args:
+            expr: AST expression node
+
+        Returns:
+            Function of (nodes, input context) returning a list of values
+        """
+        scalar = self._scalar(expr)
+        if scalar is not None:
+            return lambda nodes, ctx: [scalar(ctx)] * len(nodes)
+
+        if isinstance(expr, Variable) and expr.name == self.variable:
+            return lambda nodes, _ctx: nodes
+
+        if isinstance(expr, PropertyAccess) and expr.variable == self.variable:
+            return self._property_column(expr.property)
+
+        if isinstance(expr, BinaryOp) and expr.op in BINARY_OPERATORS:
+            if expr.op in _COMPARISON_OPERATORS:
+                return self._from_predicate(self.predicate(expr))
+            return self._binary_column(expr)
+
+        if isinstance(expr, BinaryOp) and expr.op in ("AND", "OR"):
+            return self._from_predicate(self.predicate(expr))
+
+        if isinstance(expr, UnaryOp) and expr.op in ("NOT", "IS NULL", "IS NOT NULL"):
+            return self._from_predicate(self.predicate(expr))
+
+        return self._per_row(expr)
+
+    def predicate(self, expr: Any) -> PredicateFunction:
+        """Compile ``expr`` into a function returning its truth value for each node.
+
+        Args:
+            expr: AST expression node
+
+        Returns:
+            Function of (nodes, input context) returning a list of True,
+            False, None (NULL) or NOT_BOOLEAN
+        """
+        if isinstance(expr, BinaryOp) and expr.op in _COMPARISON_OPERATORS:
+            return self._comparison(expr)
+
+        if isinstance(expr, BinaryOp) and expr.op in ("AND", "OR"):
+            return self._connective(expr)
+
+        if isinstance(expr, UnaryOp):
+            if expr.op == "NOT":
+                operand = self.predicate(expr.operand)
+                return lambda nodes, ctx: [_not(value) for value in operand(nodes, ctx)]
+            if expr.op in ("IS NULL", "IS NOT NULL"):
+                column = self.column(expr.operand)
+                is_null = expr.op == "IS NULL"
+                return lambda nodes, ctx: [
+                    isinstance(value, CypherNull) is is_null for value in column(nodes, ctx)
+                ]
+
+        column = self.column(expr)
+        return lambda nodes, ctx: [_truth(value) for value in column(nodes, ctx)]
+
+    def _scalar(self, expr: Any) -> Callable[[ExecutionContext], Any] | None:
+        """Function of the input context for expressions constant over a batch."""
+        if isinstance(expr, Literal) and not isinstance(expr.value, (list, dict)):
+            compiled = self.executor._compile_expression(expr)
+            if hasattr(compiled, "constant_value"):
+                value = compiled.constant_value
+                return lambda _ctx: value
+            return compiled  # type: ignore[no-any-return]
+        if isinstance(expr, Parameter):
+            return self.executor._compile_expression(expr)  # type: ignore[no-any-return]
+        return None
+
+    @staticmethod
+    def _property_column(key: str) -> ColumnFunction:
+        def property_column(nodes: list[NodeRef], _ctx: ExecutionContext) -> list[Any]:
+            values: list[Any] = []
+            append = values.append
+            for node in nodes:
+                value = node.properties.get(key)
+                append(CypherNull() if value is None else value)
+            return values
+
+        return property_column
+
+    def _per_row(self, expr: Any) -> ColumnFunction:
+        """Evaluate ``expr`` node by node with its row-at-a-time closure."""
+        compiled = self.executor._compile_expression(expr)
+        variable = self.variable
+
+        def per_row(nodes: list[NodeRef], ctx: ExecutionContext) -> list[Any]:
+            values: list[Any] = []
+            for node in nodes:
+                row = ctx.child()
+                row.bind(variable, node)
+                values.append(compiled(row))
+            return values
+
+        return per_row
+
+    @staticmethod
+    def _from_predicate(predicate: PredicateFunction) -> ColumnFunction:
+        """Turn truth values back into CypherBool/CypherNull values."""
+
+        def column(nodes: list[NodeRef], ctx: ExecutionContext) -> list[Any]:
+            # Comparisons, connectives and null checks never yield NOT_BOOLEAN
+            return [
+                CypherNull() if value is None else CypherBool(value)
+                for value in predicate(nodes, ctx)
+            ]
+
+        return column
+
+    def _binary_column(self, expr: BinaryOp) -> ColumnFunction:
+        binary = BINARY_OPERATORS[expr.op]
+        left = self.column(expr.left)
+        right = self.column(expr.right)
+        integer = _INTEGER_ARITHMETIC.get(expr.op)
+        if integer is None:
+            return lambda nodes, ctx: list(map(binary, left(nodes, ctx), right(nodes, ctx)))
+
+        def arithmetic(nodes: list[NodeRef], ctx: ExecutionContext) -> list[Any]:
+            values: list[Any] = []
+            append = values.append
+            for left_val, right_val in zip(left(nodes, ctx), right(nodes, ctx)):
+                if type(left_val) is CypherInt and type(right_val) is CypherInt:
+                    append(CypherInt(integer(left_val.value, right_val.value)))
+                else:
+                    append(binary(left_val, right_val))
+            return values
+
+        return arithmetic
+
+    def _comparison(self, expr: BinaryOp) -> PredicateFunction:
+        op = expr.op
+        binary = BINARY_OPERATORS[op]
+        left = self.column(expr.left)
+        right_scalar = self._scalar(expr.right)
+
+        if right_scalar is not None:
+
+            def compare_scalar(nodes: list[NodeRef], ctx: ExecutionContext) -> list[Any]:
+                right_val = right_scalar(ctx)
+                raw = right_val.value
+                truths: list[Any] = []
+                append = truths.append
+                for left_val in left(nodes, ctx):
+                    if _natively_comparable(left_val, right_val):
+                        append(_compare(op, left_val.value, raw))
+                    else:
+                        append(_truth(binary(left_val, right_val)))
+                return truths
+
+            return compare_scalar
+
+        right = self.column(expr.right)
+
+        def compare(nodes: list[NodeRef], ctx: ExecutionContext) -> list[Any]:
+            truths: list[Any] = []
+            append = truths.append
+            for left_val, right_val in zip(left(nodes, ctx), right(nodes, ctx)):
+                if _natively_comparable(left_val, right_val):
+                    append(_compare(op, left_val.value, right_val.value))
+                else:
+                    append(_truth(binary(left_val, right_val)))
+            return truths
+
+        return compare
+
+    def _connective(self, expr: BinaryOp) -> PredicateFunction:
+        left = self.predicate(expr.left)
+        right = self.predicate(expr.right)
+        # The left value that decides the result without evaluating the right
+        decided = expr.op == "OR"
+        combine = _and if expr.op == "AND" else _or
+
+        def connective(nodes: list[NodeRef], ctx: ExecutionContext) -> list[Any]:
+            truths = left(nodes, ctx)
+            pending = [i for i, value in enumerate(truths) if value is not decided]
+            if not pending:
+                return truths
+            if len(pending) == len(nodes):
+                right_truths = right(nodes, ctx)
+            else:
+                right_truths = right([nodes[i] for i in pending], ctx)
+            for i, right_value in zip(pending, right_truths):
+                truths[i] = combine(truths[i], right_value)
+            return truths
+
+        return connective
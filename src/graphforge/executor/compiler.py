@@ -0,0 +1,342 @@
+"""Compile AST expressions into Python closures.
+
+evaluate_expression() dispatches on the type of every expression node each
+time it is evaluated, so a WHERE clause re-walks its AST for every row.
+compile_expression() does that walk once, returning a tree of closures
+specialized to each node: operators and function handlers are looked up at
+compile time, constant subexpressions are folded, and evaluating a row is a
+chain of plain function calls.
+
+Compiled expressions produce exactly the values (and raise exactly the
+errors) of evaluate_expression(), whose operator and function helpers they
+share. Expression types without a specialized form (comprehensions,
+subqueries, subscripts, ...) compile to a closure calling
+evaluate_expression().
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from graphforge.ast.expression import (
+    BinaryOp,
+    CaseExpression,
+    FunctionCall,
+    Literal,
+    Parameter,
+    PropertyAccess,
+    UnaryOp,
+    Variable,
+)
+from graphforge.executor.evaluator import (
+    BINARY_OPERATORS,
+    ExecutionContext,
+    _logical_and,
+    _logical_or,
+    _logical_xor,
+    evaluate_expression,
+    function_handler,
+)
+from graphforge.types.graph import EdgeRef, NodeRef
+from graphforge.types.values import (
+    CypherBool,
+    CypherFloat,
+    CypherInt,
+    CypherMap,
+    CypherNull,
+    CypherString,
+)
+
+CompiledExpression = Callable[[ExecutionContext], Any]
+
+# Result types that are immutable and may be shared between rows when folded
+_FOLDABLE_TYPES = (CypherBool, CypherInt, CypherFloat, CypherString, CypherNull)
+
+
+def compile_expression(expr: Any, executor: Any = None) -> CompiledExpression:
+    """Compile an AST expression into a closure evaluating it for one row.
+
+    Args:
+        expr: AST expression node
+        executor: Optional QueryExecutor, used for parameters, custom
+            functions and subqueries as by evaluate_expression()
+
+    Returns:
+        Callable taking an ExecutionContext and returning the expression's value
+
+    Examples:
+        >>> predicate = compile_expression(parser_ast.where.predicate, executor)
+        >>> rows = [ctx for ctx in rows if predicate(ctx) == CypherBool(True)]
+    """
+    return _Compiler(executor).compile(expr)
+
+
+def _constant(value: Any) -> CompiledExpression:
+    """Closure returning a precomputed value."""
+
+    def constant(_ctx: ExecutionContext) -> Any:
+        return value
+
+    constant.constant_value = value  # type: ignore[attr-defined]
+    return constant
+
+
+def _is_constant(compiled: CompiledExpression) -> bool:
+    """Whether a compiled expression was folded to a constant."""
+    return hasattr(compiled, "constant_value")
+
+
+class _Compiler:
+    """Builds closures for the expression nodes of one executor."""
+
+    def __init__(self, executor: Any):
+        self.executor = executor
+
+    def compile(self, expr: Any) -> CompiledExpression:
+        """Compile ``expr`` into a closure."""
+        return self._compile_node(expr)
+
+    def _fold(self, expr: Any, compiled: CompiledExpression) -> CompiledExpression:
+        """Evaluate an operator whose operands are all constants, if it succeeds."""
+        try:
+            value = evaluate_expression(expr, ExecutionContext(), self.executor)
+        except Exception:
+            # Errors are raised when (and if) the expression is evaluated
+            return compiled
+        if isinstance(value, _FOLDABLE_TYPES):
+            return _constant(value)
+        return compiled
+
+    def _interpreted(self, expr: Any) -> CompiledExpression:
+        """Fall back to evaluate_expression() for ``expr``."""
+        executor = self.executor
+
+        def interpreted(ctx: ExecutionContext) -> Any:
+            return evaluate_expression(expr, ctx, executor)
+
+        return interpreted
+
+    def _compile_node(self, expr: Any) -> CompiledExpression:
+        if isinstance(expr, Literal):
+            return self._compile_literal(expr)
+        if isinstance(expr, Variable):
+            return self._compile_variable(expr)
+        if isinstance(expr, Parameter):
+            return self._compile_parameter(expr)
+        if isinstance(expr, PropertyAccess):
+            return self._compile_property_access(expr)
+        if isinstance(expr, UnaryOp):
+            return self._compile_unary(expr)
+        if isinstance(expr, BinaryOp):
+            return self._compile_binary(expr)
+        if isinstance(expr, CaseExpression):
+            return self._compile_case(expr)
+        if isinstance(expr, FunctionCall):
+            return self._compile_function(expr)
+        return self._interpreted(expr)
+
+    def _compile_literal(self, expr: Literal) -> CompiledExpression:
+        if not _is_scalar_literal(expr):
+            # Lists and maps are rebuilt per row: their values are mutable
+            return self._interpreted(expr)
+        try:
+            value = evaluate_expression(expr, ExecutionContext(), self.executor)
+        except ValueError:
+            # Integer overflow is reported when the literal is evaluated
+            return self._interpreted(expr)
+        return _constant(value)
+
+    @staticmethod
+    def _compile_variable(expr: Variable) -> CompiledExpression:
+        name = expr.name
+
+        def variable(ctx: ExecutionContext) -> Any:
+            return ctx.get(name)
+
+        return variable
+
+    def _compile_parameter(self, expr: Parameter) -> CompiledExpression:
+        executor = self.executor
+        name = expr.name
+
+        def parameter(_ctx: ExecutionContext) -> Any:
+            parameters = executor.parameters if executor is not None else {}
+            if name not in parameters:
+                raise ValueError(f"Missing parameter: ${name}")
+            return parameters[name]
+
+        return parameter
+
+    def _compile_property_access(self, expr: PropertyAccess) -> CompiledExpression:
+        base: CompiledExpression
+        if expr.variable:
+            name = expr.variable
+
+            def variable(ctx: ExecutionContext) -> Any:
+                return ctx.get(name)
+
+            base = variable
+        elif expr.base:
+            base = self.compile(expr.base)
+        else:
+            return self._interpreted(expr)
+        key = expr.property
+
+        def property_access(ctx: ExecutionContext) -> Any:
+            obj = base(ctx)
+            if isinstance(obj, (NodeRef, EdgeRef)):
+                value = obj.properties.get(key)
+                return CypherNull() if value is None else value
+            if isinstance(obj, CypherNull):
+                return CypherNull()
+            if isinstance(obj, CypherMap):
+                value = obj.value.get(key)
+                return CypherNull() if value is None else value
+            raise TypeError(f"Cannot access property on {type(obj).__name__}")
+
+        return property_access
+
+    def _compile_unary(self, expr: UnaryOp) -> CompiledExpression:
+        if expr.op == "-" and isinstance(expr.operand, Literal):
+            # Negated literals are range-checked as a whole
+            return self._interpreted(expr)
+        operand = self.compile(expr.operand)
+        compiled = self._compile_unary_operator(expr.op, operand)
+        if compiled is None:
+            return self._interpreted(expr)
+        if _is_constant(operand):
+            return self._fold(expr, compiled)
+        return compiled
+
+    @staticmethod
+    def _compile_unary_operator(op: str, operand: CompiledExpression) -> CompiledExpression | None:
+        if op == "IS NULL":
+
+            def is_null(ctx: ExecutionContext) -> Any:
+                return CypherBool(isinstance(operand(ctx), CypherNull))
+
+            return is_null
+
+        if op == "IS NOT NULL":
+
+            def is_not_null(ctx: ExecutionContext) -> Any:
+                return CypherBool(not isinstance(operand(ctx), CypherNull))
+
+            return is_not_null
+
+        if op == "NOT":
+
+            def logical_not(ctx: ExecutionContext) -> Any:
+                value = operand(ctx)
+                if isinstance(value, CypherBool):
+                    return CypherBool(not value.value)
+                if isinstance(value, CypherNull):
+                    return value
+                raise TypeError("NOT requires boolean operand")
+
+            return logical_not
+
+        return None
+
+    def _compile_binary(self, expr: BinaryOp) -> CompiledExpression:
+        left = self.compile(expr.left)
+        right = self.compile(expr.right)
+        compiled = self._compile_binary_operator(expr.op, left, right)
+        if compiled is None:
+            return self._interpreted(expr)
+        if _is_constant(left) and _is_constant(right):
+            return self._fold(expr, compiled)
+        return compiled
+
+    @staticmethod
+    def _compile_binary_operator(
+        op: str, left: CompiledExpression, right: CompiledExpression
+    ) -> CompiledExpression | None:
+        if op == "AND":
+
+            def logical_and(ctx: ExecutionContext) -> Any:
+                left_val = left(ctx)
+                if isinstance(left_val, CypherBool) and not left_val.value:
+                    return left_val
+                return _logical_and(left_val, right(ctx))
+
+            return logical_and
+
+        if op == "OR":
+
+            def logical_or(ctx: ExecutionContext) -> Any:
+                left_val = left(ctx)
+                if isinstance(left_val, CypherBool) and left_val.value:
+                    return left_val
+                return _logical_or(left_val, right(ctx))
+
+            return logical_or
+
+        if op == "XOR":
+
+            def logical_xor(ctx: ExecutionContext) -> Any:
+                return _logical_xor(left(ctx), right(ctx))
+
+            return logical_xor
+
+        operator = BINARY_OPERATORS.get(op)
+        if operator is None:
+            return None
+
+        if _is_constant(right):
+            right_val = right.constant_value  # type: ignore[attr-defined]
+
+            def binary_constant(ctx: ExecutionContext) -> Any:
+                return operator(left(ctx), right_val)
+
+            return binary_constant
+
+        def binary(ctx: ExecutionContext) -> Any:
+            return operator(left(ctx), right(ctx))
+
+        return binary
+
+    def _compile_case(self, expr: CaseExpression) -> CompiledExpression:
+        branches = [
+            (self.compile(condition), self.compile(result))
+            for condition, result in expr.when_clauses
+        ]
+        otherwise = self.compile(expr.else_expr) if expr.else_expr is not None else None
+
+        def case(ctx: ExecutionContext) -> Any:
+            for condition, result in branches:
+                value = condition(ctx)
+                # NULL is treated as false, not propagated
+                if isinstance(value, CypherBool) and value.value:
+                    return result(ctx)
+            if otherwise is not None:
+                return otherwise(ctx)
+            return CypherNull()
+
+        return case
+
+    def _compile_function(self, expr: FunctionCall) -> CompiledExpression:
+        name = expr.name.upper()
+        handler = function_handler(name)
+        if handler is None or expr.distinct:
+            return self._interpreted(expr)
+
+        args = [self.compile(arg) for arg in expr.args]
+        interpreted = self._interpreted(expr)
+        # Functions registered later override built-ins, as in evaluate_expression()
+        custom_functions = getattr(self.executor, "custom_functions", None)
+
+        def function(ctx: ExecutionContext) -> Any:
+            if custom_functions is not None and name in custom_functions:
+                return interpreted(ctx)
+            values = [arg(ctx) for arg in args]
+            for value in values:
+                if isinstance(value, CypherNull):
+                    return value
+            return handler(name, values)
+
+        return function
+
+
+def _is_scalar_literal(expr: Literal) -> bool:
+    """Whether a literal holds a single scalar value (not a list or map)."""
+    return not isinstance(expr.value, (list, dict))
@@ -4,7 +4,8 @@ This module evaluates AST expressions in an execution context to produce
 CypherValue results.
 """
 
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from functools import partial
 import math
 from typing import Any
 
@@ -16,6 +17,7 @@ from graphforge.ast.expression import (
     FunctionCall,
     ListComprehension,
     Literal,
+    Parameter,
     PatternComprehension,
     PropertyAccess,
     QuantifierExpression,
@@ -53,18 +55,69 @@ _INT64_MIN = -(1 << 63)
 _INT64_MAX = (1 << 63) - 1
 
 
+# Longest parent chain an ExecutionContext keeps before flattening it
+_MAX_CONTEXT_DEPTH = 8
+
+
 class ExecutionContext:
     """Context for query execution.
 
-    Maintains variable bindings during query execution.
+    Maintains variable bindings during query execution. A context derived
+    with child() shares its parent's bindings instead of copying them: it
+    stores only the variables bound on it and falls back to the parent for
+    the rest, so extending a row with one variable costs O(1) however wide
+    the row is. A parent must not be rebound once children are derived
+    from it.
 
     Attributes:
-        bindings: Dictionary mapping variable names to values
+        bindings: Dictionary mapping variable names to values. Reading it
+            flattens the parent chain into a dictionary owned by this
+            context; assigning it replaces all bindings.
     """
 
+    __slots__ = ("_depth", "_local", "_parent")
+
     def __init__(self):
         """Initialize empty execution context."""
-        self.bindings: dict[str, Any] = {}
+        self._local: dict[str, Any] = {}
+        self._parent: ExecutionContext | None = None
+        self._depth = 0
+
+    @property
+    def bindings(self) -> dict[str, Any]:
+        """All bindings of this context, including those of its parents."""
+        if self._parent is not None:
+            merged = dict(self._parent.bindings)
+            merged.update(self._local)
+            self._local = merged
+            self._parent = None
+            self._depth = 0
+        return self._local
+
+    @bindings.setter
+    def bindings(self, bindings: dict[str, Any]) -> None:
+        self._local = bindings
+        self._parent = None
+        self._depth = 0
+
+    def child(self) -> "ExecutionContext":
+        """Derive a context that extends this one's bindings.
+
+        Returns:
+            New context seeing every binding of this context; variables bound
+            on it shadow this context's without modifying them
+        """
+        ctx = ExecutionContext.__new__(ExecutionContext)
+        ctx._local = {}
+        if self._depth >= _MAX_CONTEXT_DEPTH:
+            # Bound lookup cost on deep pipelines
+            ctx._local.update(self.bindings)
+            ctx._parent = None
+            ctx._depth = 0
+        else:
+            ctx._parent = self
+            ctx._depth = self._depth + 1
+        return ctx
 
     def bind(self, name: str, value: Any) -> None:
         """Bind a variable to a value.
@@ -73,7 +126,7 @@ class ExecutionContext:
             name: Variable name
             value: Value to bind (NodeRef, EdgeRef, CypherValue)
         """
-        self.bindings[name] = value
+        self._local[name] = value
 
     def get(self, name: str) -> Any:
         """Get a variable's value.
@@ -87,7 +140,13 @@ class ExecutionContext:
         Raises:
             KeyError: If variable is not bound
         """
-        return self.bindings[name]
+        ctx: ExecutionContext | None = self
+        while ctx is not None:
+            local = ctx._local
+            if name in local:
+                return local[name]
+            ctx = ctx._parent
+        raise KeyError(name)
 
     def has(self, name: str) -> bool:
         """Check if a variable is bound.
@@ -98,7 +157,12 @@ class ExecutionContext:
         Returns:
             True if variable is bound
         """
-        return name in self.bindings
+        ctx: ExecutionContext | None = self
+        while ctx is not None:
+            if name in ctx._local:
+                return True
+            ctx = ctx._parent
+        return False
 
 
 def evaluate_expression(expr: Any, ctx: ExecutionContext, executor: Any = None) -> CypherValue:
@@ -129,6 +193,7 @@ def evaluate_expression(expr: Any, ctx: ExecutionContext, executor: Any = None)
                     (
                         Literal,
                         Variable,
+                        Parameter,
                         PropertyAccess,
                         Subscript,
                         BinaryOp,
@@ -154,6 +219,7 @@ def evaluate_expression(expr: Any, ctx: ExecutionContext, executor: Any = None)
                     (
                         Literal,
                         Variable,
+                        Parameter,
                         PropertyAccess,
                         Subscript,
                         BinaryOp,
@@ -184,6 +250,13 @@ def evaluate_expression(expr: Any, ctx: ExecutionContext, executor: Any = None)
     if isinstance(expr, Variable):
         return ctx.get(expr.name)  # type: ignore[no-any-return]
 
+    # Parameter reference (bound per execution by QueryExecutor.execute)
+    if isinstance(expr, Parameter):
+        parameters = executor.parameters if executor is not None else {}
+        if expr.name not in parameters:
+            raise ValueError(f"Missing parameter: ${expr.name}")
+        return parameters[expr.name]  # type: ignore[no-any-return]
+
     # Property access
     if isinstance(expr, PropertyAccess):
         # Get the base object: either from variable or evaluate base expression
@@ -277,322 +350,32 @@ def evaluate_expression(expr: Any, ctx: ExecutionContext, executor: Any = None)
         # For AND/OR, implement short-circuit evaluation
         # XOR needs both operands but has special NULL handling
         # Other operators need both operands evaluated
-        if expr.op in ("AND", "OR", "XOR"):
+        if expr.op == "AND":
             left_val = evaluate_expression(expr.left, ctx, executor)
+            # false AND anything = false (short-circuit)
+            if isinstance(left_val, CypherBool) and not left_val.value:
+                return CypherBool(False)
+            return _logical_and(left_val, evaluate_expression(expr.right, ctx, executor))
 
-            # Three-valued short-circuit semantics for AND
-            if expr.op == "AND":
-                # false AND anything = false (short-circuit)
-                if isinstance(left_val, CypherBool) and not left_val.value:
-                    return CypherBool(False)
-
-                # Evaluate right operand
-                right_val = evaluate_expression(expr.right, ctx, executor)
-
-                # true AND x = x (return right as-is, could be true/false/NULL)
-                if isinstance(left_val, CypherBool) and left_val.value:
-                    if isinstance(right_val, (CypherBool, CypherNull)):
-                        return right_val
-                    raise TypeError("AND requires boolean operands")
-
-                # NULL AND false = false
-                if isinstance(left_val, CypherNull):
-                    if isinstance(right_val, CypherBool) and not right_val.value:
-                        return CypherBool(False)
-                    # NULL AND true = NULL, NULL AND NULL = NULL
-                    if isinstance(right_val, (CypherBool, CypherNull)):
-                        return CypherNull()
-                    raise TypeError("AND requires boolean operands")
-
-                raise TypeError("AND requires boolean operands")
-
-            # Three-valued short-circuit semantics for OR
-            if expr.op == "OR":
-                # true OR anything = true (short-circuit)
-                if isinstance(left_val, CypherBool) and left_val.value:
-                    return CypherBool(True)
-
-                # Evaluate right operand
-                right_val = evaluate_expression(expr.right, ctx, executor)
-
-                # false OR x = x (return right as-is, could be true/false/NULL)
-                if isinstance(left_val, CypherBool) and not left_val.value:
-                    if isinstance(right_val, (CypherBool, CypherNull)):
-                        return right_val
-                    raise TypeError("OR requires boolean operands")
-
-                # NULL OR true = true
-                if isinstance(left_val, CypherNull):
-                    if isinstance(right_val, CypherBool) and right_val.value:
-                        return CypherBool(True)
-                    # NULL OR false = NULL, NULL OR NULL = NULL
-                    if isinstance(right_val, (CypherBool, CypherNull)):
-                        return CypherNull()
-                    raise TypeError("OR requires boolean operands")
-
-                raise TypeError("OR requires boolean operands")
-
-            # Three-valued logic for XOR (no short-circuit possible)
-            if expr.op == "XOR":
-                right_val = evaluate_expression(expr.right, ctx, executor)
-
-                # If either operand is NULL, result is NULL
-                if isinstance(left_val, CypherNull) or isinstance(right_val, CypherNull):
-                    # Validate the non-NULL operand is boolean (if any)
-                    if isinstance(left_val, CypherNull) and not isinstance(
-                        right_val, (CypherBool, CypherNull)
-                    ):
-                        raise TypeError(XOR_TYPE_ERROR_MSG)
-                    if isinstance(right_val, CypherNull) and not isinstance(
-                        left_val, (CypherBool, CypherNull)
-                    ):
-                        raise TypeError(XOR_TYPE_ERROR_MSG)
-                    return CypherNull()
-
-                # Both operands must be boolean
-                if not isinstance(left_val, CypherBool) or not isinstance(right_val, CypherBool):
-                    raise TypeError(XOR_TYPE_ERROR_MSG)
+        if expr.op == "OR":
+            left_val = evaluate_expression(expr.left, ctx, executor)
+            # true OR anything = true (short-circuit)
+            if isinstance(left_val, CypherBool) and left_val.value:
+                return CypherBool(True)
+            return _logical_or(left_val, evaluate_expression(expr.right, ctx, executor))
 
-                # XOR truth table: true XOR true = false, true XOR false = true,
-                # false XOR true = true, false XOR false = false
-                return CypherBool(left_val.value != right_val.value)
+        if expr.op == "XOR":
+            left_val = evaluate_expression(expr.left, ctx, executor)
+            return _logical_xor(left_val, evaluate_expression(expr.right, ctx, executor))
 
         # For all other operators, evaluate both operands
         left_val = evaluate_expression(expr.left, ctx, executor)
         right_val = evaluate_expression(expr.right, ctx, executor)
 
-        # Comparison operators
-        if expr.op == ">":
-            result = left_val.less_than(right_val)
-            # Swap because we want left > right
-            if isinstance(result, CypherBool):
-                result = CypherBool(not result.value)
-                # But actually we want right < left
-                result = right_val.less_than(left_val)
-            return result
-
-        if expr.op == "<":
-            return left_val.less_than(right_val)
-
-        if expr.op == ">=":
-            # left >= right  is  NOT (left < right)
-            result = left_val.less_than(right_val)
-            if isinstance(result, CypherNull):
-                return result
-            return CypherBool(not result.value)
-
-        if expr.op == "<=":
-            # left <= right  is  NOT (right < left)
-            result = right_val.less_than(left_val)
-            if isinstance(result, CypherNull):
-                return result
-            return CypherBool(not result.value)
-
-        if expr.op == "=":
-            return left_val.equals(right_val)
-
-        if expr.op == "<>":
-            result = left_val.equals(right_val)
-            if isinstance(result, CypherNull):
-                return result
-            return CypherBool(not result.value)
-
-        # IN operator: value IN list
-        if expr.op == "IN":
-            # anything IN NULL → NULL
-            if isinstance(right_val, CypherNull):
-                return CypherNull()
-
-            # Right operand must be a list
-            if not isinstance(right_val, CypherList):
-                raise TypeError(
-                    f"IN operator requires a list on the right side, got {type(right_val).__name__}"
-                )
-
-            # Empty list: value IN [] → false (even for NULL IN [])
-            # This must come before NULL check on left operand
-            if not right_val.value:
-                return CypherBool(False)
-
-            # NULL IN non-empty-list → NULL
-            if isinstance(left_val, CypherNull):
-                return CypherNull()
-
-            # Check if left_val is in the list
-            # Use three-valued logic: if any comparison is NULL and no match found, return NULL
-            has_null = False
-            for item in right_val.value:
-                result = left_val.equals(item)
-                if isinstance(result, CypherBool):
-                    if result.value:
-                        return CypherBool(True)  # Found a match
-                elif isinstance(result, CypherNull):
-                    has_null = True  # Track that we saw a NULL comparison
-
-            # No match found: return NULL if we saw any NULL comparisons, else false
-            return CypherNull() if has_null else CypherBool(False)
-
-        # Arithmetic operators
-        if expr.op in ("+", "-", "*", "/", "%", "^"):
-            # NULL propagation: any NULL operand returns NULL
-            if isinstance(left_val, CypherNull) or isinstance(right_val, CypherNull):
-                return CypherNull()
-
-            # Special case: string concatenation with +
-            if expr.op == "+":
-                from graphforge.types.values import CypherString, CypherValue
-
-                if isinstance(left_val, CypherString) or isinstance(right_val, CypherString):
-                    # Ensure both operands are CypherValue instances before accessing .value
-                    if not isinstance(left_val, CypherValue) or not isinstance(
-                        right_val, CypherValue
-                    ):
-                        raise TypeError(
-                            f"String concatenation requires CypherValue operands, "
-                            f"got {type(left_val).__name__} and {type(right_val).__name__}"
-                        )
-
-                    # Convert both to strings and concatenate
-                    left_str = (
-                        left_val.value
-                        if isinstance(left_val, CypherString)
-                        else str(left_val.value)
-                    )
-                    right_str = (
-                        right_val.value
-                        if isinstance(right_val, CypherString)
-                        else str(right_val.value)
-                    )
-                    return CypherString(left_str + right_str)
-
-            # Temporal arithmetic: datetime + duration, datetime - duration, datetime - datetime
-            if expr.op in ("+", "-"):
-                # Addition: temporal + duration or duration + temporal
-                if expr.op == "+":
-                    if isinstance(
-                        left_val, (CypherDateTime, CypherDate, CypherTime)
-                    ) and isinstance(right_val, CypherDuration):
-                        return _add_duration(left_val, right_val)
-                    elif isinstance(left_val, CypherDuration) and isinstance(
-                        right_val, (CypherDateTime, CypherDate, CypherTime)
-                    ):
-                        return _add_duration(right_val, left_val)
-
-                # Subtraction: temporal - duration or temporal - temporal
-                if expr.op == "-":
-                    if isinstance(
-                        left_val, (CypherDateTime, CypherDate, CypherTime)
-                    ) and isinstance(right_val, CypherDuration):
-                        return _subtract_duration(left_val, right_val)
-                    elif isinstance(left_val, (CypherDateTime, CypherDate)) and isinstance(
-                        right_val, (CypherDateTime, CypherDate)
-                    ):
-                        return _duration_between(left_val, right_val)
-
-            # Type checking: both operands must be numeric
-            if not isinstance(left_val, (CypherInt, CypherFloat)) or not isinstance(
-                right_val, (CypherInt, CypherFloat)
-            ):
-                raise TypeError(
-                    f"Arithmetic operator {expr.op} requires numeric operands, "
-                    f"got {type(left_val).__name__} and {type(right_val).__name__}"
-                )
-
-            # Type coercion: if either operand is float, result is float
-            result_type = (
-                CypherFloat
-                if isinstance(left_val, CypherFloat) or isinstance(right_val, CypherFloat)
-                else CypherInt
-            )
-
-            # Convert to Python numeric types
-            left_num = (
-                float(left_val.value) if isinstance(left_val, CypherFloat) else int(left_val.value)
-            )
-            right_num = (
-                float(right_val.value)
-                if isinstance(right_val, CypherFloat)
-                else int(right_val.value)
-            )
-
-            # Perform arithmetic operation
-            arith_result: float | int
-            if expr.op == "+":
-                arith_result = left_num + right_num
-            elif expr.op == "-":
-                arith_result = left_num - right_num
-            elif expr.op == "*":
-                arith_result = left_num * right_num
-            elif expr.op == "/":
-                # Division by zero returns NULL
-                if right_num == 0:
-                    return CypherNull()
-                # Division always returns float in Cypher
-                return CypherFloat(left_num / right_num)
-            elif expr.op == "%":
-                # Modulo by zero returns NULL
-                if right_num == 0:
-                    return CypherNull()
-                arith_result = left_num % right_num
-            elif expr.op == "^":
-                # Power: int^int returns int if result is whole, else float
-                # Handle edge cases: division by zero, overflow, complex, non-finite
-                try:
-                    pow_result = left_num**right_num
-                except (ZeroDivisionError, OverflowError):
-                    # 0^-1, very large numbers, etc. return NULL
-                    return CypherNull()
-
-                # Check for complex or non-finite results
-                if isinstance(pow_result, complex) or (
-                    isinstance(pow_result, float) and not math.isfinite(pow_result)
-                ):
-                    return CypherNull()
-
-                if isinstance(left_val, CypherInt) and isinstance(right_val, CypherInt):
-                    # int^int: return int if result is a whole number, else float
-                    if isinstance(pow_result, float):
-                        if math.isfinite(pow_result) and pow_result == int(pow_result):
-                            return CypherInt(int(pow_result))
-                        else:
-                            return CypherFloat(pow_result)
-                    else:
-                        return CypherInt(int(pow_result))
-                # If either operand is float, result is float
-                return CypherFloat(float(pow_result))
-            else:
-                raise ValueError(f"Unknown arithmetic operator: {expr.op}")
-
-            # Return with appropriate type (except division which always returns float)
-            if result_type is CypherFloat:
-                return CypherFloat(float(arith_result))
-            else:
-                return CypherInt(int(arith_result))
-
-        # String matching operators
-        if expr.op in ("STARTS WITH", "ENDS WITH", "CONTAINS"):
-            # NULL handling: any NULL operand returns NULL
-            if isinstance(left_val, CypherNull) or isinstance(right_val, CypherNull):
-                return CypherNull()
-
-            # Type checking: both operands must be strings
-            from graphforge.types.values import CypherString
-
-            if not isinstance(left_val, CypherString) or not isinstance(right_val, CypherString):
-                raise TypeError(
-                    f"{expr.op} requires string operands, "
-                    f"got {type(left_val).__name__} and {type(right_val).__name__}"
-                )
-
-            # Perform string matching
-            if expr.op == "STARTS WITH":
-                return CypherBool(left_val.value.startswith(right_val.value))
-            elif expr.op == "ENDS WITH":
-                return CypherBool(left_val.value.endswith(right_val.value))
-            elif expr.op == "CONTAINS":
-                return CypherBool(right_val.value in left_val.value)
-
-        raise ValueError(f"Unknown binary operator: {expr.op}")
+        operator = BINARY_OPERATORS.get(expr.op)
+        if operator is None:
+            raise ValueError(f"Unknown binary operator: {expr.op}")
+        return operator(left_val, right_val)
 
     # CASE expressions
     if isinstance(expr, CaseExpression):
@@ -622,8 +405,7 @@ def evaluate_expression(expr: Any, ctx: ExecutionContext, executor: Any = None)
         items: list[CypherValue] = []
         for item in list_val.value:
             # Create new context with loop variable bound
-            new_ctx = ExecutionContext()
-            new_ctx.bindings = dict(ctx.bindings)
+            new_ctx = ctx.child()
             new_ctx.bind(expr.variable, item)
 
             # Apply filter if present
@@ -656,8 +438,7 @@ def evaluate_expression(expr: Any, ctx: ExecutionContext, executor: Any = None)
         operators = executor.planner.plan(temp_query)
 
         # Execute pattern matching with current context
-        match_ctx = ExecutionContext()
-        match_ctx.bindings = dict(ctx.bindings)
+        match_ctx = ctx.child()
         match_rows = [match_ctx]
 
         # Execute all operators to get pattern matches
@@ -696,8 +477,7 @@ def evaluate_expression(expr: Any, ctx: ExecutionContext, executor: Any = None)
         filtered_items: list[CypherValue] = []
         for item in list_val.value:
             # Create new context with loop variable bound
-            new_ctx = ExecutionContext()
-            new_ctx.bindings = dict(ctx.bindings)
+            new_ctx = ctx.child()
             new_ctx.bind(expr.variable, item)
 
             # Evaluate predicate
@@ -725,8 +505,7 @@ def evaluate_expression(expr: Any, ctx: ExecutionContext, executor: Any = None)
         extracted_items: list[CypherValue] = []
         for item in list_val.value:
             # Create new context with loop variable bound
-            new_ctx = ExecutionContext()
-            new_ctx.bindings = dict(ctx.bindings)
+            new_ctx = ctx.child()
             new_ctx.bind(expr.variable, item)
 
             # Apply map transformation
@@ -754,8 +533,7 @@ def evaluate_expression(expr: Any, ctx: ExecutionContext, executor: Any = None)
         # Iterate and update accumulator
         for item in list_val.value:
             # Create new context with both accumulator and loop variable bound
-            new_ctx = ExecutionContext()
-            new_ctx.bindings = dict(ctx.bindings)
+            new_ctx = ctx.child()
             new_ctx.bind(expr.accumulator, accumulator_val)
             new_ctx.bind(expr.variable, item)
 
@@ -784,8 +562,7 @@ def evaluate_expression(expr: Any, ctx: ExecutionContext, executor: Any = None)
 
         for item in list_val.value:
             # Create new context with loop variable bound
-            new_ctx = ExecutionContext()
-            new_ctx.bindings = dict(ctx.bindings)
+            new_ctx = ctx.child()
             new_ctx.bind(expr.variable, item)
 
             # Evaluate predicate
@@ -862,19 +639,16 @@ def evaluate_expression(expr: Any, ctx: ExecutionContext, executor: Any = None)
         operators = executor.planner.plan(expr.query)
 
         # Create a new execution context with current bindings (correlated subquery)
-        subquery_ctx = ExecutionContext()
-        subquery_ctx.bindings = dict(ctx.bindings)
+        subquery_ctx = ctx.child()
 
-        # Execute the subquery
-        subquery_rows = [subquery_ctx]
-        for i, op in enumerate(operators):
-            subquery_rows = executor._execute_operator(op, subquery_rows, i, len(operators))
+        # Stream the subquery: EXISTS stops at the first row
+        subquery_rows = executor._stream(operators, [subquery_ctx])
 
         # Return result based on subquery type
         if expr.type == "EXISTS":
-            return CypherBool(len(subquery_rows) > 0)
+            return CypherBool(next(subquery_rows, None) is not None)
         elif expr.type == "COUNT":
-            return CypherInt(len(subquery_rows))
+            return CypherInt(sum(1 for _ in subquery_rows))
         else:
             raise ValueError(f"Unknown subquery type: {expr.type}")
 
@@ -889,6 +663,302 @@ def evaluate_expression(expr: Any, ctx: ExecutionContext, executor: Any = None)
     raise TypeError(f"Cannot evaluate expression type: {type(expr).__name__}")
 
 
+def _logical_and(left_val: Any, right_val: Any) -> CypherValue:
+    """Combine AND operands once the left operand is known not to be false."""
+    # true AND x = x (return right as-is, could be true/false/NULL)
+    if isinstance(left_val, CypherBool) and left_val.value:
+        if isinstance(right_val, (CypherBool, CypherNull)):
+            return right_val
+        raise TypeError("AND requires boolean operands")
+
+    # NULL AND false = false
+    if isinstance(left_val, CypherNull):
+        if isinstance(right_val, CypherBool) and not right_val.value:
+            return CypherBool(False)
+        # NULL AND true = NULL, NULL AND NULL = NULL
+        if isinstance(right_val, (CypherBool, CypherNull)):
+            return CypherNull()
+        raise TypeError("AND requires boolean operands")
+
+    raise TypeError("AND requires boolean operands")
+
+
+def _logical_or(left_val: Any, right_val: Any) -> CypherValue:
+    """Combine OR operands once the left operand is known not to be true."""
+    # false OR x = x (return right as-is, could be true/false/NULL)
+    if isinstance(left_val, CypherBool) and not left_val.value:
+        if isinstance(right_val, (CypherBool, CypherNull)):
+            return right_val
+        raise TypeError("OR requires boolean operands")
+
+    # NULL OR true = true
+    if isinstance(left_val, CypherNull):
+        if isinstance(right_val, CypherBool) and right_val.value:
+            return CypherBool(True)
+        # NULL OR false = NULL, NULL OR NULL = NULL
+        if isinstance(right_val, (CypherBool, CypherNull)):
+            return CypherNull()
+        raise TypeError("OR requires boolean operands")
+
+    raise TypeError("OR requires boolean operands")
+
+
+def _logical_xor(left_val: Any, right_val: Any) -> CypherValue:
+    """Three-valued XOR (no short-circuit possible)."""
+    # If either operand is NULL, result is NULL
+    if isinstance(left_val, CypherNull) or isinstance(right_val, CypherNull):
+        # Validate the non-NULL operand is boolean (if any)
+        if isinstance(left_val, CypherNull) and not isinstance(right_val, (CypherBool, CypherNull)):
+            raise TypeError(XOR_TYPE_ERROR_MSG)
+        if isinstance(right_val, CypherNull) and not isinstance(left_val, (CypherBool, CypherNull)):
+            raise TypeError(XOR_TYPE_ERROR_MSG)
+        return CypherNull()
+
+    # Both operands must be boolean
+    if not isinstance(left_val, CypherBool) or not isinstance(right_val, CypherBool):
+        raise TypeError(XOR_TYPE_ERROR_MSG)
+
+    # XOR truth table: true XOR true = false, true XOR false = true,
+    # false XOR true = true, false XOR false = false
+    return CypherBool(left_val.value != right_val.value)
+
+
+def _greater_than(left_val: Any, right_val: Any) -> CypherValue:
+    """Evaluate left > right as right < left."""
+    return right_val.less_than(left_val)  # type: ignore[no-any-return]
+
+
+def _less_than(left_val: Any, right_val: Any) -> CypherValue:
+    """Evaluate left < right."""
+    return left_val.less_than(right_val)  # type: ignore[no-any-return]
+
+
+def _greater_equal(left_val: Any, right_val: Any) -> CypherValue:
+    """Evaluate left >= right as NOT (left < right)."""
+    result = left_val.less_than(right_val)
+    if isinstance(result, CypherNull):
+        return result
+    return CypherBool(not result.value)
+
+
+def _less_equal(left_val: Any, right_val: Any) -> CypherValue:
+    """Evaluate left <= right as NOT (right < left)."""
+    result = right_val.less_than(left_val)
+    if isinstance(result, CypherNull):
+        return result
+    return CypherBool(not result.value)
+
+
+def _equal(left_val: Any, right_val: Any) -> CypherValue:
+    """Evaluate left = right."""
+    return left_val.equals(right_val)  # type: ignore[no-any-return]
+
+
+def _not_equal(left_val: Any, right_val: Any) -> CypherValue:
+    """Evaluate left <> right."""
+    result = left_val.equals(right_val)
+    if isinstance(result, CypherNull):
+        return result
+    return CypherBool(not result.value)
+
+
+def _in_list(left_val: Any, right_val: Any) -> CypherValue:
+    """Evaluate value IN list with three-valued logic."""
+    # anything IN NULL → NULL
+    if isinstance(right_val, CypherNull):
+        return CypherNull()
+
+    # Right operand must be a list
+    if not isinstance(right_val, CypherList):
+        raise TypeError(
+            f"IN operator requires a list on the right side, got {type(right_val).__name__}"
+        )
+
+    # Empty list: value IN [] → false (even for NULL IN [])
+    # This must come before NULL check on left operand
+    if not right_val.value:
+        return CypherBool(False)
+
+    # NULL IN non-empty-list → NULL
+    if isinstance(left_val, CypherNull):
+        return CypherNull()
+
+    # Check if left_val is in the list
+    # Use three-valued logic: if any comparison is NULL and no match found, return NULL
+    has_null = False
+    for item in right_val.value:
+        result = left_val.equals(item)
+        if isinstance(result, CypherBool):
+            if result.value:
+                return CypherBool(True)  # Found a match
+        elif isinstance(result, CypherNull):
+            has_null = True  # Track that we saw a NULL comparison
+
+    # No match found: return NULL if we saw any NULL comparisons, else false
+    return CypherNull() if has_null else CypherBool(False)
+
+
+def _arithmetic(op: str, left_val: Any, right_val: Any) -> CypherValue:
+    """Evaluate an arithmetic operator (+, -, *, /, %, ^)."""
+    # NULL propagation: any NULL operand returns NULL
+    if isinstance(left_val, CypherNull) or isinstance(right_val, CypherNull):
+        return CypherNull()
+
+    # Special case: string concatenation with +
+    if op == "+":
+        if isinstance(left_val, CypherString) or isinstance(right_val, CypherString):
+            # Ensure both operands are CypherValue instances before accessing .value
+            if not isinstance(left_val, CypherValue) or not isinstance(right_val, CypherValue):
+                raise TypeError(
+                    f"String concatenation requires CypherValue operands, "
+                    f"got {type(left_val).__name__} and {type(right_val).__name__}"
+                )
+
+            # Convert both to strings and concatenate
+            left_str = left_val.value if isinstance(left_val, CypherString) else str(left_val.value)
+            right_str = (
+                right_val.value if isinstance(right_val, CypherString) else str(right_val.value)
+            )
+            return CypherString(left_str + right_str)
+
+    # Temporal arithmetic: datetime + duration, datetime - duration, datetime - datetime
+    if op in ("+", "-"):
+        # Addition: temporal + duration or duration + temporal
+        if op == "+":
+            if isinstance(left_val, (CypherDateTime, CypherDate, CypherTime)) and isinstance(
+                right_val, CypherDuration
+            ):
+                return _add_duration(left_val, right_val)
+            elif isinstance(left_val, CypherDuration) and isinstance(
+                right_val, (CypherDateTime, CypherDate, CypherTime)
+            ):
+                return _add_duration(right_val, left_val)
+
+        # Subtraction: temporal - duration or temporal - temporal
+        if op == "-":
+            if isinstance(left_val, (CypherDateTime, CypherDate, CypherTime)) and isinstance(
+                right_val, CypherDuration
+            ):
+                return _subtract_duration(left_val, right_val)
+            elif isinstance(left_val, (CypherDateTime, CypherDate)) and isinstance(
+                right_val, (CypherDateTime, CypherDate)
+            ):
+                return _duration_between(left_val, right_val)
+
+    # Type checking: both operands must be numeric
+    if not isinstance(left_val, (CypherInt, CypherFloat)) or not isinstance(
+        right_val, (CypherInt, CypherFloat)
+    ):
+        raise TypeError(
+            f"Arithmetic operator {op} requires numeric operands, "
+            f"got {type(left_val).__name__} and {type(right_val).__name__}"
+        )
+
+    # Type coercion: if either operand is float, result is float
+    result_type = (
+        CypherFloat
+        if isinstance(left_val, CypherFloat) or isinstance(right_val, CypherFloat)
+        else CypherInt
+    )
+
+    # Convert to Python numeric types
+    left_num = float(left_val.value) if isinstance(left_val, CypherFloat) else int(left_val.value)
+    right_num = (
+        float(right_val.value) if isinstance(right_val, CypherFloat) else int(right_val.value)
+    )
+
+    # Perform arithmetic operation
+    arith_result: float | int
+    if op == "+":
+        arith_result = left_num + right_num
+    elif op == "-":
+        arith_result = left_num - right_num
+    elif op == "*":
+        arith_result = left_num * right_num
+    elif op == "/":
+        # Division by zero returns NULL
+        if right_num == 0:
+            return CypherNull()
+        # Division always returns float in Cypher
+        return CypherFloat(left_num / right_num)
+    elif op == "%":
+        # Modulo by zero returns NULL
+        if right_num == 0:
+            return CypherNull()
+        arith_result = left_num % right_num
+    elif op == "^":
+        # Power: int^int returns int if result is whole, else float
+        # Handle edge cases: division by zero, overflow, complex, non-finite
+        try:
+            pow_result = left_num**right_num
+        except (ZeroDivisionError, OverflowError):
+            # 0^-1, very large numbers, etc. return NULL
+            return CypherNull()
+
+        # Check for complex or non-finite results
+        if isinstance(pow_result, complex) or (
+            isinstance(pow_result, float) and not math.isfinite(pow_result)
+        ):
+            return CypherNull()
+
+        if isinstance(left_val, CypherInt) and isinstance(right_val, CypherInt):
+            # int^int: return int if result is a whole number, else float
+            if isinstance(pow_result, float):
+                if math.isfinite(pow_result) and pow_result == int(pow_result):
+                    return CypherInt(int(pow_result))
+                else:
+                    return CypherFloat(pow_result)
+            else:
+                return CypherInt(int(pow_result))
+        # If either operand is float, result is float
+        return CypherFloat(float(pow_result))
+    else:
+        raise ValueError(f"Unknown arithmetic operator: {op}")
+
+    # Return with appropriate type (except division which always returns float)
+    if result_type is CypherFloat:
+        return CypherFloat(float(arith_result))
+    else:
+        return CypherInt(int(arith_result))
+
+
+def _string_match(op: str, left_val: Any, right_val: Any) -> CypherValue:
+    """Evaluate STARTS WITH, ENDS WITH or CONTAINS."""
+    # NULL handling: any NULL operand returns NULL
+    if isinstance(left_val, CypherNull) or isinstance(right_val, CypherNull):
+        return CypherNull()
+
+    # Type checking: both operands must be strings
+    if not isinstance(left_val, CypherString) or not isinstance(right_val, CypherString):
+        raise TypeError(
+            f"{op} requires string operands, "
+            f"got {type(left_val).__name__} and {type(right_val).__name__}"
+        )
+
+    # Perform string matching
+    if op == "STARTS WITH":
+        return CypherBool(left_val.value.startswith(right_val.value))
+    elif op == "ENDS WITH":
+        return CypherBool(left_val.value.endswith(right_val.value))
+    elif op == "CONTAINS":
+        return CypherBool(right_val.value in left_val.value)
+    raise ValueError(f"Unknown binary operator: {op}")
+
+
+# Binary operators other than AND/OR/XOR, by operator symbol
+BINARY_OPERATORS: dict[str, Callable[[Any, Any], CypherValue]] = {
+    ">": _greater_than,
+    "<": _less_than,
+    ">=": _greater_equal,
+    "<=": _less_equal,
+    "=": _equal,
+    "<>": _not_equal,
+    "IN": _in_list,
+    **{op: partial(_arithmetic, op) for op in ("+", "-", "*", "/", "%", "^")},
+    **{op: partial(_string_match, op) for op in ("STARTS WITH", "ENDS WITH", "CONTAINS")},
+}
+
+
 # Function categories
 STRING_FUNCTIONS = {
     "LENGTH",
@@ -933,6 +1003,17 @@ SPATIAL_FUNCTIONS = {"POINT", "DISTANCE"}
 MATH_FUNCTIONS = {"ABS", "CEIL", "FLOOR", "ROUND", "SIGN", "SQRT", "RAND", "POW"}
 GRAPH_FUNCTIONS = {"ID", "LABELS"}
 PATH_FUNCTIONS = {"LENGTH", "NODES", "RELATIONSHIPS", "HEAD", "LAST"}
+# Functions _evaluate_function handles before NULL propagation
+_SPECIAL_FUNCTIONS = {
+    "COALESCE",
+    "LENGTH",
+    "HEAD",
+    "LAST",
+    "REVERSE",
+    "EXISTS",
+    *GRAPH_FUNCTIONS,
+    *PATH_FUNCTIONS,
+}
 AGGREGATE_FUNCTIONS = {
     "COUNT",
     "SUM",
@@ -1375,37 +1456,65 @@ def _evaluate_function(
     if any(isinstance(arg, CypherNull) for arg in args):
         return CypherNull()
 
-    # SIZE function for lists and strings
-    if func_name == "SIZE":
-        arg = args[0]
-        if isinstance(arg, (CypherList, CypherString)):
-            return CypherInt(len(arg.value))
-        raise TypeError(f"SIZE expects list or string, got {type(arg).__name__}")
+    # Dispatch to specific function handlers
+    handler = function_handler(func_name)
+    if handler is None:
+        raise ValueError(f"Unknown function: {func_name}")
+    return handler(func_name, args)
 
-    # ISEMPTY function for lists, strings, and maps
-    if func_name == "ISEMPTY":
-        if len(args) == 0:
-            raise TypeError("ISEMPTY expects exactly one argument")
-        arg = args[0]
-        if isinstance(arg, (CypherList, CypherString, CypherMap)):
-            return CypherBool(len(arg.value) == 0)
-        raise TypeError(f"ISEMPTY expects list, string, or map, got {type(arg).__name__}")
 
-    # Dispatch to specific function handlers
+def _evaluate_size(_func_name: str, args: list[CypherValue]) -> CypherValue:
+    """Evaluate SIZE for lists and strings."""
+    arg = args[0]
+    if isinstance(arg, (CypherList, CypherString)):
+        return CypherInt(len(arg.value))
+    raise TypeError(f"SIZE expects list or string, got {type(arg).__name__}")
+
+
+def _evaluate_isempty(_func_name: str, args: list[CypherValue]) -> CypherValue:
+    """Evaluate ISEMPTY for lists, strings, and maps."""
+    if len(args) == 0:
+        raise TypeError("ISEMPTY expects exactly one argument")
+    arg = args[0]
+    if isinstance(arg, (CypherList, CypherString, CypherMap)):
+        return CypherBool(len(arg.value) == 0)
+    raise TypeError(f"ISEMPTY expects list, string, or map, got {type(arg).__name__}")
+
+
+def function_handler(func_name: str) -> Callable[[str, list[CypherValue]], CypherValue] | None:
+    """Return the handler for a scalar function that propagates NULL arguments.
+
+    These are the functions _evaluate_function dispatches to once no argument
+    is NULL; the handler is called as ``handler(func_name, args)``. Functions
+    with special argument handling (COALESCE, EXISTS, the overloaded LENGTH,
+    HEAD, LAST and REVERSE, graph and path functions) and custom functions
+    are not covered.
+
+    Args:
+        func_name: Upper-case function name
+
+    Returns:
+        Handler, or None if the name is not a NULL-propagating scalar function
+    """
+    if func_name in _SPECIAL_FUNCTIONS:
+        return None
+    if func_name == "SIZE":
+        return _evaluate_size
+    if func_name == "ISEMPTY":
+        return _evaluate_isempty
     if func_name in STRING_FUNCTIONS:
-        return _evaluate_string_function(func_name, args)
-    elif func_name in LIST_FUNCTIONS:
-        return _evaluate_list_function(func_name, args)
-    elif func_name in MATH_FUNCTIONS:
-        return _evaluate_math_function(func_name, args)
-    elif func_name in TYPE_FUNCTIONS:
-        return _evaluate_type_function(func_name, args)
-    elif func_name in TEMPORAL_FUNCTIONS:
-        return _evaluate_temporal_function(func_name, args)
-    elif func_name in SPATIAL_FUNCTIONS:
-        return _evaluate_spatial_function(func_name, args)
-    else:
-        raise ValueError(f"Unknown function: {func_name}")
+        return _evaluate_string_function
+    if func_name in LIST_FUNCTIONS:
+        return _evaluate_list_function
+    if func_name in MATH_FUNCTIONS:
+        return _evaluate_math_function
+    if func_name in TYPE_FUNCTIONS:
+        return _evaluate_type_function
+    if func_name in TEMPORAL_FUNCTIONS:
+        return _evaluate_temporal_function
+    if func_name in SPATIAL_FUNCTIONS:
+        return _evaluate_spatial_function
+    return None
 
 
 def _evaluate_string_function(func_name: str, args: list[CypherValue]) -> CypherValue:
@@ -6,6 +6,13 @@ against a graph store.
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from datetime import timedelta
+from functools import partial
+import heapq
+from itertools import chain, islice
+import math
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
 from graphforge.ast.expression import (
@@ -14,33 +21,46 @@ from graphforge.ast.expression import (
     FunctionCall,
     ListComprehension,
     Literal,
+    Parameter,
     PropertyAccess,
     QuantifierExpression,
     SubqueryExpression,
     UnaryOp,
     Variable,
 )
+from graphforge.executor.batch import DEFAULT_SCAN_BATCH_SIZE, BatchCompiler
+from graphforge.executor.compiler import CompiledExpression, compile_expression
 from graphforge.executor.evaluator import ExecutionContext, evaluate_expression
+from graphforge.executor.paths import PathLink, path_edges, path_lists
+from graphforge.executor.procedures import call_procedure, get_procedure
 from graphforge.planner.operators import (
     Aggregate,
+    Call,
     Create,
+    CreateIndex,
     Delete,
     Distinct,
+    DropIndex,
     ExpandEdges,
     ExpandMultiHop,
     ExpandVariableLength,
     Filter,
     Limit,
     Merge,
+    NodeIndexScan,
+    NodeIndexSeek,
     OptionalExpandEdges,
     OptionalScanNodes,
+    ProcedureCall,
     Project,
     Remove,
     ScanNodes,
     Set,
+    ShortestPath,
     Skip,
     Sort,
     Subquery,
+    TopK,
     Union,
     Unwind,
     With,
@@ -48,16 +68,24 @@ from graphforge.planner.operators import (
 from graphforge.storage.memory import Graph
 from graphforge.types.values import (
     CypherBool,
+    CypherDate,
+    CypherDateTime,
+    CypherDistance,
+    CypherDuration,
     CypherFloat,
     CypherInt,
     CypherList,
     CypherMap,
     CypherNull,
+    CypherPath,
+    CypherPoint,
+    CypherString,
+    CypherTime,
     CypherValue,
 )
 
 if TYPE_CHECKING:
-    from graphforge.types.graph import NodeRef
+    from graphforge.types.graph import EdgeRef, NodeRef
 
 
 def _cypher_to_python(cypher_val: CypherValue) -> Any:
@@ -84,6 +112,117 @@ def _cypher_to_python(cypher_val: CypherValue) -> Any:
         return cypher_val.value
 
 
+# Number of compiled expressions an executor keeps before starting over
+_COMPILED_EXPRESSION_CACHE_SIZE = 4096
+
+# Rank of each value type in ORDER BY, following openCypher orderability:
+# maps < nodes < relationships < lists < paths < points < temporals <
+# durations < strings < booleans < numbers < NULL
+_MAP_RANK = 0
+_NODE_RANK = 1
+_RELATIONSHIP_RANK = 2
+_LIST_RANK = 3
+_PATH_RANK = 4
+_POINT_RANK = 5
+_DATETIME_RANK = 6
+_LOCAL_DATETIME_RANK = 7
+_DATE_RANK = 8
+_TIME_RANK = 9
+_LOCAL_TIME_RANK = 10
+_DURATION_RANK = 11
+_STRING_RANK = 12
+_BOOLEAN_RANK = 13
+_NUMBER_RANK = 14
+_OTHER_RANK = 15
+_NULL_RANK = 16
+
+
+def _order_key(value: Any) -> tuple:
+    """Return a key whose native tuple ordering is the ORDER BY order of ``value``.
+
+    Values of one type compare as Cypher's ``<`` does; values of different
+    types are ordered by type rank, so any two keys are comparable and
+    NULLs sort last (first when the sort is reversed).
+
+    Args:
+        value: Evaluated sort expression (CypherValue, NodeRef or EdgeRef)
+
+    Returns:
+        Totally ordered key tuple
+    """
+    from graphforge.types.graph import EdgeRef, NodeRef
+
+    if isinstance(value, CypherNull):
+        return (_NULL_RANK,)
+    if isinstance(value, (CypherInt, CypherFloat, CypherDistance)):
+        number = value.value
+        if isinstance(number, float) and math.isnan(number):
+            return (_NUMBER_RANK, 1, 0)  # NaN sorts after every number
+        return (_NUMBER_RANK, 0, number)
+    if isinstance(value, CypherBool):
+        return (_BOOLEAN_RANK, value.value)
+    if isinstance(value, CypherString):
+        return (_STRING_RANK, value.value)
+    if isinstance(value, CypherList):
+        return (_LIST_RANK, tuple(_order_key(item) for item in value.value))
+    if isinstance(value, CypherMap):
+        return (_MAP_RANK, tuple(sorted((k, _order_key(v)) for k, v in value.value.items())))
+    if isinstance(value, NodeRef):
+        return (_NODE_RANK, isinstance(value.id, str), value.id)
+    if isinstance(value, EdgeRef):
+        return (_RELATIONSHIP_RANK, isinstance(value.id, str), value.id)
+    if isinstance(value, CypherPath):
+        elements = [_order_key(value.nodes[0])]
+        for rel, node in zip(value.relationships, value.nodes[1:]):
+            elements.extend((_order_key(rel), _order_key(node)))
+        return (_PATH_RANK, tuple(elements))
+    if isinstance(value, CypherPoint):
+        return (_POINT_RANK, tuple(sorted(value.value.items())))
+    if isinstance(value, CypherDateTime):
+        moment = value.value
+        if moment.utcoffset() is None:
+            return (_LOCAL_DATETIME_RANK, moment)
+        return (_DATETIME_RANK, moment)
+    if isinstance(value, CypherDate):
+        return (_DATE_RANK, value.value)
+    if isinstance(value, CypherTime):
+        time = value.value
+        seconds = time.hour * 3600 + time.minute * 60 + time.second + time.microsecond / 1e6
+        offset = time.utcoffset()
+        if offset is None:
+            return (_LOCAL_TIME_RANK, seconds)
+        return (_TIME_RANK, seconds - offset.total_seconds())
+    if isinstance(value, CypherDuration):
+        duration = value.value
+        if isinstance(duration, timedelta):
+            return (_DURATION_RANK, 0, duration)
+        return (_DURATION_RANK, duration.years * 12 + duration.months, duration.tdelta)
+    return (_OTHER_RANK,)
+
+
+class _Descending:
+    """Sort key wrapper reversing the order of the key it holds."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: tuple):
+        self.key = key
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __lt__(self, other: _Descending) -> bool:
+        return other.key < self.key
+
+
+def _order_key_at(index: int, pair: tuple[tuple, Any]) -> Any:
+    """Return one order key of an (order keys, row) pair."""
+    return pair[0][index]
+
+
 def _expression_to_string(expr: Any, fallback_index: int | None = None) -> str:
     """Convert AST expression to its Cypher string representation.
 
@@ -101,6 +240,10 @@ def _expression_to_string(expr: Any, fallback_index: int | None = None) -> str:
     if isinstance(expr, Variable):
         return expr.name
 
+    # Parameter reference
+    if isinstance(expr, Parameter):
+        return f"${expr.name}"
+
     # Property access
     if isinstance(expr, PropertyAccess):
         return f"{expr.variable}.{expr.property}"
@@ -211,45 +354,342 @@ class QueryExecutor:
     each stage of the query.
     """
 
-    def __init__(self, graph: Graph, graphforge=None, planner=None):
+    def __init__(
+        self, graph: Graph, graphforge=None, planner=None, scan_batch_size: int | None = None
+    ):
         """Initialize executor with a graph.
 
         Args:
             graph: The graph to query
             graphforge: Optional GraphForge instance for CREATE operations
             planner: Optional QueryPlanner instance for subquery execution
+            scan_batch_size: Rows per batch for batched node scans, or None to
+                execute them row at a time (see graphforge.executor.batch)
+
+        Raises:
+            ValueError: If scan_batch_size is less than 1
         """
+        if scan_batch_size is not None and scan_batch_size < 1:
+            raise ValueError(f"scan_batch_size must be at least 1, got {scan_batch_size}")
         self.graph = graph
         self.graphforge = graphforge
         self.planner = planner
+        self.scan_batch_size = scan_batch_size
         self.custom_functions: dict[str, Any] = {}
+        # Parameter values for the query currently executing ($name -> value)
+        self.parameters: dict[str, CypherValue] = {}
+        # Compiled expressions by id(expression); the expression is kept alive
+        # alongside its closure so that its id cannot be reused
+        self._compiled_expressions: dict[int, tuple[Any, CompiledExpression]] = {}
 
-    def execute(self, operators: list) -> list[dict]:
+    def _compile_expression(self, expr: Any) -> CompiledExpression:
+        """Return the compiled closure for an expression, compiling it on first use.
+
+        Plans are cached and reused across executions, so the closures of
+        their expressions are too.
+
+        Args:
+            expr: AST expression node
+
+        Returns:
+            Closure evaluating ``expr`` against an ExecutionContext
+        """
+        cached = self._compiled_expressions.get(id(expr))
+        if cached is not None and cached[0] is expr:
+            return cached[1]
+        if len(self._compiled_expressions) >= _COMPILED_EXPRESSION_CACHE_SIZE:
+            self._compiled_expressions.clear()
+        compiled = compile_expression(expr, self)
+        self._compiled_expressions[id(expr)] = (expr, compiled)
+        return compiled
+
+    def execute(
+        self, operators: list, parameters: dict[str, CypherValue] | None = None
+    ) -> list[dict]:
         """Execute a pipeline of operators.
 
         Args:
             operators: List of logical plan operators
+            parameters: Optional parameter values referenced as $name in the
+                query. When omitted, the parameters of an enclosing execution
+                (if any) remain in effect.
 
         Returns:
             List of result rows (dicts mapping column names to values)
         """
-        # Start with empty context
-        rows: list[Any] = [ExecutionContext()]
+        return list(self.execute_iter(operators, parameters))
+
+    def execute_iter(
+        self, operators: list, parameters: dict[str, CypherValue] | None = None
+    ) -> Iterator[dict]:
+        """Execute a pipeline of operators, producing result rows as they are pulled.
+
+        Each operator pulls rows from the one before it, so a LIMIT stops the
+        scans and expansions feeding it once it has enough rows, and only
+        pipeline breakers (sorting, aggregation, ...) hold their whole input
+        in memory. Closing the iterator early discards the rest of the
+        pipeline.
+
+        A pipeline containing updating operators (CREATE, MERGE, SET, REMOVE,
+        DELETE, index DDL), including inside UNION branches and subqueries,
+        is run to completion before this method returns, so its writes take
+        effect whether or not any row is pulled; the returned iterator then
+        walks the buffered rows.
 
-        # Execute each operator in sequence
-        for i, op in enumerate(operators):
-            rows = self._execute_operator(op, rows, i, len(operators))
+        Args:
+            operators: List of logical plan operators
+            parameters: Optional parameter values referenced as $name in the
+                query. When omitted, the parameters of an enclosing execution
+                (if any) remain in effect.
+
+        Returns:
+            Iterator over result rows (dicts mapping column names to values)
+        """
+        rows = self._iter_rows(operators, parameters)
+        if self._has_updates(operators):
+            return iter(list(rows))
+        return rows
+
+    @classmethod
+    def _has_updates(cls, operators: list) -> bool:
+        """Check whether a pipeline, or one nested in it, writes to the graph."""
+        for op in operators:
+            if isinstance(op, (Create, Set, Remove, Delete, Merge, CreateIndex, DropIndex)):
+                return True
+            if isinstance(op, Union) and any(cls._has_updates(branch) for branch in op.branches):
+                return True
+            if isinstance(op, (Call, Subquery)) and cls._has_updates(op.operators):
+                return True
+        return False
+
+    def _iter_rows(
+        self, operators: list, parameters: dict[str, CypherValue] | None
+    ) -> Iterator[dict]:
+        """Generator behind execute_iter(), pulling rows through the pipeline."""
+        # Start with empty context
+        rows = self._stream(operators, [ExecutionContext()])
 
         # If there's no Project or Aggregate operator in the pipeline (no RETURN clause),
-        # return empty results (Cypher semantics: queries without RETURN produce no output)
+        # run it for its side effects and produce no rows (Cypher semantics)
         # Exception: Union operators contain their own RETURN clauses in branches
-        if operators and not any(isinstance(op, (Project, Aggregate, Union)) for op in operators):
-            return []
+        returns_rows = not operators or any(
+            isinstance(op, (Project, Aggregate, Union)) for op in operators
+        )
+
+        while True:
+            # Parameters are in effect only while pulling, so interleaved
+            # iterators and nested executions each see their own
+            previous_parameters = self.parameters
+            if parameters is not None:
+                self.parameters = parameters
+            try:
+                row = next(rows, None)
+            finally:
+                self.parameters = previous_parameters
+            # Rows are never None, so None marks an exhausted pipeline
+            if row is None:
+                return
+            if returns_rows:
+                # Project/Aggregate (or Union) has converted rows to dicts
+                yield row
+
+    def _stream(self, operators: list, input_rows: Iterable[Any]) -> Iterator[Any]:
+        """Chain operators into a pull-based pipeline over input rows.
 
-        # At this point, rows has been converted to list[dict] by Project/Aggregate operator
-        # (or Union operator which also returns list[dict])
+        Args:
+            operators: List of logical plan operators
+            input_rows: Rows fed to the first operator
+
+        Returns:
+            Lazy iterator over the rows produced by the last operator
+        """
+        rows: Iterator[Any] = iter(input_rows)
+        i = 0
+        while i < len(operators):
+            op = operators[i]
+            if (
+                self.scan_batch_size is not None
+                and isinstance(op, ScanNodes)
+                and op.path_var is None
+            ):
+                end = self._batched_segment_end(operators, i)
+                rows = self._iter_batched_scan(operators[i:end], rows, i, len(operators))
+                i = end
+                continue
+            rows = self._stream_operator(op, rows, i, len(operators))
+            i += 1
         return rows
 
+    @staticmethod
+    def _batched_segment_end(operators: list, start: int) -> int:
+        """End of the ScanNodes, Filter* [, Project] segment starting at ``start``."""
+        from graphforge.ast.expression import Wildcard
+
+        end = start + 1
+        while end < len(operators) and isinstance(operators[end], Filter):
+            end += 1
+        if (
+            end < len(operators)
+            and isinstance(operators[end], Project)
+            and not any(isinstance(item.expression, Wildcard) for item in operators[end].items)
+        ):
+            end += 1
+        return end
+
+    def _iter_batched_scan(
+        self, operators: list, input_rows: Iterable[ExecutionContext], op_index: int, total_ops: int
+    ) -> Iterator[Any]:
+        """Stream a ScanNodes segment, moving the scanned nodes in column batches.
+
+        The scan predicate and the Filters narrow each batch of candidate
+        nodes, and a trailing Project evaluates its items one column at a
+        time. Rows whose scan variable is already bound are executed row at a
+        time.
+
+        Args:
+            operators: ScanNodes, followed by Filters and optionally a Project
+            input_rows: Input execution contexts
+            op_index: Index of the ScanNodes operator in the pipeline
+            total_ops: Total number of operators in the pipeline
+
+        Yields:
+            Execution contexts for the surviving nodes, or Project rows
+        """
+        scan = operators[0]
+        compiler = BatchCompiler(self, scan.variable)
+        predicates = [
+            compiler.predicate(op.predicate) for op in operators[1:] if isinstance(op, Filter)
+        ]
+        if scan.predicate is not None:
+            predicates.insert(0, compiler.predicate(scan.predicate))
+        project = operators[-1] if isinstance(operators[-1], Project) else None
+        keys: list[str] = []
+        columns = []
+        if project is not None:
+            for i, return_item in enumerate(project.items):
+                keys.append(
+                    return_item.alias
+                    or _expression_to_string(return_item.expression, fallback_index=i)
+                )
+                columns.append(compiler.column(return_item.expression))
+
+        batch_size = self.scan_batch_size or DEFAULT_SCAN_BATCH_SIZE
+        for ctx in input_rows:
+            if ctx.has(scan.variable):
+                rows: Iterator[Any] = iter((ctx,))
+                for offset, op in enumerate(operators):
+                    rows = self._stream_operator(op, rows, op_index + offset, total_ops)
+                yield from rows
+                continue
+
+            nodes = self._scan_candidates(scan)
+            for start in range(0, len(nodes), batch_size):
+                batch = nodes[start : start + batch_size]
+                for predicate in predicates:
+                    batch = [
+                        node for node, truth in zip(batch, predicate(batch, ctx)) if truth is True
+                    ]
+                    if not batch:
+                        break
+                if not batch:
+                    continue
+                if project is None:
+                    for node in batch:
+                        row = ctx.child()
+                        row.bind(scan.variable, node)
+                        yield row
+                else:
+                    for values in zip(*[column(batch, ctx) for column in columns]):
+                        yield dict(zip(keys, values))
+
+    def _stream_operator(
+        self,
+        op,
+        input_rows: Iterator[Any],
+        op_index: int,
+        total_ops: int,
+    ) -> Iterator[Any]:
+        """Stream a single operator over the rows pulled from its input.
+
+        Row-at-a-time operators yield as they go; LIMIT and SKIP stop or skip
+        pulling. Every other operator is a pipeline breaker that drains its
+        input and runs the list-based implementation.
+
+        Args:
+            op: Logical plan operator
+            input_rows: Lazy input rows
+            op_index: Index of current operator in pipeline
+            total_ops: Total number of operators in pipeline
+
+        Returns:
+            Lazy iterator over the operator's output rows
+        """
+        if isinstance(op, ScanNodes):
+            return self._iter_scan(op, input_rows)
+
+        if isinstance(op, NodeIndexSeek):
+            return self._iter_index_seek(op, input_rows)
+
+        if isinstance(op, NodeIndexScan):
+            return self._iter_index_scan(op, input_rows)
+
+        if isinstance(op, ExpandEdges) and op.agg_hint is None:
+            return self._iter_expand(op, input_rows)
+
+        if isinstance(op, ShortestPath):
+            return self._iter_shortest_path(op, input_rows)
+
+        if isinstance(op, ProcedureCall):
+            return self._iter_procedure_call(op, input_rows)
+
+        if isinstance(op, Filter):
+            return self._iter_filter(op, input_rows)
+
+        if isinstance(op, Project):
+            return self._iter_project(op, input_rows)
+
+        if isinstance(op, Limit):
+            return self._iter_limit(op, input_rows)
+
+        if isinstance(op, Skip):
+            return self._iter_skip(op, input_rows)
+
+        if isinstance(op, Unwind):
+            return self._iter_unwind(op, input_rows)
+
+        if isinstance(op, Distinct):
+            return self._iter_distinct(op, input_rows)
+
+        if isinstance(op, With) and not op.sort_items:
+            return self._iter_with_page(op, input_rows)
+
+        if isinstance(op, With) and op.limit_count is not None:
+            return self._iter_with_top_k(op, input_rows)
+
+        if isinstance(op, TopK):
+            return self._iter_top_k(op, input_rows)
+
+        if isinstance(
+            op, (OptionalScanNodes, OptionalExpandEdges, ExpandVariableLength, ExpandMultiHop)
+        ):
+            # Independent per input row: run the list-based implementation on each
+            return self._iter_per_row(op, input_rows, op_index, total_ops)
+
+        return self._iter_materialized(op, input_rows, op_index, total_ops)
+
+    def _iter_per_row(
+        self, op, input_rows: Iterator[Any], op_index: int, total_ops: int
+    ) -> Iterator[Any]:
+        """Stream an operator by executing it on one input row at a time."""
+        for row in input_rows:
+            yield from self._execute_operator(op, [row], op_index, total_ops)
+
+    def _iter_materialized(
+        self, op, input_rows: Iterator[Any], op_index: int, total_ops: int
+    ) -> Iterator[Any]:
+        """Stream a pipeline breaker: drain the input, then execute the operator once."""
+        yield from self._execute_operator(op, list(input_rows), op_index, total_ops)
+
     def _execute_operator(
         self,
         op,
@@ -271,6 +711,12 @@ class QueryExecutor:
         if isinstance(op, ScanNodes):
             return self._execute_scan(op, input_rows)
 
+        if isinstance(op, NodeIndexSeek):
+            return self._execute_index_seek(op, input_rows)
+
+        if isinstance(op, NodeIndexScan):
+            return self._execute_index_scan(op, input_rows)
+
         if isinstance(op, OptionalScanNodes):
             return self._execute_optional_scan(op, input_rows)
 
@@ -285,6 +731,9 @@ class QueryExecutor:
         if isinstance(op, ExpandMultiHop):
             return self._execute_multi_hop(op, input_rows)
 
+        if isinstance(op, ShortestPath):
+            return list(self._iter_shortest_path(op, input_rows))
+
         if isinstance(op, OptionalExpandEdges):
             return self._execute_optional_expand(op, input_rows)
 
@@ -303,6 +752,9 @@ class QueryExecutor:
         if isinstance(op, Sort):
             return self._execute_sort(op, input_rows)
 
+        if isinstance(op, TopK):
+            return self._execute_top_k(op, input_rows)
+
         if isinstance(op, Aggregate):
             # Determine if we're in WITH context (more operators follow)
             # In WITH, return ExecutionContexts; in RETURN, return dicts
@@ -341,9 +793,18 @@ class QueryExecutor:
         if isinstance(op, Call):
             return self._execute_call(op, input_rows)
 
+        if isinstance(op, ProcedureCall):
+            return list(self._iter_procedure_call(op, input_rows))
+
         if isinstance(op, Subquery):
             return self._execute_subquery(op, input_rows)
 
+        if isinstance(op, CreateIndex):
+            return self._execute_create_index(op, input_rows)
+
+        if isinstance(op, DropIndex):
+            return self._execute_drop_index(op, input_rows)
+
         raise TypeError(f"Unknown operator type: {type(op).__name__}")
 
     def _node_matches_labels(self, node: NodeRef | CypherNull, label_spec: list[list[str]]) -> bool:
@@ -373,17 +834,21 @@ class QueryExecutor:
     def _execute_scan(
         self, op: ScanNodes, input_rows: list[ExecutionContext]
     ) -> list[ExecutionContext]:
-        """Execute ScanNodes operator.
+        """Execute ScanNodes operator."""
+        return list(self._iter_scan(op, input_rows))
+
+    def _iter_scan(
+        self, op: ScanNodes, input_rows: Iterable[ExecutionContext]
+    ) -> Iterator[ExecutionContext]:
+        """Stream ScanNodes rows, binding one candidate node at a time.
 
         If the variable is already bound in the input context (e.g., from WITH),
         validate that the bound node matches the pattern instead of doing a full scan.
         """
-        result = []
-
         # For each input row
         for ctx in input_rows:
             # Check if variable is already bound (e.g., from WITH clause)
-            if op.variable in ctx.bindings:
+            if ctx.has(op.variable):
                 # Variable already bound - validate it matches the pattern
                 bound_node = ctx.get(op.variable)
 
@@ -396,14 +861,13 @@ class QueryExecutor:
                         if op.path_var:
                             from graphforge.types import CypherPath
 
-                            eval_ctx = ExecutionContext()
-                            eval_ctx.bindings = dict(ctx.bindings)
+                            eval_ctx = ctx.child()
                             path = CypherPath(nodes=[bound_node], relationships=[])
                             eval_ctx.bind(op.path_var, path)
 
                         # Apply pattern predicate if specified
                         if op.predicate is not None:
-                            predicate_result = evaluate_expression(op.predicate, eval_ctx, self)
+                            predicate_result = self._compile_expression(op.predicate)(eval_ctx)
                             # Only include node if predicate evaluates to true
                             if not (
                                 isinstance(predicate_result, CypherBool) and predicate_result.value
@@ -411,79 +875,222 @@ class QueryExecutor:
                                 continue  # Skip this node if predicate is not true
 
                         # Predicate passed - add result
-                        result.append(eval_ctx)
+                        yield eval_ctx
                 # No label requirements - check predicate
                 elif op.path_var or op.predicate is not None:
                     from graphforge.types import CypherPath
 
-                    new_ctx = ExecutionContext()
-                    new_ctx.bindings = dict(ctx.bindings)
+                    new_ctx = ctx.child()
                     if op.path_var:
                         path = CypherPath(nodes=[bound_node], relationships=[])
                         new_ctx.bind(op.path_var, path)
 
                     # Apply pattern predicate if specified
                     if op.predicate is not None:
-                        predicate_result = evaluate_expression(op.predicate, new_ctx, self)
+                        predicate_result = self._compile_expression(op.predicate)(new_ctx)
                         if not (
                             isinstance(predicate_result, CypherBool) and predicate_result.value
                         ):
                             continue  # Skip if predicate fails
 
-                    result.append(new_ctx)
+                    yield new_ctx
                 else:
-                    result.append(ctx)
+                    yield ctx
             else:
                 # Variable not bound - do normal scan
-                if op.labels:
-                    # Collect nodes from all label groups (disjunction)
-                    all_nodes = set()
-                    for label_group in op.labels:
-                        # Scan by first label in the group for efficiency
-                        group_nodes = self.graph.get_nodes_by_label(label_group[0])
+                yield from self._bind_scanned_nodes(op, ctx, self._scan_candidates(op))
+
+    def _scan_candidates(self, op: ScanNodes) -> list[NodeRef]:
+        """Nodes matching the label groups of a ScanNodes operator."""
+        if not op.labels:
+            # Scan all nodes
+            return self.graph.get_all_nodes()
+
+        # Collect nodes from all label groups (disjunction)
+        all_nodes = set()
+        for label_group in op.labels:
+            # Scan by first label in the group for efficiency
+            group_nodes = self.graph.get_nodes_by_label(label_group[0])
+
+            # Filter to nodes with ALL labels in this group (conjunction)
+            if len(label_group) > 1:
+                group_nodes = [
+                    node
+                    for node in group_nodes
+                    if all(label in node.labels for label in label_group)
+                ]
+
+            # Add to result set
+            all_nodes.update(group_nodes)
+
+        return list(all_nodes)
+
+    def _bind_scanned_nodes(
+        self,
+        op: ScanNodes | NodeIndexSeek | NodeIndexScan,
+        ctx: ExecutionContext,
+        nodes: Iterable[NodeRef],
+    ) -> Iterator[ExecutionContext]:
+        """Bind each candidate node of a scan and yield those passing the predicate."""
+        predicate = self._compile_expression(op.predicate) if op.predicate is not None else None
+        for node in nodes:
+            # Extend existing bindings
+            new_ctx = ctx.child()
+            # Bind new node
+            new_ctx.bind(op.variable, node)
+            # Bind path variable if requested (single-node path)
+            if op.path_var:
+                from graphforge.types import CypherPath
+
+                path = CypherPath(nodes=[node], relationships=[])
+                new_ctx.bind(op.path_var, path)
+
+            # Apply pattern predicate if specified
+            if predicate is not None:
+                predicate_result = predicate(new_ctx)
+                # Only include node if predicate evaluates to true
+                if not (isinstance(predicate_result, CypherBool) and predicate_result.value):
+                    continue  # Skip this node if predicate is not true
+
+            yield new_ctx
+
+    def _execute_index_seek(
+        self, op: NodeIndexSeek, input_rows: list[ExecutionContext]
+    ) -> list[ExecutionContext]:
+        """Execute NodeIndexSeek operator."""
+        return list(self._iter_index_seek(op, input_rows))
 
-                        # Filter to nodes with ALL labels in this group (conjunction)
-                        if len(label_group) > 1:
-                            group_nodes = [
-                                node
-                                for node in group_nodes
-                                if all(label in node.labels for label in label_group)
-                            ]
+    def _iter_index_seek(
+        self, op: NodeIndexSeek, input_rows: Iterable[ExecutionContext]
+    ) -> Iterator[ExecutionContext]:
+        """Stream NodeIndexSeek rows.
 
-                        # Add to result set
-                        all_nodes.update(group_nodes)
+        Candidate nodes come from the property index; rows whose variable is
+        already bound, whose lookup value cannot be indexed, or whose index
+        has been dropped since planning are handled as a plain ScanNodes.
+        """
+        scan: ScanNodes | None = None
+        label_group = op.labels[0]
 
-                    nodes = list(all_nodes)
-                else:
-                    # Scan all nodes
-                    nodes = self.graph.get_all_nodes()
+        for ctx in input_rows:
+            nodes = None
+            if not ctx.has(op.variable):
+                value = evaluate_expression(op.value, ctx, self)
+                nodes = self.graph.find_nodes_by_property(op.label, op.property, value)
+
+            if nodes is None:
+                if scan is None:
+                    scan = ScanNodes(
+                        variable=op.variable,
+                        labels=op.labels,
+                        path_var=op.path_var,
+                        predicate=op.predicate,
+                    )
+                yield from self._iter_scan(scan, [ctx])
+                continue
 
-                # Bind each node
-                for node in nodes:
-                    new_ctx = ExecutionContext()
-                    # Copy existing bindings
-                    new_ctx.bindings = dict(ctx.bindings)
-                    # Bind new node
-                    new_ctx.bind(op.variable, node)
-                    # Bind path variable if requested (single-node path)
-                    if op.path_var:
-                        from graphforge.types import CypherPath
+            if len(label_group) > 1:
+                nodes = [
+                    node for node in nodes if all(label in node.labels for label in label_group)
+                ]
+            yield from self._bind_scanned_nodes(op, ctx, nodes)
 
-                        path = CypherPath(nodes=[node], relationships=[])
-                        new_ctx.bind(op.path_var, path)
+    def _execute_index_scan(
+        self, op: NodeIndexScan, input_rows: list[ExecutionContext]
+    ) -> list[ExecutionContext]:
+        """Execute NodeIndexScan operator."""
+        return list(self._iter_index_scan(op, input_rows))
+
+    def _iter_index_scan(
+        self, op: NodeIndexScan, input_rows: Iterable[ExecutionContext]
+    ) -> Iterator[ExecutionContext]:
+        """Stream NodeIndexScan rows.
+
+        Candidate nodes come from the range index, in ORDER BY order when
+        ``op.descending`` is set. Rows whose variable is already bound, whose
+        bounds the index cannot answer (e.g. mixed types), or whose index has
+        been dropped since planning are handled as a plain ScanNodes, sorted
+        and truncated as the replaced Sort and Limit would have done.
+        """
+        label_group = op.labels[0]
 
-                    # Apply pattern predicate if specified
-                    if op.predicate is not None:
-                        predicate_result = evaluate_expression(op.predicate, new_ctx, self)
-                        # Only include node if predicate evaluates to true
-                        if not (
-                            isinstance(predicate_result, CypherBool) and predicate_result.value
-                        ):
-                            continue  # Skip this node if predicate is not true
+        for ctx in input_rows:
+            nodes = None
+            if not ctx.has(op.variable):
+                bounds = {
+                    name: evaluate_expression(expression, ctx, self)
+                    for name, expression in (
+                        ("lower", op.lower),
+                        ("upper", op.upper),
+                        ("prefix", op.prefix),
+                    )
+                    if expression is not None
+                }
+                nodes = self.graph.find_nodes_in_range(
+                    op.label,
+                    op.property,
+                    lower_inclusive=op.lower_inclusive,
+                    upper_inclusive=op.upper_inclusive,
+                    descending=op.descending,
+                    **bounds,
+                )
 
-                    result.append(new_ctx)
+            if nodes is None:
+                yield from self._scan_without_index(op, ctx)
+                continue
 
-        return result
+            if len(label_group) > 1:
+                nodes = (
+                    node for node in nodes if all(label in node.labels for label in label_group)
+                )
+            yield from islice(self._bind_scanned_nodes(op, ctx, nodes), op.limit)
+
+    def _scan_without_index(
+        self, op: NodeIndexScan, ctx: ExecutionContext
+    ) -> list[ExecutionContext]:
+        """Answer a NodeIndexScan for one input row with a label scan."""
+        scan = ScanNodes(
+            variable=op.variable,
+            labels=op.labels,
+            path_var=op.path_var,
+            predicate=op.predicate,
+        )
+        rows = self._execute_scan(scan, [ctx])
+        if op.descending is not None:
+            from graphforge.ast.clause import OrderByItem
+
+            key = PropertyAccess(variable=op.variable, property=op.property)
+            order = OrderByItem(expression=key, ascending=not op.descending)
+            rows = self._execute_sort(Sort(items=[order]), rows)
+        if op.limit is not None:
+            rows = rows[: op.limit]
+        return rows
+
+    def _execute_create_index(self, op: CreateIndex, input_rows: list) -> list:
+        """Execute CreateIndex operator."""
+        if op.if_not_exists and (
+            self.graph.get_property_index(op.label, op.property) is not None
+            or (op.name is not None and self.graph.get_property_index_by_name(op.name) is not None)
+        ):
+            return []
+        self.graph.create_property_index(op.label, op.property, name=op.name, kind=op.kind)
+        return []
+
+    def _execute_drop_index(self, op: DropIndex, input_rows: list) -> list:
+        """Execute DropIndex operator."""
+        if op.name is not None:
+            index = self.graph.get_property_index_by_name(op.name)
+            target = f"'{op.name}'"
+        else:
+            assert op.label is not None and op.property is not None
+            index = self.graph.get_property_index(op.label, op.property)
+            target = f"on :{op.label}({op.property})"
+        if index is None:
+            if op.if_exists:
+                return []
+            raise ValueError(f"No index {target}")
+        self.graph.drop_property_index(index.name)
+        return []
 
     def _execute_optional_scan(
         self, op: OptionalScanNodes, input_rows: list[ExecutionContext]
@@ -497,7 +1104,7 @@ class QueryExecutor:
         # For each input row
         for ctx in input_rows:
             # Check if variable is already bound (e.g., from WITH clause)
-            if op.variable in ctx.bindings:
+            if ctx.has(op.variable):
                 # Variable already bound - validate it matches the pattern
                 bound_node = ctx.get(op.variable)
 
@@ -508,8 +1115,7 @@ class QueryExecutor:
                         result.append(ctx)
                     else:
                         # Node doesn't match - OPTIONAL preserves row with NULL
-                        new_ctx = ExecutionContext()
-                        new_ctx.bindings = dict(ctx.bindings)
+                        new_ctx = ctx.child()
                         new_ctx.bind(op.variable, CypherNull())
                         result.append(new_ctx)
                 else:
@@ -543,14 +1149,12 @@ class QueryExecutor:
                 if nodes:
                     # Bind each node
                     for node in nodes:
-                        new_ctx = ExecutionContext()
-                        new_ctx.bindings = dict(ctx.bindings)
+                        new_ctx = ctx.child()
                         new_ctx.bind(op.variable, node)
                         result.append(new_ctx)
                 else:
                     # OPTIONAL semantics: No nodes found - preserve row with NULL
-                    new_ctx = ExecutionContext()
-                    new_ctx.bindings = dict(ctx.bindings)
+                    new_ctx = ctx.child()
                     new_ctx.bind(op.variable, CypherNull())
                     result.append(new_ctx)
 
@@ -565,70 +1169,43 @@ class QueryExecutor:
             return self._execute_expand_with_aggregation(op, input_rows)
 
         # Standard expansion without aggregation
-        result = []
+        return list(self._iter_expand(op, input_rows))
+
+    def _iter_expand(
+        self, op: ExpandEdges, input_rows: Iterable[ExecutionContext]
+    ) -> Iterator[ExecutionContext]:
+        """Stream ExpandEdges rows (without aggregation), one edge at a time."""
+        # Operator fields are read once rather than once per edge
+        iter_neighbors = self.graph.iter_neighbors
+        src_var, edge_var, dst_var, path_var = op.src_var, op.edge_var, op.dst_var, op.path_var
+        direction, edge_types = op.direction, op.edge_types or None
+        predicate = self._compile_expression(op.predicate) if op.predicate is not None else None
 
         for ctx in input_rows:
-            src_node = ctx.get(op.src_var)
-
-            # Get edges based on direction
-            if op.direction == "OUT":
-                edges = self.graph.get_outgoing_edges(src_node.id)
-            elif op.direction == "IN":
-                edges = self.graph.get_incoming_edges(src_node.id)
-            else:  # UNDIRECTED
-                # For undirected, get both outgoing and incoming edges
-                # BUT: self-loops will appear in both lists, so deduplicate them
-                outgoing = self.graph.get_outgoing_edges(src_node.id)
-                incoming = self.graph.get_incoming_edges(src_node.id)
-
-                # Deduplicate edges - self-loops (src==dst) will appear in both lists
-                # Use edge ID to identify duplicates
-                seen_edge_ids = set()
-                edges = []
-                for edge in outgoing + incoming:
-                    if edge.id not in seen_edge_ids:
-                        edges.append(edge)
-                        seen_edge_ids.add(edge.id)
-
-            # Filter by type if specified
-            if op.edge_types:
-                edges = [e for e in edges if e.type in op.edge_types]
-
-            # Bind edge and dst node
-            for edge in edges:
-                new_ctx = ExecutionContext()
-                new_ctx.bindings = dict(ctx.bindings)
-
-                if op.edge_var:
-                    new_ctx.bind(op.edge_var, edge)
-
-                # Determine dst node based on direction
-                if op.direction == "OUT":
-                    dst_node = edge.dst
-                elif op.direction == "IN":
-                    dst_node = edge.src
-                else:  # UNDIRECTED - use whichever is not src
-                    dst_node = edge.dst if edge.src.id == src_node.id else edge.src
+            src_node = ctx.get(src_var)
 
-                new_ctx.bind(op.dst_var, dst_node)
+            # Walk the edges of the wanted types in place; undirected
+            # expansion lists a self-loop once
+            for edge, dst_node in iter_neighbors(src_node.id, direction, edge_types):
+                # Bind edge and dst node
+                new_ctx = ctx.child()
+                if edge_var:
+                    new_ctx.bind(edge_var, edge)
+                new_ctx.bind(dst_var, dst_node)
 
                 # Bind path variable if requested (single-hop path)
-                if op.path_var:
-                    from graphforge.types import CypherPath
-
+                if path_var:
                     path = CypherPath(nodes=[src_node, dst_node], relationships=[edge])
-                    new_ctx.bind(op.path_var, path)
+                    new_ctx.bind(path_var, path)
 
                 # Apply pattern predicate if specified
-                if op.predicate is not None:
-                    predicate_result = evaluate_expression(op.predicate, new_ctx, self)
+                if predicate is not None:
+                    predicate_result = predicate(new_ctx)
                     # Only include edge if predicate evaluates to true
                     if not (isinstance(predicate_result, CypherBool) and predicate_result.value):
                         continue  # Skip this edge if predicate is not true
 
-                result.append(new_ctx)
-
-        return result
+                yield new_ctx
 
     def _execute_expand_with_aggregation(
         self, op: ExpandEdges, input_rows: list[ExecutionContext]
@@ -659,43 +1236,16 @@ class QueryExecutor:
         # Process all expansions, accumulating aggregates
         for ctx in input_rows:
             src_node = ctx.get(op.src_var)
-
-            # Get edges based on direction
-            if op.direction == "OUT":
-                edges = self.graph.get_outgoing_edges(src_node.id)
-            elif op.direction == "IN":
-                edges = self.graph.get_incoming_edges(src_node.id)
-            else:  # UNDIRECTED
-                outgoing = self.graph.get_outgoing_edges(src_node.id)
-                incoming = self.graph.get_incoming_edges(src_node.id)
-                seen_edge_ids = set()
-                edges = []
-                for edge in outgoing + incoming:
-                    if edge.id not in seen_edge_ids:
-                        edges.append(edge)
-                        seen_edge_ids.add(edge.id)
-
-            # Filter by type if specified
-            if op.edge_types:
-                edges = [e for e in edges if e.type in op.edge_types]
+            neighbors = self.graph.iter_neighbors(src_node.id, op.direction, op.edge_types or None)
 
             # Process each edge and update aggregates
-            for edge in edges:
+            for edge, dst_node in neighbors:
                 # Create temporary context for expression evaluation
-                temp_ctx = ExecutionContext()
-                temp_ctx.bindings = dict(ctx.bindings)
+                temp_ctx = ctx.child()
 
                 if op.edge_var:
                     temp_ctx.bind(op.edge_var, edge)
 
-                # Determine dst node
-                if op.direction == "OUT":
-                    dst_node = edge.dst
-                elif op.direction == "IN":
-                    dst_node = edge.src
-                else:  # UNDIRECTED
-                    dst_node = edge.dst if edge.src.id == src_node.id else edge.src
-
                 temp_ctx.bind(op.dst_var, dst_node)
 
                 # Apply pattern predicate if specified
@@ -831,114 +1381,123 @@ class QueryExecutor:
         for ctx in input_rows:
             src_node = ctx.get(op.src_var)
 
-            # Perform depth-first search with cycle detection
-            from graphforge.types.graph import EdgeRef
+            if op.reachability:
+                for node in self._reachable_nodes(op, src_node, ctx):
+                    new_ctx = ctx.child()
+                    new_ctx.bind(op.dst_var, node)
+                    result.append(new_ctx)
+                continue
 
-            stack: list[tuple[NodeRef, list[EdgeRef], int, set[str | int]]] = [
-                (src_node, [], 0, {src_node.id})
-            ]
+            # Perform depth-first search with cycle detection. Paths are
+            # PathLinks sharing their prefixes, and on_path holds the nodes
+            # of the path being extended: a node is added when its steps are
+            # pushed and removed by the (node, None, -1) marker pushed
+            # beneath them once they have all been explored
+            stack: list[tuple[NodeRef, PathLink | None, int]] = [(src_node, None, 0)]
+            on_path: set[Any] = set()
 
             while stack:
-                current_node, edge_path, depth, visited_in_path = stack.pop()
+                current_node, link, depth = stack.pop()
+                if depth < 0:
+                    on_path.discard(current_node.id)
+                    continue
 
                 # Check if we've reached valid depth range
                 if op.min_hops <= depth <= (op.max_hops if op.max_hops else float("inf")):
                     # Yield this path
-                    new_ctx = ExecutionContext()
-                    new_ctx.bindings = dict(ctx.bindings)
+                    new_ctx = ctx.child()
 
                     new_ctx.bind(op.dst_var, current_node)
 
-                    # Bind edge list if variable provided
+                    # Bind edge list if variable provided, skipping the
+                    # planner's anonymous variables, which nothing reads
                     # Note: Binding raw list of EdgeRef objects (not wrapped in CypherList)
                     # since EdgeRef is not a CypherValue and individual edges are bound directly
-                    if op.edge_var:
-                        new_ctx.bind(op.edge_var, edge_path)
+                    if op.edge_var and not op.edge_var.startswith("__anon_"):
+                        new_ctx.bind(op.edge_var, path_edges(link))
 
                     # Bind path if path variable is specified
                     if op.path_var:
-                        from graphforge.types import CypherPath
-
-                        # Build node list from edge path
-                        # Start with source node, then add destination of each edge
-                        nodes = [src_node]
-                        for edge in edge_path:
-                            # Add the destination node of each edge
-                            # (accounting for direction)
-                            if op.direction == "OUT":
-                                nodes.append(edge.dst)
-                            elif op.direction == "IN":
-                                nodes.append(edge.src)
-                            else:  # UNDIRECTED
-                                # Add whichever node we haven't visited yet
-                                prev_node = nodes[-1]
-                                next_node = edge.dst if edge.src.id == prev_node.id else edge.src
-                                nodes.append(next_node)
-
-                        path = CypherPath(nodes=nodes, relationships=edge_path)
-                        new_ctx.bind(op.path_var, path)
+                        nodes, edges = path_lists(src_node, link)
+                        new_ctx.bind(op.path_var, CypherPath(nodes=nodes, relationships=edges))
 
                     result.append(new_ctx)
 
                 # Continue exploration if we haven't exceeded max depth
                 if op.max_hops is None or depth < op.max_hops:
-                    # Get edges based on direction
-                    if op.direction == "OUT":
-                        edges = self.graph.get_outgoing_edges(current_node.id)
-                    elif op.direction == "IN":
-                        edges = self.graph.get_incoming_edges(current_node.id)
-                    else:  # UNDIRECTED
-                        # For undirected, get both outgoing and incoming edges
-                        # BUT: self-loops will appear in both lists, so deduplicate them
-                        outgoing = self.graph.get_outgoing_edges(current_node.id)
-                        incoming = self.graph.get_incoming_edges(current_node.id)
-
-                        # Deduplicate edges - self-loops (src==dst) will appear in both lists
-                        # Use edge ID to identify duplicates
-                        seen_edge_ids = set()
-                        edges = []
-                        for edge in outgoing + incoming:
-                            if edge.id not in seen_edge_ids:
-                                edges.append(edge)
-                                seen_edge_ids.add(edge.id)
-
-                    # Filter by type if specified
-                    if op.edge_types:
-                        edges = [e for e in edges if e.type in op.edge_types]
-
-                    # Apply pattern predicate to filter edges if specified
-                    if op.predicate is not None:
-                        filtered_edges = []
-                        for edge in edges:
-                            # Create a temporary context with the edge bound
-                            temp_ctx = ExecutionContext()
-                            temp_ctx.bindings = dict(ctx.bindings)
-                            if op.edge_var:
-                                temp_ctx.bind(op.edge_var, edge)
-                            # Evaluate predicate
-                            predicate_result = evaluate_expression(op.predicate, temp_ctx, self)
-                            # Only include edge if predicate evaluates to true
-                            if isinstance(predicate_result, CypherBool) and predicate_result.value:
-                                filtered_edges.append(edge)
-                        edges = filtered_edges
-
+                    on_path.add(current_node.id)
+                    stack.append((current_node, None, -1))
                     # Add edges to stack for exploration
-                    for edge in edges:
-                        # Determine next node
-                        if op.direction == "OUT":
-                            next_node = edge.dst
-                        elif op.direction == "IN":
-                            next_node = edge.src
-                        else:  # UNDIRECTED
-                            next_node = edge.dst if edge.src.id == current_node.id else edge.src
-
+                    for edge, next_node in self._variable_expand_steps(op, current_node, ctx):
                         # Cycle detection - don't revisit nodes in current path
-                        if next_node.id not in visited_in_path:
-                            new_visited = visited_in_path | {next_node.id}
-                            stack.append((next_node, [*edge_path, edge], depth + 1, new_visited))
+                        if next_node.id not in on_path:
+                            stack.append((next_node, PathLink(edge, next_node, link), depth + 1))
 
         return result
 
+    def _variable_expand_steps(
+        self, op: ExpandVariableLength, node: NodeRef, ctx: ExecutionContext
+    ) -> Iterator[tuple[EdgeRef, NodeRef]]:
+        """Iterate over the (edge, next node) steps a variable-length expansion may take.
+
+        Steps are read from the adjacency lists in place, so the graph must
+        not gain or lose edges until the iterator is exhausted.
+        """
+        steps = self.graph.iter_neighbors(node.id, op.direction, op.edge_types or None)
+        if op.predicate is None:
+            return steps
+
+        def accept(step: tuple[EdgeRef, NodeRef]) -> bool:
+            # Evaluate the pattern predicate with the edge bound
+            temp_ctx = ctx.child()
+            if op.edge_var:
+                temp_ctx.bind(op.edge_var, step[0])
+            predicate_result = evaluate_expression(op.predicate, temp_ctx, self)
+            return isinstance(predicate_result, CypherBool) and predicate_result.value
+
+        return filter(accept, steps)
+
+    def _reachable_nodes(
+        self, op: ExpandVariableLength, src_node: NodeRef, ctx: ExecutionContext
+    ) -> Iterator[NodeRef]:
+        """Yield each node within op's hop range of src_node once, nearest first.
+
+        A level-synchronous breadth-first search with one visited set for the
+        whole search, so every node and relationship is looked at once rather
+        than once per path through it. The first level at which a node is
+        reached is its shortest distance, the shortest path to it is simple,
+        and as in path expansion src_node itself is only returned for a
+        minimum of 0 hops.
+        """
+        if op.min_hops == 0:
+            yield src_node
+        visited = {src_node.id}
+        frontier = [src_node]
+        depth = 0
+        # Without a predicate only the neighbours are needed, which a CSR
+        # snapshot reads from its target arrays without building edges
+        if op.predicate is None:
+            types = op.edge_types or None
+
+            def neighbors(node: NodeRef) -> Iterator[NodeRef]:
+                return self.graph.iter_neighbor_nodes(node.id, op.direction, types)
+
+        else:
+
+            def neighbors(node: NodeRef) -> Iterator[NodeRef]:
+                return (step[1] for step in self._variable_expand_steps(op, node, ctx))
+
+        while frontier and (op.max_hops is None or depth < op.max_hops):
+            depth += 1
+            next_frontier = []
+            for node in frontier:
+                for next_node in neighbors(node):
+                    if next_node.id not in visited:
+                        visited.add(next_node.id)
+                        next_frontier.append(next_node)
+                        yield next_node
+            frontier = next_frontier
+
     def _execute_multi_hop(
         self, op: ExpandMultiHop, input_rows: list[ExecutionContext]
     ) -> list[ExecutionContext]:
@@ -952,21 +1511,17 @@ class QueryExecutor:
         for ctx in input_rows:
             src_node = ctx.get(op.src_var)
 
-            # Track paths through the multi-hop traversal
-            # Each state: (current_node, path_nodes, path_edges, hop_index)
-            from graphforge.types.graph import EdgeRef
-
-            states: list[tuple[NodeRef, list[NodeRef], list[EdgeRef], int]] = [
-                (src_node, [src_node], [], 0)
-            ]
+            # Track paths through the multi-hop traversal as shared PathLinks
+            # Each state: (current_node, path link, hop_index)
+            states: list[tuple[NodeRef, PathLink | None, int]] = [(src_node, None, 0)]
 
             while states:
-                current_node, path_nodes, path_edges, hop_idx = states.pop()
+                current_node, link, hop_idx = states.pop()
 
                 # If we've completed all hops, emit result
                 if hop_idx >= len(op.hops):
-                    new_ctx = ExecutionContext()
-                    new_ctx.bindings = dict(ctx.bindings)
+                    new_ctx = ctx.child()
+                    path_nodes, path_edges = path_lists(src_node, link)
 
                     # Bind all intermediate node variables
                     # path_nodes[0] is src (already bound)
@@ -981,8 +1536,6 @@ class QueryExecutor:
 
                     # Bind path variable if specified
                     if op.path_var:
-                        from graphforge.types import CypherPath
-
                         path = CypherPath(nodes=path_nodes, relationships=path_edges)
                         new_ctx.bind(op.path_var, path)
 
@@ -991,60 +1544,206 @@ class QueryExecutor:
 
                 # Process current hop
                 edge_var, edge_types, direction, dst_var = op.hops[hop_idx]
-
-                # Get edges based on direction
-                if direction == "OUT":
-                    edges = self.graph.get_outgoing_edges(current_node.id)
-                elif direction == "IN":
-                    edges = self.graph.get_incoming_edges(current_node.id)
-                else:  # UNDIRECTED
-                    edges = self.graph.get_outgoing_edges(
-                        current_node.id
-                    ) + self.graph.get_incoming_edges(current_node.id)
-
-                # Filter by type if specified
-                if edge_types:
-                    edges = [e for e in edges if e.type in edge_types]
+                neighbors = self.graph.iter_neighbors(
+                    current_node.id, direction, edge_types or None
+                )
 
                 # For each matching edge, continue traversal
-                for edge in edges:
-                    # Determine next node based on direction
-                    if direction == "OUT":
-                        next_node = edge.dst
-                    elif direction == "IN":
-                        next_node = edge.src
-                    else:  # UNDIRECTED
-                        next_node = edge.dst if edge.src.id == current_node.id else edge.src
-
+                for edge, next_node in neighbors:
                     # Add state for next hop
-                    new_path_nodes = [*path_nodes, next_node]
-                    new_path_edges = [*path_edges, edge]
-                    states.append((next_node, new_path_nodes, new_path_edges, hop_idx + 1))
+                    states.append((next_node, PathLink(edge, next_node, link), hop_idx + 1))
 
         return result
 
+    def _iter_shortest_path(
+        self, op: ShortestPath, input_rows: Iterable[ExecutionContext]
+    ) -> Iterator[ExecutionContext]:
+        """Stream the shortest paths between the bound end nodes of each row."""
+        from graphforge.types.graph import NodeRef
+
+        for ctx in input_rows:
+            src_node = ctx.get(op.src_var)
+            dst_node = ctx.get(op.dst_var)
+            if not isinstance(src_node, NodeRef) or not isinstance(dst_node, NodeRef):
+                continue
+
+            for nodes, edges in self._shortest_paths(op, src_node, dst_node, ctx):
+                new_ctx = ctx.child()
+                if op.edge_var:
+                    # Lists of relationships are bound as raw EdgeRef lists,
+                    # as ExpandVariableLength does
+                    new_ctx.bind(op.edge_var, edges if op.variable_length else edges[0])
+                if op.path_var:
+                    new_ctx.bind(op.path_var, CypherPath(nodes=nodes, relationships=edges))
+                yield new_ctx
+
+    def _shortest_paths(
+        self, op: ShortestPath, src_node: NodeRef, dst_node: NodeRef, ctx: ExecutionContext
+    ) -> Iterator[tuple[list[NodeRef], list[EdgeRef]]]:
+        """Find the shortest paths from src_node to dst_node by bidirectional BFS.
+
+        One search grows from each end, following relationships backwards
+        from dst_node. Each step expands one whole level of the side with the
+        smaller frontier, so the work stays close to the square root of a
+        one-sided search on graphs that branch out. The searches stop at the
+        first level where they meet; every shortest path crosses that level at
+        exactly one node, so joining the parent chains of both sides through
+        those nodes yields each shortest path once.
+
+        Args:
+            op: ShortestPath operator
+            src_node: Start node
+            dst_node: End node
+            ctx: Input row, for evaluating the relationship predicate
+
+        Yields:
+            (nodes, relationships) of each shortest path; only the first one
+            found unless op.all_paths is set
+        """
+        if src_node.id == dst_node.id:
+            if op.min_hops == 0:
+                yield [src_node], []
+            return
+
+        steps = self._shortest_path_steps(op, ctx)
+        # Per side: depth and parent links (previous node, edge) of every reached node
+        forward: tuple[dict[Any, int], dict[Any, list]] = ({src_node.id: 0}, {src_node.id: []})
+        backward: tuple[dict[Any, int], dict[Any, list]] = ({dst_node.id: 0}, {dst_node.id: []})
+        frontiers = {True: [src_node], False: [dst_node]}
+        depths = {True: 0, False: 0}
+
+        while frontiers[True] and frontiers[False]:
+            if op.max_hops is not None and depths[True] + depths[False] >= op.max_hops:
+                return
+
+            is_forward = len(frontiers[True]) <= len(frontiers[False])
+            depth, parents = forward if is_forward else backward
+            other_depth, _ = backward if is_forward else forward
+            level = depths[is_forward] + 1
+            depths[is_forward] = level
+
+            next_frontier: list[NodeRef] = []
+            for node in frontiers[is_forward]:
+                for edge, next_node in steps(node, is_forward):
+                    next_id = next_node.id
+                    seen = depth.get(next_id)
+                    if seen is None:
+                        depth[next_id] = level
+                        parents[next_id] = [(node, edge)]
+                        next_frontier.append(next_node)
+                    elif seen == level and op.all_paths:
+                        parents[next_id].append((node, edge))
+            frontiers[is_forward] = next_frontier
+
+            meeting = [node for node in next_frontier if node.id in other_depth]
+            if not meeting:
+                continue
+
+            # Nodes reached from the other side at a lower depth close shorter paths
+            length = min(other_depth[node.id] for node in meeting)
+            meeting = [node for node in meeting if other_depth[node.id] == length]
+            if not op.all_paths:
+                meeting = meeting[:1]
+            for node in meeting:
+                for src_half in self._path_halves(forward[1], node):
+                    for dst_half in self._path_halves(backward[1], node):
+                        nodes = src_half[0] + dst_half[0][-2::-1]
+                        edges = src_half[1] + dst_half[1][::-1]
+                        yield nodes, edges
+                        if not op.all_paths:
+                            return
+            return
+
+    def _shortest_path_steps(self, op: ShortestPath, ctx: ExecutionContext):
+        """Build the neighbour function used by both sides of a shortest path search.
+
+        Args:
+            op: ShortestPath operator
+            ctx: Input row, for evaluating the relationship predicate
+
+        Returns:
+            Function of (node, forward) iterating over the (edge, next node)
+            pairs that match the relationship pattern, walking edges backwards
+            when forward is False
+        """
+        graph = self.graph
+        edge_types = op.edge_types or None
+        predicate = self._compile_expression(op.predicate) if op.predicate is not None else None
+
+        def accept(edge: EdgeRef) -> bool:
+            if predicate is None:
+                return True
+            edge_ctx = ctx.child()
+            if op.edge_var:
+                edge_ctx.bind(op.edge_var, edge)
+            result = predicate(edge_ctx)
+            return isinstance(result, CypherBool) and result.value
+
+        def steps(node: NodeRef, forward: bool) -> Iterator[tuple[EdgeRef, NodeRef]]:
+            if op.direction == "UNDIRECTED":
+                # Self-loops never lie on a shortest path
+                return (
+                    (edge, next_node)
+                    for edge, next_node in graph.iter_neighbors(node.id, "UNDIRECTED", edge_types)
+                    if edge.src.id != edge.dst.id and accept(edge)
+                )
+            direction = "OUT" if (op.direction == "OUT") is forward else "IN"
+            return (
+                (edge, next_node)
+                for edge, next_node in graph.iter_neighbors(node.id, direction, edge_types)
+                if accept(edge)
+            )
+
+        return steps
+
+    @staticmethod
+    def _path_halves(
+        parents: dict[Any, list], node: NodeRef
+    ) -> Iterator[tuple[list[NodeRef], list[EdgeRef]]]:
+        """Yield (nodes, edges) along every parent chain from a search root to node."""
+        stack: list[tuple[NodeRef, list[NodeRef], list[EdgeRef]]] = [(node, [node], [])]
+        while stack:
+            current, nodes, edges = stack.pop()
+            links = parents[current.id]
+            if not links:
+                yield nodes[::-1], edges[::-1]
+                continue
+            for previous, edge in links:
+                stack.append((previous, [*nodes, previous], [*edges, edge]))
+
     def _execute_filter(
         self, op: Filter, input_rows: list[ExecutionContext]
     ) -> list[ExecutionContext]:
         """Execute Filter operator."""
-        result = []
+        return list(self._iter_filter(op, input_rows))
 
+    def _iter_filter(
+        self, op: Filter, input_rows: Iterable[ExecutionContext]
+    ) -> Iterator[ExecutionContext]:
+        """Stream the rows for which the Filter predicate is true."""
+        predicate = self._compile_expression(op.predicate)
         for ctx in input_rows:
             # Evaluate predicate
-            value = evaluate_expression(op.predicate, ctx, self)
+            value = predicate(ctx)
 
             # Keep row if predicate is true
             if isinstance(value, CypherBool) and value.value:
-                result.append(ctx)
-
-        return result
+                yield ctx
 
     def _execute_project(self, op: Project, input_rows: list[ExecutionContext]) -> list[dict]:
         """Execute Project operator."""
-        from graphforge.ast.expression import Wildcard
+        return list(self._iter_project(op, input_rows))
 
-        result = []
+    def _iter_project(self, op: Project, input_rows: Iterable[ExecutionContext]) -> Iterator[dict]:
+        """Stream Project rows, evaluating the return items of one row at a time."""
+        from graphforge.ast.expression import Wildcard
 
+        compiled = [
+            None
+            if isinstance(return_item.expression, Wildcard)
+            else self._compile_expression(return_item.expression)
+            for return_item in op.items
+        ]
         for ctx in input_rows:
             row = {}
             for i, return_item in enumerate(op.items):
@@ -1058,7 +1757,7 @@ class QueryExecutor:
                     continue
 
                 # Extract expression and alias from ReturnItem
-                value = evaluate_expression(return_item.expression, ctx, self)
+                value = compiled[i](ctx)  # type: ignore[misc]
 
                 # Determine column name
                 if return_item.alias:
@@ -1070,9 +1769,7 @@ class QueryExecutor:
                     key = _expression_to_string(return_item.expression, fallback_index=i)
 
                 row[key] = value
-            result.append(row)
-
-        return result
+            yield row
 
     def _execute_with(self, op: With, input_rows: list[ExecutionContext]) -> list[ExecutionContext]:
         """Execute WITH operator.
@@ -1090,16 +1787,43 @@ class QueryExecutor:
         Returns:
             List of ExecutionContexts with only the projected variables
         """
-        from graphforge.ast.expression import Variable, Wildcard
+        # Steps 1-2: Project items into new contexts and apply optional WHERE filter
+        result = list(self._iter_with_projection(op, input_rows))
 
-        # Step 1: Project items into new contexts
-        result = []
+        # Step 3: Apply optional ORDER BY sort
+        if op.sort_items:
+            # WITH items are already projected, so no RETURN aliases to resolve
+            keyed_rows = self._order_keyed_rows(op.sort_items, None, result)
+            result = self._sorted_rows(keyed_rows, [item.ascending for item in op.sort_items])
 
+        # Step 4: Apply optional SKIP
+        if op.skip_count is not None:
+            result = result[self._row_count(op.skip_count, "SKIP") :]
+
+        # Step 5: Apply optional LIMIT
+        if op.limit_count is not None:
+            result = result[: self._row_count(op.limit_count, "LIMIT")]
+
+        return result
+
+    def _iter_with_projection(
+        self, op: With, input_rows: Iterable[ExecutionContext]
+    ) -> Iterator[ExecutionContext]:
+        """Stream WITH rows projected into new contexts that pass the WHERE filter."""
+        from graphforge.ast.expression import Variable, Wildcard
+
+        compiled = [
+            None
+            if isinstance(return_item.expression, Wildcard)
+            else self._compile_expression(return_item.expression)
+            for return_item in op.items
+        ]
+        predicate = self._compile_expression(op.predicate) if op.predicate else None
         for ctx in input_rows:
             new_ctx = ExecutionContext()
             bound_vars = set()  # Track variables to detect duplicates
 
-            for return_item in op.items:
+            for return_item, expression in zip(op.items, compiled):
                 # Handle Wildcard (*) - copy all variables from current context
                 # Exclude planner-generated anonymous variables (starting with "__anon_")
                 if isinstance(return_item.expression, Wildcard):
@@ -1116,7 +1840,7 @@ class QueryExecutor:
                     continue
 
                 # Evaluate expression
-                value = evaluate_expression(return_item.expression, ctx, self)
+                value = expression(ctx)  # type: ignore[misc]
 
                 # Determine variable name to bind
                 if return_item.alias:
@@ -1141,75 +1865,58 @@ class QueryExecutor:
                 new_ctx.bind(var_name, value)
                 bound_vars.add(var_name)
 
-            result.append(new_ctx)
-
-        # Step 2: Apply optional WHERE filter
-        if op.predicate:
-            filtered = []
-            for ctx in result:
-                value = evaluate_expression(op.predicate, ctx, self)
-                if isinstance(value, CypherBool) and value.value:
-                    filtered.append(ctx)
-            result = filtered
-
-        # Step 3: Apply optional ORDER BY sort
-        if op.sort_items:
-            # Similar to _execute_sort but simpler since WITH items are already projected
-            from functools import cmp_to_key
-
-            def compare_values(val1, val2, ascending):
-                """Compare two CypherValues."""
-                # Handle NULLs
-                is_null1 = isinstance(val1, CypherNull)
-                is_null2 = isinstance(val2, CypherNull)
-
-                if is_null1 and is_null2:
-                    return 0
-                if is_null1:
-                    return 1 if ascending else -1  # NULLs last in ASC, first in DESC
-                if is_null2:
-                    return -1 if ascending else 1
-
-                # Compare non-NULL values
-                comp_result = val1.less_than(val2)
-                if isinstance(comp_result, CypherBool):
-                    if comp_result.value:
-                        return -1 if ascending else 1
-                    comp_result2 = val2.less_than(val1)
-                    if isinstance(comp_result2, CypherBool) and comp_result2.value:
-                        return 1 if ascending else -1
-                    return 0
-                return 0
-
-            def compare_rows(ctx1, ctx2):
-                """Compare two contexts by evaluating sort expressions."""
-                for sort_item in op.sort_items:  # type: ignore[union-attr]
-                    val1 = evaluate_expression(sort_item.expression, ctx1, self)
-                    val2 = evaluate_expression(sort_item.expression, ctx2, self)
-                    cmp = compare_values(val1, val2, sort_item.ascending)
-                    if cmp != 0:
-                        return cmp
-                return 0
-
-            result = sorted(result, key=cmp_to_key(compare_rows))
-
-        # Step 4: Apply optional SKIP
-        if op.skip_count is not None:
-            result = result[op.skip_count :]
+            # Apply optional WHERE filter
+            if predicate is not None:
+                value = predicate(new_ctx)
+                if not (isinstance(value, CypherBool) and value.value):
+                    continue
 
-        # Step 5: Apply optional LIMIT
-        if op.limit_count is not None:
-            result = result[: op.limit_count]
-
-        return result
+            yield new_ctx
 
     def _execute_limit(self, op: Limit, input_rows: list) -> list:
         """Execute Limit operator."""
-        return input_rows[: op.count]
+        return input_rows[: self._row_count(op.count, "LIMIT")]
 
     def _execute_skip(self, op: Skip, input_rows: list) -> list:
         """Execute Skip operator."""
-        return input_rows[op.count :]
+        return input_rows[self._row_count(op.count, "SKIP") :]
+
+    def _iter_limit(self, op: Limit, input_rows: Iterable[Any]) -> Iterator[Any]:
+        """Stream the first rows of the input, stopping the pipeline feeding it."""
+        yield from islice(input_rows, self._row_count(op.count, "LIMIT"))
+
+    def _iter_skip(self, op: Skip, input_rows: Iterable[Any]) -> Iterator[Any]:
+        """Stream the input past its first rows."""
+        yield from islice(input_rows, self._row_count(op.count, "SKIP"), None)
+
+    def _row_count(self, count: int | Parameter, clause: str) -> int:
+        """Resolve a SKIP or LIMIT count, reading a $parameter when the query runs.
+
+        Counts are resolved on the first pull, when the parameters of the
+        execution are in effect, so one plan serves every page.
+
+        Args:
+            count: Literal count or Parameter
+            clause: "SKIP" or "LIMIT", for error messages
+
+        Returns:
+            The non-negative row count
+
+        Raises:
+            ValueError: If the parameter is missing or negative
+            TypeError: If the parameter is not an integer
+        """
+        if not isinstance(count, Parameter):
+            return count
+        value = evaluate_expression(count, ExecutionContext(), self)
+        if not isinstance(value, CypherInt):
+            raise TypeError(
+                f"{clause} expects a non-negative integer, got {type(value).__name__} "
+                f"for ${count.name}"
+            )
+        if value.value < 0:
+            raise ValueError(f"{clause} expects a non-negative integer, got {value.value}")
+        return int(value.value)
 
     def _execute_distinct(self, op: Distinct, input_rows: list) -> list:
         """Execute DISTINCT operator.
@@ -1220,9 +1927,11 @@ class QueryExecutor:
         """
         if not input_rows:
             return input_rows
+        return list(self._iter_distinct(op, input_rows))
 
+    def _iter_distinct(self, op: Distinct, input_rows: Iterable[Any]) -> Iterator[Any]:
+        """Stream the first occurrence of each distinct row."""
         seen = set()
-        result = []
 
         for ctx in input_rows:
             # Create hashable key from all bindings
@@ -1239,16 +1948,14 @@ class QueryExecutor:
                 # Before projection - ctx is ExecutionContext
                 key_items = []
                 for var_name in sorted(ctx.bindings.keys()):
-                    value = ctx.bindings[var_name]
+                    value = ctx.get(var_name)
                     hashable = self._value_to_hashable(value)
                     key_items.append((var_name, hashable))
 
             key = tuple(key_items)
             if key not in seen:
                 seen.add(key)
-                result.append(ctx)
-
-        return result
+                yield ctx
 
     def _execute_sort(self, op: Sort, input_rows: list[ExecutionContext]) -> list[ExecutionContext]:
         """Execute Sort operator.
@@ -1259,98 +1966,173 @@ class QueryExecutor:
         - DESC: NULLs first
 
         Supports referencing RETURN aliases by pre-evaluating RETURN expressions.
+        Each row's sort expressions are evaluated once into an order key, so
+        sorting runs on native tuple comparisons.
         """
         if not input_rows:
             return input_rows
+        keyed_rows = self._order_keyed_rows(op.items, op.return_items, input_rows)
+        return self._sorted_rows(keyed_rows, [item.ascending for item in op.items])
 
-        # Pre-evaluate RETURN expressions with aliases and extend contexts
-        # This allows ORDER BY to reference aliases defined in RETURN
-        # Keep mapping from extended context to original context
-        # Note: Skip aggregate functions - they can't be evaluated until after Aggregate operator
+    def _order_keyed_rows(
+        self,
+        items: list[Any],
+        return_items: list[Any] | None,
+        input_rows: Iterable[ExecutionContext],
+    ) -> Iterator[tuple[tuple, ExecutionContext]]:
+        """Pair each row with the order keys of its ORDER BY expressions.
+
+        RETURN aliases are bound for evaluation only if the ORDER BY
+        expressions cannot be evaluated from the first row without them
+        (after aggregation, the aliases are already bound, and the planner
+        has rewritten ORDER BY sub-expressions repeating an aliased aggregate
+        item to read that alias). Aggregate functions are skipped: the
+        Aggregate operator evaluates them. A Sort planned ahead of its
+        Aggregate cannot evaluate the aggregates left over; a single row,
+        which has nothing to be ordered against, is then yielded without
+        evaluating its keys.
 
-        # Check if ORDER BY expressions can already be evaluated from input context
-        # This happens after aggregation where aliases are already bound
-        skip_return_items_eval = False
-        if input_rows and op.items:
+        Args:
+            items: OrderByItems to evaluate
+            return_items: Optional ReturnItems for alias resolution
+            input_rows: Rows to sort
+
+        Yields:
+            (tuple of order keys, original row) pairs
+        """
+        rows = iter(input_rows)
+        first = next(rows, None)
+        if first is None:
+            return
+
+        expressions = [order_item.expression for order_item in items]
+        aliased = []
+        if return_items:
+            from graphforge.executor.evaluator import is_aggregate_function
+
+            if any(self._contains_aggregate(expression) for expression in expressions):
+                second = next(rows, None)
+                if second is None:
+                    yield (), first
+                    return
+                rows = chain((second,), rows)
             try:
-                # Try to evaluate all ORDER BY expressions from first context
-                for order_item in op.items:
-                    evaluate_expression(order_item.expression, input_rows[0], self)
-                # If we got here, all ORDER BY expressions are available - skip return_items eval
-                skip_return_items_eval = True
+                for expression in expressions:
+                    evaluate_expression(expression, first, self)
             except (KeyError, AttributeError):
-                # ORDER BY references something not in context - need return_items eval
-                skip_return_items_eval = False
+                aliased = [
+                    item
+                    for item in return_items
+                    if item.alias and not is_aggregate_function(item.expression)
+                ]
+
+        aliases = [(item.alias, self._compile_expression(item.expression)) for item in aliased]
+        keys = [self._compile_expression(expression) for expression in expressions]
+        for ctx in chain((first,), rows):
+            eval_ctx = ctx
+            if aliases:
+                eval_ctx = ctx.child()
+                for alias, expression in aliases:
+                    eval_ctx.bind(alias, expression(ctx))
+            yield tuple(_order_key(key(eval_ctx)) for key in keys), ctx
+
+    @classmethod
+    def _contains_aggregate(cls, expression: Any) -> bool:
+        """Check whether an expression is or contains an aggregate function call."""
+        from graphforge.executor.evaluator import is_aggregate_function
+
+        if is_aggregate_function(expression):
+            return True
+        if isinstance(expression, BinaryOp):
+            return cls._contains_aggregate(expression.left) or cls._contains_aggregate(
+                expression.right
+            )
+        if isinstance(expression, UnaryOp):
+            return cls._contains_aggregate(expression.operand)
+        if isinstance(expression, FunctionCall):
+            return any(cls._contains_aggregate(arg) for arg in expression.args)
+        return False
 
-        extended_rows = []
-        context_mapping = {}  # Maps id(extended_ctx) -> original_ctx
+    @staticmethod
+    def _sorted_rows(keyed_rows: Iterable[tuple[tuple, Any]], ascending: list[bool]) -> list[Any]:
+        """Stable-sort rows by their order keys.
 
-        for ctx in input_rows:
-            extended_ctx = ExecutionContext()
-            extended_ctx.bindings = dict(ctx.bindings)
+        Mixed directions are sorted one key at a time, last key first, so
+        every pass still compares plain keys.
+        """
+        keyed = list(keyed_rows)
+        if len(keyed) < 2:
+            return [row for _, row in keyed]
+        if len(set(ascending)) == 1:
+            keyed.sort(key=itemgetter(0), reverse=not ascending[0])
+        else:
+            for i in reversed(range(len(ascending))):
+                keyed.sort(key=partial(_order_key_at, i), reverse=not ascending[i])
+        return [row for _, row in keyed]
 
-            # Add RETURN aliases to context (only if not after aggregation)
-            if op.return_items and not skip_return_items_eval:
-                for return_item in op.return_items:
-                    if return_item.alias:
-                        # Skip aggregate functions (COUNT, SUM, AVG, etc.)
-                        # They must be evaluated by the Aggregate operator
-                        from graphforge.executor.evaluator import is_aggregate_function
-
-                        if not is_aggregate_function(return_item.expression):
-                            # Evaluate the expression and bind it with the alias name
-                            value = evaluate_expression(return_item.expression, ctx, self)
-                            extended_ctx.bind(return_item.alias, value)
-
-            extended_rows.append(extended_ctx)
-            context_mapping[id(extended_ctx)] = ctx
-
-        def compare_values(val1, val2, ascending):
-            """Compare two CypherValues."""
-            # Handle NULLs
-            is_null1 = isinstance(val1, CypherNull)
-            is_null2 = isinstance(val2, CypherNull)
-
-            if is_null1 and is_null2:
-                return 0
-            if is_null1:
-                return 1 if ascending else -1  # NULLs last in ASC, first in DESC
-            if is_null2:
-                return -1 if ascending else 1
-
-            # Compare non-NULL values using less_than
-            result = val1.less_than(val2)
-            if isinstance(result, CypherBool):
-                if result.value:
-                    return -1 if ascending else 1
-                # Check if val2 < val1
-                result2 = val2.less_than(val1)
-                if isinstance(result2, CypherBool) and result2.value:
-                    return 1 if ascending else -1
-                return 0  # Equal
-            return 0  # NULL comparison result, treat as equal
-
-        from functools import cmp_to_key
-
-        def multi_key_compare(ctx1, ctx2):
-            """Compare two contexts by all sort keys."""
-            for order_item in op.items:
-                val1 = evaluate_expression(order_item.expression, ctx1, self)
-                val2 = evaluate_expression(order_item.expression, ctx2, self)
-                cmp_result = compare_values(val1, val2, order_item.ascending)
-                if cmp_result != 0:
-                    return cmp_result
-            return 0  # All keys equal
-
-        sorted_extended_rows = sorted(extended_rows, key=cmp_to_key(multi_key_compare))
-
-        # Map back to original contexts maintaining the sorted order
-        result_rows = []
-        for sorted_ctx in sorted_extended_rows:
-            original_ctx = context_mapping[id(sorted_ctx)]
-            result_rows.append(original_ctx)
-
-        return result_rows
+    def _execute_top_k(
+        self, op: TopK, input_rows: list[ExecutionContext]
+    ) -> list[ExecutionContext]:
+        """Execute TopK operator."""
+        return list(self._iter_top_k(op, input_rows))
+
+    def _iter_top_k(
+        self, op: TopK, input_rows: Iterable[ExecutionContext]
+    ) -> Iterator[ExecutionContext]:
+        """Stream the first ``op.count`` rows of the ORDER BY order.
+
+        Order keys are computed once per row (resolving RETURN aliases as
+        Sort does) and rows are kept in a heap of at most ``op.count``
+        entries, so the input is never held in memory.
+        """
+        keyed_rows = self._order_keyed_rows(op.items, op.return_items, input_rows)
+        yield from self._top_rows(keyed_rows, [item.ascending for item in op.items], op.count)
+
+    def _iter_with_top_k(
+        self, op: With, input_rows: Iterable[ExecutionContext]
+    ) -> Iterator[ExecutionContext]:
+        """Stream WITH ... ORDER BY ... [SKIP] LIMIT, keeping only SKIP + LIMIT rows."""
+        sort_items = op.sort_items or []
+        skip = self._row_count(op.skip_count, "SKIP") if op.skip_count is not None else 0
+        limit = self._row_count(op.limit_count, "LIMIT") if op.limit_count is not None else 0
+        keyed_rows = self._order_keyed_rows(
+            sort_items, None, self._iter_with_projection(op, input_rows)
+        )
+        top = self._top_rows(keyed_rows, [item.ascending for item in sort_items], skip + limit)
+        yield from islice(top, skip, None)
+
+    def _iter_with_page(
+        self, op: With, input_rows: Iterable[ExecutionContext]
+    ) -> Iterator[ExecutionContext]:
+        """Stream an unsorted WITH projection, applying its SKIP and LIMIT."""
+        skip = self._row_count(op.skip_count, "SKIP") if op.skip_count is not None else 0
+        stop = None
+        if op.limit_count is not None:
+            stop = skip + self._row_count(op.limit_count, "LIMIT")
+        yield from islice(self._iter_with_projection(op, input_rows), skip, stop)
+
+    @staticmethod
+    def _top_rows(
+        keyed_rows: Iterable[tuple[tuple, Any]], ascending: list[bool], count: int
+    ) -> list[Any]:
+        """Return the first ``count`` rows in sort order from (order keys, row) pairs.
+
+        Uses a bounded heap: O(N log K) comparisons and O(K) memory. Rows with
+        equal keys keep their input order, as in a stable sort.
+        """
+        if all(ascending):
+            top = heapq.nsmallest(count, keyed_rows, key=itemgetter(0))
+        elif not any(ascending):
+            top = heapq.nlargest(count, keyed_rows, key=itemgetter(0))
+        else:
+            top = heapq.nsmallest(
+                count,
+                keyed_rows,
+                key=lambda pair: tuple(
+                    key if asc else _Descending(key) for key, asc in zip(pair[0], ascending)
+                ),
+            )
+        return [row for _, row in top]
 
     def _expressions_match(self, expr1, expr2) -> bool:
         """Check if two expressions are semantically equivalent.
@@ -1979,8 +2761,8 @@ class QueryExecutor:
                     if isinstance(pattern_parts[0], NodePattern):
                         src_pattern = pattern_parts[0]
                         # Check if variable already bound (for connecting existing nodes)
-                        if src_pattern.variable and src_pattern.variable in new_ctx.bindings:
-                            src_node = new_ctx.bindings[src_pattern.variable]
+                        if src_pattern.variable and new_ctx.has(src_pattern.variable):
+                            src_node = new_ctx.get(src_pattern.variable)
                         else:
                             src_node = self._create_node_from_pattern(src_pattern, new_ctx)
                             if src_pattern.variable:
@@ -2007,8 +2789,8 @@ class QueryExecutor:
                         src_node = last_dst_node
 
                         # Check if destination variable already bound
-                        if dst_pattern.variable and dst_pattern.variable in new_ctx.bindings:
-                            dst_node = new_ctx.bindings[dst_pattern.variable]
+                        if dst_pattern.variable and new_ctx.has(dst_pattern.variable):
+                            dst_node = new_ctx.get(dst_pattern.variable)
                         else:
                             dst_node = self._create_node_from_pattern(dst_pattern, new_ctx)
                             if dst_pattern.variable:
@@ -2143,13 +2925,13 @@ class QueryExecutor:
                 name = item.name
 
                 # Get the element from context
-                if var_name in ctx.bindings:
-                    element = ctx.bindings[var_name]
+                if ctx.has(var_name):
+                    element = ctx.get(var_name)
 
                     if item.item_type == "property":
                         # Remove property if it exists
                         if hasattr(element, "properties") and name in element.properties:
-                            del element.properties[name]
+                            self.graph.remove_property(element, name)
                     elif item.item_type == "label":
                         # Remove label if it exists
                         # NodeRef is immutable, so we need to create a new one with updated labels
@@ -2194,79 +2976,35 @@ class QueryExecutor:
         """
         from graphforge.types.graph import EdgeRef, NodeRef
 
+        # Collect the elements of every row first, so each is deleted once and
+        # a node's relationships may be deleted by the same clause
+        nodes: dict[Any, NodeRef] = {}
+        edges: dict[Any, EdgeRef] = {}
         for ctx in input_rows:
             for var_name in op.variables:
-                if var_name in ctx.bindings:
-                    element = ctx.bindings[var_name]
+                if ctx.has(var_name):
+                    element = ctx.get(var_name)
 
-                    # Skip NULL values - they don't exist in the graph
-                    if isinstance(element, CypherNull):
-                        continue
-
-                    # Delete from graph
+                    # NULL values don't exist in the graph
                     if isinstance(element, NodeRef):
-                        # Get all edges connected to this node
-                        outgoing = self.graph.get_outgoing_edges(element.id)
-                        incoming = self.graph.get_incoming_edges(element.id)
-                        all_edges = outgoing + incoming
-
-                        # Check if node has relationships
-                        if all_edges and not op.detach:
-                            raise ValueError(
-                                "Cannot delete node with relationships. "
-                                "Use DETACH DELETE to delete relationships first."
-                            )
-
-                        # Remove all connected edges first (if DETACH)
-                        if op.detach:
-                            for edge in all_edges:
-                                self.graph._edges.pop(edge.id, None)
-                                # Remove from adjacency lists
-                                if edge.src.id in self.graph._outgoing:
-                                    self.graph._outgoing[edge.src.id] = [
-                                        e
-                                        for e in self.graph._outgoing[edge.src.id]
-                                        if e.id != edge.id
-                                    ]
-                                if edge.dst.id in self.graph._incoming:
-                                    self.graph._incoming[edge.dst.id] = [
-                                        e
-                                        for e in self.graph._incoming[edge.dst.id]
-                                        if e.id != edge.id
-                                    ]
-                                # Remove from type index
-                                if edge.type in self.graph._type_index:
-                                    self.graph._type_index[edge.type].discard(edge.id)
-
-                        # Remove node
-                        self.graph._nodes.pop(element.id, None)
-                        # Remove from label index
-                        for label in element.labels:
-                            if label in self.graph._label_index:
-                                self.graph._label_index[label].discard(element.id)
-                        # Remove adjacency lists
-                        self.graph._outgoing.pop(element.id, None)
-                        self.graph._incoming.pop(element.id, None)
-
+                        nodes[element.id] = element
                     elif isinstance(element, EdgeRef):
-                        # Remove edge
-                        self.graph._edges.pop(element.id, None)
-                        # Remove from adjacency lists
-                        if element.src.id in self.graph._outgoing:
-                            self.graph._outgoing[element.src.id] = [
-                                e
-                                for e in self.graph._outgoing[element.src.id]
-                                if e.id != element.id
-                            ]
-                        if element.dst.id in self.graph._incoming:
-                            self.graph._incoming[element.dst.id] = [
-                                e
-                                for e in self.graph._incoming[element.dst.id]
-                                if e.id != element.id
-                            ]
-                        # Remove from type index
-                        if element.type in self.graph._type_index:
-                            self.graph._type_index[element.type].discard(element.id)
+                        edges[element.id] = element
+
+        # Check every node before deleting anything
+        if not op.detach:
+            for node in nodes.values():
+                for edge in chain(
+                    self.graph.iter_outgoing(node.id), self.graph.iter_incoming(node.id)
+                ):
+                    if edge.id not in edges:
+                        raise ValueError(
+                            "Cannot delete node with relationships. "
+                            "Use DETACH DELETE to delete relationships first."
+                        )
+
+        self.graph.remove_edges_bulk(edges)
+        self.graph.remove_nodes_bulk(nodes, detach=op.detach)
 
         # DELETE produces no output rows
         return []
@@ -2577,8 +3315,8 @@ class QueryExecutor:
         """
 
         # Check if variable is already bound (from MATCH clause)
-        if node_pattern.variable and node_pattern.variable in ctx.bindings:
-            return ctx.bindings[node_pattern.variable]
+        if node_pattern.variable and ctx.has(node_pattern.variable):
+            return ctx.get(node_pattern.variable)
 
         # Validate no disjunctive labels in MERGE
         if node_pattern.labels and len(node_pattern.labels) > 1:
@@ -2680,14 +3418,14 @@ class QueryExecutor:
                 prop_name = property_access.property
 
                 # Get the node or edge from context
-                if var_name in ctx.bindings:
-                    element = ctx.bindings[var_name]
+                if ctx.has(var_name):
+                    element = ctx.get(var_name)
 
                     # Evaluate the new value
                     new_value = evaluate_expression(value_expr, ctx, self)
 
                     # Update the property on the element
-                    element.properties[prop_name] = new_value
+                    self.graph.set_property(element, prop_name, new_value)
 
     def _execute_unwind(
         self, op: Unwind, input_rows: list[ExecutionContext]
@@ -2703,13 +3441,19 @@ class QueryExecutor:
         Returns:
             Expanded execution contexts (one per list element per input row)
         """
-        result = []
-
+        return list(self._iter_unwind(op, input_rows))
+
+    def _iter_unwind(
+        self, op: Unwind, input_rows: Iterable[ExecutionContext]
+    ) -> Iterator[ExecutionContext]:
+        """Stream UNWIND rows, one list element at a time."""
+        rows = iter(input_rows)
+        first = next(rows, None)
         # If no input rows, start with one empty context
-        if not input_rows:
-            input_rows = [ExecutionContext()]
+        if first is None:
+            first = ExecutionContext()
 
-        for ctx in input_rows:
+        for ctx in chain([first], rows):
             # Evaluate the list expression
             value = evaluate_expression(op.expression, ctx, self)
 
@@ -2721,18 +3465,14 @@ class QueryExecutor:
             if isinstance(value, CypherList):
                 # Expand each list item into a new row
                 for item in value.value:
-                    new_ctx = ExecutionContext()
-                    new_ctx.bindings = dict(ctx.bindings)
+                    new_ctx = ctx.child()
                     new_ctx.bind(op.variable, item)
-                    result.append(new_ctx)
+                    yield new_ctx
             else:
                 # If not a list or NULL, wrap in a list
-                new_ctx = ExecutionContext()
-                new_ctx.bindings = dict(ctx.bindings)
+                new_ctx = ctx.child()
                 new_ctx.bind(op.variable, value)
-                result.append(new_ctx)
-
-        return result
+                yield new_ctx
 
     def _execute_optional_expand(
         self, op: OptionalExpandEdges, input_rows: list[ExecutionContext]
@@ -2755,10 +3495,9 @@ class QueryExecutor:
 
         for ctx in input_rows:
             # Get source node
-            if op.src_var not in ctx.bindings:
+            if not ctx.has(op.src_var):
                 # OPTIONAL MATCH: Source variable not bound - preserve row with NULL bindings
-                new_ctx = ExecutionContext()
-                new_ctx.bindings = dict(ctx.bindings)
+                new_ctx = ctx.child()
                 new_ctx.bind(op.dst_var, CypherNull())
                 if op.edge_var:
                     new_ctx.bind(op.edge_var, CypherNull())
@@ -2768,57 +3507,37 @@ class QueryExecutor:
             src_node = ctx.get(op.src_var)
             if not isinstance(src_node, NodeRef):
                 # OPTIONAL MATCH: Source is not a node - preserve row with NULL bindings
-                new_ctx = ExecutionContext()
-                new_ctx.bindings = dict(ctx.bindings)
+                new_ctx = ctx.child()
                 new_ctx.bind(op.dst_var, CypherNull())
                 if op.edge_var:
                     new_ctx.bind(op.edge_var, CypherNull())
                 result.append(new_ctx)
                 continue
 
-            # Get edges based on direction
-            if op.direction == "OUT":
-                edges = self.graph.get_outgoing_edges(src_node.id)
-            elif op.direction == "IN":
-                edges = self.graph.get_incoming_edges(src_node.id)
-            else:  # UNDIRECTED
-                edges = self.graph.get_outgoing_edges(src_node.id) + self.graph.get_incoming_edges(
-                    src_node.id
-                )
+            # Walk the edges of the wanted types in place
+            matched = False
+            for edge, dst_node in self.graph.iter_neighbors(
+                src_node.id, op.direction, op.edge_types or None
+            ):
+                # INNER JOIN behavior - bind actual values
+                matched = True
+                new_ctx = ctx.child()
+
+                # Bind edge if variable specified
+                if op.edge_var:
+                    new_ctx.bind(op.edge_var, edge)
 
-            # Filter by edge types if specified
-            if op.edge_types:
-                edges = [e for e in edges if e.type in op.edge_types]
+                new_ctx.bind(op.dst_var, dst_node)
+                result.append(new_ctx)
 
             # LEFT JOIN behavior
-            if not edges:
+            if not matched:
                 # No edges found - preserve row with NULL bindings
-                new_ctx = ExecutionContext()
-                new_ctx.bindings = dict(ctx.bindings)
+                new_ctx = ctx.child()
                 new_ctx.bind(op.dst_var, CypherNull())
                 if op.edge_var:
                     new_ctx.bind(op.edge_var, CypherNull())
                 result.append(new_ctx)
-            else:
-                # INNER JOIN behavior - bind actual values
-                for edge in edges:
-                    new_ctx = ExecutionContext()
-                    new_ctx.bindings = dict(ctx.bindings)
-
-                    # Bind edge if variable specified
-                    if op.edge_var:
-                        new_ctx.bind(op.edge_var, edge)
-
-                    # Determine destination node based on direction
-                    if op.direction == "OUT":
-                        dst_node = edge.dst
-                    elif op.direction == "IN":
-                        dst_node = edge.src
-                    else:  # UNDIRECTED - check which end is the source
-                        dst_node = edge.dst if edge.src.id == src_node.id else edge.src
-
-                    new_ctx.bind(op.dst_var, dst_node)
-                    result.append(new_ctx)
 
         return result
 
@@ -2956,6 +3675,27 @@ class QueryExecutor:
 
         return all_results
 
+    def _iter_procedure_call(
+        self, op: ProcedureCall, input_rows: Iterable[ExecutionContext]
+    ) -> Iterator[ExecutionContext]:
+        """Stream one row per record returned by the procedure, for each input row."""
+        procedure = get_procedure(op.name)
+        yield_items = op.yield_items or [(field, field) for field in procedure.fields]
+        for field, _ in yield_items:
+            if field not in procedure.fields:
+                raise ValueError(
+                    f"Procedure {procedure.name} has no output field '{field}' "
+                    f"(fields: {', '.join(procedure.fields)})"
+                )
+
+        arguments = [self._compile_expression(arg) for arg in op.arguments]
+        for ctx in input_rows:
+            for record in call_procedure(procedure, self.graph, [arg(ctx) for arg in arguments]):
+                new_ctx = ctx.child()
+                for field, alias in yield_items:
+                    new_ctx.bind(alias, record[field])
+                yield new_ctx
+
     def _execute_call(self, op, input_rows: list[ExecutionContext]) -> list[ExecutionContext]:
         """Execute Call operator (for CALL { } subqueries).
 
@@ -2982,8 +3722,7 @@ class QueryExecutor:
 
         for outer_ctx in input_rows:
             # Create subquery context with inherited bindings (correlated subquery)
-            sub_ctx = ExecutionContext()
-            sub_ctx.bindings = dict(outer_ctx.bindings)
+            sub_ctx = outer_ctx.child()
 
             # Execute nested query pipeline
             sub_rows = [sub_ctx]
@@ -2993,8 +3732,7 @@ class QueryExecutor:
             if is_unit_subquery:
                 # Unit subquery: always produce exactly 1 output row per input row
                 # (Ignore sub_rows cardinality - just preserve outer bindings)
-                combined_ctx = ExecutionContext()
-                combined_ctx.bindings = dict(outer_ctx.bindings)
+                combined_ctx = outer_ctx.child()
                 result.append(combined_ctx)
             else:
                 # Row-producing subquery: merge each sub_row with outer bindings
@@ -0,0 +1,59 @@
+"""Persistent linked paths for depth-first traversals.
+
+A traversal that copies its path into a new list on every step spends O(L)
+per extension and O(L^2) per path of length L. A PathLink instead records
+one step and points at the path it extends. Extending a path allocates a
+single link, and every path shares its prefix with the paths it branched
+from. Node and relationship lists are only built for paths that are emitted
+and bound to a variable.
+"""
+
+from typing import NamedTuple
+
+from graphforge.types.graph import EdgeRef, NodeRef
+
+
+class PathLink(NamedTuple):
+    """The last step of a path and the path it extends.
+
+    Attributes:
+        edge: Relationship taken by the step
+        node: Node the step arrives at
+        previous: Path before the step (None when it starts at the start node)
+    """
+
+    edge: EdgeRef
+    node: NodeRef
+    previous: "PathLink | None"
+
+
+def path_edges(link: PathLink | None) -> list[EdgeRef]:
+    """Relationships of a linked path, first step first."""
+    edges = []
+    while link is not None:
+        edges.append(link.edge)
+        link = link.previous
+    edges.reverse()
+    return edges
+
+
+def path_lists(start: NodeRef, link: PathLink | None) -> tuple[list[NodeRef], list[EdgeRef]]:
+    """Nodes and relationships of a linked path from start.
+
+    Args:
+        start: First node of the path
+        link: Last step of the path (None for the empty path)
+
+    Returns:
+        (nodes, relationships), with len(nodes) == len(relationships) + 1
+    """
+    nodes = []
+    edges = []
+    while link is not None:
+        nodes.append(link.node)
+        edges.append(link.edge)
+        link = link.previous
+    nodes.append(start)
+    nodes.reverse()
+    edges.reverse()
+    return nodes, edges
@@ -0,0 +1,328 @@
+"""Built-in procedures for CALL name(args) [YIELD ...] clauses.
+
+Procedures are looked up by name (case-insensitively) in PROCEDURES. Each one
+receives the graph and its evaluated arguments and returns an iterator of
+records, one dict of output fields per row. Records are produced lazily, so a
+LIMIT after the CALL stops the procedure early.
+
+Weighted shortest paths:
+
+- ``graphforge.shortestPath.dijkstra(source, target, config)`` yields the
+  cheapest ``path`` from source to target and its ``cost``
+- ``graphforge.shortestPath.astar(source, target, config)`` finds the same
+  path with A*, guided by the distance between node points
+- ``graphforge.shortestPath.singleSource(source, config)`` streams every node
+  reachable from source with its ``cost``, cheapest first
+
+Config map keys (all optional):
+
+- ``weightProperty``: Relationship property holding the weight (default 'weight')
+- ``defaultWeight``: Weight of relationships without that property (default 1.0)
+- ``relationshipTypes``: Relationship types to follow (default: all)
+- ``direction``: 'OUT', 'IN' or 'UNDIRECTED' (default 'OUT')
+- ``pointProperty``: (A* only) Node property holding a point (default 'location')
+
+Weights must be finite, non-negative numbers. The A* heuristic is the great-circle
+distance in meters between WGS-84 points (Euclidean distance for Cartesian
+points), so weights must be at least the distance they cover, in the same
+unit, for A* to return the cheapest path. Nodes without a point are
+estimated at 0.
+"""
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+import heapq
+from itertools import count
+import math
+from typing import Any
+
+from graphforge.executor.evaluator import _haversine_distance
+from graphforge.storage.memory import Graph
+from graphforge.types.graph import EdgeRef, NodeRef
+from graphforge.types.values import (
+    CypherFloat,
+    CypherInt,
+    CypherList,
+    CypherMap,
+    CypherNull,
+    CypherPath,
+    CypherPoint,
+)
+
+Record = dict[str, Any]
+
+
+@dataclass(frozen=True)
+class Procedure:
+    """A procedure callable from Cypher.
+
+    Attributes:
+        name: Dotted procedure name
+        parameters: Parameter names; a trailing ``config`` parameter is optional
+        fields: Names of the fields of each output record
+        func: Function of (graph, arguments) returning the output records
+    """
+
+    name: str
+    parameters: tuple[str, ...]
+    fields: tuple[str, ...]
+    func: Callable[[Graph, list[Any]], Iterator[Record]]
+
+
+_DIRECTIONS = {"OUT", "IN", "UNDIRECTED"}
+_CONFIG_KEYS = {
+    "weightProperty",
+    "defaultWeight",
+    "relationshipTypes",
+    "direction",
+    "pointProperty",
+}
+
+
+def _config(value: Any, procedure: str) -> dict[str, Any]:
+    """Read the config map argument of a procedure into Python values."""
+    if isinstance(value, CypherNull):
+        items = {}
+    elif isinstance(value, CypherMap):
+        items = value.value
+    else:
+        raise TypeError(f"{procedure} config must be a map, got {type(value).__name__}")
+    unknown = set(items) - _CONFIG_KEYS
+    if unknown:
+        raise ValueError(f"{procedure} got unknown config keys: {', '.join(sorted(unknown))}")
+    config: dict[str, Any] = {}
+    for key, item in items.items():
+        if isinstance(item, CypherList):
+            config[key] = [element.value for element in item.value]
+        elif not isinstance(item, CypherNull):
+            config[key] = item.value
+    direction = str(config.get("direction", "OUT")).upper()
+    if direction not in _DIRECTIONS:
+        raise ValueError(f"{procedure} direction must be one of {_DIRECTIONS}, got {direction}")
+    config["direction"] = direction
+    if "defaultWeight" in config:
+        config["defaultWeight"] = _weight(config["defaultWeight"], f"{procedure} defaultWeight")
+    return config
+
+
+def _weight(value: Any, name: str) -> float:
+    """Check that a weight is a finite, non-negative number."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError(f"{name} must be a number, got {type(value).__name__}")
+    if math.isnan(value) or math.isinf(value):
+        raise ValueError(f"{name} must be finite, got {value}")
+    if value < 0:
+        raise ValueError(f"{name} is negative: {value}")
+    return float(value)
+
+
+def _node(value: Any, procedure: str, parameter: str) -> NodeRef | None:
+    """A node argument, or None for NULL."""
+    if isinstance(value, CypherNull):
+        return None
+    if not isinstance(value, NodeRef):
+        raise TypeError(f"{procedure} {parameter} must be a node, got {type(value).__name__}")
+    return value
+
+
+def _steps(
+    graph: Graph, config: dict[str, Any]
+) -> Callable[[NodeRef], Iterator[tuple[EdgeRef, NodeRef, float]]]:
+    """Build the function listing (edge, next node, weight) for each neighbour."""
+    weight_property = config.get("weightProperty", "weight")
+    default_weight: float = config.get("defaultWeight", 1.0)
+    types = config.get("relationshipTypes") or None
+    if isinstance(types, str):
+        types = [types]
+    direction = config["direction"]
+
+    def weight(edge: EdgeRef) -> float:
+        value = edge.properties.get(weight_property)
+        if value is None or isinstance(value, CypherNull):
+            return default_weight
+        if not isinstance(value, (CypherInt, CypherFloat)):
+            raise TypeError(
+                f"Relationship weight '{weight_property}' must be a number, "
+                f"got {type(value).__name__}"
+            )
+        return _weight(value.value, f"Relationship weight '{weight_property}'")
+
+    def steps(node: NodeRef) -> Iterator[tuple[EdgeRef, NodeRef, float]]:
+        for edge, next_node in graph.iter_neighbors(node.id, direction, types):
+            yield edge, next_node, weight(edge)
+
+    return steps
+
+
+def _point_distance(a: CypherPoint, b: CypherPoint) -> float:
+    """Distance between two points, 0 when they use different coordinate systems."""
+    p, q = a.value, b.value
+    if p["crs"] != q["crs"]:
+        return 0.0
+    if p["crs"] == "wgs-84":
+        return _haversine_distance(p["latitude"], p["longitude"], q["latitude"], q["longitude"])
+    axes = ("x", "y", "z") if p["crs"] == "cartesian-3d" else ("x", "y")
+    return math.sqrt(sum((q[axis] - p[axis]) ** 2 for axis in axes))
+
+
+def _search(
+    source: NodeRef,
+    steps: Callable[[NodeRef], Iterator[tuple[EdgeRef, NodeRef, float]]],
+    parents: dict[Any, tuple[NodeRef, EdgeRef]],
+    heuristic: Callable[[NodeRef], float] | None = None,
+) -> Iterator[tuple[NodeRef, float]]:
+    """Settle nodes cheapest first with a binary heap (Dijkstra, or A* with a heuristic).
+
+    Args:
+        source: Start node
+        steps: Neighbour function from _steps()
+        parents: Filled with the (previous node, edge) of each settled node
+        heuristic: Estimated remaining cost from a node (None for Dijkstra)
+
+    Yields:
+        (node, cost) for each node reachable from source, in settling order.
+        Without a heuristic every node is settled once; with one, a node is
+        settled again if a cheaper route to it turns up later
+    """
+    costs = {source.id: 0.0}
+    # The counter breaks ties so that nodes are never compared
+    tie = count()
+    heap = [(heuristic(source) if heuristic else 0.0, next(tie), 0.0, source)]
+    while heap:
+        _, _, cost, node = heapq.heappop(heap)
+        if cost > costs[node.id]:
+            # Superseded by a cheaper entry for the same node
+            continue
+        yield node, cost
+        for edge, next_node, weight in steps(node):
+            next_cost = cost + weight
+            if next_cost >= costs.get(next_node.id, math.inf):
+                continue
+            costs[next_node.id] = next_cost
+            parents[next_node.id] = (node, edge)
+            estimate = next_cost + heuristic(next_node) if heuristic else next_cost
+            heapq.heappush(heap, (estimate, next(tie), next_cost, next_node))
+
+
+def _path_to(
+    source: NodeRef, target: NodeRef, parents: dict[Any, tuple[NodeRef, EdgeRef]]
+) -> CypherPath:
+    """Follow parent links back from target to source."""
+    nodes = [target]
+    edges = []
+    while nodes[-1].id != source.id:
+        node, edge = parents[nodes[-1].id]
+        nodes.append(node)
+        edges.append(edge)
+    return CypherPath(nodes=nodes[::-1], relationships=edges[::-1])
+
+
+def _cheapest_path(graph: Graph, args: list[Any], procedure: str, a_star: bool) -> Iterator[Record]:
+    """Yield the cheapest path from args[0] to args[1], if there is one."""
+    source = _node(args[0], procedure, "source")
+    target = _node(args[1], procedure, "target")
+    if source is None or target is None:
+        return
+    config = _config(args[2], procedure)
+    heuristic = None
+    if a_star:
+        point_property = config.get("pointProperty", "location")
+        goal = target.properties.get(point_property)
+        if isinstance(goal, CypherPoint):
+
+            def heuristic(node: NodeRef) -> float:
+                point = node.properties.get(point_property)
+                return _point_distance(point, goal) if isinstance(point, CypherPoint) else 0.0
+
+    parents: dict[Any, tuple[NodeRef, EdgeRef]] = {}
+    for node, cost in _search(source, _steps(graph, config), parents, heuristic):
+        if node.id == target.id:
+            yield {"path": _path_to(source, target, parents), "cost": CypherFloat(cost)}
+            return
+
+
+def _dijkstra(graph: Graph, args: list[Any]) -> Iterator[Record]:
+    return _cheapest_path(graph, args, "graphforge.shortestPath.dijkstra", a_star=False)
+
+
+def _astar(graph: Graph, args: list[Any]) -> Iterator[Record]:
+    return _cheapest_path(graph, args, "graphforge.shortestPath.astar", a_star=True)
+
+
+def _single_source(graph: Graph, args: list[Any]) -> Iterator[Record]:
+    procedure = "graphforge.shortestPath.singleSource"
+    source = _node(args[0], procedure, "source")
+    if source is None:
+        return
+    steps = _steps(graph, _config(args[1], procedure))
+    for node, cost in _search(source, steps, {}):
+        yield {"node": node, "cost": CypherFloat(cost)}
+
+
+PROCEDURES: dict[str, Procedure] = {
+    procedure.name.lower(): procedure
+    for procedure in (
+        Procedure(
+            name="graphforge.shortestPath.dijkstra",
+            parameters=("source", "target", "config"),
+            fields=("path", "cost"),
+            func=_dijkstra,
+        ),
+        Procedure(
+            name="graphforge.shortestPath.astar",
+            parameters=("source", "target", "config"),
+            fields=("path", "cost"),
+            func=_astar,
+        ),
+        Procedure(
+            name="graphforge.shortestPath.singleSource",
+            parameters=("source", "config"),
+            fields=("node", "cost"),
+            func=_single_source,
+        ),
+    )
+}
+
+
+def get_procedure(name: str) -> Procedure:
+    """Look up a procedure by name.
+
+    Args:
+        name: Dotted procedure name (case-insensitive)
+
+    Returns:
+        The registered Procedure
+
+    Raises:
+        ValueError: If no procedure has that name
+    """
+    procedure = PROCEDURES.get(name.lower())
+    if procedure is None:
+        raise ValueError(f"Unknown procedure: {name}")
+    return procedure
+
+
+def call_procedure(procedure: Procedure, graph: Graph, args: list[Any]) -> Iterator[Record]:
+    """Call a procedure, checking its argument count.
+
+    Args:
+        procedure: Procedure to call
+        graph: Graph to run on
+        args: Evaluated arguments; an omitted trailing config is passed as NULL
+
+    Returns:
+        Iterator over the output records
+
+    Raises:
+        ValueError: If too few or too many arguments are given
+    """
+    required = len(procedure.parameters)
+    if procedure.parameters[-1] == "config":
+        required -= 1
+    if not required <= len(args) <= len(procedure.parameters):
+        raise ValueError(
+            f"{procedure.name} expects arguments ({', '.join(procedure.parameters)}), "
+            f"got {len(args)}"
+        )
+    args = args + [CypherNull()] * (len(procedure.parameters) - len(args))
+    return procedure.func(graph, args)
@@ -2,12 +2,16 @@
 
 from graphforge.optimizer.cost_model import CardinalityEstimator
 from graphforge.optimizer.optimizer import QueryOptimizer
+from graphforge.optimizer.plan_cache import PlanCache, PlanCacheStats
 from graphforge.optimizer.predicate_utils import PredicateAnalysis
-from graphforge.optimizer.statistics import GraphStatistics
+from graphforge.optimizer.statistics import GraphStatistics, StatisticsCounters
 
 __all__ = [
     "CardinalityEstimator",
     "GraphStatistics",
+    "PlanCache",
+    "PlanCacheStats",
     "PredicateAnalysis",
     "QueryOptimizer",
+    "StatisticsCounters",
 ]
@@ -1,24 +1,60 @@
 """Query optimizer for transforming logical operator plans."""
 
+from collections.abc import Iterable
 from typing import Any
 
-from graphforge.ast.expression import FunctionCall, Variable
+from pydantic import BaseModel
+
+from graphforge.ast.expression import (
+    BinaryOp,
+    FunctionCall,
+    Literal,
+    Parameter,
+    PropertyAccess,
+    Variable,
+    Wildcard,
+)
 from graphforge.optimizer.predicate_utils import PredicateAnalysis
 from graphforge.optimizer.statistics import GraphStatistics
 from graphforge.planner.operators import (
     Aggregate,
     AggregationHint,
+    Distinct,
     ExpandEdges,
+    ExpandMultiHop,
     ExpandVariableLength,
     Filter,
+    Limit,
+    NodeIndexScan,
+    NodeIndexSeek,
     OptionalExpandEdges,
     OptionalScanNodes,
+    Project,
     ScanNodes,
+    Skip,
+    Sort,
     Subquery,
+    TopK,
     Union,
     With,
 )
 
+# Operators that map each input row to output rows on its own, so repeating
+# an input row only repeats its output rows
+_ROW_WISE_OPERATORS = (
+    Filter,
+    ScanNodes,
+    NodeIndexSeek,
+    NodeIndexScan,
+    OptionalScanNodes,
+    ExpandEdges,
+    OptionalExpandEdges,
+    ExpandVariableLength,
+    ExpandMultiHop,
+    Project,
+    Sort,
+)
+
 
 class QueryOptimizer:
     """Optimizes logical query plans for better performance.
@@ -33,6 +69,11 @@ class QueryOptimizer:
         3. Predicate reordering - Evaluate more selective predicates first
         4. Redundant traversal elimination - Remove duplicate pattern scans
         5. Aggregate pushdown - Move aggregations into traversal operators
+        6. Index seek - Answer property equalities on ScanNodes from a property index,
+           and ranges, prefixes and ORDER BY ... LIMIT from a range index
+        7. Top-K - Replace a Sort feeding a LIMIT with a bounded-heap TopK
+        8. Reachability - Expand variable-length patterns whose paths are unused
+           and whose rows are deduplicated downstream by breadth-first search
 
     Attributes:
         enable_filter_pushdown: Enable filter pushdown optimization
@@ -40,6 +81,9 @@ class QueryOptimizer:
         enable_predicate_reorder: Enable predicate reordering optimization
         enable_redundant_elimination: Enable redundant traversal elimination
         enable_aggregate_pushdown: Enable aggregate pushdown optimization
+        enable_index_seek: Enable index seek optimization
+        enable_top_k: Enable Top-K optimization
+        enable_reachability: Enable reachability-mode variable-length expansion
         statistics: Graph statistics for cost-based optimization (optional)
     """
 
@@ -50,6 +94,10 @@ class QueryOptimizer:
         enable_predicate_reorder: bool = True,
         enable_redundant_elimination: bool = True,
         enable_aggregate_pushdown: bool = True,
+        enable_index_seek: bool = True,
+        enable_top_k: bool = True,
+        enable_reachability: bool = True,
+        *,
         statistics: GraphStatistics | None = None,
         max_orderings: int = 1000,
     ):
@@ -61,6 +109,9 @@ class QueryOptimizer:
             enable_predicate_reorder: Enable predicate reordering pass
             enable_redundant_elimination: Enable redundant traversal elimination
             enable_aggregate_pushdown: Enable aggregate pushdown pass
+            enable_index_seek: Enable index seek pass
+            enable_top_k: Enable Top-K pass
+            enable_reachability: Enable reachability pass
             statistics: Graph statistics for cost-based optimization (optional)
             max_orderings: Maximum orderings to enumerate in join reordering (default 1000)
         """
@@ -69,7 +120,12 @@ class QueryOptimizer:
         self.enable_predicate_reorder = enable_predicate_reorder
         self.enable_redundant_elimination = enable_redundant_elimination
         self.enable_aggregate_pushdown = enable_aggregate_pushdown
+        self.enable_index_seek = enable_index_seek
+        self.enable_top_k = enable_top_k
+        self.enable_reachability = enable_reachability
         self._statistics = statistics
+        self._property_indexes: set[tuple[str, str]] = set()
+        self._ordered_indexes: set[tuple[str, str]] = set()
         self._max_orderings = max_orderings
         self._predicate_analysis = PredicateAnalysis()
 
@@ -84,6 +140,20 @@ class QueryOptimizer:
         """
         self._statistics = statistics
 
+    def update_property_indexes(
+        self,
+        indexes: Iterable[tuple[str, str]],
+        ordered: Iterable[tuple[str, str]] = (),
+    ) -> None:
+        """Update the property indexes available to the index seek pass.
+
+        Args:
+            indexes: (label, property) pairs that have a property index
+            ordered: The subset of pairs whose index is a range index
+        """
+        self._property_indexes = set(indexes)
+        self._ordered_indexes = set(ordered)
+
     def optimize(self, operators: list[Any]) -> list[Any]:
         """Apply optimization passes to operator pipeline.
 
@@ -113,8 +183,349 @@ class QueryOptimizer:
         if self.enable_aggregate_pushdown:
             operators = self._aggregate_pushdown_pass(operators)
 
+        # Index seeks last: the passes above only recognize ScanNodes
+        if self.enable_index_seek and self._property_indexes:
+            operators = self._index_seek_pass(operators)
+
+        # Top-K after index seeks, which may already serve the order from an index
+        if self.enable_top_k:
+            operators = self._top_k_pass(operators)
+
+        if self.enable_reachability:
+            operators = self._reachability_pass(operators)
+
+        return operators
+
+    def _index_seek_pass(self, operators: list[Any]) -> list[Any]:
+        """Replace ScanNodes with NodeIndexSeek where a property index applies.
+
+        A ScanNodes qualifies when its labels are a single conjunction and
+        its predicate has an equality conjunct ``var.prop = value`` where
+        (label, prop) is indexed for one of the labels and ``value`` is a
+        literal, parameter, or reference to another variable. The predicate
+        is kept whole on the seek so the result is identical to the scan.
+
+        With range indexes, a scan without a usable equality becomes a
+        NodeIndexScan if a conjunct bounds a range-indexed property
+        (``<``, ``<=``, ``>``, ``>=`` or STARTS WITH), and a leading scan
+        whose rows are immediately sorted by a range-indexed property
+        produces them in that order instead, absorbing the Sort (and any
+        LIMIT reached only through Project/SKIP).
+
+        Args:
+            operators: Input operator list
+
+        Returns:
+            Operator list with eligible scans turned into index seeks
+        """
+        operators = [
+            self._try_index_seek(op) if isinstance(op, ScanNodes) else op for op in operators
+        ]
+        if self._ordered_indexes:
+            operators = self._index_order_pass(operators)
         return operators
 
+    def _try_index_seek(self, op: ScanNodes) -> Any:
+        """Return a NodeIndexSeek for a scan if an index applies, else the scan."""
+        if op.predicate is None or op.labels is None or len(op.labels) != 1:
+            return op
+        label_group = op.labels[0]
+
+        for conjunct in PredicateAnalysis.extract_conjuncts(op.predicate):
+            if not (isinstance(conjunct, BinaryOp) and conjunct.op == "="):
+                continue
+            for prop_side, value_side in (
+                (conjunct.left, conjunct.right),
+                (conjunct.right, conjunct.left),
+            ):
+                if not (
+                    isinstance(prop_side, PropertyAccess)
+                    and prop_side.variable == op.variable
+                    and prop_side.base is None
+                ):
+                    continue
+                if not self._is_seek_value(value_side, op.variable):
+                    continue
+                for label in label_group:
+                    if (label, prop_side.property) in self._property_indexes:
+                        return NodeIndexSeek(
+                            variable=op.variable,
+                            labels=op.labels,
+                            label=label,
+                            property=prop_side.property,
+                            value=value_side,
+                            path_var=op.path_var,
+                            predicate=op.predicate,
+                        )
+        return self._try_index_range_scan(op) if self._ordered_indexes else op
+
+    def _try_index_range_scan(self, op: ScanNodes) -> Any:
+        """Return a NodeIndexScan for a scan with range conjuncts, else the scan.
+
+        Bounds are taken from the first range-indexed property that has one;
+        further conjuncts stay in the predicate, which the scan re-checks.
+        """
+        assert op.predicate is not None and op.labels is not None
+        bounds: dict[str, dict[str, Any]] = {}
+        for conjunct in PredicateAnalysis.extract_conjuncts(op.predicate):
+            bound = self._range_bound(conjunct, op.variable)
+            if bound is None:
+                continue
+            property_name, field, inclusive, value = bound
+            if not any((label, property_name) in self._ordered_indexes for label in op.labels[0]):
+                continue
+            property_bounds = bounds.setdefault(property_name, {})
+            if field not in property_bounds:
+                property_bounds[field] = value
+                if inclusive is not None:
+                    property_bounds[f"{field}_inclusive"] = inclusive
+
+        if not bounds:
+            return op
+        property_name, property_bounds = next(iter(bounds.items()))
+        label = next(
+            label for label in op.labels[0] if (label, property_name) in self._ordered_indexes
+        )
+        return NodeIndexScan(
+            variable=op.variable,
+            labels=op.labels,
+            label=label,
+            property=property_name,
+            path_var=op.path_var,
+            predicate=op.predicate,
+            **property_bounds,
+        )
+
+    def _range_bound(
+        self, conjunct: Any, variable: str
+    ) -> tuple[str, str, bool | None, Any] | None:
+        """Read ``(property, bound field, inclusive, value)`` from a range conjunct.
+
+        ``var.prop < value`` gives an upper bound, ``value < var.prop`` a
+        lower one, and ``var.prop STARTS WITH value`` a prefix (inclusive is
+        None). Returns None for any other conjunct.
+        """
+        if not isinstance(conjunct, BinaryOp):
+            return None
+        if conjunct.op == "STARTS WITH":
+            sides = [(conjunct.left, conjunct.right, "prefix")]
+        elif conjunct.op in ("<", "<="):
+            sides = [
+                (conjunct.left, conjunct.right, "upper"),
+                (conjunct.right, conjunct.left, "lower"),
+            ]
+        elif conjunct.op in (">", ">="):
+            sides = [
+                (conjunct.left, conjunct.right, "lower"),
+                (conjunct.right, conjunct.left, "upper"),
+            ]
+        else:
+            return None
+
+        for prop_side, value_side, field in sides:
+            if (
+                isinstance(prop_side, PropertyAccess)
+                and prop_side.variable == variable
+                and prop_side.base is None
+                and self._is_seek_value(value_side, variable)
+            ):
+                inclusive = None if field == "prefix" else conjunct.op in ("<=", ">=")
+                return prop_side.property, field, inclusive, value_side
+        return None
+
+    def _index_order_pass(self, operators: list[Any]) -> list[Any]:
+        """Serve a leading scan followed by ORDER BY on a range-indexed property in order.
+
+        Only the first operator is considered, so the scan runs once on a
+        single input row and its output order is the query's row order.
+        """
+        if len(operators) < 2 or not isinstance(operators[1], Sort):
+            return operators
+        scan, sort = operators[0], operators[1]
+        if not isinstance(scan, (ScanNodes, NodeIndexScan)) or len(sort.items) != 1:
+            return operators
+        property_name = self._sort_property(sort, scan.variable)
+        if property_name is None:
+            return operators
+        descending = not sort.items[0].ascending
+
+        if isinstance(scan, NodeIndexScan):
+            if scan.property != property_name:
+                return operators
+            ordered = scan.model_copy(update={"descending": descending})
+        else:
+            if scan.labels is None or len(scan.labels) != 1:
+                return operators
+            label = next(
+                (
+                    label
+                    for label in scan.labels[0]
+                    if (label, property_name) in self._ordered_indexes
+                ),
+                None,
+            )
+            if label is None:
+                return operators
+            ordered = NodeIndexScan(
+                variable=scan.variable,
+                labels=scan.labels,
+                label=label,
+                property=property_name,
+                descending=descending,
+                path_var=scan.path_var,
+                predicate=scan.predicate,
+            )
+
+        rest = operators[2:]
+        limit = self._pushable_limit(rest)
+        if limit is not None:
+            ordered = ordered.model_copy(update={"limit": limit})
+        return [ordered, *rest]
+
+    @staticmethod
+    def _sort_property(sort: Sort, variable: str) -> str | None:
+        """Return ``prop`` if a single-item Sort orders by ``variable.prop``.
+
+        An ORDER BY on a RETURN alias is resolved through the Sort's return
+        items.
+        """
+        expression = sort.items[0].expression
+        if isinstance(expression, Variable) and expression.name != variable:
+            aliased = [
+                item.expression for item in sort.return_items or [] if item.alias == expression.name
+            ]
+            if len(aliased) == 1:
+                expression = aliased[0]
+        if (
+            isinstance(expression, PropertyAccess)
+            and expression.variable == variable
+            and expression.base is None
+        ):
+            return expression.property
+        return None
+
+    @staticmethod
+    def _pushable_limit(operators: list[Any]) -> int | None:
+        """Rows a scan must produce for a LIMIT reached through Project/SKIP only.
+
+        Only literal counts are pushed down; a $parameter count is known only
+        when the query runs, after the plan has been cached.
+        """
+        skipped = 0
+        for op in operators:
+            if isinstance(op, Project):
+                continue
+            if isinstance(op, Skip) and isinstance(op.count, int):
+                skipped += op.count
+                continue
+            if isinstance(op, Limit) and isinstance(op.count, int):
+                return skipped + op.count
+            return None
+        return None
+
+    def _top_k_pass(self, operators: list[Any]) -> list[Any]:
+        """Replace each Sort whose rows reach a LIMIT through Project/SKIP with TopK.
+
+        Only the first SKIP + LIMIT rows of the sort order can reach the
+        output, so a bounded heap over the input replaces the full sort. The
+        SKIP and LIMIT operators are kept and apply to the TopK's rows.
+        """
+        result = list(operators)
+        for i, op in enumerate(result):
+            if not isinstance(op, Sort):
+                continue
+            count = self._pushable_limit(result[i + 1 :])
+            if count is not None:
+                result[i] = TopK(items=op.items, return_items=op.return_items, count=count)
+        return result
+
+    def _reachability_pass(self, operators: list[Any]) -> list[Any]:
+        """Switch variable-length expansions that only decide reachability to BFS.
+
+        Depth-first expansion emits a row for every simple path, but when
+        neither the path nor the relationship list is referenced later and
+        the rows reach a DISTINCT (or aggregates that ignore duplicates)
+        through row-wise operators only, just the set of reachable end nodes
+        matters. Such expansions are marked for reachability mode, which
+        visits each node once.
+        """
+        result = list(operators)
+        for i, op in enumerate(result):
+            if (
+                not isinstance(op, ExpandVariableLength)
+                or op.reachability
+                or op.min_hops > 1
+                or op.agg_hint is not None
+                or not self._deduplicated(result[i + 1 :])
+            ):
+                continue
+            rest = result[i + 1 :]
+            if any(var and self._references(rest, var) for var in (op.edge_var, op.path_var)):
+                continue
+            result[i] = op.model_copy(update={"reachability": True, "path_var": None})
+        return result
+
+    @staticmethod
+    def _deduplicated(operators: list[Any]) -> bool:
+        """Whether duplicate rows are dropped before anything can count them.
+
+        True when row-wise operators lead to a DISTINCT, a WITH DISTINCT, or
+        an aggregation whose functions are all DISTINCT, MIN or MAX.
+        """
+        for op in operators:
+            if isinstance(op, Distinct):
+                return True
+            if isinstance(op, Aggregate):
+                return all(
+                    isinstance(expr, FunctionCall)
+                    and (expr.distinct or expr.name.upper() in ("MIN", "MAX"))
+                    for expr in op.agg_exprs
+                )
+            if isinstance(op, With):
+                # SKIP and LIMIT count rows, whether or not they are distinct
+                if op.skip_count is not None or op.limit_count is not None:
+                    return False
+                if op.distinct:
+                    return True
+                continue
+            if not isinstance(op, _ROW_WISE_OPERATORS):
+                return False
+        return False
+
+    @classmethod
+    def _references(cls, value: Any, name: str) -> bool:
+        """Whether a variable name occurs anywhere in operators or expressions.
+
+        Any string equal to the name counts, which errs on the side of
+        keeping a variable that is not actually used, and ``*`` projects
+        every variable.
+        """
+        if isinstance(value, Wildcard):
+            return True
+        if isinstance(value, str):
+            return value == name
+        if isinstance(value, BaseModel):
+            return any(cls._references(field, name) for field in value.__dict__.values())
+        if isinstance(value, dict):
+            return any(
+                cls._references(key, name) or cls._references(item, name)
+                for key, item in value.items()
+            )
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return any(cls._references(item, name) for item in value)
+        return False
+
+    @staticmethod
+    def _is_seek_value(expr: Any, variable: str) -> bool:
+        """Whether an expression can be evaluated once per row before the seek."""
+        if isinstance(expr, (Literal, Parameter)):
+            return True
+        if isinstance(expr, Variable):
+            return expr.name != variable
+        if isinstance(expr, PropertyAccess):
+            return expr.base is None and expr.variable != variable
+        return False
+
     def _filter_pushdown_pass(self, operators: list[Any]) -> list[Any]:
         """Push Filter predicates into ScanNodes/ExpandEdges operators.
 
@@ -0,0 +1,182 @@
+"""LRU cache of compiled query plans.
+
+This module provides the PlanCache used by GraphForge to skip parsing,
+planning and optimization for query strings it has already compiled.
+Entries are keyed by normalized query text and remember the graph
+statistics they were optimized against, so cost-based plans are rebuilt
+once the graph has changed enough to make them stale.
+"""
+
+from collections import OrderedDict
+import re
+
+from pydantic import BaseModel, Field
+
+from graphforge.optimizer.statistics import GraphStatistics
+
+# String literals and line comments (kept verbatim, comments with their line
+# break) or runs of whitespace (collapsed to a single space)
+_NORMALIZE_PATTERN = re.compile(r"""("(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|//[^\n]*\n?)|\s+""")
+
+
+class PlanCacheStats(BaseModel):
+    """Snapshot of plan cache counters.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that required compiling the query
+        evictions: Entries dropped because the cache was full
+        invalidations: Entries dropped because statistics drifted past the threshold
+        size: Current number of cached plans
+        max_size: Maximum number of cached plans
+    """
+
+    hits: int = Field(default=0, ge=0, description="Lookups answered from the cache")
+    misses: int = Field(default=0, ge=0, description="Lookups that required compilation")
+    evictions: int = Field(default=0, ge=0, description="Entries evicted by LRU policy")
+    invalidations: int = Field(default=0, ge=0, description="Entries dropped as stale")
+    size: int = Field(default=0, ge=0, description="Current number of cached plans")
+    max_size: int = Field(default=0, ge=0, description="Maximum number of cached plans")
+
+    model_config = {"frozen": True}
+
+
+class PlanCache:
+    """Least-recently-used cache of optimized operator pipelines.
+
+    Examples:
+        >>> cache = PlanCache(max_size=2)
+        >>> key = PlanCache.normalize("MATCH (n)   RETURN n")
+        >>> cache.get(key) is None
+        True
+        >>> plan = [ScanNodes(variable="n"), Project(items=[...])]
+        >>> cache.put(key, plan)
+        >>> cache.get(key) is plan
+        True
+    """
+
+    def __init__(self, max_size: int = 256, drift_threshold: float = 0.2):
+        """Initialize plan cache.
+
+        Args:
+            max_size: Maximum number of cached plans (0 disables caching)
+            drift_threshold: Maximum GraphStatistics.drift() tolerated before a
+                cached plan is considered stale and recompiled (default 0.2)
+
+        Raises:
+            ValueError: If max_size or drift_threshold is negative
+        """
+        if max_size < 0:
+            raise ValueError(f"max_size must be non-negative, got {max_size}")
+        if drift_threshold < 0:
+            raise ValueError(f"drift_threshold must be non-negative, got {drift_threshold}")
+        self.max_size = max_size
+        self.drift_threshold = drift_threshold
+        self._entries: OrderedDict[str, tuple[list, GraphStatistics | None]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """Normalize query text into a cache key.
+
+        Strips leading/trailing whitespace and collapses whitespace runs to a
+        single space, leaving string literals and comments untouched.
+
+        Args:
+            query: openCypher query string
+
+        Returns:
+            Normalized query text
+        """
+        return _NORMALIZE_PATTERN.sub(lambda m: m.group(1) or " ", query.strip())
+
+    def get(self, key: str, statistics: GraphStatistics | None = None) -> list | None:
+        """Look up a cached plan.
+
+        Args:
+            key: Normalized query text (see normalize())
+            statistics: Current graph statistics. When given, a plan optimized
+                against statistics that drifted past the threshold is dropped.
+
+        Returns:
+            Cached operator list, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        operators, planned_with = entry
+        if (
+            statistics is not None
+            and planned_with is not None
+            and planned_with is not statistics
+            and planned_with.drift(statistics) > self.drift_threshold
+        ):
+            del self._entries[key]
+            self._invalidations += 1
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return operators
+
+    def put(self, key: str, operators: list, statistics: GraphStatistics | None = None) -> None:
+        """Store a compiled plan, evicting the least recently used entry if full.
+
+        Args:
+            key: Normalized query text (see normalize())
+            operators: Optimized operator list
+            statistics: Graph statistics the plan was optimized against
+        """
+        if self.max_size == 0:
+            return
+        self._entries[key] = (operators, statistics)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate_all(self) -> None:
+        """Drop all cached plans, counting them as invalidations.
+
+        Used when something other than statistics makes every plan stale,
+        such as a property index being created or dropped.
+        """
+        self._invalidations += len(self._entries)
+        self._entries.clear()
+
+    def clear(self) -> None:
+        """Remove all cached plans and reset the counters."""
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def stats(self) -> PlanCacheStats:
+        """Return a snapshot of the cache counters.
+
+        Returns:
+            PlanCacheStats with hit/miss/eviction/invalidation counts and sizes
+        """
+        return PlanCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+            size=len(self._entries),
+            max_size=self.max_size,
+        )
+
+    def __len__(self) -> int:
+        """Return the number of cached plans."""
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a normalized query text is cached."""
+        return key in self._entries
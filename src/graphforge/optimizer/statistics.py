@@ -1,9 +1,11 @@
 """Statistics collection for cost-based query optimization.
 
 This module provides the GraphStatistics model for tracking graph-wide statistics
-used in cardinality estimation and join reordering optimization.
+used in cardinality estimation and join reordering optimization, and the
+StatisticsCounters the graph store updates incrementally to produce it.
 """
 
+from collections.abc import Iterable, Mapping
 import time
 
 from pydantic import BaseModel, Field
@@ -13,8 +15,9 @@ class GraphStatistics(BaseModel):
     """Graph-wide statistics for cost estimation.
 
     Tracks node counts, edge counts, and relationship cardinalities to enable
-    cost-based query optimization. Statistics are maintained eagerly during
-    graph mutations and persisted with the database.
+    cost-based query optimization. Instances are immutable snapshots built
+    from StatisticsCounters, which the graph store maintains during
+    mutations; statistics are persisted with the database.
 
     Attributes:
         total_nodes: Total number of nodes in the graph
@@ -48,3 +51,175 @@ class GraphStatistics(BaseModel):
             GraphStatistics instance with all counts at zero
         """
         return cls(total_nodes=0, total_edges=0)
+
+    def drift(self, other: "GraphStatistics") -> float:
+        """Measure how far another statistics snapshot has drifted from this one.
+
+        Drift is the largest relative change in any tracked count (total nodes,
+        total edges, per-label and per-type counts), where the relative change
+        of a count is ``abs(new - old) / max(old, 1)``.
+
+        Args:
+            other: Newer statistics to compare against this snapshot
+
+        Returns:
+            Maximum relative change as a non-negative float (0.0 means identical counts)
+
+        Examples:
+            >>> old = GraphStatistics(total_nodes=100, total_edges=0)
+            >>> new = GraphStatistics(total_nodes=150, total_edges=0)
+            >>> old.drift(new)
+            0.5
+        """
+
+        def relative(old: int, new: int) -> float:
+            return abs(new - old) / max(old, 1)
+
+        result = max(
+            relative(self.total_nodes, other.total_nodes),
+            relative(self.total_edges, other.total_edges),
+        )
+        for mine, theirs in (
+            (self.node_counts_by_label, other.node_counts_by_label),
+            (self.edge_counts_by_type, other.edge_counts_by_type),
+        ):
+            for key in mine.keys() | theirs.keys():
+                result = max(result, relative(mine.get(key, 0), theirs.get(key, 0)))
+        return result
+
+
+class StatisticsCounters:
+    """Mutable counters from which GraphStatistics snapshots are built.
+
+    The graph store updates these counters in O(1) per mutation and only
+    materializes an immutable GraphStatistics (via snapshot()) when the
+    optimizer asks for one. Average degree per edge type is derived from
+    per-type source out-degree counts, so no edge scan is ever needed.
+
+    Examples:
+        >>> counters = StatisticsCounters()
+        >>> counters.add_node(["Person"])
+        >>> counters.add_node(["Person"])
+        >>> counters.add_edge("KNOWS", 1)
+        >>> counters.add_edge("KNOWS", 1)
+        >>> stats = counters.snapshot()
+        >>> stats.node_counts_by_label, stats.avg_degree_by_type
+        ({'Person': 2}, {'KNOWS': 2.0})
+    """
+
+    __slots__ = (
+        "edge_counts_by_type",
+        "node_counts_by_label",
+        "source_degrees_by_type",
+        "total_edges",
+        "total_nodes",
+    )
+
+    def __init__(self) -> None:
+        """Initialize all counters at zero."""
+        self.total_nodes = 0
+        self.total_edges = 0
+        self.node_counts_by_label: dict[str, int] = {}
+        self.edge_counts_by_type: dict[str, int] = {}
+        # edge type -> source node ID -> number of outgoing edges of that type
+        self.source_degrees_by_type: dict[str, dict[int | str, int]] = {}
+
+    def add_node(self, labels: Iterable[str]) -> None:
+        """Count a node with the given labels."""
+        self.total_nodes += 1
+        counts = self.node_counts_by_label
+        for label in labels:
+            counts[label] = counts.get(label, 0) + 1
+
+    def add_nodes(self, count: int, label_counts: Mapping[str, int]) -> None:
+        """Count a batch of nodes.
+
+        Args:
+            count: Number of nodes in the batch
+            label_counts: Number of nodes in the batch carrying each label
+        """
+        self.total_nodes += count
+        counts = self.node_counts_by_label
+        for label, label_count in label_counts.items():
+            counts[label] = counts.get(label, 0) + label_count
+
+    def remove_node(self, labels: Iterable[str]) -> None:
+        """Uncount a node with the given labels."""
+        self.total_nodes -= 1
+        counts = self.node_counts_by_label
+        for label in labels:
+            remaining = counts.get(label, 0) - 1
+            if remaining > 0:
+                counts[label] = remaining
+            else:
+                counts.pop(label, None)
+
+    def add_edge(self, edge_type: str, src_id: int | str) -> None:
+        """Count an edge of the given type leaving src_id."""
+        self.total_edges += 1
+        self.edge_counts_by_type[edge_type] = self.edge_counts_by_type.get(edge_type, 0) + 1
+        degrees = self.source_degrees_by_type.setdefault(edge_type, {})
+        degrees[src_id] = degrees.get(src_id, 0) + 1
+
+    def add_edges(self, edge_type: str, source_degrees: Mapping[int | str, int]) -> None:
+        """Count a batch of edges of one type.
+
+        Args:
+            edge_type: Relationship type of every edge in the batch
+            source_degrees: Number of edges in the batch leaving each source node ID
+        """
+        count = sum(source_degrees.values())
+        self.total_edges += count
+        self.edge_counts_by_type[edge_type] = self.edge_counts_by_type.get(edge_type, 0) + count
+        degrees = self.source_degrees_by_type.setdefault(edge_type, {})
+        for src_id, degree in source_degrees.items():
+            degrees[src_id] = degrees.get(src_id, 0) + degree
+
+    def remove_edge(self, edge_type: str, src_id: int | str) -> None:
+        """Uncount an edge of the given type leaving src_id."""
+        self.total_edges -= 1
+        remaining = self.edge_counts_by_type.get(edge_type, 0) - 1
+        if remaining > 0:
+            self.edge_counts_by_type[edge_type] = remaining
+        else:
+            self.edge_counts_by_type.pop(edge_type, None)
+
+        degrees = self.source_degrees_by_type.get(edge_type)
+        if degrees is None:
+            return
+        degree = degrees.get(src_id, 0) - 1
+        if degree > 0:
+            degrees[src_id] = degree
+        else:
+            degrees.pop(src_id, None)
+            if not degrees:
+                del self.source_degrees_by_type[edge_type]
+
+    def snapshot(self) -> GraphStatistics:
+        """Materialize the current counts as an immutable GraphStatistics.
+
+        Returns:
+            GraphStatistics with counts and average degree per edge type
+        """
+        return GraphStatistics(
+            total_nodes=self.total_nodes,
+            total_edges=self.total_edges,
+            node_counts_by_label=dict(self.node_counts_by_label),
+            edge_counts_by_type=dict(self.edge_counts_by_type),
+            avg_degree_by_type={
+                edge_type: count / max(len(self.source_degrees_by_type.get(edge_type, ())), 1)
+                for edge_type, count in self.edge_counts_by_type.items()
+            },
+        )
+
+    def copy(self) -> "StatisticsCounters":
+        """Return an independent copy of the counters."""
+        clone = StatisticsCounters()
+        clone.total_nodes = self.total_nodes
+        clone.total_edges = self.total_edges
+        clone.node_counts_by_label = dict(self.node_counts_by_label)
+        clone.edge_counts_by_type = dict(self.edge_counts_by_type)
+        clone.source_degrees_by_type = {
+            edge_type: dict(degrees) for edge_type, degrees in self.source_degrees_by_type.items()
+        }
+        return clone
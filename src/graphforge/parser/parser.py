@@ -6,18 +6,23 @@ strings into AST representations using Lark and custom transformers.
 
 from functools import lru_cache
 from pathlib import Path
+import re
 
 from lark import Lark, Token, Transformer
 
 from graphforge.ast.clause import (
+    CallClause,
     CreateClause,
+    CreateIndexClause,
     DeleteClause,
+    DropIndexClause,
     LimitClause,
     MatchClause,
     MergeClause,
     OptionalMatchClause,
     OrderByClause,
     OrderByItem,
+    ProcedureCallClause,
     RemoveClause,
     RemoveItem,
     ReturnClause,
@@ -33,6 +38,7 @@ from graphforge.ast.expression import (
     CaseExpression,
     FunctionCall,
     Literal,
+    Parameter,
     PropertyAccess,
     Subscript,
     UnaryOp,
@@ -58,6 +64,76 @@ def _get_lark_parser():
         return Lark(f.read(), start="query", parser="earley")
 
 
+@lru_cache(maxsize=1)
+def _get_lalr_parser():
+    """Get cached LALR(1) parser instance with the AST transformer built in.
+
+    The LALR grammar (``cypher_lalr.lark``) is the deterministic fast path.
+    The transformer runs inline while parsing, so no intermediate parse tree
+    is built. Like the Earley parser, it is compiled once and shared.
+
+    Returns:
+        Lark: Compiled LALR parser that returns AST nodes directly
+    """
+    grammar_path = Path(__file__).parent / "cypher_lalr.lark"
+    with grammar_path.open() as f:
+        return Lark(f.read(), start="query", parser="lalr", transformer=_LALRTransformer())
+
+
+# Clause sequences accepted by cypher.lark, spelled as regular expressions over
+# one-character clause codes (see _CLAUSE_CODES). The LALR grammar parses any
+# sequence of clauses; these patterns keep it from accepting orderings that the
+# Earley grammar rejects.
+_TAIL = "o?s?l?"
+_READING = "(?:MW?|OW?|U|C)"
+_READ_QUERY = f"MW?O+W?r{_TAIL}|MW?r{_TAIL}|OW?r{_TAIL}"
+_WRITE_QUERY = f"cr?|mS?r?|MW?c+S?r?{_TAIL}|MW?m+S?r?{_TAIL}"
+_UPDATE_QUERY = f"MW?O+W?[SR]*D?r?{_TAIL}|MW?[SR]*D?r?{_TAIL}|OW?[SR]*D?r?{_TAIL}"
+_UNWIND_QUERY = f"U+W?r?{_TAIL}|U+W?cr?|U+MW?r?{_TAIL}"
+_CALL_QUERY = f"C+W?r?{_TAIL}|C+W?cr?|C+MW?r?{_TAIL}"
+_RETURN_ONLY_QUERY = f"r{_TAIL}"
+_FINAL_QUERY_PART = "|".join(
+    [_READ_QUERY, _RETURN_ONLY_QUERY, _WRITE_QUERY, _UPDATE_QUERY, _UNWIND_QUERY, _CALL_QUERY]
+)
+_SINGLE_PART_QUERY = "|".join(
+    [_FINAL_QUERY_PART, f"{_READING}{_READING}+W?r{_TAIL}"]  # reading_only_query
+)
+_MULTI_PART_QUERY = f"(?:{_READING}|c|m)+w+(?:{_FINAL_QUERY_PART})"
+_WITH_QUERY = f"w+(?:{_FINAL_QUERY_PART})"
+
+_SINGLE_PART_SHAPE = re.compile(f"(?:{_SINGLE_PART_QUERY})")
+_UNION_BRANCH_SHAPE = re.compile(f"(?:{_SINGLE_PART_QUERY})|(?:{_MULTI_PART_QUERY})")
+_SCHEMA_COMMAND = "[IX]"
+_QUERY_SHAPE = re.compile(
+    f"(?:{_SINGLE_PART_QUERY})|(?:{_MULTI_PART_QUERY})|(?:{_WITH_QUERY})|{_SCHEMA_COMMAND}"
+)
+
+_CLAUSE_CODES: dict[type, str] = {
+    MatchClause: "M",
+    OptionalMatchClause: "O",
+    WhereClause: "W",
+    UnwindClause: "U",
+    CallClause: "C",
+    ProcedureCallClause: "C",
+    CreateClause: "c",
+    MergeClause: "m",
+    SetClause: "S",
+    RemoveClause: "R",
+    DeleteClause: "D",
+    WithClause: "w",
+    ReturnClause: "r",
+    OrderByClause: "o",
+    SkipClause: "s",
+    LimitClause: "l",
+    CreateIndexClause: "I",
+    DropIndexClause: "X",
+}
+
+
+class _LALRFallbackError(Exception):
+    """Raised while LALR parsing when the query must be re-parsed with Earley."""
+
+
 class ASTTransformer(Transformer):
     """Transforms Lark parse tree into GraphForge AST."""
 
@@ -346,6 +422,95 @@ class ASTTransformer(Transformer):
 
         return CallClause(query=items[0])
 
+    def procedure_call(self, items):
+        """Transform CALL procedure(args) [YIELD ...]."""
+        # items: [name, procedure_args?, yield_clause?]
+        arguments: list = []
+        yield_items = None
+        for item in items[1:]:
+            if isinstance(item, tuple):
+                arguments = list(item)
+            else:
+                yield_items = item
+        return ProcedureCallClause(name=items[0], arguments=arguments, yield_items=yield_items)
+
+    def procedure_name(self, items):
+        """Transform a dotted procedure name."""
+        return ".".join(self._get_token_value(item) for item in items)
+
+    def procedure_args(self, items):
+        """Transform procedure arguments (a tuple, to tell them apart from YIELD)."""
+        return tuple(items)
+
+    def yield_clause(self, items):
+        """Transform YIELD field [AS alias], ..."""
+        return list(items)
+
+    def yield_item(self, items):
+        """Transform a YIELD item into a (field, alias) pair."""
+        field = self._get_token_value(items[0])
+        alias = self._get_token_value(items[1]) if len(items) > 1 else field
+        return (field, alias)
+
+    def schema_command(self, items):
+        """Transform a schema command into a single-clause query."""
+        return CypherQuery(clauses=[items[0]])
+
+    def create_index(self, items):
+        """Transform CREATE [RANGE] INDEX [name] [IF NOT EXISTS] FOR (n:Label) ON (n.prop)."""
+        # items: [index_kind, index_name?, if_not_exists?, variable, label, property_access]
+        kind, options = items[0], items[1:-3]
+        variable, label, property_access = items[-3:]
+        name = next((item for item in options if isinstance(item, str)), None)
+        if_not_exists = True in options
+        if property_access.variable != variable.name:
+            raise ValueError(
+                f"CREATE INDEX must index a property of '{variable.name}', "
+                f"got '{property_access.variable}.{property_access.property}'"
+            )
+        return CreateIndexClause(
+            label=label,
+            property=property_access.property,
+            name=name,
+            if_not_exists=if_not_exists,
+            kind=kind,
+        )
+
+    def create_index_legacy(self, items):
+        """Transform CREATE [RANGE] INDEX ON :Label(prop)."""
+        # items: [index_kind, label, IDENTIFIER]
+        return CreateIndexClause(
+            label=items[1], property=self._get_token_value(items[2]), kind=items[0]
+        )
+
+    def range_index_kind(self, items):
+        """Transform the RANGE index kind."""
+        return "range"
+
+    def hash_index_kind(self, items):
+        """Transform the default (hash) index kind."""
+        return "hash"
+
+    def drop_index(self, items):
+        """Transform DROP INDEX name [IF EXISTS]."""
+        return DropIndexClause(name=items[0], if_exists=len(items) > 1)
+
+    def drop_index_legacy(self, items):
+        """Transform DROP INDEX ON :Label(prop)."""
+        return DropIndexClause(label=items[0], property=self._get_token_value(items[1]))
+
+    def index_name(self, items):
+        """Transform index name."""
+        return self._get_token_value(items[0])
+
+    def if_not_exists(self, items):
+        """Transform IF NOT EXISTS."""
+        return True
+
+    def if_exists(self, items):
+        """Transform IF EXISTS."""
+        return True
+
     def where_clause(self, items):
         """Transform WHERE clause."""
         return WhereClause(predicate=items[0])
@@ -400,12 +565,14 @@ class ASTTransformer(Transformer):
         )
 
     def limit_clause(self, items):
-        """Transform LIMIT clause."""
-        return LimitClause(count=int(items[0]))
+        """Transform LIMIT clause (an integer or a $parameter)."""
+        count = items[0]
+        return LimitClause(count=count if isinstance(count, Parameter) else int(count))
 
     def skip_clause(self, items):
-        """Transform SKIP clause."""
-        return SkipClause(count=int(items[0]))
+        """Transform SKIP clause (an integer or a $parameter)."""
+        count = items[0]
+        return SkipClause(count=count if isinstance(count, Parameter) else int(count))
 
     def order_by_clause(self, items):
         """Transform ORDER BY clause."""
@@ -436,6 +603,20 @@ class ASTTransformer(Transformer):
         # items: [pattern_parts_list]
         return {"path_variable": None, "parts": items[0]}
 
+    def shortest_path(self, items):
+        """Transform shortestPath(...) / allShortestPaths(...) around pattern parts."""
+        # items: [SHORTEST_PATH_FUNCTION token, pattern_parts_list]
+        mode = "all" if str(items[0]).lower() == "allshortestpaths" else "single"
+        return {"shortest": mode, "parts": items[1]}
+
+    def shortest_path_with_binding(self, items):
+        """Transform p = shortestPath((a)-[*]->(b))."""
+        return {"path_variable": items[0].name, **items[1]}
+
+    def shortest_path_without_binding(self, items):
+        """Transform shortestPath((a)-[*]->(b)) without a path variable."""
+        return {"path_variable": None, **items[0]}
+
     def pattern_parts(self, items):
         """Transform pattern parts (node-rel-node-rel-node...)."""
         return items
@@ -985,6 +1166,10 @@ class ASTTransformer(Transformer):
         """Transform variable reference."""
         return Variable(name=self._get_token_value(items[0]))
 
+    def parameter(self, items):
+        """Transform parameter reference ($name), dropping the leading $."""
+        return Parameter(name=self._get_token_value(items[0])[1:])
+
     def _parse_int_token(self, s: str) -> int:
         """Decode a decimal, hexadecimal (0x/0X), or octal (0o/0O) integer token.
 
@@ -1145,9 +1330,64 @@ class ASTTransformer(Transformer):
         return (key, value_expr)
 
 
+class _LALRTransformer(ASTTransformer):
+    """Inline AST transformer for the LALR grammar.
+
+    Handles the rules where ``cypher_lalr.lark`` differs from ``cypher.lark``
+    and rejects clause sequences the Earley grammar would not accept by
+    raising ``_LALRFallbackError``.
+    """
+
+    @staticmethod
+    def _check_shape(query, shape):
+        """Validate a clause sequence against a compiled shape pattern."""
+        codes = "".join(_CLAUSE_CODES.get(type(clause), "?") for clause in query.clauses)
+        if shape.fullmatch(codes) is None:
+            raise _LALRFallbackError(codes)
+
+    def query(self, items):
+        """Transform query rule, validating the top-level clause sequence."""
+        if isinstance(items[0], CypherQuery):
+            self._check_shape(items[0], _QUERY_SHAPE)
+        return items[0]
+
+    def union_query(self, items):
+        """Transform UNION query, validating each branch."""
+        for item in items:
+            if isinstance(item, CypherQuery):
+                self._check_shape(item, _UNION_BRANCH_SHAPE)
+        return super().union_query(items)
+
+    def clause_sequence(self, items):
+        """Transform a flat clause sequence into a CypherQuery."""
+        return CypherQuery(clauses=list(items))
+
+    def eq_op(self, items):
+        """Transform the "=" comparison operator."""
+        return "="
+
+    def star_op(self, items):
+        """Transform the "*" multiplication operator."""
+        return "*"
+
+    def exists_expr(self, items):
+        """Transform EXISTS subquery expression (single-part queries only)."""
+        self._check_shape(items[0], _SINGLE_PART_SHAPE)
+        return super().exists_expr(items)
+
+    def count_expr(self, items):
+        """Transform COUNT subquery expression (single-part queries only)."""
+        self._check_shape(items[0], _SINGLE_PART_SHAPE)
+        return super().count_expr(items)
+
+
 class CypherParser:
     """Main parser for openCypher queries.
 
+    Queries are parsed with a deterministic LALR(1) grammar first. Queries
+    that grammar cannot handle are re-parsed with the full Earley grammar,
+    which is also the source of all syntax errors.
+
     Examples:
         >>> parser = CypherParser()
         >>> ast = parser.parse("MATCH (n:Person) RETURN n")
@@ -1155,9 +1395,14 @@ class CypherParser:
         True
     """
 
-    def __init__(self):
-        """Initialize parser with grammar and transformer."""
+    def __init__(self, use_lalr: bool = True):
+        """Initialize parser with grammar and transformer.
+
+        Args:
+            use_lalr: Try the LALR fast path before the Earley parser (default: True)
+        """
         self._lark = _get_lark_parser()
+        self._lalr = _get_lalr_parser() if use_lalr else None
         self._transformer = ASTTransformer()
 
     def parse(self, query: str) -> CypherQuery:
@@ -1172,6 +1417,14 @@ class CypherParser:
         Raises:
             lark.exceptions.LarkError: If the query is syntactically invalid
         """
+        if self._lalr is not None:
+            try:
+                return self._lalr.parse(query)  # type: ignore[no-any-return]
+            except Exception:
+                # Any failure on the fast path (syntax error, unsupported clause
+                # ordering, transformer error) is re-run through Earley so that
+                # results and error reporting match the reference grammar.
+                pass
         tree = self._lark.parse(query)
         ast = self._transformer.transform(tree)
         return ast  # type: ignore[no-any-return]
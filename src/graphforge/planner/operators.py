@@ -2,8 +2,10 @@
 
 This module defines the operators used in logical query plans:
 - ScanNodes: Scan nodes by label
+- NodeIndexSeek: Look nodes up through a property index
 - ExpandEdges: Traverse relationships
 - OptionalExpandEdges: Optional relationship expansion (left outer join)
+- ShortestPath: Shortest paths between two bound nodes
 - Filter: Apply predicates
 - Project: Select return items
 - With: Pipeline boundary for query chaining
@@ -17,12 +19,17 @@ This module defines the operators used in logical query plans:
 - Unwind: Expand lists into rows
 - Union: Combine results from multiple queries
 - Subquery: Nested query expressions (EXISTS, COUNT)
+- ProcedureCall: Call a built-in procedure
+- CreateIndex: Declare a property index
+- DropIndex: Remove a property index
 """
 
 from typing import Any
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from graphforge.ast.expression import Parameter
+
 
 class AggregationHint(BaseModel):
     """Hint for incremental aggregation during traversal.
@@ -98,6 +105,82 @@ class ScanNodes(BaseModel):
     model_config = {"frozen": True}
 
 
+class NodeIndexSeek(BaseModel):
+    """Operator for finding nodes through a property index.
+
+    Produced by the optimizer from a ScanNodes whose predicate contains an
+    equality on an indexed label/property pair. Candidate nodes come from
+    the index and are then checked against the full label specification and
+    predicate exactly as ScanNodes would, so the plan stays correct if the
+    index is dropped (execution falls back to a label scan).
+
+    Attributes:
+        variable: Variable name to bind nodes to
+        labels: Label groups of the original scan (a single conjunction)
+        label: Indexed label (one of the labels in the group)
+        property: Indexed property name
+        value: Expression for the value to look up (literal, parameter, or
+               an expression over already-bound variables)
+        path_var: Variable name to bind single-node path to (None if not needed)
+        predicate: Full predicate of the original scan, including the equality
+    """
+
+    variable: str = Field(..., min_length=1, description="Variable name to bind nodes")
+    labels: list[list[str]] = Field(..., min_length=1, description="Label filter")
+    label: str = Field(..., min_length=1, description="Indexed label")
+    property: str = Field(..., min_length=1, description="Indexed property name")
+    value: Any = Field(..., description="Lookup value expression")
+    path_var: str | None = Field(default=None, description="Path variable name")
+    predicate: Any | None = Field(default=None, description="Predicate to filter nodes")
+
+    model_config = {"frozen": True, "arbitrary_types_allowed": True}
+
+
+class NodeIndexScan(BaseModel):
+    """Operator for finding nodes through a range index, in index order.
+
+    Produced by the optimizer from a ScanNodes whose predicate bounds a
+    range-indexed property (``<``, ``<=``, ``>``, ``>=``, STARTS WITH), or
+    whose rows are immediately sorted by that property. Candidate nodes come
+    from the index and are then checked against the full label specification
+    and predicate exactly as ScanNodes would. When ``descending`` is set the
+    rows are produced in ORDER BY order (replacing the Sort), and ``limit``
+    stops the scan after that many rows. If the index is missing or cannot
+    answer the scan, execution falls back to a label scan plus sort.
+
+    Attributes:
+        variable: Variable name to bind nodes to
+        labels: Label groups of the original scan (a single conjunction)
+        label: Indexed label (one of the labels in the group)
+        property: Indexed property name
+        lower: Lower bound expression (None for unbounded)
+        lower_inclusive: Whether the lower bound is inclusive
+        upper: Upper bound expression (None for unbounded)
+        upper_inclusive: Whether the upper bound is inclusive
+        prefix: STARTS WITH prefix expression (None if none)
+        descending: None for any order, else the ORDER BY direction
+        limit: Maximum number of rows to produce (None for all)
+        path_var: Variable name to bind single-node path to (None if not needed)
+        predicate: Full predicate of the original scan, including the bounds
+    """
+
+    variable: str = Field(..., min_length=1, description="Variable name to bind nodes")
+    labels: list[list[str]] = Field(..., min_length=1, description="Label filter")
+    label: str = Field(..., min_length=1, description="Indexed label")
+    property: str = Field(..., min_length=1, description="Indexed property name")
+    lower: Any | None = Field(default=None, description="Lower bound expression")
+    lower_inclusive: bool = Field(default=True, description="Inclusive lower bound")
+    upper: Any | None = Field(default=None, description="Upper bound expression")
+    upper_inclusive: bool = Field(default=True, description="Inclusive upper bound")
+    prefix: Any | None = Field(default=None, description="STARTS WITH prefix expression")
+    descending: bool | None = Field(default=None, description="Produced order")
+    limit: int | None = Field(default=None, ge=0, description="Maximum rows to produce")
+    path_var: str | None = Field(default=None, description="Path variable name")
+    predicate: Any | None = Field(default=None, description="Predicate to filter nodes")
+
+    model_config = {"frozen": True, "arbitrary_types_allowed": True}
+
+
 class OptionalScanNodes(BaseModel):
     """Operator for scanning nodes with OPTIONAL semantics.
 
@@ -184,6 +267,10 @@ class ExpandVariableLength(BaseModel):
         max_hops: Maximum number of hops (None for unbounded)
         predicate: WHERE predicate expression to filter edges (None if not specified)
         agg_hint: Optional hint for incremental aggregation during traversal
+        reachability: Emit each reachable destination once per input row instead
+            of once per path, without binding the edge list. Set by the optimizer
+            when neither the path nor the edge list is used and duplicate rows are
+            removed downstream
     """
 
     src_var: str = Field(..., min_length=1, description="Source variable name")
@@ -200,6 +287,9 @@ class ExpandVariableLength(BaseModel):
     agg_hint: AggregationHint | None = Field(
         default=None, description="Optional hint for incremental aggregation"
     )
+    reachability: bool = Field(
+        default=False, description="Emit reachable destinations once, not every path"
+    )
 
     @field_validator("direction")
     @classmethod
@@ -235,6 +325,22 @@ class ExpandVariableLength(BaseModel):
             )
         return self
 
+    @model_validator(mode="after")
+    def validate_reachability(self) -> "ExpandVariableLength":
+        """Validate that reachability mode binds no path and starts at 0 or 1 hops.
+
+        A breadth-first search sees each node only at its shortest distance,
+        which tells whether some path of min..max hops reaches it only when
+        the minimum is 0 or 1.
+        """
+        if self.reachability and self.path_var is not None:
+            raise ValueError("Reachability mode cannot bind a path variable")
+        if self.reachability and self.min_hops > 1:
+            raise ValueError(
+                f"Reachability mode requires minimum hops of 0 or 1, got {self.min_hops}"
+            )
+        return self
+
     model_config = {"frozen": True}
 
 
@@ -278,6 +384,71 @@ class ExpandMultiHop(BaseModel):
     model_config = {"frozen": True}
 
 
+class ShortestPath(BaseModel):
+    """Operator for shortestPath() and allShortestPaths() patterns.
+
+    Finds the shortest paths between two nodes that are already bound, by a
+    breadth-first search that grows from both ends and stops at the first
+    depth where the two searches meet.
+
+    Attributes:
+        src_var: Variable name of the start node
+        dst_var: Variable name of the end node
+        edge_var: Variable name to bind the relationships to (None for anonymous)
+        path_var: Variable name to bind the path to (None if not needed)
+        edge_types: List of edge types to match
+        direction: Direction to traverse ('OUT', 'IN', 'UNDIRECTED')
+        min_hops: Minimum number of hops (0 or 1)
+        max_hops: Maximum number of hops (None for unbounded)
+        predicate: WHERE predicate expression to filter edges (None if not specified)
+        all_paths: Return every shortest path (allShortestPaths) instead of one
+        variable_length: Whether edge_var is bound to a list of relationships
+            (``[r*]``) or to the single relationship of a fixed-length pattern
+    """
+
+    src_var: str = Field(..., min_length=1, description="Start node variable name")
+    dst_var: str = Field(..., min_length=1, description="End node variable name")
+    edge_var: str | None = Field(default=None, description="Relationship variable name")
+    path_var: str | None = Field(default=None, description="Path variable name")
+    edge_types: list[str] = Field(..., description="Edge types to match")
+    direction: str = Field(..., description="Traversal direction")
+    min_hops: int = Field(default=1, description="Minimum hops (0 or 1)")
+    max_hops: int | None = Field(default=None, description="Maximum hops (None=unbounded)")
+    predicate: Any | None = Field(
+        default=None, description="WHERE predicate expression to filter edges"
+    )
+    all_paths: bool = Field(default=False, description="Return all shortest paths")
+    variable_length: bool = Field(default=True, description="Bind edge_var to a list")
+
+    @field_validator("direction")
+    @classmethod
+    def validate_direction(cls, v: str) -> str:
+        """Validate direction is valid."""
+        valid_dirs = {"OUT", "IN", "UNDIRECTED"}
+        if v not in valid_dirs:
+            raise ValueError(f"Direction must be one of {valid_dirs}, got {v}")
+        return v
+
+    @field_validator("min_hops")
+    @classmethod
+    def validate_min_hops(cls, v: int) -> int:
+        """Validate minimum hops."""
+        if v not in (0, 1):
+            raise ValueError(f"Minimum hops of a shortest path must be 0 or 1, got {v}")
+        return v
+
+    @model_validator(mode="after")
+    def validate_hop_range(self) -> "ShortestPath":
+        """Validate that max_hops >= min_hops when specified."""
+        if self.max_hops is not None and self.max_hops < self.min_hops:
+            raise ValueError(
+                f"Maximum hops ({self.max_hops}) must be >= minimum hops ({self.min_hops})"
+            )
+        return self
+
+    model_config = {"frozen": True}
+
+
 class Filter(BaseModel):
     """Operator for filtering rows based on a predicate.
 
@@ -310,10 +481,19 @@ class Limit(BaseModel):
     """Operator for limiting the number of result rows.
 
     Attributes:
-        count: Maximum number of rows to return
+        count: Maximum number of rows to return, or a Parameter resolved
+            when the query runs
     """
 
-    count: int = Field(..., ge=0, description="Maximum number of rows")
+    count: int | Parameter = Field(..., description="Maximum number of rows")
+
+    @field_validator("count")
+    @classmethod
+    def validate_count(cls, v: int | Parameter) -> int | Parameter:
+        """Validate a literal count is non-negative."""
+        if isinstance(v, int) and v < 0:
+            raise ValueError(f"count must be non-negative, got {v}")
+        return v
 
     model_config = {"frozen": True}
 
@@ -322,10 +502,19 @@ class Skip(BaseModel):
     """Operator for skipping result rows.
 
     Attributes:
-        count: Number of rows to skip
+        count: Number of rows to skip, or a Parameter resolved when the
+            query runs
     """
 
-    count: int = Field(..., ge=0, description="Number of rows to skip")
+    count: int | Parameter = Field(..., description="Number of rows to skip")
+
+    @field_validator("count")
+    @classmethod
+    def validate_count(cls, v: int | Parameter) -> int | Parameter:
+        """Validate a literal count is non-negative."""
+        if isinstance(v, int) and v < 0:
+            raise ValueError(f"count must be non-negative, got {v}")
+        return v
 
     model_config = {"frozen": True}
 
@@ -349,6 +538,30 @@ class Sort(BaseModel):
     model_config = {"frozen": True, "arbitrary_types_allowed": True}
 
 
+class TopK(BaseModel):
+    """Operator keeping only the first rows of a sort order.
+
+    Produced by the optimizer from a Sort whose output reaches a LIMIT
+    through Project and SKIP only. The rows are those the Sort would emit
+    first, in the same order (NULL ordering and ties included), found with a
+    bounded heap in O(N log K) time and O(K) memory. The SKIP and LIMIT
+    operators stay in the plan and apply to the kept rows as before.
+
+    Attributes:
+        items: List of OrderByItem AST nodes (expression + ascending flag)
+        return_items: Optional list of ReturnItem AST nodes for alias resolution
+        count: Number of rows to keep (SKIP + LIMIT)
+    """
+
+    items: list[Any] = Field(..., min_length=1, description="List of OrderByItems")
+    return_items: list[Any] | None = Field(
+        default=None, description="Optional ReturnItems for alias resolution"
+    )
+    count: int = Field(..., ge=0, description="Number of rows to keep")
+
+    model_config = {"frozen": True, "arbitrary_types_allowed": True}
+
+
 class Aggregate(BaseModel):
     """Operator for aggregating rows.
 
@@ -381,16 +594,32 @@ class With(BaseModel):
         distinct: True for WITH DISTINCT (deduplication)
         predicate: Optional filter predicate (WHERE after WITH)
         sort_items: Optional list of OrderByItem AST nodes
-        skip_count: Optional number of rows to skip
-        limit_count: Optional maximum number of rows
+        skip_count: Optional number of rows to skip (int or Parameter)
+        limit_count: Optional maximum number of rows (int or Parameter)
     """
 
     items: list[Any] = Field(..., min_length=1, description="List of ReturnItems")
     distinct: bool = Field(default=False, description="True for WITH DISTINCT")
     predicate: Any | None = Field(default=None, description="Optional WHERE expression")
     sort_items: list[Any] | None = Field(default=None, description="Optional OrderByItem list")
-    skip_count: int | None = Field(default=None, ge=0, description="Optional SKIP count")
-    limit_count: int | None = Field(default=None, gt=0, description="Optional LIMIT count")
+    skip_count: int | Parameter | None = Field(default=None, description="Optional SKIP count")
+    limit_count: int | Parameter | None = Field(default=None, description="Optional LIMIT count")
+
+    @field_validator("skip_count")
+    @classmethod
+    def validate_skip_count(cls, v: int | Parameter | None) -> int | Parameter | None:
+        """Validate a literal SKIP count is non-negative."""
+        if isinstance(v, int) and v < 0:
+            raise ValueError(f"skip_count must be non-negative, got {v}")
+        return v
+
+    @field_validator("limit_count")
+    @classmethod
+    def validate_limit_count(cls, v: int | Parameter | None) -> int | Parameter | None:
+        """Validate a literal LIMIT count is positive."""
+        if isinstance(v, int) and v <= 0:
+            raise ValueError(f"limit_count must be positive, got {v}")
+        return v
 
     model_config = {"frozen": True, "arbitrary_types_allowed": True}
 
@@ -575,6 +804,32 @@ class Call(BaseModel):
     model_config = {"frozen": True, "arbitrary_types_allowed": True}
 
 
+class ProcedureCall(BaseModel):
+    """Operator for CALL procedure(args) [YIELD ...] clauses.
+
+    Calls the procedure once per input row and binds each record it returns
+    as a new row extending the input row.
+
+    Example:
+        MATCH (a:Station {name: 'A'}), (b:Station {name: 'B'})
+        CALL graphforge.shortestPath.dijkstra(a, b) YIELD path, cost
+        RETURN path, cost
+
+    Attributes:
+        name: Dotted procedure name
+        arguments: Argument expressions, evaluated per input row
+        yield_items: (field, alias) pairs to bind, None to bind every field
+    """
+
+    name: str = Field(..., min_length=1, description="Procedure name")
+    arguments: list[Any] = Field(default_factory=list, description="Argument expressions")
+    yield_items: list[tuple[str, str]] | None = Field(
+        default=None, description="(field, alias) pairs to bind"
+    )
+
+    model_config = {"frozen": True, "arbitrary_types_allowed": True}
+
+
 class Subquery(BaseModel):
     """Operator for subquery expressions (EXISTS, COUNT, etc.).
 
@@ -642,3 +897,48 @@ class OptionalExpandEdges(BaseModel):
         return v
 
     model_config = {"frozen": True}
+
+
+class CreateIndex(BaseModel):
+    """Operator for declaring a property index.
+
+    Example:
+        CREATE INDEX person_name IF NOT EXISTS FOR (p:Person) ON (p.name)
+
+    Attributes:
+        label: Node label to index
+        property: Property name to index
+        name: Index name (None to generate one)
+        if_not_exists: Do nothing instead of failing if the index exists
+        kind: Index kind, 'hash' (equality) or 'range' (ordered)
+    """
+
+    label: str = Field(..., min_length=1, description="Indexed node label")
+    property: str = Field(..., min_length=1, description="Indexed property name")
+    name: str | None = Field(default=None, description="Index name")
+    if_not_exists: bool = Field(default=False, description="Ignore an existing index")
+    kind: str = Field(default="hash", description="Index kind")
+
+    model_config = {"frozen": True}
+
+
+class DropIndex(BaseModel):
+    """Operator for removing a property index.
+
+    Example:
+        DROP INDEX person_name IF EXISTS
+        DROP INDEX ON :Person(name)
+
+    Attributes:
+        name: Index name (None to identify the index by label and property)
+        label: Indexed node label
+        property: Indexed property name
+        if_exists: Do nothing instead of failing if the index does not exist
+    """
+
+    name: str | None = Field(default=None, description="Index name")
+    label: str | None = Field(default=None, description="Indexed node label")
+    property: str | None = Field(default=None, description="Indexed property name")
+    if_exists: bool = Field(default=False, description="Ignore a missing index")
+
+    model_config = {"frozen": True}
@@ -8,12 +8,15 @@ from typing import Any
 from graphforge.ast.clause import (
     CallClause,
     CreateClause,
+    CreateIndexClause,
     DeleteClause,
+    DropIndexClause,
     LimitClause,
     MatchClause,
     MergeClause,
     OptionalMatchClause,
     OrderByClause,
+    ProcedureCallClause,
     RemoveClause,
     ReturnClause,
     SetClause,
@@ -22,23 +25,27 @@ from graphforge.ast.clause import (
     WhereClause,
     WithClause,
 )
-from graphforge.ast.expression import FunctionCall
+from graphforge.ast.expression import BinaryOp, FunctionCall, UnaryOp, Variable
 from graphforge.ast.pattern import Direction, NodePattern, RelationshipPattern
 from graphforge.ast.query import CypherQuery
 from graphforge.planner.operators import (
     Aggregate,
     Call,
     Create,
+    CreateIndex,
     Delete,
+    DropIndex,
     ExpandEdges,
     Filter,
     Limit,
     Merge,
     OptionalExpandEdges,
+    ProcedureCall,
     Project,
     Remove,
     ScanNodes,
     Set,
+    ShortestPath,
     Skip,
     Sort,
     Union,
@@ -86,6 +93,29 @@ class QueryPlanner:
         # Reset type context for new query
         self._type_context = TypeContext()
 
+        # Schema commands are standalone single-clause queries
+        if len(ast.clauses) == 1:
+            clause = ast.clauses[0]
+            if isinstance(clause, CreateIndexClause):
+                return [
+                    CreateIndex(
+                        label=clause.label,
+                        property=clause.property,
+                        name=clause.name,
+                        if_not_exists=clause.if_not_exists,
+                        kind=clause.kind,
+                    )
+                ]
+            if isinstance(clause, DropIndexClause):
+                return [
+                    DropIndex(
+                        name=clause.name,
+                        label=clause.label,
+                        property=clause.property,
+                        if_exists=clause.if_exists,
+                    )
+                ]
+
         # Check if query contains WITH clauses
         has_with = any(isinstance(c, WithClause) for c in ast.clauses)
 
@@ -127,7 +157,7 @@ class QueryPlanner:
                 optional_match_clauses.append(clause)
             elif isinstance(clause, UnwindClause):
                 unwind_clauses.append(clause)
-            elif isinstance(clause, CallClause):
+            elif isinstance(clause, (CallClause, ProcedureCallClause)):
                 call_clauses.append(clause)
             elif isinstance(clause, CreateClause):
                 create_clauses.append(clause)
@@ -162,6 +192,14 @@ class QueryPlanner:
                 operators.extend(self._plan_optional_match(clause))
             elif isinstance(clause, UnwindClause):
                 operators.append(Unwind(expression=clause.expression, variable=clause.variable))
+            elif isinstance(clause, ProcedureCallClause):
+                operators.append(
+                    ProcedureCall(
+                        name=clause.name,
+                        arguments=clause.arguments,
+                        yield_items=clause.yield_items,
+                    )
+                )
             elif isinstance(clause, CallClause):
                 # CALL clause executes a nested query - plan it recursively
                 # Save type context before planning nested query (self.plan resets it)
@@ -327,9 +365,10 @@ class QueryPlanner:
                     if segment.where:
                         operators.append(Filter(predicate=segment.where.predicate))
                     if segment.order_by:
-                        operators.append(
-                            Sort(items=segment.order_by.items, return_items=segment.items)
+                        order_items = self._order_by_aggregate_aliases(
+                            segment.order_by.items, segment.items
                         )
+                        operators.append(Sort(items=order_items, return_items=segment.items))
                     # Add DISTINCT operator before SKIP/LIMIT (after ORDER BY)
                     if segment.distinct:
                         from graphforge.planner.operators import Distinct
@@ -404,6 +443,10 @@ class QueryPlanner:
                 pattern_parts = pattern
                 path_var = None
 
+            if isinstance(pattern, dict) and pattern.get("shortest"):
+                operators.extend(self._plan_shortest_path(pattern))
+                continue
+
             # Handle simple node pattern
             if len(pattern_parts) == 1 and isinstance(pattern_parts[0], NodePattern):
                 node_pattern = pattern_parts[0]
@@ -670,6 +713,85 @@ class QueryPlanner:
 
         return operators
 
+    def _plan_shortest_path(self, pattern: dict) -> list[Any]:
+        """Plan a shortestPath() or allShortestPaths() pattern.
+
+        Both end nodes are scanned (or checked, when already bound) first, so
+        the ShortestPath operator always searches between two known nodes.
+
+        Args:
+            pattern: Pattern dict with "shortest" set to "single" or "all"
+
+        Returns:
+            List of operators binding the end nodes, relationships and path
+
+        Raises:
+            SyntaxError: If the pattern is not a single relationship, or its
+                minimum length is greater than 1
+        """
+        parts = pattern["parts"]
+        function = "allShortestPaths" if pattern["shortest"] == "all" else "shortestPath"
+        if len(parts) != 3 or not isinstance(parts[1], RelationshipPattern):
+            raise SyntaxError(f"{function} requires a pattern with a single relationship")
+
+        rel_pattern = parts[1]
+        variable_length = rel_pattern.min_hops is not None or rel_pattern.max_hops is not None
+        min_hops = rel_pattern.min_hops if rel_pattern.min_hops is not None else 1
+        max_hops = rel_pattern.max_hops if variable_length else 1
+        if min_hops > 1:
+            raise SyntaxError(f"{function} does not support a minimal length greater than 1")
+
+        operators: list[Any] = []
+        end_vars = []
+        for node_pattern in (parts[0], parts[2]):
+            var_name = node_pattern.variable or self._generate_anonymous_variable()
+            self._type_context.validate_compatible(var_name, VariableType.NODE)
+            self._type_context.bind_variable(var_name, VariableType.NODE)
+            operators.append(
+                ScanNodes(
+                    variable=var_name,
+                    labels=node_pattern.labels if node_pattern.labels else None,
+                )
+            )
+            if node_pattern.properties:
+                operators.append(
+                    Filter(
+                        predicate=self._properties_to_predicate(var_name, node_pattern.properties)
+                    )
+                )
+            end_vars.append(var_name)
+
+        if rel_pattern.variable:
+            self._type_context.validate_compatible(rel_pattern.variable, VariableType.RELATIONSHIP)
+            self._type_context.bind_variable(rel_pattern.variable, VariableType.RELATIONSHIP)
+
+        path_var = pattern.get("path_variable")
+        if path_var:
+            self._type_context.validate_compatible(path_var, VariableType.PATH)
+            self._type_context.bind_variable(path_var, VariableType.PATH)
+
+        direction_map = {
+            Direction.OUT: "OUT",
+            Direction.IN: "IN",
+            Direction.UNDIRECTED: "UNDIRECTED",
+        }
+        operators.append(
+            ShortestPath(
+                src_var=end_vars[0],
+                dst_var=end_vars[1],
+                edge_var=rel_pattern.variable,
+                path_var=path_var,
+                edge_types=rel_pattern.types if rel_pattern.types else [],
+                direction=direction_map[rel_pattern.direction],
+                min_hops=min_hops,
+                max_hops=max_hops,
+                predicate=rel_pattern.predicate,
+                all_paths=pattern["shortest"] == "all",
+                variable_length=variable_length,
+            )
+        )
+        return operators
+
     def _plan_optional_match(self, clause: OptionalMatchClause) -> list[Any]:
         """Plan OPTIONAL MATCH clause into operators.
 
@@ -1071,6 +1193,58 @@ class QueryPlanner:
         # Could add recursive checking for complex expressions in the future
         return False
 
+    def _order_by_aggregate_aliases(self, order_items: list[Any], items: list[Any]) -> list[Any]:
+        """Rewrite ORDER BY items to read the aliases of repeated aggregate items.
+
+        ``WITH avg(n.age) AS a ORDER BY avg(n.age) + 1`` sorts rows that the
+        Aggregate operator has already reduced, where ``n`` is no longer bound
+        but ``a`` is.
+
+        Args:
+            order_items: OrderByItems following the Aggregate
+            items: WITH items, some of which are aliased aggregates
+
+        Returns:
+            OrderByItems with matching sub-expressions replaced by Variables
+        """
+        aggregates = [
+            (item.expression, item.alias)
+            for item in items
+            if item.alias and self._contains_aggregate(item.expression)
+        ]
+        if not aggregates:
+            return order_items
+        return [
+            order_item.model_copy(
+                update={
+                    "expression": self._resolve_aggregate_aliases(order_item.expression, aggregates)
+                }
+            )
+            for order_item in order_items
+        ]
+
+    def _resolve_aggregate_aliases(self, expr: Any, aggregates: list[tuple[Any, str]]) -> Any:
+        """Replace sub-expressions equal to an aggregate expression with its alias."""
+        for aggregate, alias in aggregates:
+            if expr == aggregate:
+                return Variable(name=alias)
+        if isinstance(expr, BinaryOp):
+            return expr.model_copy(
+                update={
+                    "left": self._resolve_aggregate_aliases(expr.left, aggregates),
+                    "right": self._resolve_aggregate_aliases(expr.right, aggregates),
+                }
+            )
+        if isinstance(expr, UnaryOp):
+            return expr.model_copy(
+                update={"operand": self._resolve_aggregate_aliases(expr.operand, aggregates)}
+            )
+        if isinstance(expr, FunctionCall):
+            return expr.model_copy(
+                update={"args": [self._resolve_aggregate_aliases(a, aggregates) for a in expr.args]}
+            )
+        return expr
+
     def _split_aggregates(self, return_clause: ReturnClause) -> tuple[list, list]:
         """Split RETURN items into grouping expressions and aggregates.
 
@@ -2,6 +2,7 @@
 
 This module contains storage implementations:
 - In-memory graph store
+- Read-only compressed sparse row (CSR) snapshot of a graph
 - SQLite persistent storage backend
 - TWO separate serialization systems (see below)
 
@@ -31,7 +32,9 @@ NEVER mix these systems:
 See CLAUDE.md "Two Serialization Systems" for detailed explanation.
 """
 
-from graphforge.storage.memory import Graph
+from graphforge.storage.csr import CSRGraph
+from graphforge.storage.indexes import PropertyIndex
+from graphforge.storage.memory import Graph, GraphChanges
 from graphforge.storage.pydantic_serialization import (
     deserialize_model,
     deserialize_model_from_json,
@@ -55,7 +58,10 @@ from graphforge.storage.serialization import (
 from graphforge.storage.sqlite_backend import SQLiteBackend
 
 __all__ = [
+    "CSRGraph",
     "Graph",
+    "GraphChanges",
+    "PropertyIndex",
     "SQLiteBackend",
     "deserialize_cypher_value",
     "deserialize_labels",
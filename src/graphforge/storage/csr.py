@@ -0,0 +1,424 @@
+"""Read-only compressed sparse row (CSR) snapshot of a graph.
+
+Graph keeps one EdgeRef object per relationship and two dict entries per
+relationship in its adjacency buckets: several hundred bytes per edge,
+scattered across the heap. CSRGraph.from_graph() (or Graph.freeze()) packs
+the structure of a graph into flat ``array('q')`` columns instead:
+
+- Nodes get dense indices 0..n-1; NodeRef objects are kept in a list
+- Edges get dense indices 0..m-1, in ascending ID order when every ID is an
+  integer, with their source, destination and type in parallel arrays
+- For each direction and relationship type, an ``offsets`` array of n + 1
+  entries and ``targets`` / ``edges`` arrays of one entry per edge: the
+  neighbours of node i are ``targets[offsets[i]:offsets[i + 1]]``
+
+Traversal walks these integer arrays. EdgeRef objects are only built for
+edges a caller asks for, so a snapshot costs tens of bytes per edge plus the
+property maps of edges that have properties.
+
+The snapshot shares NodeRef objects and property maps with the graph it was
+built from, so it reflects property values but not structural changes made
+to that graph afterwards. Property indexes are not carried over, so index
+seeks fall back to label scans.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from graphforge.optimizer.statistics import GraphStatistics
+from graphforge.types.graph import EdgeRef, NodeRef
+
+if TYPE_CHECKING:
+    from graphforge.storage.indexes import PropertyIndex
+    from graphforge.storage.memory import Graph
+
+# One direction and type of adjacency: (offsets, targets, edges)
+_Adjacency = tuple[array, array, array]
+
+
+def _build_adjacency(node_count: int, keys: list[int], others: list[int], edges: list[int]):
+    """Counting-sort one direction and type of edges into CSR arrays.
+
+    Args:
+        node_count: Number of nodes
+        keys: Dense index of the node each edge is listed under
+        others: Dense index of the node at the other end of each edge
+        edges: Dense index of each edge
+
+    Returns:
+        (offsets, targets, edges) arrays; edges keep their relative order
+        within a node
+    """
+    counts = [0] * (node_count + 1)
+    for key in keys:
+        counts[key + 1] += 1
+    for i in range(node_count):
+        counts[i + 1] += counts[i]
+    offsets = array("q", counts)
+
+    position = counts[:-1]
+    targets = array("q", bytes(8 * len(keys)))
+    edge_slots = array("q", bytes(8 * len(keys)))
+    for key, other, edge in zip(keys, others, edges, strict=True):
+        slot = position[key]
+        targets[slot] = other
+        edge_slots[slot] = edge
+        position[key] = slot + 1
+    return offsets, targets, edge_slots
+
+
+class CSRGraph:
+    """Read-only graph snapshot with adjacency in compressed sparse row arrays.
+
+    Implements the read API of Graph (node and edge lookups, label and type
+    scans, adjacency lists and iterators, statistics), so a QueryExecutor
+    can run read queries against it. Every mutating method raises
+    RuntimeError.
+
+    Examples:
+        >>> frozen = graph.freeze()
+        >>> [node.id for node in frozen.iter_neighbor_nodes(1, "OUT", ["KNOWS"])]
+        [2, 3]
+    """
+
+    def __init__(
+        self,
+        nodes: list[NodeRef],
+        edges: list[EdgeRef],
+        statistics: GraphStatistics | None = None,
+    ):
+        """Pack nodes and edges into a snapshot.
+
+        Args:
+            nodes: Every node of the graph
+            edges: Every edge of the graph; both endpoints must be in nodes
+            statistics: Statistics of the graph (default: empty statistics)
+
+        Raises:
+            ValueError: If an edge endpoint is not among the nodes
+        """
+        self._nodes = list(nodes)
+        self._node_index: dict[Any, int] = {node.id: i for i, node in enumerate(self._nodes)}
+        self._label_index: dict[str, array] = {}
+        for i, node in enumerate(self._nodes):
+            for label in node.labels:
+                self._label_index.setdefault(label, array("q")).append(i)
+
+        # Integer IDs are stored sorted and found by binary search; other
+        # IDs need a dict
+        edges = list(edges)
+        try:
+            edges.sort(key=lambda edge: edge.id)
+            self._edge_ids: array | list = array("q", (edge.id for edge in edges))
+            self._edge_index: dict[Any, int] | None = None
+        except (TypeError, OverflowError):
+            self._edge_ids = [edge.id for edge in edges]
+            self._edge_index = {edge_id: i for i, edge_id in enumerate(self._edge_ids)}
+
+        node_index = self._node_index
+        try:
+            sources = [node_index[edge.src.id] for edge in edges]
+            destinations = [node_index[edge.dst.id] for edge in edges]
+        except KeyError as error:
+            raise ValueError(f"Edge endpoint {error.args[0]} not found in nodes") from None
+        self._edge_src = array("q", sources)
+        self._edge_dst = array("q", destinations)
+
+        self._types: list[str] = []
+        self._type_codes: dict[str, int] = {}
+        edges_by_type: list[list[int]] = []
+        type_codes = []
+        for i, edge in enumerate(edges):
+            code = self._type_codes.get(edge.type)
+            if code is None:
+                code = self._type_codes[edge.type] = len(self._types)
+                self._types.append(edge.type)
+                edges_by_type.append([])
+            edges_by_type[code].append(i)
+            type_codes.append(code)
+        self._edge_types = array("q", type_codes)
+        self._edge_properties: dict[int, dict] = {
+            i: edge.properties for i, edge in enumerate(edges) if edge.properties
+        }
+
+        # Adjacency per type code, one list per direction
+        node_count = len(self._nodes)
+        self._outgoing: list[_Adjacency] = []
+        self._incoming: list[_Adjacency] = []
+        for typed_edges in edges_by_type:
+            typed_sources = [sources[i] for i in typed_edges]
+            typed_destinations = [destinations[i] for i in typed_edges]
+            self._outgoing.append(
+                _build_adjacency(node_count, typed_sources, typed_destinations, typed_edges)
+            )
+            self._incoming.append(
+                _build_adjacency(node_count, typed_destinations, typed_sources, typed_edges)
+            )
+
+        self._statistics = statistics if statistics is not None else GraphStatistics.empty()
+
+    @classmethod
+    def from_graph(cls, graph: "Graph") -> "CSRGraph":
+        """Build a snapshot of an in-memory graph.
+
+        Args:
+            graph: Graph to snapshot
+
+        Returns:
+            CSRGraph with the graph's nodes, edges and statistics
+        """
+        return cls(graph.get_all_nodes(), graph.get_all_edges(), graph.get_statistics())
+
+    # Nodes
+
+    def get_node(self, node_id: int | str) -> NodeRef | None:
+        """Get a node by ID, or None if it doesn't exist."""
+        i = self._node_index.get(node_id)
+        return None if i is None else self._nodes[i]
+
+    def has_node(self, node_id: int | str) -> bool:
+        """Check whether a node exists."""
+        return node_id in self._node_index
+
+    def node_count(self) -> int:
+        """Get the number of nodes."""
+        return len(self._nodes)
+
+    def get_all_nodes(self) -> list[NodeRef]:
+        """Get all nodes."""
+        return list(self._nodes)
+
+    def get_nodes_by_label(self, label: str) -> list[NodeRef]:
+        """Get all nodes with a label."""
+        nodes = self._nodes
+        return [nodes[i] for i in self._label_index.get(label, ())]
+
+    def get_statistics(self) -> GraphStatistics:
+        """Get the statistics of the graph at the time of the snapshot."""
+        return self._statistics
+
+    # Edges
+
+    def _edge_position(self, edge_id: int | str) -> int | None:
+        """Dense index of an edge ID, or None if there is no such edge."""
+        if self._edge_index is not None:
+            return self._edge_index.get(edge_id)
+        if not isinstance(edge_id, int):
+            return None
+        i = bisect_left(self._edge_ids, edge_id)
+        if i < len(self._edge_ids) and self._edge_ids[i] == edge_id:
+            return i
+        return None
+
+    def _edge(self, i: int) -> EdgeRef:
+        """Build the EdgeRef of the edge with dense index i."""
+        nodes = self._nodes
+        return EdgeRef(
+            id=self._edge_ids[i],
+            type=self._types[self._edge_types[i]],
+            src=nodes[self._edge_src[i]],
+            dst=nodes[self._edge_dst[i]],
+            properties=self._edge_properties.get(i) or {},
+        )
+
+    def get_edge(self, edge_id: int | str) -> EdgeRef | None:
+        """Get an edge by ID, or None if it doesn't exist."""
+        i = self._edge_position(edge_id)
+        return None if i is None else self._edge(i)
+
+    def has_edge(self, edge_id: int | str) -> bool:
+        """Check whether an edge exists."""
+        return self._edge_position(edge_id) is not None
+
+    def edge_count(self) -> int:
+        """Get the number of edges."""
+        return len(self._edge_ids)
+
+    def get_all_edges(self) -> list[EdgeRef]:
+        """Get all edges, in dense index order."""
+        return [self._edge(i) for i in range(len(self._edge_ids))]
+
+    def get_edges_by_type(self, edge_type: str) -> list[EdgeRef]:
+        """Get all edges of a relationship type."""
+        code = self._type_codes.get(edge_type)
+        if code is None:
+            return []
+        _, _, edges = self._outgoing[code]
+        return [self._edge(i) for i in sorted(edges)]
+
+    # Adjacency
+
+    def _adjacency(self, types: Iterable[str] | None) -> list[int]:
+        """Type codes to traverse, all of them or those of some types."""
+        if types is None:
+            return list(range(len(self._types)))
+        codes = self._type_codes
+        # dict.fromkeys drops repeated types while keeping their order
+        return [codes[t] for t in dict.fromkeys(types) if t in codes]
+
+    def iter_neighbors(
+        self,
+        node_id: int | str,
+        direction: str = "OUT",
+        types: Iterable[str] | None = None,
+    ) -> Iterator[tuple[EdgeRef, NodeRef]]:
+        """Iterate over a node's edges and the nodes at their other end.
+
+        Args:
+            node_id: The node ID
+            direction: "OUT", "IN" or "UNDIRECTED" (outgoing then incoming
+                edges, with a self-loop yielded once)
+            types: Only yield edges of these types (default: all types)
+
+        Yields:
+            (edge, neighbour) pairs, grouped by type: the given types in
+            order, or every type in the order it was first seen in the graph
+
+        Raises:
+            ValueError: If the direction is not recognized
+        """
+        if direction not in ("OUT", "IN", "UNDIRECTED"):
+            raise ValueError(f"Unknown direction: {direction}")
+        return self._iter_neighbors(node_id, direction, types)
+
+    def _iter_neighbors(
+        self, node_id: int | str, direction: str, types: Iterable[str] | None
+    ) -> Iterator[tuple[EdgeRef, NodeRef]]:
+        """Generator behind iter_neighbors()."""
+        node = self._node_index.get(node_id)
+        if node is None:
+            return
+        nodes = self._nodes
+        codes = self._adjacency(types)
+        if direction != "IN":
+            for code in codes:
+                offsets, targets, edges = self._outgoing[code]
+                for slot in range(offsets[node], offsets[node + 1]):
+                    yield self._edge(edges[slot]), nodes[targets[slot]]
+        if direction != "OUT":
+            undirected = direction == "UNDIRECTED"
+            for code in codes:
+                offsets, targets, edges = self._incoming[code]
+                for slot in range(offsets[node], offsets[node + 1]):
+                    target = targets[slot]
+                    # An undirected self-loop was already yielded as outgoing
+                    if undirected and target == node:
+                        continue
+                    yield self._edge(edges[slot]), nodes[target]
+
+    def iter_neighbor_nodes(
+        self,
+        node_id: int | str,
+        direction: str = "OUT",
+        types: Iterable[str] | None = None,
+    ) -> Iterator[NodeRef]:
+        """Iterate over the nodes at the other end of a node's edges.
+
+        Reads the target arrays only; no EdgeRef is built.
+
+        Args:
+            node_id: The node ID
+            direction: "OUT", "IN" or "UNDIRECTED"
+            types: Only follow edges of these types (default: all types)
+
+        Yields:
+            Neighbour nodes, once per edge, in iter_neighbors() order
+
+        Raises:
+            ValueError: If the direction is not recognized
+        """
+        if direction not in ("OUT", "IN", "UNDIRECTED"):
+            raise ValueError(f"Unknown direction: {direction}")
+        return self._iter_neighbor_nodes(node_id, direction, types)
+
+    def _iter_neighbor_nodes(
+        self, node_id: int | str, direction: str, types: Iterable[str] | None
+    ) -> Iterator[NodeRef]:
+        """Generator behind iter_neighbor_nodes()."""
+        node = self._node_index.get(node_id)
+        if node is None:
+            return
+        nodes = self._nodes
+        codes = self._adjacency(types)
+        if direction != "IN":
+            for code in codes:
+                offsets, targets, _ = self._outgoing[code]
+                for target in targets[offsets[node] : offsets[node + 1]]:
+                    yield nodes[target]
+        if direction != "OUT":
+            undirected = direction == "UNDIRECTED"
+            for code in codes:
+                offsets, targets, _ = self._incoming[code]
+                for target in targets[offsets[node] : offsets[node + 1]]:
+                    if not (undirected and target == node):
+                        yield nodes[target]
+
+    def iter_outgoing(
+        self, node_id: int | str, types: Iterable[str] | None = None
+    ) -> Iterator[EdgeRef]:
+        """Iterate over the edges going out from a node."""
+        return (edge for edge, _ in self._iter_neighbors(node_id, "OUT", types))
+
+    def iter_incoming(
+        self, node_id: int | str, types: Iterable[str] | None = None
+    ) -> Iterator[EdgeRef]:
+        """Iterate over the edges coming into a node."""
+        return (edge for edge, _ in self._iter_neighbors(node_id, "IN", types))
+
+    def get_outgoing_edges(
+        self, node_id: int | str, types: Iterable[str] | None = None
+    ) -> list[EdgeRef]:
+        """Get the edges going out from a node (empty list if it doesn't exist)."""
+        return list(self.iter_outgoing(node_id, types))
+
+    def get_incoming_edges(
+        self, node_id: int | str, types: Iterable[str] | None = None
+    ) -> list[EdgeRef]:
+        """Get the edges coming into a node (empty list if it doesn't exist)."""
+        return list(self.iter_incoming(node_id, types))
+
+    # Property indexes are not part of the snapshot
+
+    def get_property_index(self, label: str, property: str) -> "PropertyIndex | None":
+        """Property indexes are not carried over: always None."""
+        return None
+
+    def get_property_index_by_name(self, name: str) -> "PropertyIndex | None":
+        """Property indexes are not carried over: always None."""
+        return None
+
+    def property_indexes(self) -> "list[PropertyIndex]":
+        """Property indexes are not carried over: always empty."""
+        return []
+
+    @property
+    def index_version(self) -> int:
+        """Property indexes never change in a snapshot: always 0."""
+        return 0
+
+    def find_nodes_by_property(self, label: str, property: str, value) -> list[NodeRef] | None:
+        """No index answers the lookup: always None, so the caller scans."""
+        return None
+
+    def find_nodes_in_range(self, label: str, property: str, **bounds) -> list[NodeRef] | None:
+        """No index answers the scan: always None, so the caller scans."""
+        return None
+
+    @property
+    def in_transaction(self) -> bool:
+        """Snapshots have no transactions: always False."""
+        return False
+
+    def _read_only(self, *args, **kwargs):
+        """Reject a mutation."""
+        raise RuntimeError(
+            "CSRGraph is a read-only snapshot; modify the Graph and freeze() it again"
+        )
+
+    add_node = add_nodes_bulk = add_edge = add_edges_bulk = load_elements = _read_only
+    remove_node = remove_nodes_bulk = remove_edge = remove_edges_bulk = _read_only
+    set_property = remove_property = create_property_index = drop_property_index = _read_only
+    clear = restore = begin_transaction = savepoint = _read_only
+    rollback_to_savepoint = commit_transaction = rollback_transaction = _read_only
@@ -0,0 +1,371 @@
+"""Secondary property indexes for the in-memory graph.
+
+A PropertyIndex maps the values of one node property, for nodes carrying one
+label, to the IDs of those nodes. Lookups answer openCypher equality
+(``n.prop = value``) in O(1) instead of scanning every node with the label.
+
+Only scalar values are keyed: booleans, numbers and strings. Integers and
+floats share keys (``1 = 1.0`` is true in Cypher) while booleans are kept
+apart from numbers. Nodes whose value is null, NaN or non-scalar are not
+entered, since no scalar can equal them; lookups with a non-scalar value are
+refused so the caller can fall back to a scan.
+
+An OrderedPropertyIndex additionally keeps the distinct values of each
+comparable type family (numbers, strings, booleans, dates, datetimes) in a
+sorted list, so inequality ranges, string prefixes and ordered iteration are
+answered with ``bisect`` instead of a scan plus sort.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Hashable, Iterator
+import datetime
+from itertools import chain
+import math
+
+from graphforge.types.values import (
+    CypherBool,
+    CypherDate,
+    CypherDateTime,
+    CypherFloat,
+    CypherInt,
+    CypherNull,
+    CypherString,
+    CypherType,
+    CypherValue,
+)
+
+
+def index_key(value: CypherValue) -> Hashable | None:
+    """Return the hash key shared by every scalar value equal to ``value``.
+
+    Args:
+        value: Property value
+
+    Returns:
+        Hashable key, or None if the value is not an indexable scalar (or is
+        NaN, which equals nothing)
+    """
+    if isinstance(value, CypherBool):
+        return (CypherType.BOOLEAN, value.value)
+    if isinstance(value, (CypherInt, CypherFloat)):
+        number = value.value
+        if isinstance(number, float) and math.isnan(number):
+            return None
+        return (CypherType.FLOAT, number)
+    if isinstance(value, CypherString):
+        return (CypherType.STRING, value.value)
+    return None
+
+
+class PropertyIndex:
+    """Hash index from the values of ``label``-nodes' ``property`` to node IDs.
+
+    Attributes:
+        name: Index name, unique per graph
+        label: Indexed node label
+        property: Indexed property name
+
+    Examples:
+        >>> index = PropertyIndex("person_name", "Person", "name")
+        >>> index.add(1, CypherString("Alice"))
+        >>> index.lookup(CypherString("Alice"))
+        {1}
+    """
+
+    kind = "hash"
+
+    __slots__ = ("_entries", "label", "name", "property")
+
+    def __init__(self, name: str, label: str, property: str):
+        """Initialize an empty index.
+
+        Args:
+            name: Index name
+            label: Indexed node label
+            property: Indexed property name
+        """
+        self.name = name
+        self.label = label
+        self.property = property
+        self._entries: dict[Hashable, set[int | str]] = {}
+
+    def __len__(self) -> int:
+        """Number of distinct keyed values."""
+        return len(self._entries)
+
+    def add(self, node_id: int | str, value: CypherValue) -> None:
+        """Enter a node under its property value (unkeyed values are skipped)."""
+        key = index_key(value)
+        if key is not None:
+            self._entries.setdefault(key, set()).add(node_id)
+
+    def remove(self, node_id: int | str, value: CypherValue) -> None:
+        """Remove a node entered under its property value."""
+        key = index_key(value)
+        if key is None:
+            return
+        ids = self._entries.get(key)
+        if ids is not None:
+            ids.discard(node_id)
+            if not ids:
+                del self._entries[key]
+
+    def lookup(self, value: CypherValue) -> set[int | str] | None:
+        """Return the IDs of nodes whose property equals ``value``.
+
+        Args:
+            value: Value to compare against
+
+        Returns:
+            Set of node IDs (empty for null, which equals nothing), or None if
+            the value cannot be looked up and the caller must scan instead.
+            The returned set is owned by the index and must not be modified.
+        """
+        if isinstance(value, CypherNull):
+            return set()
+        key = index_key(value)
+        if key is None:
+            if isinstance(value, CypherFloat):  # NaN
+                return set()
+            return None
+        return self._entries.get(key, set())
+
+    def clear(self) -> None:
+        """Remove every entry, keeping the index definition."""
+        self._entries.clear()
+
+
+def order_key(value: CypherValue) -> tuple[str, object] | None:
+    """Return ``(family, sortable value)`` for values with a total order.
+
+    Values of one family compare with each other exactly as Cypher's ``<``
+    does; values of different families are never ordered against each other.
+
+    Args:
+        value: Property value
+
+    Returns:
+        (family, value) pair, or None for null, NaN and unordered types
+    """
+    if isinstance(value, CypherBool):
+        return ("boolean", value.value)
+    if isinstance(value, (CypherInt, CypherFloat)):
+        number = value.value
+        if isinstance(number, float) and math.isnan(number):
+            return None
+        return ("number", number)
+    if isinstance(value, CypherString):
+        return ("string", value.value)
+    if isinstance(value, CypherDateTime):
+        moment: datetime.datetime = value.value
+        return ("datetime" if moment.tzinfo is None else "datetime_tz", moment)
+    if isinstance(value, CypherDate):
+        return ("date", value.value)
+    return None
+
+
+class OrderedPropertyIndex(PropertyIndex):
+    """Sorted index answering equality, range, prefix and ordered scans.
+
+    Nodes whose value has no order key (lists, maps, NaN, ...) are tracked
+    separately: range and prefix scans return them as extra candidates so
+    the caller's predicate decides, and ordered iteration is refused while
+    any exist (or while several families are present), since only a full
+    sort can order them the way ORDER BY does.
+
+    Examples:
+        >>> index = OrderedPropertyIndex("event_ts", "Event", "ts")
+        >>> for node_id, ts in [(1, 5), (2, 9), (3, 7)]:
+        ...     index.add(node_id, CypherInt(ts))
+        >>> list(index.scan(lower=CypherInt(6)))
+        [3, 2]
+    """
+
+    kind = "range"
+
+    __slots__ = ("_size", "_sorted", "_unordered")
+
+    def __init__(self, name: str, label: str, property: str):
+        """Initialize an empty index.
+
+        Args:
+            name: Index name
+            label: Indexed node label
+            property: Indexed property name
+        """
+        super().__init__(name, label, property)
+        # family -> sorted distinct values; _entries maps (family, value) -> IDs
+        self._sorted: dict[str, list] = {}
+        # IDs of nodes whose non-null value has no order key
+        self._unordered: set[int | str] = set()
+        # Number of nodes entered (keyed or unordered)
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Number of nodes with a non-null value for the property."""
+        return self._size
+
+    def add(self, node_id: int | str, value: CypherValue) -> None:
+        """Enter a node under its property value."""
+        if isinstance(value, CypherNull):
+            return
+        self._size += 1
+        key = order_key(value)
+        if key is None:
+            self._unordered.add(node_id)
+            return
+        ids = self._entries.get(key)
+        if ids is None:
+            self._entries[key] = {node_id}
+            insort(self._sorted.setdefault(key[0], []), key[1])
+        else:
+            ids.add(node_id)
+
+    def remove(self, node_id: int | str, value: CypherValue) -> None:
+        """Remove a node entered under its property value."""
+        if isinstance(value, CypherNull):
+            return
+        key = order_key(value)
+        if key is None:
+            if node_id in self._unordered:
+                self._unordered.discard(node_id)
+                self._size -= 1
+            return
+        ids = self._entries.get(key)
+        if ids is None or node_id not in ids:
+            return
+        self._size -= 1
+        ids.discard(node_id)
+        if not ids:
+            del self._entries[key]
+            family, sort_value = key
+            values = self._sorted[family]
+            del values[bisect_left(values, sort_value)]
+            if not values:
+                del self._sorted[family]
+
+    def lookup(self, value: CypherValue) -> set[int | str] | None:
+        """Return the IDs of nodes whose property equals ``value``.
+
+        Args:
+            value: Value to compare against
+
+        Returns:
+            Set of node IDs, or None if the value has no order key and the
+            caller must scan instead. The set must not be modified.
+        """
+        if isinstance(value, CypherNull):
+            return set()
+        key = order_key(value)
+        if key is None:
+            if isinstance(value, CypherFloat):  # NaN
+                return set()
+            return None
+        return self._entries.get(key, set())
+
+    def scan(
+        self,
+        lower: CypherValue | None = None,
+        lower_inclusive: bool = True,
+        upper: CypherValue | None = None,
+        upper_inclusive: bool = True,
+        prefix: CypherValue | None = None,
+        descending: bool | None = None,
+    ) -> Iterator[int | str] | None:
+        """Return candidate node IDs for a range, prefix or ordered scan.
+
+        Keyed values within the bounds come first, in value order. For range
+        and prefix scans, nodes whose value belongs to another family (or has
+        no order key) are appended as candidates, since Cypher comparisons
+        across types are not simply false; the caller re-checks its predicate.
+
+        Args:
+            lower: Lower bound (None for unbounded)
+            lower_inclusive: Whether the lower bound is inclusive
+            upper: Upper bound (None for unbounded)
+            upper_inclusive: Whether the upper bound is inclusive
+            prefix: String prefix (STARTS WITH)
+            descending: Order of the result: None for any order, else
+                ascending or descending value order
+
+        Returns:
+            Lazy iterator of candidate node IDs (the index must not change
+            while it is consumed), or None if the scan cannot be answered
+            from the index (a bound of an unordered type, bounds of different
+            families, or an order requested over mixed families)
+        """
+        bounds = [bound for bound in (lower, upper, prefix) if bound is not None]
+        if any(isinstance(bound, CypherNull) for bound in bounds):
+            return iter(())  # comparisons with null are never true
+
+        if not bounds:
+            # Ordered iteration over every keyed value
+            if descending is None or self._unordered or len(self._sorted) > 1:
+                return None
+            family = next(iter(self._sorted), None)
+            if family is None:
+                return iter(())
+            return self._collect(family, self._sorted[family], descending)
+
+        if prefix is not None and not isinstance(prefix, CypherString):
+            return None
+        lower_key = order_key(lower) if lower is not None else None
+        upper_key = order_key(upper) if upper is not None else None
+        families = {key[0] for key in (lower_key, upper_key) if key is not None}
+        if prefix is not None:
+            families.add("string")
+        if (lower is not None and lower_key is None) or (upper is not None and upper_key is None):
+            return None
+        if len(families) != 1:
+            return None
+        family = families.pop()
+
+        others = self._other_ids(family)
+        if others and descending is not None:
+            return None
+
+        values = self._sorted.get(family, [])
+        start, stop = 0, len(values)
+        if lower_key is not None:
+            bisect = bisect_left if lower_inclusive else bisect_right
+            start = bisect(values, lower_key[1])
+        if upper_key is not None:
+            bisect = bisect_right if upper_inclusive else bisect_left
+            stop = bisect(values, upper_key[1])
+        if prefix is not None:
+            start = max(start, bisect_left(values, prefix.value))
+            end = start
+            while end < stop and values[end].startswith(prefix.value):
+                end += 1
+            stop = end
+
+        return chain(self._collect(family, values[start:stop], bool(descending)), others)
+
+    def _collect(self, family: str, values: list, descending: bool) -> Iterator[int | str]:
+        """Expand sorted values of a family into node IDs."""
+        entries = self._entries
+        for value in reversed(values) if descending else values:
+            yield from entries[(family, value)]
+
+    def _other_ids(self, family: str) -> list[int | str]:
+        """IDs of nodes whose value is outside ``family``."""
+        other_ids = list(self._unordered)
+        for other, values in self._sorted.items():
+            if other != family:
+                other_ids.extend(self._collect(other, values, descending=False))
+        return other_ids
+
+    def clear(self) -> None:
+        """Remove every entry, keeping the index definition."""
+        super().clear()
+        self._sorted.clear()
+        self._unordered.clear()
+        self._size = 0
+
+
+# Index implementations by the kind named in CREATE [RANGE] INDEX
+INDEX_KINDS: dict[str, type[PropertyIndex]] = {
+    PropertyIndex.kind: PropertyIndex,
+    OrderedPropertyIndex.kind: OrderedPropertyIndex,
+}
@@ -7,17 +7,100 @@ layer that will later be backed by persistent storage.
 The Graph class stores:
 - Nodes indexed by ID
 - Edges indexed by ID
-- Outgoing adjacency lists (node_id -> list of outgoing edges)
-- Incoming adjacency lists (node_id -> list of incoming edges)
+- Outgoing adjacency bucketed by type (node_id -> edge_type -> edge_id -> edge)
+- Incoming adjacency bucketed by type (node_id -> edge_type -> edge_id -> edge)
 - Label index (label -> set of node IDs)
 - Type index (edge_type -> set of edge IDs)
+- Optional property indexes ((label, property) -> value -> set of node IDs),
+  hash or ordered (range)
+
+While a transaction is open, every mutation appends its inverse to an undo
+log. Beginning a transaction is O(1) and rolling back only reverts the
+elements that were touched.
+
+With change tracking enabled, the graph also records which element IDs were
+written or deleted since the last persisted save, so a storage backend can
+write just that delta.
+
+freeze() packs the graph into a read-only CSRGraph snapshot for read-heavy
+workloads.
 """
 
-from collections import defaultdict
-import time
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+import gc
+from itertools import chain
 
-from graphforge.optimizer.statistics import GraphStatistics
+from graphforge.optimizer.statistics import GraphStatistics, StatisticsCounters
+from graphforge.storage.csr import CSRGraph
+from graphforge.storage.indexes import INDEX_KINDS, OrderedPropertyIndex, PropertyIndex
 from graphforge.types.graph import EdgeRef, NodeRef
+from graphforge.types.values import CypherNull
+
+# Undo log entry kinds; each entry is (kind, payload...)
+_UNDO_ADD_NODE = "add_node"  # (kind, node) - remove the added node
+_UNDO_ADD_EDGE = "add_edge"  # (kind, edge) - remove the added edge
+_UNDO_REPLACE_NODE = "replace_node"  # (kind, old_node) - put the old node back
+_UNDO_REPLACE_EDGE = "replace_edge"  # (kind, old_edge) - put the old edge back
+_UNDO_REMOVE_NODE = "remove_node"  # (kind, node) - re-add the removed node
+_UNDO_REMOVE_EDGE = "remove_edge"  # (kind, edge) - re-add the removed edge
+_UNDO_ADD_PROPERTY = "add_property"  # (kind, element, key) - drop the new key
+_UNDO_SET_PROPERTY = "set_property"  # (kind, element, key, old_value) - put old value back
+_UNDO_CREATE_INDEX = "create_index"  # (kind, index) - drop the new index
+_UNDO_DROP_INDEX = "drop_index"  # (kind, index) - rebuild the dropped index
+
+
+@dataclass
+class GraphChanges:
+    """Element IDs written or deleted since changes were last taken.
+
+    An ID is in at most one of the upserted/deleted sets for its element
+    kind: the latest mutation wins.
+
+    Attributes:
+        nodes: IDs of nodes created or modified
+        edges: IDs of edges created or modified
+        deleted_nodes: IDs of nodes removed
+        deleted_edges: IDs of edges removed
+        indexes_changed: Whether a property index was created or dropped
+    """
+
+    nodes: set[int | str] = field(default_factory=set)
+    edges: set[int | str] = field(default_factory=set)
+    deleted_nodes: set[int | str] = field(default_factory=set)
+    deleted_edges: set[int | str] = field(default_factory=set)
+    indexes_changed: bool = False
+
+    def __bool__(self) -> bool:
+        """Whether any element or index definition was written or deleted."""
+        return bool(
+            self.nodes
+            or self.edges
+            or self.deleted_nodes
+            or self.deleted_edges
+            or self.indexes_changed
+        )
+
+    def node_written(self, node_id: int | str) -> None:
+        """Record that a node was created or modified."""
+        self.deleted_nodes.discard(node_id)
+        self.nodes.add(node_id)
+
+    def node_deleted(self, node_id: int | str) -> None:
+        """Record that a node was removed."""
+        self.nodes.discard(node_id)
+        self.deleted_nodes.add(node_id)
+
+    def edge_written(self, edge_id: int | str) -> None:
+        """Record that an edge was created or modified."""
+        self.deleted_edges.discard(edge_id)
+        self.edges.add(edge_id)
+
+    def edge_deleted(self, edge_id: int | str) -> None:
+        """Record that an edge was removed."""
+        self.edges.discard(edge_id)
+        self.deleted_edges.add(edge_id)
 
 
 class Graph:
@@ -26,9 +109,10 @@ class Graph:
     The graph maintains several indexes for efficient queries:
     - Node storage: id -> NodeRef
     - Edge storage: id -> EdgeRef
-    - Outgoing edges: node_id -> [EdgeRef]
-    - Incoming edges: node_id -> [EdgeRef]
+    - Outgoing edges: node_id -> edge_type -> edge_id -> EdgeRef
+    - Incoming edges: node_id -> edge_type -> edge_id -> EdgeRef
     - Label index: label -> {node_id}
+    - Property indexes: (label, property) -> value -> {node_id} (opt-in)
     - Type index: edge_type -> {edge_id}
 
     Examples:
@@ -47,16 +131,35 @@ class Graph:
         self._nodes: dict[int | str, NodeRef] = {}
         self._edges: dict[int | str, EdgeRef] = {}
 
-        # Adjacency lists for traversal
-        self._outgoing: dict[int | str, list[EdgeRef]] = defaultdict(list)
-        self._incoming: dict[int | str, list[EdgeRef]] = defaultdict(list)
+        # Adjacency for traversal, one bucket per edge type so typed expansion
+        # never looks at edges of other types; a node's dict only holds
+        # non-empty buckets. Buckets are insertion-ordered dicts keyed by edge
+        # ID, so an edge is removed in O(1) whatever the node's degree
+        self._outgoing: dict[int | str, dict[str, dict[int | str, EdgeRef]]] = defaultdict(dict)
+        self._incoming: dict[int | str, dict[str, dict[int | str, EdgeRef]]] = defaultdict(dict)
+        # Bumped whenever an edge is added or removed, so adjacency iterators
+        # can detect a mutation made while they are live
+        self._adjacency_version = 0
 
         # Indexes for efficient queries
         self._label_index: dict[str, set[int | str]] = defaultdict(set)
         self._type_index: dict[str, set[int | str]] = defaultdict(set)
 
-        # Statistics for cost-based optimization
-        self._statistics: GraphStatistics = GraphStatistics.empty()
+        # User-declared property indexes keyed by (label, property); the
+        # version is bumped whenever one is created or dropped
+        self._property_indexes: dict[tuple[str, str], PropertyIndex] = {}
+        self._index_version = 0
+
+        # Statistics for cost-based optimization: counters are updated in O(1)
+        # per mutation; the immutable snapshot is built lazily (None = stale)
+        self._statistics_counters = StatisticsCounters()
+        self._statistics: GraphStatistics | None = GraphStatistics.empty()
+
+        # Undo log of the open transaction (None = no transaction)
+        self._undo_log: list[tuple] | None = None
+
+        # Element IDs changed since the last save (None = not tracking)
+        self._changes: GraphChanges | None = None
 
     def add_node(self, node: NodeRef) -> None:
         """Add a node to the graph.
@@ -67,56 +170,91 @@ class Graph:
         Note:
             If a node with this ID already exists, it will be replaced.
         """
-        # Track if this is a new node (for statistics)
-        is_new_node = node.id not in self._nodes
-
         # Remove old node from label index and statistics if it exists
-        if not is_new_node:
-            old_node = self._nodes[node.id]
+        old_node = self._nodes.get(node.id)
+        if old_node is not None:
             for label in old_node.labels:
                 self._label_index[label].discard(node.id)
-            # Decrement old node's label counts
-            new_node_counts = dict(self._statistics.node_counts_by_label)
-            for label in old_node.labels:
-                count = new_node_counts.get(label, 0)
-                if count > 0:
-                    new_node_counts[label] = count - 1
-                    if new_node_counts[label] == 0:
-                        del new_node_counts[label]
-            self._statistics = self._statistics.model_copy(
-                update={
-                    "node_counts_by_label": new_node_counts,
-                    "last_updated": time.time(),
-                }
-            )
+            self._statistics_counters.remove_node(old_node.labels)
+            if self._property_indexes:
+                self._unindex_node(old_node)
+
+        if self._undo_log is not None:
+            if old_node is not None:
+                self._undo_log.append((_UNDO_REPLACE_NODE, old_node))
+            else:
+                self._undo_log.append((_UNDO_ADD_NODE, node))
+        if self._changes is not None:
+            self._changes.node_written(node.id)
 
         # Store node
         self._nodes[node.id] = node
 
-        # Update label index
+        # Update label and property indexes
         for label in node.labels:
             self._label_index[label].add(node.id)
+        if self._property_indexes:
+            self._index_node(node)
 
         # Initialize adjacency lists if not present
         if node.id not in self._outgoing:
-            self._outgoing[node.id] = []
+            self._outgoing[node.id] = {}
         if node.id not in self._incoming:
-            self._incoming[node.id] = []
+            self._incoming[node.id] = {}
 
         # Update statistics
-        if is_new_node:
-            self._update_statistics_after_add_node(node)
-        else:
-            # For replacement, just update label counts
-            new_node_counts = dict(self._statistics.node_counts_by_label)
+        self._statistics_counters.add_node(node.labels)
+        self._statistics = None
+
+    def add_nodes_bulk(self, nodes: Iterable[NodeRef]) -> None:
+        """Add many nodes, updating indexes and statistics once per batch.
+
+        Nodes are stored one by one, but the label index and statistics are
+        updated with one grouped operation per label at the end of the batch.
+
+        Args:
+            nodes: Nodes to add
+
+        Note:
+            If the batch replaces existing nodes (or repeats an ID), it is
+            added node by node with add_node() replacement semantics.
+        """
+        nodes = list(nodes)
+        node_ids = {node.id for node in nodes}
+        if len(node_ids) != len(nodes) or any(node_id in self._nodes for node_id in node_ids):
+            for node in nodes:
+                self.add_node(node)
+            return
+
+        store = self._nodes
+        outgoing = self._outgoing
+        incoming = self._incoming
+        ids_by_label: dict[str, list[int | str]] = defaultdict(list)
+        for node in nodes:
+            store[node.id] = node
+            if node.id not in outgoing:
+                outgoing[node.id] = {}
+            if node.id not in incoming:
+                incoming[node.id] = {}
             for label in node.labels:
-                new_node_counts[label] = new_node_counts.get(label, 0) + 1
-            self._statistics = self._statistics.model_copy(
-                update={
-                    "node_counts_by_label": new_node_counts,
-                    "last_updated": time.time(),
-                }
-            )
+                ids_by_label[label].append(node.id)
+
+        for label, ids in ids_by_label.items():
+            self._label_index[label].update(ids)
+        if self._property_indexes:
+            for node in nodes:
+                self._index_node(node)
+
+        if self._undo_log is not None:
+            self._undo_log.extend((_UNDO_ADD_NODE, node) for node in nodes)
+        if self._changes is not None:
+            self._changes.deleted_nodes.difference_update(node_ids)
+            self._changes.nodes.update(node_ids)
+
+        self._statistics_counters.add_nodes(
+            len(nodes), {label: len(ids) for label, ids in ids_by_label.items()}
+        )
+        self._statistics = None
 
     def get_node(self, node_id: int | str) -> NodeRef | None:
         """Get a node by its ID.
@@ -171,60 +309,17 @@ class Graph:
     def get_statistics(self) -> GraphStatistics:
         """Get current graph statistics for cost-based optimization.
 
+        The snapshot is built from the incrementally maintained counters on
+        first request after a mutation and reused until the next mutation, so
+        repeated calls without intervening writes return the same object.
+
         Returns:
             GraphStatistics instance with current statistics
         """
+        if self._statistics is None:
+            self._statistics = self._statistics_counters.snapshot()
         return self._statistics
 
-    def _update_statistics_after_add_node(self, node: NodeRef) -> None:
-        """Update statistics after adding a node.
-
-        Args:
-            node: The node that was added
-        """
-        # Update node counts by label
-        new_node_counts = dict(self._statistics.node_counts_by_label)
-        for label in node.labels:
-            new_node_counts[label] = new_node_counts.get(label, 0) + 1
-
-        # Create new statistics (immutable)
-        self._statistics = self._statistics.model_copy(
-            update={
-                "total_nodes": self._statistics.total_nodes + 1,
-                "node_counts_by_label": new_node_counts,
-                "last_updated": time.time(),
-            }
-        )
-
-    def _update_statistics_after_add_edge(self, edge: EdgeRef) -> None:
-        """Update statistics after adding an edge.
-
-        Args:
-            edge: The edge that was added
-        """
-        # Update edge counts by type
-        new_edge_counts = dict(self._statistics.edge_counts_by_type)
-        new_edge_counts[edge.type] = new_edge_counts.get(edge.type, 0) + 1
-
-        # Recompute average degree for this type
-        # Average degree = count of edges / count of unique source nodes
-        edge_ids_of_type = self._type_index.get(edge.type, set())
-        unique_sources = len({self._edges[eid].src.id for eid in edge_ids_of_type})
-        avg_degree = new_edge_counts[edge.type] / max(unique_sources, 1)
-
-        new_avg_degrees = dict(self._statistics.avg_degree_by_type)
-        new_avg_degrees[edge.type] = avg_degree
-
-        # Create new statistics (immutable)
-        self._statistics = self._statistics.model_copy(
-            update={
-                "total_edges": self._statistics.total_edges + 1,
-                "edge_counts_by_type": new_edge_counts,
-                "avg_degree_by_type": new_avg_degrees,
-                "last_updated": time.time(),
-            }
-        )
-
     def add_edge(self, edge: EdgeRef) -> None:
         """Add an edge to the graph.
 
@@ -243,71 +338,167 @@ class Graph:
         if edge.dst.id not in self._nodes:
             raise ValueError(f"Destination node {edge.dst.id} not found in graph")
 
-        # Track if this is a new edge (for statistics)
-        is_new_edge = edge.id not in self._edges
-
         # Remove old edge from indexes and statistics if it exists
-        if not is_new_edge:
-            old_edge = self._edges[edge.id]
-            self._outgoing[old_edge.src.id].remove(old_edge)
-            self._incoming[old_edge.dst.id].remove(old_edge)
+        old_edge = self._edges.get(edge.id)
+        if old_edge is not None:
+            self._remove_adjacent(self._outgoing[old_edge.src.id], old_edge)
+            self._remove_adjacent(self._incoming[old_edge.dst.id], old_edge)
             self._type_index[old_edge.type].discard(edge.id)
-            # Decrement old edge's type count
-            new_edge_counts = dict(self._statistics.edge_counts_by_type)
-            count = new_edge_counts.get(old_edge.type, 0)
-            if count > 0:
-                new_edge_counts[old_edge.type] = count - 1
-                if new_edge_counts[old_edge.type] == 0:
-                    del new_edge_counts[old_edge.type]
-            # Recompute avg degree for old type
-            edge_ids_of_old_type = self._type_index.get(old_edge.type, set()) - {edge.id}
-            new_avg_degrees = dict(self._statistics.avg_degree_by_type)
-            if edge_ids_of_old_type:
-                unique_sources = len({self._edges[eid].src.id for eid in edge_ids_of_old_type})
-                new_avg_degrees[old_edge.type] = len(edge_ids_of_old_type) / max(unique_sources, 1)
-            elif old_edge.type in new_avg_degrees:
-                del new_avg_degrees[old_edge.type]
-            self._statistics = self._statistics.model_copy(
-                update={
-                    "edge_counts_by_type": new_edge_counts,
-                    "avg_degree_by_type": new_avg_degrees,
-                    "last_updated": time.time(),
-                }
-            )
+            self._statistics_counters.remove_edge(old_edge.type, old_edge.src.id)
+
+        if self._undo_log is not None:
+            if old_edge is not None:
+                self._undo_log.append((_UNDO_REPLACE_EDGE, old_edge))
+            else:
+                self._undo_log.append((_UNDO_ADD_EDGE, edge))
+        if self._changes is not None:
+            self._changes.edge_written(edge.id)
 
         # Store edge
         self._edges[edge.id] = edge
 
         # Update adjacency lists
-        self._outgoing[edge.src.id].append(edge)
-        self._incoming[edge.dst.id].append(edge)
+        self._outgoing[edge.src.id].setdefault(edge.type, {})[edge.id] = edge
+        self._incoming[edge.dst.id].setdefault(edge.type, {})[edge.id] = edge
+        self._adjacency_version += 1
 
         # Update type index
         self._type_index[edge.type].add(edge.id)
 
         # Update statistics
-        if is_new_edge:
-            self._update_statistics_after_add_edge(edge)
-        else:
-            # For replacement, just update the new edge type counts (total_edges unchanged)
-            new_edge_counts = dict(self._statistics.edge_counts_by_type)
-            new_edge_counts[edge.type] = new_edge_counts.get(edge.type, 0) + 1
-
-            # Recompute avg degree for new type
-            edge_ids_of_type = self._type_index.get(edge.type, set())
-            unique_sources = len({self._edges[eid].src.id for eid in edge_ids_of_type})
-            avg_degree = new_edge_counts[edge.type] / max(unique_sources, 1)
-
-            new_avg_degrees = dict(self._statistics.avg_degree_by_type)
-            new_avg_degrees[edge.type] = avg_degree
-
-            self._statistics = self._statistics.model_copy(
-                update={
-                    "edge_counts_by_type": new_edge_counts,
-                    "avg_degree_by_type": new_avg_degrees,
-                    "last_updated": time.time(),
-                }
+        self._statistics_counters.add_edge(edge.type, edge.src.id)
+        self._statistics = None
+
+    def add_edges_bulk(self, edges: Iterable[EdgeRef]) -> None:
+        """Add many edges, updating indexes and statistics once per batch.
+
+        Endpoints are validated for the whole batch before anything is added.
+        The type index and statistics are updated with one grouped operation
+        per edge type at the end of the batch.
+
+        Args:
+            edges: Edges to add
+
+        Raises:
+            ValueError: If any source or destination node doesn't exist
+
+        Note:
+            If the batch replaces existing edges (or repeats an ID), it is
+            added edge by edge with add_edge() replacement semantics.
+        """
+        edges = list(edges)
+        nodes = self._nodes
+        for edge in edges:
+            if edge.src.id not in nodes:
+                raise ValueError(f"Source node {edge.src.id} not found in graph")
+            if edge.dst.id not in nodes:
+                raise ValueError(f"Destination node {edge.dst.id} not found in graph")
+
+        edge_ids = {edge.id for edge in edges}
+        if len(edge_ids) != len(edges) or any(edge_id in self._edges for edge_id in edge_ids):
+            for edge in edges:
+                self.add_edge(edge)
+            return
+
+        store = self._edges
+        outgoing = self._outgoing
+        incoming = self._incoming
+        edges_by_type: dict[str, list[EdgeRef]] = defaultdict(list)
+        for edge in edges:
+            store[edge.id] = edge
+            outgoing[edge.src.id].setdefault(edge.type, {})[edge.id] = edge
+            incoming[edge.dst.id].setdefault(edge.type, {})[edge.id] = edge
+            edges_by_type[edge.type].append(edge)
+        self._adjacency_version += 1
+
+        for edge_type, typed_edges in edges_by_type.items():
+            self._type_index[edge_type].update(edge.id for edge in typed_edges)
+            self._statistics_counters.add_edges(
+                edge_type, Counter(edge.src.id for edge in typed_edges)
             )
+        self._statistics = None
+
+        if self._undo_log is not None:
+            self._undo_log.extend((_UNDO_ADD_EDGE, edge) for edge in edges)
+        if self._changes is not None:
+            self._changes.deleted_edges.difference_update(edge_ids)
+            self._changes.edges.update(edge_ids)
+
+    def load_elements(
+        self,
+        nodes: Iterable[NodeRef],
+        edges: Iterable[EdgeRef],
+        statistics: GraphStatistics | None = None,
+    ) -> None:
+        """Populate an empty graph from trusted, already-consistent storage.
+
+        This is the cold-start path for persistent backends: storage, adjacency
+        lists and indexes are filled directly, without the per-element
+        validation, replacement handling, undo logging or change tracking of
+        the add_* methods. Statistics counters are derived from the finished
+        indexes. ``edges`` is consumed only after ``nodes``, so it may be a
+        generator that looks endpoints up in this graph.
+
+        Cyclic garbage collection is paused while loading: the load allocates
+        millions of long-lived objects and creates no garbage cycles, so
+        repeated collector passes would only rescan them.
+
+        Args:
+            nodes: Nodes to load (IDs must be unique)
+            edges: Edges to load (IDs must be unique, endpoints among ``nodes``)
+            statistics: Persisted statistics to use as the current snapshot
+                (default: built from the counters on first request)
+
+        Raises:
+            ValueError: If the graph is not empty
+        """
+        if self._nodes or self._edges:
+            raise ValueError("load_elements() requires an empty graph")
+
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self._load_elements(nodes, edges)
+            for index in self._property_indexes.values():
+                self._build_index(index)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        self._statistics = statistics
+
+    def _load_elements(self, nodes: Iterable[NodeRef], edges: Iterable[EdgeRef]) -> None:
+        """Fill storage, indexes and statistics counters for load_elements()."""
+        node_store = self._nodes
+        edge_store = self._edges
+        outgoing = self._outgoing
+        incoming = self._incoming
+        label_index = self._label_index
+        type_index = self._type_index
+
+        for node in nodes:
+            node_id = node.id
+            node_store[node_id] = node
+            outgoing[node_id] = {}
+            incoming[node_id] = {}
+            for label in node.labels:
+                label_index[label].add(node_id)
+
+        source_degrees_by_type: dict[str, dict[int | str, int]] = defaultdict(dict)
+        for edge in edges:
+            src_id = edge.src.id
+            edge_store[edge.id] = edge
+            outgoing[src_id].setdefault(edge.type, {})[edge.id] = edge
+            incoming[edge.dst.id].setdefault(edge.type, {})[edge.id] = edge
+            type_index[edge.type].add(edge.id)
+            degrees = source_degrees_by_type[edge.type]
+            degrees[src_id] = degrees.get(src_id, 0) + 1
+        self._adjacency_version += 1
+
+        counters = StatisticsCounters()
+        counters.add_nodes(len(node_store), {label: len(ids) for label, ids in label_index.items()})
+        for edge_type, degrees in source_degrees_by_type.items():
+            counters.add_edges(edge_type, degrees)
+        self._statistics_counters = counters
 
     def get_edge(self, edge_id: int | str) -> EdgeRef | None:
         """Get an edge by its ID.
@@ -359,41 +550,597 @@ class Graph:
         edge_ids = self._type_index.get(edge_type, set())
         return [self._edges[edge_id] for edge_id in edge_ids]
 
-    def get_outgoing_edges(self, node_id: int | str) -> list[EdgeRef]:
-        """Get all edges going out from a node.
+    def get_outgoing_edges(
+        self, node_id: int | str, types: Iterable[str] | None = None
+    ) -> list[EdgeRef]:
+        """Get the edges going out from a node.
 
         Args:
             node_id: The source node ID
+            types: Only return edges of these types (default: all types)
+
+        Returns:
+            List of outgoing edges (empty list if node doesn't exist), grouped
+            by type and in insertion order within a type
+        """
+        return self._adjacent(self._outgoing.get(node_id), types)
+
+    def get_incoming_edges(
+        self, node_id: int | str, types: Iterable[str] | None = None
+    ) -> list[EdgeRef]:
+        """Get the edges coming into a node.
+
+        Args:
+            node_id: The destination node ID
+            types: Only return edges of these types (default: all types)
 
         Returns:
-            List of outgoing edges (empty list if node doesn't exist)
+            List of incoming edges (empty list if node doesn't exist), grouped
+            by type and in insertion order within a type
+        """
+        return self._adjacent(self._incoming.get(node_id), types)
+
+    def iter_outgoing(
+        self, node_id: int | str, types: Iterable[str] | None = None
+    ) -> Iterator[EdgeRef]:
+        """Iterate over the edges going out from a node without copying them.
+
+        Args:
+            node_id: The source node ID
+            types: Only yield edges of these types (default: all types)
+
+        Yields:
+            Outgoing edges, in the order of get_outgoing_edges()
+
+        Raises:
+            RuntimeError: If an edge is added or removed while iterating
         """
-        return list(self._outgoing.get(node_id, []))
+        return self._iter_neighbors(node_id, "OUT", types, edges_only=True)
 
-    def get_incoming_edges(self, node_id: int | str) -> list[EdgeRef]:
-        """Get all edges coming into a node.
+    def iter_incoming(
+        self, node_id: int | str, types: Iterable[str] | None = None
+    ) -> Iterator[EdgeRef]:
+        """Iterate over the edges coming into a node without copying them.
 
         Args:
             node_id: The destination node ID
+            types: Only yield edges of these types (default: all types)
+
+        Yields:
+            Incoming edges, in the order of get_incoming_edges()
+
+        Raises:
+            RuntimeError: If an edge is added or removed while iterating
+        """
+        return self._iter_neighbors(node_id, "IN", types, edges_only=True)
+
+    def iter_neighbors(
+        self,
+        node_id: int | str,
+        direction: str = "OUT",
+        types: Iterable[str] | None = None,
+    ) -> Iterator[tuple[EdgeRef, NodeRef]]:
+        """Iterate over a node's edges and the nodes at their other end.
+
+        The adjacency lists are read in place, so no list is copied or
+        concatenated per call. Edges must not be added or removed while the
+        iterator is live; use get_outgoing_edges() / get_incoming_edges() for
+        a copy that can be held across mutations.
+
+        Args:
+            node_id: The node ID
+            direction: "OUT", "IN" or "UNDIRECTED" (outgoing then incoming
+                edges, with a self-loop yielded once)
+            types: Only yield edges of these types (default: all types)
+
+        Yields:
+            (edge, neighbour) pairs
+
+        Raises:
+            ValueError: If the direction is not recognized
+            RuntimeError: If an edge is added or removed while iterating
+        """
+        if direction not in ("OUT", "IN", "UNDIRECTED"):
+            raise ValueError(f"Unknown direction: {direction}")
+        return self._iter_neighbors(node_id, direction, types, edges_only=False)
+
+    def iter_neighbor_nodes(
+        self,
+        node_id: int | str,
+        direction: str = "OUT",
+        types: Iterable[str] | None = None,
+    ) -> Iterator[NodeRef]:
+        """Iterate over the nodes at the other end of a node's edges.
+
+        Args:
+            node_id: The node ID
+            direction: "OUT", "IN" or "UNDIRECTED"
+            types: Only follow edges of these types (default: all types)
+
+        Yields:
+            Neighbour nodes, once per edge, in iter_neighbors() order
+
+        Raises:
+            ValueError: If the direction is not recognized
+            RuntimeError: If an edge is added or removed while iterating
+        """
+        return (node for _, node in self.iter_neighbors(node_id, direction, types))
+
+    def _iter_neighbors(
+        self,
+        node_id: int | str,
+        direction: str,
+        types: Iterable[str] | None,
+        edges_only: bool,
+    ) -> Iterator:
+        """Generator behind the adjacency iterators, checking the version after each edge.
+
+        Yields the edges alone when edges_only is True, else (edge, neighbour)
+        pairs.
+        """
+        version = self._adjacency_version
+        if direction != "IN":
+            for bucket in self._buckets(self._outgoing.get(node_id), types):
+                for edge in bucket:
+                    yield edge if edges_only else (edge, edge.dst)
+                    if self._adjacency_version != version:
+                        raise RuntimeError("Graph edges changed during adjacency iteration")
+        if direction != "OUT":
+            undirected = direction == "UNDIRECTED"
+            for bucket in self._buckets(self._incoming.get(node_id), types):
+                for edge in bucket:
+                    # An undirected self-loop was already yielded as outgoing
+                    if undirected and edge.src.id == edge.dst.id:
+                        continue
+                    yield edge if edges_only else (edge, edge.src)
+                    if self._adjacency_version != version:
+                        raise RuntimeError("Graph edges changed during adjacency iteration")
+
+    @staticmethod
+    def _buckets(
+        buckets: dict[str, dict[int | str, EdgeRef]] | None, types: Iterable[str] | None
+    ) -> list[Iterable[EdgeRef]]:
+        """The edges of a node's adjacency buckets, all of them or those of some types."""
+        if not buckets:
+            return []
+        if types is None:
+            return [bucket.values() for bucket in buckets.values()]
+        # dict.fromkeys drops repeated types while keeping their order
+        return [buckets[t].values() for t in dict.fromkeys(types) if t in buckets]
+
+    @classmethod
+    def _adjacent(
+        cls, buckets: dict[str, dict[int | str, EdgeRef]] | None, types: Iterable[str] | None
+    ) -> list[EdgeRef]:
+        """Concatenate a node's adjacency buckets, all of them or those of some types."""
+        return [edge for bucket in cls._buckets(buckets, types) for edge in bucket]
+
+    @staticmethod
+    def _remove_adjacent(buckets: dict[str, dict[int | str, EdgeRef]], edge: EdgeRef) -> None:
+        """Remove an edge from a node's adjacency buckets, dropping an emptied bucket."""
+        bucket = buckets[edge.type]
+        del bucket[edge.id]
+        if not bucket:
+            del buckets[edge.type]
+
+    def remove_node(self, node_id: int | str) -> None:
+        """Remove a node from the graph.
+
+        Args:
+            node_id: The node ID to remove
+
+        Raises:
+            ValueError: If the node still has incoming or outgoing edges
+
+        Note:
+            Removing a node that does not exist is a no-op.
+        """
+        node = self._nodes.get(node_id)
+        if node is None:
+            return
+        if self._outgoing.get(node_id) or self._incoming.get(node_id):
+            raise ValueError(f"Node {node_id} still has relationships")
+
+        self._unlink_node(node)
+        if self._undo_log is not None:
+            self._undo_log.append((_UNDO_REMOVE_NODE, node))
+
+    def remove_edge(self, edge_id: int | str) -> None:
+        """Remove an edge from the graph.
+
+        Args:
+            edge_id: The edge ID to remove
+
+        Note:
+            Removing an edge that does not exist is a no-op.
+        """
+        edge = self._edges.get(edge_id)
+        if edge is None:
+            return
+
+        self._unlink_edge(edge)
+        if self._undo_log is not None:
+            self._undo_log.append((_UNDO_REMOVE_EDGE, edge))
+
+    def remove_edges_bulk(self, edge_ids: Iterable[int | str]) -> None:
+        """Remove many edges.
+
+        Args:
+            edge_ids: IDs of the edges to remove; missing and repeated IDs
+                are ignored
+        """
+        for edge_id in dict.fromkeys(edge_ids):
+            self.remove_edge(edge_id)
+
+    def remove_nodes_bulk(self, node_ids: Iterable[int | str], detach: bool = False) -> None:
+        """Remove many nodes, optionally with every edge attached to them.
+
+        Nodes are checked before anything is removed, so a rejected batch
+        leaves the graph unchanged.
+
+        Args:
+            node_ids: IDs of the nodes to remove; missing and repeated IDs
+                are ignored
+            detach: Also remove the nodes' incoming and outgoing edges
+
+        Raises:
+            ValueError: If detach is False and a node still has relationships
+        """
+        nodes = [
+            self._nodes[node_id] for node_id in dict.fromkeys(node_ids) if node_id in self._nodes
+        ]
+        if not detach:
+            for node in nodes:
+                if self._outgoing.get(node.id) or self._incoming.get(node.id):
+                    raise ValueError(f"Node {node.id} still has relationships")
+
+        for node in nodes:
+            if detach:
+                # Copies, since removing an edge changes the adjacency being read
+                for edge in self.get_outgoing_edges(node.id) + self.get_incoming_edges(node.id):
+                    self.remove_edge(edge.id)
+            self.remove_node(node.id)
+
+    def set_property(self, element: NodeRef | EdgeRef, key: str, value) -> None:
+        """Set a property on a node or edge in place.
+
+        Args:
+            element: The node or edge to update
+            key: Property name
+            value: New property value (CypherValue)
+        """
+        properties = element.properties
+        old_value = properties.get(key)
+        if self._undo_log is not None:
+            if old_value is not None:
+                self._undo_log.append((_UNDO_SET_PROPERTY, element, key, old_value))
+            else:
+                self._undo_log.append((_UNDO_ADD_PROPERTY, element, key))
+        properties[key] = value
+        if self._property_indexes and isinstance(element, NodeRef):
+            self._reindex_property(element, key, old_value, value)
+        self._element_written(element)
+
+    def remove_property(self, element: NodeRef | EdgeRef, key: str) -> None:
+        """Remove a property from a node or edge in place.
+
+        Args:
+            element: The node or edge to update
+            key: Property name (removing a missing property is a no-op)
+        """
+        properties = element.properties
+        if key not in properties:
+            return
+        old_value = properties.pop(key)
+        if self._undo_log is not None:
+            self._undo_log.append((_UNDO_SET_PROPERTY, element, key, old_value))
+        if self._property_indexes and isinstance(element, NodeRef):
+            self._reindex_property(element, key, old_value, None)
+        self._element_written(element)
+
+    def _element_written(self, element: NodeRef | EdgeRef) -> None:
+        """Record an in-place change to a node or edge for change tracking."""
+        if self._changes is None:
+            return
+        if isinstance(element, NodeRef):
+            self._changes.node_written(element.id)
+        else:
+            self._changes.edge_written(element.id)
+
+    def _unlink_node(self, node: NodeRef) -> None:
+        """Drop a node with no edges from storage, indexes and statistics."""
+        del self._nodes[node.id]
+        for label in node.labels:
+            self._label_index[label].discard(node.id)
+        if self._property_indexes:
+            self._unindex_node(node)
+        self._outgoing.pop(node.id, None)
+        self._incoming.pop(node.id, None)
+        self._statistics_counters.remove_node(node.labels)
+        self._statistics = None
+        if self._changes is not None:
+            self._changes.node_deleted(node.id)
+
+    def _unlink_edge(self, edge: EdgeRef) -> None:
+        """Drop an edge from storage, adjacency lists, indexes and statistics."""
+        del self._edges[edge.id]
+        self._remove_adjacent(self._outgoing[edge.src.id], edge)
+        self._remove_adjacent(self._incoming[edge.dst.id], edge)
+        self._adjacency_version += 1
+        self._type_index[edge.type].discard(edge.id)
+        self._statistics_counters.remove_edge(edge.type, edge.src.id)
+        self._statistics = None
+        if self._changes is not None:
+            self._changes.edge_deleted(edge.id)
+
+    def create_property_index(
+        self, label: str, property: str, name: str | None = None, kind: str = "hash"
+    ) -> PropertyIndex:
+        """Declare an index on a node property for nodes with a label.
+
+        The index is built from the nodes already in the graph and kept up to
+        date by every later mutation. A ``"hash"`` index answers equality; a
+        ``"range"`` index also answers inequalities, STARTS WITH and ordered
+        scans.
+
+        Args:
+            label: Node label to index
+            property: Property name to index
+            name: Index name (default: ``index_<label>_<property>``)
+            kind: Index kind, ``"hash"`` or ``"range"``
+
+        Returns:
+            The new index
+
+        Raises:
+            ValueError: If the kind is unknown, or the label/property pair or
+                the name is already indexed
+        """
+        index_class = INDEX_KINDS.get(kind)
+        if index_class is None:
+            raise ValueError(f"Unknown index kind: {kind!r}")
+        if (label, property) in self._property_indexes:
+            raise ValueError(f"An index on :{label}({property}) already exists")
+        if name is None:
+            name = f"index_{label}_{property}"
+        if self.get_property_index_by_name(name) is not None:
+            raise ValueError(f"An index named '{name}' already exists")
+
+        index = index_class(name, label, property)
+        self._attach_index(index)
+        if self._undo_log is not None:
+            self._undo_log.append((_UNDO_CREATE_INDEX, index))
+        return index
+
+    def drop_property_index(self, name: str) -> PropertyIndex:
+        """Drop a property index by name.
+
+        Args:
+            name: Index name
 
         Returns:
-            List of incoming edges (empty list if node doesn't exist)
+            The dropped index
+
+        Raises:
+            ValueError: If no index has this name
+        """
+        index = self.get_property_index_by_name(name)
+        if index is None:
+            raise ValueError(f"No index named '{name}'")
+        self._detach_index(index)
+        if self._undo_log is not None:
+            self._undo_log.append((_UNDO_DROP_INDEX, index))
+        return index
+
+    def get_property_index(self, label: str, property: str) -> PropertyIndex | None:
+        """Get the index on a label/property pair, or None if not indexed."""
+        return self._property_indexes.get((label, property))
+
+    def get_property_index_by_name(self, name: str) -> PropertyIndex | None:
+        """Get a property index by name, or None if there is none."""
+        for index in self._property_indexes.values():
+            if index.name == name:
+                return index
+        return None
+
+    def property_indexes(self) -> list[PropertyIndex]:
+        """Get all property indexes, ordered by name."""
+        return sorted(self._property_indexes.values(), key=lambda index: index.name)
+
+    @property
+    def index_version(self) -> int:
+        """Counter bumped whenever a property index is created or dropped."""
+        return self._index_version
+
+    def find_nodes_by_property(self, label: str, property: str, value) -> list[NodeRef] | None:
+        """Find nodes with a label whose property equals a value, via an index.
+
+        Args:
+            label: Node label
+            property: Property name
+            value: Value to match (CypherValue)
+
+        Returns:
+            Matching nodes, or None if the pair is not indexed or the value
+            cannot be looked up (the caller must scan instead)
         """
-        return list(self._incoming.get(node_id, []))
+        index = self._property_indexes.get((label, property))
+        if index is None:
+            return None
+        node_ids = index.lookup(value)
+        if node_ids is None:
+            return None
+        return [self._nodes[node_id] for node_id in node_ids]
+
+    def find_nodes_in_range(
+        self,
+        label: str,
+        property: str,
+        *,
+        lower=None,
+        lower_inclusive: bool = True,
+        upper=None,
+        upper_inclusive: bool = True,
+        prefix=None,
+        descending: bool | None = None,
+    ) -> Iterator[NodeRef] | None:
+        """Find candidate nodes for a range, prefix or ordered scan, via a range index.
+
+        Candidates are a superset of the matches: nodes whose value has a
+        different type than the bounds are included, so the caller must still
+        evaluate its predicate. Without bounds and with ``descending`` set,
+        every node with the label is produced in ORDER BY order, nodes without
+        a value last (ascending) or first (descending).
+
+        Args:
+            label: Node label
+            property: Property name
+            lower: Lower bound (CypherValue, None for unbounded)
+            lower_inclusive: Whether the lower bound is inclusive
+            upper: Upper bound (CypherValue, None for unbounded)
+            upper_inclusive: Whether the upper bound is inclusive
+            prefix: String prefix (CypherValue) for STARTS WITH
+            descending: None for any order, else the requested value order
+
+        Returns:
+            Lazy iterator of candidate nodes (the graph must not change while
+            it is consumed), or None if the pair has no range index or the
+            scan cannot be answered from it (the caller must scan instead)
+        """
+        index = self._property_indexes.get((label, property))
+        if not isinstance(index, OrderedPropertyIndex):
+            return None
+        node_ids = index.scan(
+            lower=lower,
+            lower_inclusive=lower_inclusive,
+            upper=upper,
+            upper_inclusive=upper_inclusive,
+            prefix=prefix,
+            descending=descending,
+        )
+        if node_ids is None:
+            return None
+        nodes = self._nodes
+        candidates = (nodes[node_id] for node_id in node_ids)
+        unbounded = lower is None and upper is None and prefix is None
+        if descending is None or not unbounded:
+            return candidates
+        if len(self._label_index.get(label, ())) == index.size:
+            return candidates
+        # ORDER BY sorts missing/null values after (ascending) or before
+        # (descending) every other value
+        missing = self._nodes_without_property(label, property)
+        return chain(missing, candidates) if descending else chain(candidates, missing)
+
+    def _nodes_without_property(self, label: str, property: str) -> Iterator[NodeRef]:
+        """Yield nodes with a label whose property is missing or null."""
+        nodes = self._nodes
+        for node_id in self._label_index.get(label, ()):
+            node = nodes[node_id]
+            if isinstance(node.properties.get(property, CypherNull()), CypherNull):
+                yield node
+
+    def _attach_index(self, index: PropertyIndex) -> None:
+        """Build an index from the current nodes and start maintaining it."""
+        self._build_index(index)
+        self._property_indexes[(index.label, index.property)] = index
+        self._index_definitions_changed()
+
+    def _detach_index(self, index: PropertyIndex) -> None:
+        """Stop maintaining an index and forget it."""
+        del self._property_indexes[(index.label, index.property)]
+        self._index_definitions_changed()
+
+    def _index_definitions_changed(self) -> None:
+        """Record that the set of property indexes changed."""
+        self._index_version += 1
+        if self._changes is not None:
+            self._changes.indexes_changed = True
+
+    def _build_index(self, index: PropertyIndex) -> None:
+        """(Re)fill an index from the nodes currently in the graph."""
+        index.clear()
+        nodes = self._nodes
+        key = index.property
+        for node_id in self._label_index.get(index.label, ()):
+            value = nodes[node_id].properties.get(key)
+            if value is not None:
+                index.add(node_id, value)
+
+    def _index_node(self, node: NodeRef) -> None:
+        """Enter a node into every property index that covers it."""
+        properties = node.properties
+        for index in self._property_indexes.values():
+            if index.label in node.labels and index.property in properties:
+                index.add(node.id, properties[index.property])
+
+    def _unindex_node(self, node: NodeRef) -> None:
+        """Remove a node from every property index that covers it."""
+        properties = node.properties
+        for index in self._property_indexes.values():
+            if index.label in node.labels and index.property in properties:
+                index.remove(node.id, properties[index.property])
+
+    def _reindex_property(self, node: NodeRef, key: str, old_value, new_value) -> None:
+        """Move a node between index entries after one property changed.
+
+        ``old_value``/``new_value`` are None when the property was absent
+        before/after the change.
+        """
+        for index in self._property_indexes.values():
+            if index.property == key and index.label in node.labels:
+                if old_value is not None:
+                    index.remove(node.id, old_value)
+                if new_value is not None:
+                    index.add(node.id, new_value)
 
     def clear(self) -> None:
         """Clear all graph data, resetting to an empty state.
 
-        Removes all nodes, edges, indexes, and statistics.
-        This is equivalent to creating a new Graph() but reuses the same object.
+        Removes all nodes, edges, indexes (including property index
+        definitions), and statistics, and discards any open transaction.
+        This is equivalent to creating a new Graph() but reuses the same
+        object. With change tracking enabled, every removed element is
+        recorded as deleted.
         """
+        if self._changes is not None:
+            for edge_id in self._edges:
+                self._changes.edge_deleted(edge_id)
+            for node_id in self._nodes:
+                self._changes.node_deleted(node_id)
+
         self._nodes.clear()
         self._edges.clear()
         self._outgoing.clear()
         self._incoming.clear()
+        self._adjacency_version += 1
         self._label_index.clear()
         self._type_index.clear()
+        if self._property_indexes:
+            self._property_indexes.clear()
+            self._index_definitions_changed()
+        self._statistics_counters = StatisticsCounters()
         self._statistics = GraphStatistics.empty()
+        self._undo_log = None
+
+    def freeze(self) -> CSRGraph:
+        """Pack the graph into a read-only compressed sparse row snapshot.
+
+        The snapshot stores adjacency in flat integer arrays, using a
+        fraction of the memory of the adjacency buckets, and answers the
+        read API of this class. It shares nodes and property maps with this
+        graph but not structure: edges added or removed afterwards are not
+        seen. Property indexes are not carried over.
+
+        Returns:
+            CSRGraph snapshot of the graph
+
+        Examples:
+            >>> frozen = graph.freeze()
+            >>> frozen.edge_count() == graph.edge_count()
+            True
+        """
+        return CSRGraph.from_graph(self)
 
     def snapshot(self) -> dict:
         """Create a snapshot of the current graph state.
@@ -402,8 +1149,9 @@ class Graph:
             Dictionary containing all graph data for restoration
 
         Note:
-            This creates a deep copy of all internal structures to support
-            transaction rollback. For large graphs, this may be memory intensive.
+            This creates a deep copy of all internal structures. For large
+            graphs, this may be memory intensive; use begin_transaction() and
+            rollback_transaction() to revert changes instead.
         """
         import copy
 
@@ -414,7 +1162,9 @@ class Graph:
             "incoming": copy.deepcopy(dict(self._incoming)),
             "label_index": copy.deepcopy(dict(self._label_index)),
             "type_index": copy.deepcopy(dict(self._type_index)),
-            "statistics": self._statistics,  # Immutable, no need to deep copy
+            "property_indexes": copy.deepcopy(self._property_indexes),
+            "statistics": self.get_statistics(),  # Immutable, no need to deep copy
+            "statistics_counters": self._statistics_counters.copy(),
         }
 
     def restore(self, snapshot: dict) -> None:
@@ -428,8 +1178,146 @@ class Graph:
         """
         self._nodes = snapshot["nodes"]
         self._edges = snapshot["edges"]
-        self._outgoing = defaultdict(list, snapshot["outgoing"])
-        self._incoming = defaultdict(list, snapshot["incoming"])
+        self._outgoing = defaultdict(dict, snapshot["outgoing"])
+        self._incoming = defaultdict(dict, snapshot["incoming"])
+        self._adjacency_version += 1
         self._label_index = defaultdict(set, snapshot["label_index"])
         self._type_index = defaultdict(set, snapshot["type_index"])
+        self._property_indexes = snapshot.get("property_indexes", {})
+        self._index_version += 1
         self._statistics = snapshot.get("statistics", GraphStatistics.empty())
+        self._statistics_counters = snapshot["statistics_counters"]
+
+    @property
+    def in_transaction(self) -> bool:
+        """Whether a transaction is open on this graph."""
+        return self._undo_log is not None
+
+    def begin_transaction(self) -> None:
+        """Open a transaction.
+
+        Subsequent mutations record their inverse in an undo log, so this is
+        O(1) regardless of graph size.
+
+        Raises:
+            RuntimeError: If a transaction is already open
+        """
+        if self._undo_log is not None:
+            raise RuntimeError("Graph already has an open transaction")
+        self._undo_log = []
+
+    def savepoint(self) -> int:
+        """Mark the current position in the open transaction.
+
+        Savepoints are plain offsets into the undo log, so they are O(1) to
+        take and may be nested freely.
+
+        Returns:
+            Savepoint to pass to rollback_to_savepoint()
+
+        Raises:
+            RuntimeError: If no transaction is open
+        """
+        if self._undo_log is None:
+            raise RuntimeError("Graph has no open transaction")
+        return len(self._undo_log)
+
+    def rollback_to_savepoint(self, savepoint: int) -> None:
+        """Revert every mutation made after a savepoint.
+
+        The transaction stays open. Savepoints taken after this one are
+        invalidated.
+
+        Args:
+            savepoint: Savepoint returned by savepoint()
+
+        Raises:
+            RuntimeError: If no transaction is open
+            ValueError: If the savepoint is not valid in this transaction
+        """
+        undo_log = self._undo_log
+        if undo_log is None:
+            raise RuntimeError("Graph has no open transaction")
+        if not 0 <= savepoint <= len(undo_log):
+            raise ValueError(f"Invalid savepoint: {savepoint}")
+
+        # Replay inverses with logging off so they are not themselves recorded
+        self._undo_log = None
+        try:
+            while len(undo_log) > savepoint:
+                self._apply_undo(undo_log.pop())
+        finally:
+            self._undo_log = undo_log
+
+    def commit_transaction(self) -> None:
+        """Close the open transaction, keeping all of its changes.
+
+        Raises:
+            RuntimeError: If no transaction is open
+        """
+        if self._undo_log is None:
+            raise RuntimeError("Graph has no open transaction")
+        self._undo_log = None
+
+    def rollback_transaction(self) -> None:
+        """Revert every mutation of the open transaction and close it.
+
+        Raises:
+            RuntimeError: If no transaction is open
+        """
+        self.rollback_to_savepoint(0)
+        self._undo_log = None
+
+    def enable_change_tracking(self) -> None:
+        """Start recording which elements are written or deleted.
+
+        Existing elements are treated as already persisted. Storage backends
+        call this after loading so that saves only write the delta.
+        """
+        self._changes = GraphChanges()
+
+    def take_changes(self) -> GraphChanges:
+        """Return the changes recorded since the last call and reset them.
+
+        Returns:
+            GraphChanges with the IDs of written and deleted elements
+
+        Raises:
+            RuntimeError: If change tracking is not enabled
+        """
+        if self._changes is None:
+            raise RuntimeError("Change tracking is not enabled on this graph")
+        changes = self._changes
+        self._changes = GraphChanges()
+        return changes
+
+    def _apply_undo(self, entry: tuple) -> None:
+        """Apply the inverse of one recorded mutation."""
+        kind = entry[0]
+        if kind == _UNDO_SET_PROPERTY:
+            _, element, key, old_value = entry
+            current = element.properties.get(key)
+            element.properties[key] = old_value
+            if self._property_indexes and isinstance(element, NodeRef):
+                self._reindex_property(element, key, current, old_value)
+            self._element_written(element)
+        elif kind == _UNDO_ADD_PROPERTY:
+            _, element, key = entry
+            current = element.properties.pop(key, None)
+            if self._property_indexes and isinstance(element, NodeRef):
+                self._reindex_property(element, key, current, None)
+            self._element_written(element)
+        elif kind == _UNDO_CREATE_INDEX:
+            self._detach_index(entry[1])
+        elif kind == _UNDO_DROP_INDEX:
+            self._attach_index(entry[1])
+        elif kind == _UNDO_ADD_EDGE:
+            self._unlink_edge(entry[1])
+        elif kind == _UNDO_ADD_NODE:
+            self._unlink_node(entry[1])
+        elif kind in (_UNDO_REPLACE_NODE, _UNDO_REMOVE_NODE):
+            self.add_node(entry[1])
+        elif kind in (_UNDO_REPLACE_EDGE, _UNDO_REMOVE_EDGE):
+            self.add_edge(entry[1])
+        else:
+            raise ValueError(f"Unknown undo log entry: {kind!r}")
@@ -45,6 +45,9 @@ from graphforge.types.values import (
     CypherValue,
 )
 
+# msgpack encoding of an empty map, the properties blob of most edges
+_EMPTY_MAP = msgpack.packb({})
+
 
 def serialize_cypher_value(value: CypherValue) -> dict:
     """Serialize a CypherValue to a dict for msgpack.
@@ -178,7 +181,7 @@ def deserialize_properties(data: bytes) -> dict:
     Returns:
         Dict mapping str to CypherValue
     """
-    if not data:
+    if not data or data == _EMPTY_MAP:
         return {}
 
     unpacked = msgpack.unpackb(data)
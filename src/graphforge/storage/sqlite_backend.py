@@ -3,6 +3,7 @@
 This module implements durable graph storage using SQLite with WAL mode.
 """
 
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 import sqlite3
 
@@ -15,6 +16,9 @@ from graphforge.storage.serialization import (
 )
 from graphforge.types.graph import EdgeRef, NodeRef
 
+# Rows fetched per fetchmany() call when loading a graph
+LOAD_BATCH_SIZE = 10_000
+
 
 class SQLiteBackend:
     """SQLite storage backend with WAL mode for durability.
@@ -111,6 +115,15 @@ class SQLiteBackend:
             CREATE INDEX IF NOT EXISTS idx_edges_dst ON edges(dst_id)
         """)
 
+        # Adjacency rows are deleted by edge ID when an edge is rewritten or removed
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_adjacency_out_edge ON adjacency_out(edge_id)
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_adjacency_in_edge ON adjacency_in(edge_id)
+        """)
+
         # Statistics table for cost-based optimization
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS statistics (
@@ -119,6 +132,17 @@ class SQLiteBackend:
             )
         """)
 
+        # User-declared property indexes (definitions only; entries are
+        # rebuilt in memory on load)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS property_indexes (
+                name TEXT PRIMARY KEY,
+                label TEXT NOT NULL,
+                property TEXT NOT NULL,
+                kind TEXT NOT NULL DEFAULT 'hash'
+            )
+        """)
+
         self.conn.commit()
 
     def save_node(self, node: NodeRef):
@@ -127,12 +151,20 @@ class SQLiteBackend:
         Args:
             node: NodeRef to save
         """
-        labels_blob = serialize_labels(node.labels)
-        properties_blob = serialize_properties(node.properties)
+        self.save_nodes([node])
 
-        self.conn.execute(
+    def save_nodes(self, nodes: Iterable[NodeRef]):
+        """Save a batch of nodes with a single executemany.
+
+        Args:
+            nodes: NodeRefs to insert or replace
+        """
+        self.conn.executemany(
             "INSERT OR REPLACE INTO nodes (id, labels, properties) VALUES (?, ?, ?)",
-            (node.id, labels_blob, properties_blob),
+            (
+                (node.id, serialize_labels(node.labels), serialize_properties(node.properties))
+                for node in nodes
+            ),
         )
 
     def save_edge(self, edge: EdgeRef):
@@ -141,43 +173,108 @@ class SQLiteBackend:
         Args:
             edge: EdgeRef to save
         """
-        properties_blob = serialize_properties(edge.properties)
+        self.save_edges([edge])
 
-        # Save edge
-        self.conn.execute(
+    def save_edges(self, edges: Iterable[EdgeRef]):
+        """Save a batch of edges and their adjacency rows.
+
+        Adjacency rows from any previous version of each edge are replaced,
+        so rewriting an edge with new endpoints leaves no stale rows.
+
+        Args:
+            edges: EdgeRefs to insert or replace (endpoints must be saved)
+        """
+        edges = list(edges)
+        edge_ids = [(edge.id,) for edge in edges]
+        self.conn.executemany("DELETE FROM adjacency_out WHERE edge_id = ?", edge_ids)
+        self.conn.executemany("DELETE FROM adjacency_in WHERE edge_id = ?", edge_ids)
+
+        self.conn.executemany(
             """INSERT OR REPLACE INTO edges (id, type, src_id, dst_id, properties)
                VALUES (?, ?, ?, ?, ?)""",
-            (edge.id, edge.type, edge.src.id, edge.dst.id, properties_blob),
+            (
+                (
+                    edge.id,
+                    edge.type,
+                    edge.src.id,
+                    edge.dst.id,
+                    serialize_properties(edge.properties),
+                )
+                for edge in edges
+            ),
         )
 
         # Update adjacency lists
-        self.conn.execute(
+        self.conn.executemany(
             "INSERT OR IGNORE INTO adjacency_out (node_id, edge_id) VALUES (?, ?)",
-            (edge.src.id, edge.id),
+            ((edge.src.id, edge.id) for edge in edges),
         )
-
-        self.conn.execute(
+        self.conn.executemany(
             "INSERT OR IGNORE INTO adjacency_in (node_id, edge_id) VALUES (?, ?)",
-            (edge.dst.id, edge.id),
+            ((edge.dst.id, edge.id) for edge in edges),
         )
 
+    def delete_nodes(self, node_ids: Iterable[int | str]):
+        """Delete a batch of nodes.
+
+        Edges referencing the nodes must be deleted first.
+
+        Args:
+            node_ids: IDs of the nodes to delete (missing IDs are ignored)
+        """
+        self.conn.executemany(
+            "DELETE FROM nodes WHERE id = ?", ((node_id,) for node_id in node_ids)
+        )
+
+    def delete_edges(self, edge_ids: Iterable[int | str]):
+        """Delete a batch of edges and their adjacency rows.
+
+        Args:
+            edge_ids: IDs of the edges to delete (missing IDs are ignored)
+        """
+        rows = [(edge_id,) for edge_id in edge_ids]
+        self.conn.executemany("DELETE FROM adjacency_out WHERE edge_id = ?", rows)
+        self.conn.executemany("DELETE FROM adjacency_in WHERE edge_id = ?", rows)
+        self.conn.executemany("DELETE FROM edges WHERE id = ?", rows)
+
     def load_all_nodes(self) -> list[NodeRef]:
         """Load all nodes from the database.
 
         Returns:
             List of NodeRef instances
         """
-        cursor = self.conn.execute("SELECT id, labels, properties FROM nodes")
-        nodes = []
+        return [node for batch in self.iter_node_batches() for node in batch]
+
+    def iter_node_batches(self, batch_size: int = LOAD_BATCH_SIZE) -> Iterator[list[NodeRef]]:
+        """Stream nodes from the database in batches.
 
-        for row in cursor.fetchall():
-            node_id, labels_blob, properties_blob = row
-            labels = deserialize_labels(labels_blob)
-            properties = deserialize_properties(properties_blob)
+        Rows are fetched with fetchmany() so the full result set is never
+        materialized at once. Identical label blobs are decoded once and
+        share one frozenset.
 
-            nodes.append(NodeRef(id=node_id, labels=labels, properties=properties))
+        Args:
+            batch_size: Maximum number of nodes per batch
 
-        return nodes
+        Yields:
+            Lists of NodeRef instances
+        """
+        cursor = self.conn.execute("SELECT id, labels, properties FROM nodes")
+        labels_by_blob: dict[bytes, frozenset[str]] = {}
+
+        while rows := cursor.fetchmany(batch_size):
+            batch = []
+            for node_id, labels_blob, properties_blob in rows:
+                labels = labels_by_blob.get(labels_blob)
+                if labels is None:
+                    labels = labels_by_blob[labels_blob] = deserialize_labels(labels_blob)
+                batch.append(
+                    NodeRef(
+                        id=node_id,
+                        labels=labels,
+                        properties=deserialize_properties(properties_blob),
+                    )
+                )
+            yield batch
 
     def load_all_edges(self) -> dict[int, tuple]:
         """Load all edges from the database.
@@ -188,15 +285,39 @@ class SQLiteBackend:
         Returns:
             Dict mapping edge_id to (type, src_id, dst_id, properties)
         """
-        cursor = self.conn.execute("SELECT id, type, src_id, dst_id, properties FROM edges")
+        return {
+            edge_id: (edge_type, src_id, dst_id, properties)
+            for batch in self.iter_edge_batches()
+            for edge_id, edge_type, src_id, dst_id, properties in batch
+        }
+
+    def iter_edge_batches(self, batch_size: int = LOAD_BATCH_SIZE) -> Iterator[list[tuple]]:
+        """Stream edge rows from the database in batches.
+
+        Caller must reconstruct EdgeRef with actual NodeRef instances.
+        Relationship type strings are shared between rows.
 
-        edges = {}
-        for row in cursor.fetchall():
-            edge_id, edge_type, src_id, dst_id, properties_blob = row
-            properties = deserialize_properties(properties_blob)
-            edges[edge_id] = (edge_type, src_id, dst_id, properties)
+        Args:
+            batch_size: Maximum number of edges per batch
 
-        return edges
+        Yields:
+            Lists of (edge_id, type, src_id, dst_id, properties) tuples
+        """
+        cursor = self.conn.execute("SELECT id, type, src_id, dst_id, properties FROM edges")
+        # Share one string object per relationship type instead of one per row
+        types: dict[str, str] = {}
+
+        while rows := cursor.fetchmany(batch_size):
+            yield [
+                (
+                    edge_id,
+                    types.setdefault(edge_type, edge_type),
+                    src_id,
+                    dst_id,
+                    deserialize_properties(properties_blob),
+                )
+                for edge_id, edge_type, src_id, dst_id, properties_blob in rows
+            ]
 
     def load_adjacency_out(self) -> dict[int, list[int]]:
         """Load outgoing adjacency lists.
@@ -296,3 +417,26 @@ class SQLiteBackend:
             stats_json = row[0].decode("utf-8")
             return deserialize_model_from_json(GraphStatistics, stats_json)
         return None
+
+    def save_property_indexes(self, indexes: Iterable[tuple[str, str, str, str]]):
+        """Replace the stored property index definitions.
+
+        Args:
+            indexes: (name, label, property, kind) tuples
+        """
+        self.conn.execute("DELETE FROM property_indexes")
+        self.conn.executemany(
+            "INSERT INTO property_indexes (name, label, property, kind) VALUES (?, ?, ?, ?)",
+            indexes,
+        )
+
+    def load_property_indexes(self) -> list[tuple[str, str, str, str]]:
+        """Load the stored property index definitions.
+
+        Returns:
+            (name, label, property, kind) tuples ordered by name
+        """
+        cursor = self.conn.execute(
+            "SELECT name, label, property, kind FROM property_indexes ORDER BY name"
+        )
+        return cursor.fetchall()
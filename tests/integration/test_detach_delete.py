@@ -260,3 +260,38 @@ class TestDetachDelete:
         # Alice should still exist
         results = gf.execute("MATCH (n:Person) RETURN n")
         assert len(results) == 1
+
+    def test_delete_node_with_its_relationships_in_one_clause(self):
+        """DELETE without DETACH succeeds when the clause also deletes every relationship."""
+        gf = GraphForge()
+        gf.execute("CREATE (a:Person {name: 'Alice'})-[:KNOWS]->(b:Person {name: 'Bob'})")
+
+        gf.execute("MATCH (a:Person {name: 'Alice'})-[r:KNOWS]->(b) DELETE a, r")
+
+        results = gf.execute("MATCH (n:Person) RETURN n.name AS name")
+        assert [r["name"].value for r in results] == ["Bob"]
+
+    def test_failed_delete_removes_nothing(self):
+        """A rejected DELETE leaves the nodes of earlier rows in place."""
+        gf = GraphForge()
+        gf.execute("CREATE (:Person {name: 'Zed'})")
+        gf.execute("CREATE (a:Person {name: 'Alice'})-[:KNOWS]->(b:Person {name: 'Bob'})")
+
+        with pytest.raises(ValueError, match="Cannot delete node with relationships"):
+            gf.execute("MATCH (n:Person) DELETE n")
+
+        assert len(gf.execute("MATCH (n:Person) RETURN n")) == 3
+
+    def test_detach_delete_hub_updates_statistics(self):
+        """DETACH DELETE of a hub removes its relationships from the statistics."""
+        gf = GraphForge()
+        hub = gf.create_node(["Hub"])
+        for i in range(500):
+            gf.create_relationship(hub, gf.create_node(["Leaf"], i=i), "LINK")
+
+        gf.execute("MATCH (h:Hub) DETACH DELETE h")
+
+        stats = gf.graph.get_statistics()
+        assert stats.total_nodes == 500
+        assert stats.total_edges == 0
+        assert stats.edge_counts_by_type.get("LINK", 0) == 0
@@ -0,0 +1,135 @@
+"""Integration tests for streaming query results with execute_iter()."""
+
+from itertools import pairwise
+
+import pytest
+
+from graphforge import GraphForge, QueryResult
+
+
+@pytest.fixture
+def gf():
+    """Graph of 10 :Item nodes linked in a chain, counting adjacency lookups."""
+    gf = GraphForge()
+    gf.execute("UNWIND range(1, 10) AS i CREATE (:Item {i: i})")
+    nodes = sorted(gf.graph.get_nodes_by_label("Item"), key=lambda node: node.properties["i"].value)
+    for src, dst in pairwise(nodes):
+        gf.create_relationship(src, dst, "NEXT")
+
+    gf.expanded = 0
+    iter_neighbors = gf.graph.iter_neighbors
+
+    def counting(node_id, direction="OUT", types=None):
+        gf.expanded += 1
+        return iter_neighbors(node_id, direction, types)
+
+    gf.graph.iter_neighbors = counting
+    return gf
+
+
+def values(rows):
+    """Extract the ``i`` column of result rows."""
+    return [row["i"].value for row in rows]
+
+
+@pytest.mark.integration
+class TestExecuteIter:
+    """Tests for GraphForge.execute_iter()."""
+
+    def test_yields_same_rows_as_execute(self, gf):
+        """Iterating a result produces exactly the rows of execute()."""
+        query = "MATCH (n:Item) RETURN n.i AS i ORDER BY i"
+        result = gf.execute_iter(query)
+        assert isinstance(result, QueryResult)
+        assert values(result) == values(gf.execute(query))
+        assert result.closed
+
+    def test_rows_are_pulled_lazily(self, gf):
+        """Nothing is expanded until rows are requested."""
+        result = gf.execute_iter("MATCH (:Item)-[:NEXT]->(n) RETURN n.i AS i")
+        assert gf.expanded == 0
+        next(result)
+        assert gf.expanded == 1
+        result.close()
+
+    def test_batches(self, gf):
+        """batch_size groups rows into lists, with a shorter final batch."""
+        batches = list(gf.execute_iter("MATCH (n:Item) RETURN n.i AS i ORDER BY i", batch_size=4))
+        assert [values(batch) for batch in batches] == [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]]
+
+    def test_invalid_batch_size(self, gf):
+        """batch_size must be positive."""
+        with pytest.raises(ValueError, match="batch_size"):
+            gf.execute_iter("MATCH (n:Item) RETURN n", batch_size=0)
+
+    def test_close_stops_execution(self, gf):
+        """A closed result produces no more rows and expands no more nodes."""
+        result = gf.execute_iter("MATCH (:Item)-[:NEXT]->(n) RETURN n.i AS i")
+        next(result)
+        result.close()
+        assert result.closed
+        assert list(result) == []
+        assert gf.expanded == 1
+
+    def test_context_manager_closes(self, gf):
+        """Leaving the with block closes the result, even after a break."""
+        with gf.execute_iter("MATCH (:Item)-[:NEXT]->(n) RETURN n.i AS i", batch_size=3) as batches:
+            for batch in batches:
+                assert len(batch) == 3
+                break
+        assert batches.closed
+        assert gf.expanded == 3
+
+    def test_parameters(self, gf):
+        """Parameters are bound for the whole iteration."""
+        rows = gf.execute_iter(
+            "MATCH (n:Item) WHERE n.i > $min RETURN n.i AS i ORDER BY i", {"min": 7}
+        )
+        assert values(rows) == [8, 9, 10]
+
+    def test_errors_surface_before_iteration(self, gf):
+        """Invalid queries and parameters are rejected by the call itself."""
+        with pytest.raises(ValueError):
+            gf.execute_iter("   ")
+        with pytest.raises(TypeError):
+            gf.execute_iter("RETURN $x AS x", params=[1])
+
+    def test_write_query_runs_when_iterated(self, gf):
+        """Queries without RETURN apply their writes and yield nothing."""
+        assert list(gf.execute_iter("CREATE (:Item {i: 11})")) == []
+        assert len(gf.graph.get_nodes_by_label("Item")) == 11
+
+    def test_writes_applied_without_iterating(self, gf):
+        """Updating queries run in full even if the result is closed unread."""
+        gf.execute_iter("CREATE (:Item {i: 11})").close()
+        gf.execute_iter("MATCH (n:Item {i: 1}) SET n.i = 0")
+        assert sorted(values(gf.execute("MATCH (n:Item) RETURN n.i AS i")))[:2] == [0, 2]
+        assert len(gf.graph.get_nodes_by_label("Item")) == 11
+
+    def test_write_rows_are_buffered(self, gf):
+        """RETURN rows of an updating query are computed before the first pull."""
+        result = gf.execute_iter("MATCH (n:Item) WHERE n.i <= 3 SET n.seen = true RETURN n.i AS i")
+        seen = gf.execute("MATCH (n:Item) WHERE n.seen RETURN count(n) AS c")[0]["c"].value
+        assert seen == 3
+        assert sorted(values(result)) == [1, 2, 3]
+
+    def test_prepared_write_query(self, gf):
+        """PreparedQuery.execute_iter() also applies writes immediately."""
+        add = gf.prepare("CREATE (:Item {i: $i})")
+        add.execute_iter({"i": 11})
+        assert len(gf.graph.get_nodes_by_label("Item")) == 11
+
+    def test_prepared_query(self, gf):
+        """PreparedQuery.execute_iter() streams the compiled plan."""
+        above = gf.prepare("MATCH (n:Item) WHERE n.i > $min RETURN n.i AS i ORDER BY i")
+        with above.execute_iter({"min": 5}, batch_size=2) as batches:
+            assert [values(batch) for batch in batches] == [[6, 7], [8, 9], [10]]
+
+    def test_relationship_changes_during_iteration(self, gf):
+        """Adding a relationship while an expansion is live raises on the next pull."""
+        rows = gf.execute_iter("MATCH (a:Item)-[:NEXT]->(b) RETURN b.i AS i")
+        next(rows)
+        first = gf.graph.get_nodes_by_label("Item")[0]
+        gf.create_relationship(first, first, "NEXT")
+        with pytest.raises(RuntimeError, match="changed during adjacency iteration"):
+            next(rows)
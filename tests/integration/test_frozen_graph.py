@@ -0,0 +1,83 @@
+"""Integration tests for read queries on a frozen (CSR snapshot) instance."""
+
+import random
+
+import pytest
+
+from graphforge import GraphForge
+
+
+def rows(gf, query):
+    """Query results as sorted tuples of plain values."""
+
+    def plain(value):
+        if hasattr(value, "nodes"):
+            return tuple(node.id for node in value.nodes)
+        if hasattr(value, "id"):
+            return value.id
+        if isinstance(value, list):
+            return tuple(plain(item) for item in value)
+        return repr(value)
+
+    return sorted(tuple(plain(row[key]) for key in sorted(row)) for row in gf.execute(query))
+
+
+@pytest.fixture
+def gf():
+    """Random graph of 60 :N nodes with weighted :R and :S relationships."""
+    rng = random.Random(7)
+    gf = GraphForge()
+    nodes = [gf.create_node(["N"], i=i) for i in range(60)]
+    for _ in range(200):
+        a, b = rng.choice(nodes), rng.choice(nodes)
+        gf.create_relationship(a, b, rng.choice(["R", "S"]), w=rng.randint(1, 9))
+    return gf
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "query",
+    [
+        "MATCH (a:N)-[r:R]->(b) RETURN a, r, b",
+        "MATCH (a:N {i: 3})-[r]-(b) RETURN r, b",
+        "MATCH (a:N)<-[:S]-(b) RETURN a.i AS i, count(b) AS c",
+        "MATCH (a:N {i: 0})-[:R*1..3]->(b) RETURN DISTINCT b",
+        "MATCH p = (a:N {i: 1})-[:S*2..2]-(b) RETURN p",
+        "MATCH p = shortestPath((a:N {i: 0})-[*]->(b:N {i: 42})) RETURN length(p) AS n",
+        "MATCH (a:N {i: 5}) OPTIONAL MATCH (a)-[:S]->(b) RETURN a, b",
+        "MATCH (a:N {i: 0}), (b:N {i: 42}) "
+        "CALL graphforge.shortestPath.dijkstra(a, b, {weightProperty: 'w'}) "
+        "YIELD cost RETURN cost",
+    ],
+)
+def test_queries_match_original(gf, query):
+    """Read queries return the same results on the frozen instance."""
+    assert rows(gf.freeze(), query) == rows(gf, query)
+
+
+@pytest.mark.integration
+class TestFrozenInstance:
+    """Behaviour of the read-only instance."""
+
+    def test_writes_rejected(self, gf):
+        """Write queries raise and leave the snapshot unchanged."""
+        frozen = gf.freeze()
+        with pytest.raises(RuntimeError, match="read-only"):
+            frozen.execute("CREATE (:N {i: 100})")
+        with pytest.raises(RuntimeError, match="read-only"):
+            frozen.execute("MATCH (n:N {i: 0}) DETACH DELETE n")
+        assert frozen.execute("MATCH (n) RETURN count(n) AS c")[0]["c"].value == 60
+
+    def test_original_stays_writable(self, gf):
+        """The original keeps accepting writes, which the snapshot does not see."""
+        frozen = gf.freeze()
+        gf.execute("CREATE (:N {i: 100})")
+        assert gf.execute("MATCH (n) RETURN count(n) AS c")[0]["c"].value == 61
+        assert frozen.execute("MATCH (n) RETURN count(n) AS c")[0]["c"].value == 60
+
+    def test_indexed_lookup_falls_back_to_scan(self, gf):
+        """Lookups planned against a property index scan on the snapshot."""
+        gf.execute("CREATE INDEX FOR (n:N) ON (n.i)")
+        frozen = gf.freeze()
+        result = frozen.execute("MATCH (n:N) WHERE n.i = 7 RETURN n.i AS i")
+        assert [row["i"].value for row in result] == [7]
@@ -0,0 +1,172 @@
+"""Integration tests for query parameters and prepared queries."""
+
+import pytest
+
+from graphforge import GraphForge, PreparedQuery
+from graphforge.types.values import CypherInt
+
+
+@pytest.fixture
+def gf():
+    """Graph with a few Person nodes."""
+    gf = GraphForge()
+    for name, age in [("Alice", 30), ("Bob", 25), ("Carol", 35)]:
+        gf.create_node(["Person"], name=name, age=age)
+    return gf
+
+
+@pytest.mark.integration
+class TestExecuteWithParameters:
+    """Tests for GraphForge.execute(query, params=...)."""
+
+    def test_parameter_in_where(self, gf):
+        """Parameters are substituted in predicates."""
+        results = gf.execute(
+            "MATCH (p:Person) WHERE p.age > $min_age RETURN p.name AS name ORDER BY name",
+            params={"min_age": 26},
+        )
+        assert [r["name"].value for r in results] == ["Alice", "Carol"]
+
+    def test_parameter_in_pattern_properties(self, gf):
+        """Parameters work as inline property filters."""
+        results = gf.execute("MATCH (p:Person {name: $name}) RETURN p.age AS age", {"name": "Bob"})
+        assert results[0]["age"].value == 25
+
+    def test_list_and_map_parameters(self, gf):
+        """Lists and maps are converted to CypherList and CypherMap."""
+        results = gf.execute(
+            "UNWIND $names AS name RETURN name, $opts.limit AS lim",
+            params={"names": ["x", "y"], "opts": {"limit": 5}},
+        )
+        assert [r["name"].value for r in results] == ["x", "y"]
+        assert results[0]["lim"].value == 5
+
+    def test_parameter_in_create(self, gf):
+        """Parameters can supply property values for CREATE."""
+        gf.execute("CREATE (:Person {name: $name, age: $age})", {"name": "Dave", "age": 40})
+        results = gf.execute("MATCH (p:Person {name: 'Dave'}) RETURN p.age AS age")
+        assert results[0]["age"].value == 40
+
+    def test_parameter_in_subquery_and_union(self, gf):
+        """Parameters are visible inside EXISTS subqueries and UNION branches."""
+        results = gf.execute(
+            "MATCH (p:Person) WHERE EXISTS { MATCH (q:Person) WHERE q.age = p.age + $d } "
+            "RETURN p.name AS name",
+            {"d": 5},
+        )
+        assert {r["name"].value for r in results} == {"Alice", "Bob"}
+
+        results = gf.execute("RETURN $a AS x UNION ALL RETURN $b AS x", {"a": 1, "b": 2})
+        assert [r["x"].value for r in results] == [1, 2]
+
+    def test_unaliased_parameter_column_name(self, gf):
+        """An unaliased parameter is returned under its $name."""
+        results = gf.execute("RETURN $value", {"value": 7})
+        assert results[0]["$value"].value == 7
+
+    def test_cypher_values_and_nodes_pass_through(self, gf):
+        """CypherValues and nodes from earlier results can be passed back in."""
+        alice = gf.execute("MATCH (p:Person {name: 'Alice'}) RETURN p")[0]["p"]
+        results = gf.execute(
+            "MATCH (p) WHERE id(p) = id($node) RETURN p.age + $n AS x",
+            {
+                "node": alice,
+                "n": CypherInt(1),
+            },
+        )
+        assert results[0]["x"].value == 31
+
+    def test_parameters_share_one_cached_plan(self, gf):
+        """Different parameter values reuse the same compiled plan."""
+        query = "MATCH (p:Person) WHERE p.name = $name RETURN p.age AS age"
+        for name in ["Alice", "Bob", "Carol"]:
+            gf.execute(query, {"name": name})
+
+        stats = gf.plan_cache.stats()
+        assert stats.misses == 1
+        assert stats.hits == 2
+
+    def test_missing_parameter_raises(self, gf):
+        """Referencing an unbound parameter raises ValueError."""
+        with pytest.raises(ValueError, match=r"Missing parameter: \$age"):
+            gf.execute("RETURN $age AS age")
+
+    def test_parameters_do_not_leak_between_executions(self, gf):
+        """Parameters from a previous execution are not visible to the next one."""
+        gf.execute("RETURN $x AS x", {"x": 1})
+        with pytest.raises(ValueError, match="Missing parameter"):
+            gf.execute("RETURN $x AS x")
+
+    def test_invalid_params_type(self, gf):
+        """params must be a dict with string keys."""
+        with pytest.raises(TypeError, match="params must be a dict"):
+            gf.execute("RETURN 1 AS x", [1])
+        with pytest.raises(TypeError, match="Parameter names must be strings"):
+            gf.execute("RETURN 1 AS x", {1: 1})
+
+    def test_unsupported_parameter_value(self, gf):
+        """Values that cannot be converted raise TypeError."""
+        with pytest.raises(TypeError, match="Unsupported property value type"):
+            gf.execute("RETURN $x AS x", {"x": object()})
+
+    def test_skip_and_limit_parameters(self, gf):
+        """SKIP and LIMIT counts are read from parameters."""
+        query = "MATCH (p:Person) RETURN p.name AS name ORDER BY name SKIP $s LIMIT $k"
+        pages = [[r["name"].value for r in gf.execute(query, {"s": s, "k": 2})] for s in (0, 2)]
+        assert pages == [["Alice", "Bob"], ["Carol"]]
+        assert gf.plan_cache.stats().misses == 1
+
+    def test_with_skip_and_limit_parameters(self, gf):
+        """WITH ... SKIP $s LIMIT $k pages through the projected rows."""
+        results = gf.execute(
+            "MATCH (p:Person) WITH p ORDER BY p.age DESC SKIP $s LIMIT $k RETURN p.name AS name",
+            {"s": 1, "k": 1},
+        )
+        assert [r["name"].value for r in results] == ["Alice"]
+
+    @pytest.mark.parametrize(
+        ("value", "error"), [(-1, ValueError), ("2", TypeError), (1.5, TypeError)]
+    )
+    def test_invalid_limit_parameter(self, gf, value, error):
+        """A SKIP or LIMIT parameter must be a non-negative integer."""
+        with pytest.raises(error, match="LIMIT expects a non-negative integer"):
+            gf.execute("MATCH (p:Person) RETURN p LIMIT $k", {"k": value})
+
+
+@pytest.mark.integration
+class TestPreparedQuery:
+    """Tests for GraphForge.prepare()."""
+
+    def test_prepare_returns_reusable_query(self, gf):
+        """A prepared query runs with different parameter values."""
+        find = gf.prepare("MATCH (p:Person {name: $name}) RETURN p.age AS age")
+        assert isinstance(find, PreparedQuery)
+        assert find.execute({"name": "Alice"})[0]["age"].value == 30
+        assert find.execute({"name": "Carol"})[0]["age"].value == 35
+        assert find.execute({"name": "Nobody"}) == []
+
+    def test_prepared_write_query(self):
+        """A prepared CREATE applies its side effects on every execution."""
+        gf = GraphForge()
+        add = gf.prepare("CREATE (:Item {idx: $idx})")
+        for i in range(10):
+            add.execute({"idx": i})
+
+        results = gf.execute("MATCH (n:Item) RETURN count(n) AS c, sum(n.idx) AS s")
+        assert results[0]["c"].value == 10
+        assert results[0]["s"].value == 45
+
+    def test_prepared_query_recompiles_after_drift(self, gf):
+        """The prepared plan follows the graph as it grows."""
+        count = gf.prepare("MATCH (p:Person) WHERE p.age >= $age RETURN count(p) AS c")
+        assert count.execute({"age": 0})[0]["c"].value == 3
+
+        for i in range(10):
+            gf.create_node(["Person"], name=f"p{i}", age=i)
+
+        assert count.execute({"age": 0})[0]["c"].value == 13
+
+    def test_prepare_validates_query(self, gf):
+        """Empty queries are rejected at prepare time."""
+        with pytest.raises(ValueError):
+            gf.prepare("   ")
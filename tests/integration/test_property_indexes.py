@@ -0,0 +1,223 @@
+"""Integration tests for CREATE INDEX / DROP INDEX and index-backed MATCH."""
+
+import pytest
+
+from graphforge import GraphForge
+from graphforge.planner.operators import NodeIndexScan, NodeIndexSeek
+
+
+@pytest.fixture
+def gf():
+    """Graph with Person nodes and an index on Person.age."""
+    gf = GraphForge()
+    for i in range(20):
+        gf.create_node(["Person"], name=f"p{i}", age=i % 5)
+    gf.create_node(["Robot"], name="r0", age=1)
+    gf.execute("CREATE INDEX person_age FOR (p:Person) ON (p.age)")
+    return gf
+
+
+def names(rows):
+    """Sorted names from result rows."""
+    return sorted(row["name"].value for row in rows)
+
+
+@pytest.mark.integration
+class TestIndexSeekQueries:
+    """Queries answered through property indexes."""
+
+    def test_inline_property_uses_index(self, gf):
+        """MATCH with an inline property map is planned as an index seek."""
+        query = "MATCH (p:Person {age: 1}) RETURN p.name AS name"
+        assert isinstance(gf._compile(query)[0], NodeIndexSeek)
+        assert names(gf.execute(query)) == ["p1", "p11", "p16", "p6"]
+
+    def test_where_equality_with_parameter(self, gf):
+        """WHERE equalities against parameters use the index."""
+        rows = gf.execute(
+            "MATCH (p:Person) WHERE p.age = $age AND p.name <> 'p2' RETURN p.name AS name",
+            {"age": 2},
+        )
+        assert names(rows) == ["p12", "p17", "p7"]
+
+    def test_results_match_unindexed_plan(self, gf):
+        """Index seeks return exactly what a scan returns."""
+        plain = GraphForge(enable_optimizer=False)
+        for i in range(20):
+            plain.create_node(["Person"], name=f"p{i}", age=i % 5)
+        for value in ["3", "3.0", "'3'", "null", "true", "[3]"]:
+            query = f"MATCH (p:Person) WHERE p.age = {value} RETURN p.name AS name"
+            assert names(gf.execute(query)) == names(plain.execute(query))
+
+    def test_index_maintained_by_cypher_writes(self, gf):
+        """CREATE, SET, REMOVE and DELETE keep the index current."""
+        gf.execute("CREATE (:Person {name: 'new', age: 9})")
+        gf.execute("MATCH (p:Person {name: 'p0'}) SET p.age = 9")
+        gf.execute("MATCH (p:Person {name: 'new'}) REMOVE p.age")
+        gf.execute("MATCH (p:Person {name: 'p5'}) DELETE p")
+        rows = gf.execute("MATCH (p:Person {age: 9}) RETURN p.name AS name")
+        assert names(rows) == ["p0"]
+        rows = gf.execute("MATCH (p:Person {age: 0}) RETURN p.name AS name")
+        assert names(rows) == ["p10", "p15"]
+
+    def test_bound_variable_is_checked_not_seeked(self, gf):
+        """A seek on an already-bound variable filters that node."""
+        rows = gf.execute("MATCH (p:Person) WITH p MATCH (p:Person {age: 4}) RETURN p.name AS name")
+        assert names(rows) == ["p14", "p19", "p4", "p9"]
+
+    def test_rollback_reverts_index_entries(self, gf):
+        """Rolled-back writes leave the index as it was."""
+        gf.begin()
+        gf.execute("MATCH (p:Person {age: 1}) SET p.age = 7")
+        gf.rollback()
+        rows = gf.execute("MATCH (p:Person {age: 1}) RETURN p.name AS name")
+        assert names(rows) == ["p1", "p11", "p16", "p6"]
+
+
+@pytest.mark.integration
+class TestIndexDDL:
+    """Tests for creating and dropping indexes through Cypher."""
+
+    def test_create_existing_index_fails_unless_if_not_exists(self, gf):
+        """Re-creating an index is an error unless IF NOT EXISTS is given."""
+        with pytest.raises(ValueError, match="already exists"):
+            gf.execute("CREATE INDEX FOR (p:Person) ON (p.age)")
+        gf.execute("CREATE INDEX IF NOT EXISTS FOR (p:Person) ON (p.age)")
+        assert [index.name for index in gf.graph.property_indexes()] == ["person_age"]
+
+    def test_drop_index(self, gf):
+        """DROP INDEX removes the index by name or by label and property."""
+        gf.execute("DROP INDEX person_age")
+        assert gf.graph.property_indexes() == []
+        with pytest.raises(ValueError, match="No index"):
+            gf.execute("DROP INDEX ON :Person(age)")
+        gf.execute("DROP INDEX person_age IF EXISTS")
+
+    def test_cached_plans_replanned_after_ddl(self, gf):
+        """Cached and prepared plans pick up created and dropped indexes."""
+        query = "MATCH (p:Person) WHERE p.name = $name RETURN p.age AS age"
+        prepared = gf.prepare(query)
+        assert not isinstance(gf._compile(query)[0], NodeIndexSeek)
+
+        gf.execute("CREATE INDEX ON :Person(name)")
+        assert isinstance(gf._compile(query)[0], NodeIndexSeek)
+        assert prepared.execute({"name": "p3"})[0]["age"].value == 3
+        assert isinstance(prepared._operators[0], NodeIndexSeek)
+
+        gf.execute("DROP INDEX ON :Person(name)")
+        assert not isinstance(gf._compile(query)[0], NodeIndexSeek)
+        assert prepared.execute({"name": "p3"})[0]["age"].value == 3
+
+
+def events(gf):
+    """Add Event nodes with ts 0..19 (shuffled), one without ts, one with a null."""
+    for i in range(20):
+        gf.create_node(["Event"], ts=(i * 7) % 20, name=f"e{(i * 7) % 20}")
+    gf.create_node(["Event"], name="none")
+    gf.execute("CREATE (:Event {name: 'null', ts: null})")
+    return gf
+
+
+@pytest.fixture
+def ranged():
+    """Events with a range index on Event.ts and Event.name."""
+    gf = events(GraphForge())
+    gf.execute("CREATE RANGE INDEX event_ts FOR (e:Event) ON (e.ts)")
+    gf.execute("CREATE RANGE INDEX ON :Event(name)")
+    return gf
+
+
+def values(rows):
+    """Values of the single column of result rows, in row order."""
+    return [row["v"].value for row in rows]
+
+
+@pytest.mark.integration
+class TestRangeIndexQueries:
+    """Queries answered through range indexes."""
+
+    QUERIES = (
+        "MATCH (e:Event) WHERE e.ts > 15 RETURN e.ts AS v ORDER BY v",
+        "MATCH (e:Event) WHERE e.ts >= 3 AND e.ts < 6 RETURN e.ts AS v ORDER BY v DESC",
+        "MATCH (e:Event) WHERE 2.5 > e.ts RETURN e.name AS v ORDER BY v",
+        "MATCH (e:Event) WHERE e.name STARTS WITH 'e1' RETURN e.name AS v ORDER BY v",
+        "MATCH (e:Event) RETURN e.ts AS v ORDER BY v LIMIT 3",
+        "MATCH (e:Event) RETURN e.ts AS v ORDER BY e.ts DESC SKIP 1 LIMIT 4",
+        "MATCH (e:Event) WHERE e.ts < 10 RETURN e.ts AS v ORDER BY e.ts DESC LIMIT 2",
+        "MATCH (e:Event) RETURN e.name AS v ORDER BY e.name DESC LIMIT 5",
+    )
+
+    def test_results_match_unindexed_graph(self, ranged):
+        """Range scans return exactly what a scan plus sort returns."""
+        plain = events(GraphForge())
+        for query in self.QUERIES:
+            assert isinstance(ranged._compile(query)[0], NodeIndexScan), query
+            assert values(ranged.execute(query)) == values(plain.execute(query)), query
+
+    def test_order_by_limit_stops_early(self, ranged):
+        """ORDER BY ... LIMIT is planned as a limited ordered index scan."""
+        query = "MATCH (e:Event) RETURN e.ts AS v ORDER BY v DESC LIMIT 3"
+        scan = ranged._compile(query)[0]
+        assert (scan.descending, scan.limit) == (True, 3)
+        assert values(ranged.execute(query)) == [None, None, 19]
+
+    def test_mixed_types_fall_back_to_scan(self, ranged):
+        """Values of other types are re-checked, and ordering falls back to a sort."""
+        ranged.execute(
+            "CREATE (:Event {name: 'str', ts: 'late'}), (:Event {name: 'list', ts: [1]})"
+        )
+        plain = events(GraphForge())
+        plain.execute("CREATE (:Event {name: 'str', ts: 'late'}), (:Event {name: 'list', ts: [1]})")
+        for query in [
+            "MATCH (e:Event) WHERE e.ts > 17 RETURN e.name AS v ORDER BY v",
+            "MATCH (e:Event) WHERE e.ts >= 'a' RETURN e.name AS v ORDER BY v",
+            "MATCH (e:Event) WHERE e.ts < 2 RETURN e.name AS v ORDER BY e.ts DESC",
+        ]:
+            assert values(ranged.execute(query)) == values(plain.execute(query)), query
+
+    def test_range_index_maintained_by_writes(self, ranged):
+        """SET, REMOVE and DELETE keep the sorted entries current."""
+        ranged.execute("MATCH (e:Event {name: 'e19'}) SET e.ts = -1")
+        ranged.execute("MATCH (e:Event {name: 'e0'}) REMOVE e.ts")
+        ranged.execute("MATCH (e:Event {name: 'e1'}) DELETE e")
+        rows = ranged.execute("MATCH (e:Event) RETURN e.name AS v ORDER BY e.ts LIMIT 3")
+        assert values(rows) == ["e19", "e2", "e3"]
+
+
+@pytest.mark.integration
+class TestIndexPersistence:
+    """Tests for persisting index definitions in SQLite."""
+
+    def test_indexes_survive_reopen(self, tmp_path):
+        """Index definitions are saved and rebuilt on load."""
+        db_path = tmp_path / "indexed.db"
+        gf = GraphForge(db_path)
+        gf.execute("CREATE INDEX person_name FOR (p:Person) ON (p.name)")
+        gf.execute("CREATE (:Person {name: 'Alice'}), (:Person {name: 'Bob'})")
+        gf.close()
+
+        gf = GraphForge(db_path)
+        [index] = gf.graph.property_indexes()
+        assert (index.name, index.label, index.property) == ("person_name", "Person", "name")
+        query = "MATCH (p:Person {name: 'Bob'}) RETURN p.name AS name"
+        assert isinstance(gf._compile(query)[0], NodeIndexSeek)
+        assert names(gf.execute(query)) == ["Bob"]
+
+        gf.execute("DROP INDEX person_name")
+        gf.close()
+
+        gf = GraphForge(db_path)
+        assert gf.graph.property_indexes() == []
+        gf.close()
+
+    def test_range_index_kind_survives_reopen(self, tmp_path):
+        """The index kind is persisted along with the definition."""
+        db_path = tmp_path / "ranged.db"
+        gf = GraphForge(db_path)
+        gf.execute("CREATE RANGE INDEX event_ts FOR (e:Event) ON (e.ts)")
+        gf.close()
+
+        gf = GraphForge(db_path)
+        [index] = gf.graph.property_indexes()
+        assert index.kind == "range"
+        gf.close()
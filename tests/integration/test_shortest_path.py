@@ -0,0 +1,160 @@
+"""Integration tests for shortestPath() and allShortestPaths()."""
+
+import random
+
+import pytest
+
+from graphforge import GraphForge
+
+
+def ids(path):
+    """Node ids of a path as a list of the nodes' ``id`` properties."""
+    return [node.properties["id"].value for node in path.nodes]
+
+
+@pytest.fixture
+def gf():
+    """Graph with two 2-hop routes from 1 to 4 over :R, a 3-hop one and a direct :S.
+
+    1 -R-> 2 -R-> 4
+    1 -R-> 3 -R-> 4
+    1 -R-> 5 -R-> 6 -R-> 4
+    1 -S-> 4
+    """
+    gf = GraphForge()
+    nodes = {i: gf.create_node(["N"], id=i) for i in range(1, 8)}
+    for src, dst in [(1, 2), (2, 4), (1, 3), (3, 4), (1, 5), (5, 6), (6, 4)]:
+        gf.create_relationship(nodes[src], nodes[dst], "R")
+    gf.create_relationship(nodes[1], nodes[4], "S")
+    return gf
+
+
+class TestShortestPath:
+    """Tests for shortestPath()."""
+
+    def test_single_shortest_path(self, gf):
+        """shortestPath() returns one path of minimal length."""
+        results = gf.execute("MATCH p = shortestPath((a:N {id: 1})-[:R*]->(b:N {id: 4})) RETURN p")
+        assert len(results) == 1
+        assert ids(results[0]["p"]) in ([1, 2, 4], [1, 3, 4])
+
+    def test_bound_end_nodes(self, gf):
+        """End nodes bound by an earlier MATCH are searched between."""
+        results = gf.execute(
+            "MATCH (a:N {id: 1}), (b:N {id: 4}) "
+            "MATCH p = shortestPath((a)-[*]->(b)) RETURN length(p) AS hops"
+        )
+        assert [r["hops"].value for r in results] == [1]
+
+    def test_relationship_types(self, gf):
+        """Only relationships of the given types are followed."""
+        results = gf.execute(
+            "MATCH p = shortestPath((a:N {id: 1})-[:S*]->(b:N {id: 4})) RETURN length(p) AS hops"
+        )
+        assert [r["hops"].value for r in results] == [1]
+
+    def test_direction(self, gf):
+        """Directed patterns do not walk relationships backwards."""
+        query = "MATCH p = shortestPath((a:N {id: 4})-[:R*]->(b:N {id: 1})) RETURN p"
+        assert gf.execute(query) == []
+        results = gf.execute("MATCH p = shortestPath((a:N {id: 4})<-[:R*]-(b:N {id: 1})) RETURN p")
+        assert ids(results[0]["p"]) in ([4, 2, 1], [4, 3, 1])
+        results = gf.execute("MATCH p = shortestPath((a:N {id: 4})-[:R*]-(b:N {id: 6})) RETURN p")
+        assert ids(results[0]["p"]) == [4, 6]
+
+    def test_max_hops(self, gf):
+        """No path is returned when the shortest one is longer than the maximum."""
+        query = "MATCH p = shortestPath((a:N {id: 1})-[:R*..%d]->(b:N {id: 6})) RETURN p"
+        assert gf.execute(query % 1) == []
+        assert len(gf.execute(query % 2)) == 1
+
+    def test_zero_length(self, gf):
+        """A path from a node to itself has length 0 when the minimum allows it."""
+        query = "MATCH p = shortestPath((a:N {id: 1})-[*%s]->(b:N {id: 1})) RETURN length(p) AS l"
+        assert [r["l"].value for r in gf.execute(query % "0..")] == [0]
+        assert gf.execute(query % "") == []
+
+    def test_unreachable(self, gf):
+        """Unconnected nodes produce no rows."""
+        assert gf.execute("MATCH p = shortestPath((a:N {id: 1})-[*]-(b:N {id: 7})) RETURN p") == []
+
+    def test_relationship_variable(self, gf):
+        """The relationship variable is bound to the path's relationships."""
+        results = gf.execute(
+            "MATCH p = shortestPath((a:N {id: 1})-[rs:R*]->(b:N {id: 6})) RETURN p, rs"
+        )
+        assert results[0]["rs"] == results[0]["p"].relationships
+        assert [edge.type for edge in results[0]["rs"]] == ["R", "R"]
+
+    def test_relationship_predicate(self, gf):
+        """Pattern predicates restrict the relationships a path may use."""
+        gf.execute("MATCH (:N {id: 2})-[r:R]->(:N {id: 4}) SET r.closed = true")
+        gf.execute("MATCH (:N {id: 3})-[r:R]->(:N {id: 4}) SET r.closed = true")
+        results = gf.execute(
+            "MATCH p = shortestPath((a:N {id: 1})-[r:R* WHERE r.closed IS NULL]->(b:N {id: 4})) "
+            "RETURN p"
+        )
+        assert ids(results[0]["p"]) == [1, 5, 6, 4]
+
+    def test_invalid_patterns(self, gf):
+        """Only single-relationship patterns with a minimal length of 0 or 1 are allowed."""
+        with pytest.raises(SyntaxError):
+            gf.execute("MATCH p = shortestPath((a)-[*]->(b)-[*]->(c)) RETURN p")
+        with pytest.raises(SyntaxError):
+            gf.execute("MATCH p = shortestPath((a)-[*2..]->(b)) RETURN p")
+
+
+class TestAllShortestPaths:
+    """Tests for allShortestPaths()."""
+
+    def test_all_paths_of_minimal_length(self, gf):
+        """Every path of minimal length is returned once."""
+        results = gf.execute(
+            "MATCH p = allShortestPaths((a:N {id: 1})-[:R*]->(b:N {id: 4})) RETURN p"
+        )
+        assert sorted(ids(r["p"]) for r in results) == [[1, 2, 4], [1, 3, 4]]
+
+    def test_parallel_relationships(self, gf):
+        """Parallel relationships make distinct paths."""
+        gf.execute("MATCH (a:N {id: 1}), (b:N {id: 2}) CREATE (a)-[:R]->(b)")
+        results = gf.execute(
+            "MATCH p = allShortestPaths((a:N {id: 1})-[:R*]->(b:N {id: 4})) RETURN p"
+        )
+        assert sorted(ids(r["p"]) for r in results) == [[1, 2, 4], [1, 2, 4], [1, 3, 4]]
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("arrow", ["->", "-"])
+def test_matches_exhaustive_expansion(seed, arrow):
+    """Shortest paths agree with the shortest of all variable-length paths."""
+    rng = random.Random(seed)
+    gf = GraphForge()
+    nodes = [gf.create_node(["V"], id=i) for i in range(12)]
+    for _ in range(20):
+        gf.create_relationship(rng.choice(nodes), rng.choice(nodes), "E")
+
+    lhs = "(a:V {id: 0})-[:E*1..6]" + ("->" if arrow == "->" else "-")
+    every = gf.execute(f"MATCH p = {lhs}(b:V) RETURN b.id AS b, p")
+    shortest_all = gf.execute(f"MATCH p = allShortestPaths({lhs}(b:V)) RETURN b.id AS b, p")
+    shortest = gf.execute(f"MATCH p = shortestPath({lhs}(b:V)) RETURN b.id AS b, p")
+
+    expected: dict[int, list] = {}
+    for row in every:
+        paths = expected.setdefault(row["b"].value, [])
+        if paths and len(row["p"].relationships) < len(paths[0].relationships):
+            paths.clear()
+        if not paths or len(row["p"].relationships) == len(paths[0].relationships):
+            paths.append(row["p"])
+
+    def key(path):
+        return [edge.id for edge in path.relationships]
+
+    found: dict[int, list] = {}
+    for row in shortest_all:
+        found.setdefault(row["b"].value, []).append(key(row["p"]))
+    assert {b: sorted(map(key, paths)) for b, paths in expected.items()} == {
+        b: sorted(paths) for b, paths in found.items()
+    }
+    assert sorted(row["b"].value for row in shortest) == sorted(expected)
+    for row in shortest:
+        assert key(row["p"]) in [key(path) for path in expected[row["b"].value]]
@@ -228,3 +228,78 @@ class TestSQLitePersistence:
         finally:
             if Path(db_path).exists():
                 Path(db_path).unlink()
+
+
+class TestSQLiteIncrementalSave:
+    """Tests that saves write only the changed elements."""
+
+    def test_deletes_are_persisted(self):
+        """Deleted nodes and relationships stay deleted after reopening."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+
+            gf = GraphForge(db_path)
+            gf.execute("CREATE (:Person {name: 'Alice'})-[:KNOWS]->(:Person {name: 'Bob'})")
+            gf.execute("CREATE (:Person {name: 'Carol'})")
+            gf.close()
+
+            gf = GraphForge(db_path)
+            gf.execute("MATCH (p:Person {name: 'Bob'}) DETACH DELETE p")
+            gf.close()
+
+            gf = GraphForge(db_path)
+            results = gf.execute("MATCH (p:Person) RETURN p.name AS name ORDER BY name")
+            assert [r["name"].value for r in results] == ["Alice", "Carol"]
+            assert gf.execute("MATCH ()-[r]->() RETURN count(r) AS c")[0]["c"].value == 0
+            gf.close()
+
+    def test_commit_writes_only_changed_elements(self):
+        """A property update rewrites one node, not the whole graph."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+
+            gf = GraphForge(db_path)
+            gf.execute("UNWIND range(1, 50) AS i CREATE (:Person {id: i})")
+            gf.close()
+
+            gf = GraphForge(db_path)
+            assert gf.backend is not None
+            saved_ids = []
+            save_nodes = gf.backend.save_nodes
+
+            def recording_save_nodes(nodes):
+                nodes = list(nodes)
+                saved_ids.extend(node.id for node in nodes)
+                save_nodes(nodes)
+
+            gf.backend.save_nodes = recording_save_nodes  # type: ignore[method-assign]
+            gf.begin()
+            gf.execute("MATCH (p:Person {id: 7}) SET p.name = 'Seven'")
+            gf.commit()
+            gf.close()
+
+            assert len(saved_ids) == 1
+
+            gf = GraphForge(db_path)
+            results = gf.execute("MATCH (p:Person {id: 7}) RETURN p.name AS name")
+            assert results[0]["name"].value == "Seven"
+            assert gf.execute("MATCH (p:Person) RETURN count(p) AS c")[0]["c"].value == 50
+            gf.close()
+
+    def test_rolled_back_changes_are_not_persisted(self):
+        """Elements created and rolled back never reach the database."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+
+            gf = GraphForge(db_path)
+            gf.create_node(["Person"], name="Alice")
+            gf.begin()
+            gf.create_node(["Person"], name="Bob")
+            gf.execute("MATCH (p:Person {name: 'Alice'}) SET p.age = 30")
+            gf.rollback()
+            gf.close()
+
+            gf = GraphForge(db_path)
+            results = gf.execute("MATCH (p:Person) RETURN p.name AS name, p.age IS NULL AS no_age")
+            assert [(r["name"].value, r["no_age"].value) for r in results] == [("Alice", True)]
+            gf.close()
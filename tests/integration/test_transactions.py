@@ -336,3 +336,52 @@ class TestComplexTransactions:
         results = gf.execute("MATCH (p:Person) RETURN p.name AS name")
         assert len(results) == 1
         assert results[0]["name"].value == "Alice"
+
+
+class TestUndoLogRollback:
+    """Tests that rollback reverts query-level mutations and savepoints."""
+
+    def test_rollback_reverts_set_remove_and_delete(self):
+        """SET, REMOVE and DETACH DELETE are all undone by rollback."""
+        gf = GraphForge()
+        gf.execute("CREATE (:Person {name: 'Alice', age: 30})-[:KNOWS]->(:Person {name: 'Bob'})")
+
+        gf.begin()
+        gf.execute("MATCH (p:Person {name: 'Alice'}) SET p.age = 31, p.city = 'Paris'")
+        gf.execute("MATCH (p:Person {name: 'Alice'}) REMOVE p:Person")
+        gf.execute("MATCH (p {name: 'Bob'}) DETACH DELETE p")
+        gf.rollback()
+
+        results = gf.execute("""
+            MATCH (a:Person)-[:KNOWS]->(b:Person)
+            RETURN a.name AS a, a.age AS age, a.city IS NULL AS no_city, b.name AS b
+        """)
+        assert len(results) == 1
+        assert results[0]["a"].value == "Alice"
+        assert results[0]["age"].value == 30
+        assert results[0]["no_city"].value is True
+        assert results[0]["b"].value == "Bob"
+
+    def test_savepoint_rollback_keeps_transaction_open(self):
+        """rollback_to_savepoint() reverts later changes only."""
+        gf = GraphForge()
+        gf.begin()
+        gf.create_node(["Person"], name="Alice")
+        sp = gf.savepoint()
+        gf.create_node(["Person"], name="Bob")
+
+        gf.rollback_to_savepoint(sp)
+        gf.create_node(["Person"], name="Carol")
+        gf.commit()
+
+        results = gf.execute("MATCH (p:Person) RETURN p.name AS name ORDER BY name")
+        assert [r["name"].value for r in results] == ["Alice", "Carol"]
+
+    def test_savepoint_without_transaction_raises_error(self):
+        """Savepoints require an open transaction."""
+        gf = GraphForge()
+
+        with pytest.raises(RuntimeError, match="Not in a transaction"):
+            gf.savepoint()
+        with pytest.raises(RuntimeError, match="Not in a transaction"):
+            gf.rollback_to_savepoint(0)
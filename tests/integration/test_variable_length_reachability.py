@@ -0,0 +1,73 @@
+"""Integration tests for reachability-mode variable-length expansion."""
+
+import random
+
+import pytest
+
+from graphforge import GraphForge
+
+
+def build(gf, seed):
+    """Random graph of 15 :V nodes and 40 :E/:F relationships, with cycles."""
+    rng = random.Random(seed)
+    nodes = [gf.create_node(["V"], id=i) for i in range(15)]
+    for _ in range(40):
+        gf.create_relationship(
+            rng.choice(nodes), rng.choice(nodes), rng.choice(["E", "F"]), w=rng.randint(0, 3)
+        )
+
+
+def normalize(rows):
+    """Order-insensitive comparable form of result rows."""
+
+    def value(v):
+        if hasattr(v, "id"):
+            return ("node", v.id)
+        if isinstance(v.value, list):
+            return sorted(repr(value(item)) for item in v.value)
+        return v.value
+
+    return sorted(repr(sorted((key, value(v)) for key, v in row.items())) for row in rows)
+
+
+QUERIES = [
+    "MATCH (a:V {id: 0})-[:E*1..6]->(b) RETURN DISTINCT b",
+    "MATCH (a:V {id: 0})-[*]-(b) RETURN DISTINCT b.id AS id",
+    "MATCH (a:V {id: 0})<-[:E|:F*0..3]-(b) RETURN DISTINCT b.id AS id ORDER BY id",
+    "MATCH (a:V {id: 0})-[r:E* WHERE r.w > 0]->(b) RETURN DISTINCT b.id AS id",
+    "MATCH p = (a:V {id: 1})-[:F*..4]->(b) RETURN DISTINCT b.id AS id",
+    "MATCH (a:V)-[:E*..3]->(b) WHERE b.id > 5 RETURN a.id AS a, count(DISTINCT b) AS reached",
+    "MATCH (a:V)-[:E*]->(b) RETURN a.id AS a, collect(DISTINCT b.id) AS ids, max(b.id) AS top",
+    "MATCH (a:V {id: 2})-[:E*]->(b) WITH DISTINCT b MATCH (b)-[:F]->(c) RETURN c.id AS id",
+    "MATCH (a:V {id: 3})-[:E*]->(b)-[:F]->(c) RETURN DISTINCT c.id AS id",
+]
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("query", QUERIES)
+def test_same_results_as_path_expansion(seed, query):
+    """Reachability mode returns the rows of per-path expansion."""
+    optimized, reference = GraphForge(), GraphForge(enable_optimizer=False)
+    build(optimized, seed)
+    build(reference, seed)
+    assert normalize(optimized.execute(query)) == normalize(reference.execute(query))
+
+
+def test_query_uses_reachability_mode():
+    """RETURN DISTINCT over the end node plans a reachability expansion."""
+    gf = GraphForge()
+    operators = gf.optimizer.optimize(
+        gf.planner.plan(gf.parser.parse("MATCH (a:V)-[:E*1..6]->(b) RETURN DISTINCT b"))
+    )
+    assert [op.reachability for op in operators if hasattr(op, "reachability")] == [True]
+
+
+def test_source_only_at_zero_hops():
+    """The start node is returned for *0.. but not when a cycle leads back to it."""
+    gf = GraphForge()
+    a, b = gf.create_node(["V"], id=0), gf.create_node(["V"], id=1)
+    gf.create_relationship(a, b, "E")
+    gf.create_relationship(b, a, "E")
+    query = "MATCH (a:V {id: 0})-[:E*%s]->(b) RETURN DISTINCT b.id AS id"
+    assert sorted(r["id"].value for r in gf.execute(query % "0..")) == [0, 1]
+    assert [r["id"].value for r in gf.execute(query % "1..")] == [1]
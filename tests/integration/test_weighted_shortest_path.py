@@ -0,0 +1,250 @@
+"""Integration tests for the weighted shortest path procedures."""
+
+import random
+
+import pytest
+
+from graphforge import GraphForge
+
+
+def ids(path):
+    """Node ids of a path as a list of the nodes' ``id`` properties."""
+    return [node.properties["id"].value for node in path.nodes]
+
+
+@pytest.fixture
+def gf():
+    """Weighted routes from 1 to 4, the fewest hops not being the cheapest.
+
+    1 -[w: 10]-> 4
+    1 -[w: 3]-> 2 -[w: 3]-> 4
+    1 -[w: 1]-> 3 -[w: 1]-> 2
+    4 -[:T, w: 1]-> 5
+    """
+    gf = GraphForge()
+    gf.execute("UNWIND range(1, 6) AS i CREATE (:N {id: i})")
+    for src, dst, weight in [(1, 4, 10), (1, 2, 3), (2, 4, 3), (1, 3, 1), (3, 2, 1)]:
+        gf.execute(
+            f"MATCH (a:N {{id: {src}}}), (b:N {{id: {dst}}}) CREATE (a)-[:R {{w: {weight}}}]->(b)"
+        )
+    gf.execute("MATCH (a:N {id: 4}), (b:N {id: 5}) CREATE (a)-[:T {w: 1}]->(b)")
+    return gf
+
+
+DIJKSTRA = (
+    "MATCH (a:N {id: $src}), (b:N {id: $dst}) "
+    "CALL graphforge.shortestPath.dijkstra(a, b, $config) YIELD path, cost "
+    "RETURN path, cost"
+)
+
+
+class TestDijkstra:
+    """Tests for graphforge.shortestPath.dijkstra."""
+
+    def test_cheapest_path(self, gf):
+        """The path of least total weight is returned, not the fewest hops."""
+        results = gf.execute(DIJKSTRA, {"src": 1, "dst": 4, "config": {"weightProperty": "w"}})
+        assert len(results) == 1
+        assert ids(results[0]["path"]) == [1, 3, 2, 4]
+        assert results[0]["cost"].value == 5.0
+
+    def test_default_weight(self, gf):
+        """Without a weight property every relationship costs defaultWeight."""
+        results = gf.execute(DIJKSTRA, {"src": 1, "dst": 4, "config": {"defaultWeight": 2}})
+        assert ids(results[0]["path"]) == [1, 4]
+        assert results[0]["cost"].value == 2.0
+
+    def test_relationship_types(self, gf):
+        """Only the listed relationship types are followed."""
+        config = {"weightProperty": "w", "relationshipTypes": ["R"]}
+        assert gf.execute(DIJKSTRA, {"src": 1, "dst": 5, "config": config}) == []
+        config["relationshipTypes"] = ["R", "T"]
+        results = gf.execute(DIJKSTRA, {"src": 1, "dst": 5, "config": config})
+        assert results[0]["cost"].value == 6.0
+
+    def test_direction(self, gf):
+        """Direction IN walks relationships backwards, UNDIRECTED both ways."""
+        config = {"weightProperty": "w"}
+        assert gf.execute(DIJKSTRA, {"src": 4, "dst": 1, "config": config}) == []
+        config["direction"] = "in"
+        results = gf.execute(DIJKSTRA, {"src": 4, "dst": 1, "config": config})
+        assert ids(results[0]["path"]) == [4, 2, 3, 1]
+        config["direction"] = "UNDIRECTED"
+        results = gf.execute(DIJKSTRA, {"src": 5, "dst": 3, "config": config})
+        assert ids(results[0]["path"]) == [5, 4, 2, 3]
+        assert results[0]["cost"].value == 5.0
+
+    def test_same_node(self, gf):
+        """A node reaches itself with an empty path of cost 0."""
+        results = gf.execute(DIJKSTRA, {"src": 2, "dst": 2, "config": None})
+        assert ids(results[0]["path"]) == [2]
+        assert results[0]["cost"].value == 0.0
+
+    def test_unreachable_and_null(self, gf):
+        """Unreachable targets and NULL nodes produce no rows."""
+        assert gf.execute(DIJKSTRA, {"src": 1, "dst": 6, "config": None}) == []
+        results = gf.execute(
+            "OPTIONAL MATCH (a:Missing) MATCH (b:N {id: 1}) "
+            "CALL graphforge.shortestPath.dijkstra(a, b) YIELD cost RETURN cost"
+        )
+        assert results == []
+
+    def test_invalid_weights(self, gf):
+        """Negative, NaN and non-numeric weights are errors."""
+        gf.execute("MATCH (:N {id: 1})-[r:R]->(:N {id: 4}) SET r.w = -1")
+        with pytest.raises(ValueError, match="negative"):
+            gf.execute(DIJKSTRA, {"src": 1, "dst": 4, "config": {"weightProperty": "w"}})
+        gf.execute("MATCH (:N {id: 1})-[r:R]->(:N {id: 4}) SET r.w = $nan", {"nan": float("nan")})
+        with pytest.raises(ValueError, match="must be finite"):
+            gf.execute(DIJKSTRA, {"src": 1, "dst": 4, "config": {"weightProperty": "w"}})
+        gf.execute("MATCH (:N {id: 1})-[r:R]->(:N {id: 4}) SET r.w = 'far'")
+        with pytest.raises(TypeError, match="must be a number"):
+            gf.execute(DIJKSTRA, {"src": 1, "dst": 4, "config": {"weightProperty": "w"}})
+
+    def test_negative_default_weight(self, gf):
+        """A negative defaultWeight is rejected instead of producing negative costs."""
+        config = {"defaultWeight": -5, "weightProperty": "missing"}
+        with pytest.raises(ValueError, match="defaultWeight is negative"):
+            gf.execute(DIJKSTRA, {"src": 1, "dst": 4, "config": config})
+
+    def test_yield_is_optional(self, gf):
+        """Without YIELD every output field is bound under its own name."""
+        results = gf.execute(
+            "MATCH (a:N {id: 1}), (b:N {id: 2}) "
+            "CALL graphforge.shortestPath.dijkstra(a, b, {weightProperty: 'w'}) "
+            "RETURN length(path) AS hops, cost"
+        )
+        assert [(r["hops"].value, r["cost"].value) for r in results] == [(2, 2.0)]
+
+    def test_unknown_yield_field(self, gf):
+        """Yielding a field the procedure does not produce is an error."""
+        with pytest.raises(ValueError, match="no output field"):
+            gf.execute(
+                "MATCH (a:N {id: 1}), (b:N {id: 2}) "
+                "CALL graphforge.shortestPath.dijkstra(a, b) YIELD distance RETURN distance"
+            )
+
+
+class TestAStar:
+    """Tests for graphforge.shortestPath.astar."""
+
+    @pytest.fixture
+    def cities(self):
+        """Cities with WGS-84 locations and road lengths in meters."""
+        gf = GraphForge()
+        for name, lat, lon in [
+            ("London", 51.5074, -0.1278),
+            ("Oxford", 51.7520, -1.2577),
+            ("Cambridge", 52.2053, 0.1218),
+            ("Birmingham", 52.4862, -1.8904),
+        ]:
+            gf.execute(
+                "CREATE (:City {name: $name, location: point({latitude: $lat, longitude: $lon})})",
+                {"name": name, "lat": lat, "lon": lon},
+            )
+        for a, b, meters in [
+            ("London", "Oxford", 95_000),
+            ("Oxford", "Birmingham", 110_000),
+            ("London", "Cambridge", 100_000),
+            ("Cambridge", "Birmingham", 160_000),
+        ]:
+            gf.execute(
+                "MATCH (a:City {name: $a}), (b:City {name: $b}) CREATE (a)-[:ROAD {m: $m}]->(b)",
+                {"a": a, "b": b, "m": meters},
+            )
+        return gf
+
+    def test_geographic_heuristic(self, cities):
+        """A* follows WGS-84 locations to the same cheapest path as Dijkstra."""
+        query = (
+            "MATCH (a:City {name: 'London'}), (b:City {name: 'Birmingham'}) "
+            "CALL graphforge.shortestPath.%s(a, b, {weightProperty: 'm'}) YIELD path, cost "
+            "RETURN [n IN nodes(path) | n.name] AS route, cost"
+        )
+        astar = cities.execute(query % "astar")
+        dijkstra = cities.execute(query % "dijkstra")
+        assert [n.value for n in astar[0]["route"].value] == ["London", "Oxford", "Birmingham"]
+        assert astar[0]["cost"].value == dijkstra[0]["cost"].value == 205_000.0
+
+    def test_without_points(self, gf):
+        """Nodes without a point property fall back to Dijkstra's order."""
+        results = gf.execute(
+            "MATCH (a:N {id: 1}), (b:N {id: 4}) "
+            "CALL graphforge.shortestPath.astar(a, b, {weightProperty: 'w'}) YIELD cost "
+            "RETURN cost"
+        )
+        assert [r["cost"].value for r in results] == [5.0]
+
+
+class TestSingleSource:
+    """Tests for graphforge.shortestPath.singleSource."""
+
+    def test_streams_costs_in_order(self, gf):
+        """Every reachable node is returned once, cheapest first."""
+        results = gf.execute(
+            "MATCH (a:N {id: 1}) "
+            "CALL graphforge.shortestPath.singleSource(a, {weightProperty: 'w'}) "
+            "YIELD node, cost RETURN node.id AS id, cost"
+        )
+        assert [(r["id"].value, r["cost"].value) for r in results] == [
+            (1, 0.0),
+            (3, 1.0),
+            (2, 2.0),
+            (4, 5.0),
+            (5, 6.0),
+        ]
+
+    def test_limit(self, gf):
+        """LIMIT after the call keeps the nearest nodes."""
+        results = gf.execute(
+            "MATCH (a:N {id: 1}) "
+            "CALL graphforge.shortestPath.singleSource(a, {weightProperty: 'w'}) "
+            "YIELD node AS n RETURN n.id AS id LIMIT 2"
+        )
+        assert [r["id"].value for r in results] == [1, 3]
+
+    def test_per_row(self, gf):
+        """The procedure runs once for each incoming row."""
+        results = gf.execute(
+            "MATCH (a:N) WHERE a.id IN [4, 5] "
+            "CALL graphforge.shortestPath.singleSource(a) YIELD node "
+            "RETURN a.id AS src, count(node) AS reached ORDER BY src"
+        )
+        assert [(r["src"].value, r["reached"].value) for r in results] == [(4, 2), (5, 1)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_exhaustive_expansion(seed):
+    """Dijkstra costs agree with the cheapest of all variable-length paths."""
+    rng = random.Random(seed)
+    gf = GraphForge()
+    nodes = [gf.create_node(["V"], id=i) for i in range(10)]
+    for _ in range(25):
+        gf.create_relationship(rng.choice(nodes), rng.choice(nodes), "E", w=rng.randint(0, 9))
+
+    every = gf.execute(
+        "MATCH p = (a:V {id: 0})-[:E*1..9]->(b:V) "
+        "RETURN b.id AS b, reduce(s = 0, r IN relationships(p) | s + r.w) AS cost"
+    )
+    expected = {0: 0.0}
+    for row in every:
+        b, cost = row["b"].value, float(row["cost"].value)
+        expected[b] = min(cost, expected.get(b, cost))
+
+    results = gf.execute(
+        "MATCH (a:V {id: 0}) "
+        "CALL graphforge.shortestPath.singleSource(a, {weightProperty: 'w'}) YIELD node, cost "
+        "RETURN node.id AS b, cost"
+    )
+    assert {r["b"].value: r["cost"].value for r in results} == expected
+
+    for b, cost in expected.items():
+        results = gf.execute(
+            "MATCH (a:V {id: 0}), (b:V {id: $b}) "
+            "CALL graphforge.shortestPath.dijkstra(a, b, {weightProperty: 'w'}) YIELD path, cost "
+            "RETURN path, cost",
+            {"b": b},
+        )
+        assert results[0]["cost"].value == cost
+        path_cost = sum(edge.properties["w"].value for edge in results[0]["path"].relationships)
+        assert path_cost == cost
@@ -0,0 +1,133 @@
+"""Unit tests for GraphForge.create_nodes() and create_relationships()."""
+
+from pydantic import ValidationError
+import pytest
+
+from graphforge import GraphForge
+
+
+@pytest.mark.unit
+class TestCreateNodes:
+    """Tests for batch node creation."""
+
+    def test_row_batch(self):
+        """Rows of (labels, properties) create one node each, in order."""
+        gf = GraphForge()
+        nodes = gf.create_nodes([(["Person"], {"name": "Alice"}), (["Person", "Admin"], {})])
+
+        assert [node.id for node in nodes] == [1, 2]
+        assert nodes[0].properties["name"].value == "Alice"
+        assert nodes[1].labels == frozenset(["Person", "Admin"])
+        assert gf.graph.get_statistics().node_counts_by_label == {"Person": 2, "Admin": 1}
+
+    def test_columnar_batch(self):
+        """Columnar batches share labels and take one value per column per node."""
+        gf = GraphForge()
+        nodes = gf.create_nodes(
+            labels=["City"], columns={"name": ["Paris", "Rome"], "pop": [2.1, 2.8]}
+        )
+
+        assert len(nodes) == 2
+        assert {key: value.value for key, value in nodes[1].properties.items()} == {
+            "name": "Rome",
+            "pop": 2.8,
+        }
+        results = gf.execute("MATCH (c:City) RETURN c.name AS name ORDER BY name")
+        assert [r["name"].value for r in results] == ["Paris", "Rome"]
+
+    def test_ids_continue_after_batch(self):
+        """Single-node creation continues numbering after a batch."""
+        gf = GraphForge()
+        gf.create_nodes(labels=["A"], columns={"i": [1, 2, 3]})
+        assert gf.create_node(["A"]).id == 4
+
+    def test_invalid_label_adds_nothing(self):
+        """A batch with an invalid label is rejected as a whole."""
+        gf = GraphForge()
+        with pytest.raises(ValidationError):
+            gf.create_nodes([(["Good"], {}), (["1bad"], {})])
+        assert gf.graph.node_count() == 0
+        assert gf.create_node().id == 1
+
+    def test_unequal_columns_rejected(self):
+        """Columns must have equal lengths."""
+        gf = GraphForge()
+        with pytest.raises(ValueError, match="same length"):
+            gf.create_nodes(labels=["A"], columns={"a": [1, 2], "b": [1]})
+
+    def test_batch_forms_are_exclusive(self):
+        """Exactly one batch form must be given."""
+        gf = GraphForge()
+        with pytest.raises(ValueError, match="not both"):
+            gf.create_nodes([(["A"], {})], columns={"a": [1]})
+        with pytest.raises(ValueError, match="must be provided"):
+            gf.create_nodes()
+        with pytest.raises(ValueError, match="columnar"):
+            gf.create_nodes([(["A"], {})], labels=["A"])
+
+
+@pytest.mark.unit
+class TestCreateRelationships:
+    """Tests for batch relationship creation."""
+
+    def test_row_batch(self):
+        """Rows may omit properties."""
+        gf = GraphForge()
+        a, b, c = gf.create_nodes(labels=["P"], columns={"n": [1, 2, 3]})
+        edges = gf.create_relationships([(a, b, "KNOWS", {"since": 2020}), (b, c, "LIKES")])
+
+        assert [edge.id for edge in edges] == [1, 2]
+        assert edges[1].properties == {}
+        stats = gf.graph.get_statistics()
+        assert stats.edge_counts_by_type == {"KNOWS": 1, "LIKES": 1}
+        results = gf.execute("MATCH (x)-[r:KNOWS]->(y) RETURN x.n AS x, r.since AS s, y.n AS y")
+        assert (results[0]["x"].value, results[0]["s"].value, results[0]["y"].value) == (
+            1,
+            2020,
+            2,
+        )
+
+    def test_columnar_batch(self):
+        """Columnar batches take parallel src/dst sequences and property columns."""
+        gf = GraphForge()
+        a, b, c = gf.create_nodes(labels=["P"], columns={"n": [1, 2, 3]})
+        gf.create_relationships(
+            rel_type="R", src=[a, a, b], dst=[b, c, c], columns={"w": [1, 2, 3]}
+        )
+
+        stats = gf.graph.get_statistics()
+        assert stats.edge_counts_by_type == {"R": 3}
+        assert stats.avg_degree_by_type == {"R": 1.5}
+        results = gf.execute("MATCH ()-[r:R]->() RETURN sum(r.w) AS total")
+        assert results[0]["total"].value == 6
+
+    def test_columnar_batch_without_properties(self):
+        """Property columns are optional."""
+        gf = GraphForge()
+        a, b = gf.create_nodes(labels=["P"], columns={"n": [1, 2]})
+        edges = gf.create_relationships(rel_type="R", src=[a], dst=[b])
+        assert edges[0].properties == {}
+
+    def test_non_node_endpoint_rejected(self):
+        """Endpoints must be NodeRefs; nothing is added on failure."""
+        gf = GraphForge()
+        a, b = gf.create_nodes(labels=["P"], columns={"n": [1, 2]})
+        with pytest.raises(TypeError, match="dst must be a NodeRef"):
+            gf.create_relationships([(a, b, "R"), (a, "b", "R")])
+        assert gf.graph.edge_count() == 0
+
+    def test_invalid_type_rejected(self):
+        """Relationship types are validated."""
+        gf = GraphForge()
+        a, b = gf.create_nodes(labels=["P"], columns={"n": [1, 2]})
+        with pytest.raises(ValidationError):
+            gf.create_relationships(rel_type="bad-type", src=[a], dst=[b])
+
+    def test_columnar_length_mismatch(self):
+        """src, dst and columns must have equal lengths."""
+        gf = GraphForge()
+        a, b = gf.create_nodes(labels=["P"], columns={"n": [1, 2]})
+        with pytest.raises(ValueError, match="same length"):
+            gf.create_relationships(rel_type="R", src=[a, b], dst=[b])
+        with pytest.raises(ValueError, match="require rel_type"):
+            gf.create_relationships(src=[a], dst=[b])
@@ -101,7 +101,7 @@ class TestClearTransactionState:
 
         # Should not be in a transaction anymore
         assert gf._in_transaction is False
-        assert gf._transaction_snapshot is None
+        assert gf.graph.in_transaction is False
 
     def test_can_begin_transaction_after_clear(self):
         """After clear(), a new transaction can be started."""
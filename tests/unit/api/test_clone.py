@@ -206,6 +206,41 @@ class TestCloneIdCounters:
         assert new_edge.id == 2
 
 
+@pytest.mark.unit
+class TestCloneIndexes:
+    """Test that clone() copies property indexes."""
+
+    def test_clone_copies_property_indexes(self):
+        """Clone should keep every property index, with its entries."""
+        gf = GraphForge()
+        gf.execute("CREATE INDEX pn FOR (n:P) ON (n.name)")
+        gf.execute("CREATE (:P {name: 'Alice'})")
+
+        cloned = gf.clone()
+
+        assert [index.name for index in cloned.graph.property_indexes()] == ["pn"]
+        assert cloned.graph.index_version == gf.graph.index_version
+        with pytest.raises(ValueError, match="already exists"):
+            cloned.execute("CREATE INDEX pn FOR (n:P) ON (n.name)")
+        results = cloned.execute("MATCH (n:P) WHERE n.name = 'Alice' RETURN n.name AS name")
+        assert [r["name"].value for r in results] == ["Alice"]
+
+    def test_clone_property_indexes_independent(self):
+        """Writes and index drops on the clone should not affect the original."""
+        gf = GraphForge()
+        gf.execute("CREATE INDEX pn FOR (n:P) ON (n.name)")
+
+        cloned = gf.clone()
+        cloned.execute("CREATE (:P {name: 'Bob'})")
+
+        assert gf.graph.property_indexes()[0] is not cloned.graph.property_indexes()[0]
+        assert gf.execute("MATCH (n:P {name: 'Bob'}) RETURN count(n) AS c")[0]["c"].value == 0
+        assert cloned.execute("MATCH (n:P {name: 'Bob'}) RETURN count(n) AS c")[0]["c"].value == 1
+
+        cloned.execute("DROP INDEX pn")
+        assert len(gf.graph.property_indexes()) == 1
+
+
 @pytest.mark.unit
 class TestCloneErrors:
     """Test clone() error conditions."""
@@ -235,14 +270,20 @@ class TestCloneTransactionState:
     """Test that clone() copies transaction state correctly."""
 
     def test_clone_during_open_transaction(self):
-        """Clone should copy _in_transaction and deep-copy _transaction_snapshot."""
+        """Clone should copy _in_transaction and an independent undo log."""
         gf = GraphForge()
         gf.execute("CREATE (:Person {name: 'Alice'})")
         gf.begin()
+        gf.execute("CREATE (:Person {name: 'Bob'})")
+        gf.execute("MATCH (p:Person {name: 'Alice'}) SET p.age = 30")
 
         cloned = gf.clone()
 
         assert cloned._in_transaction == gf._in_transaction
-        assert gf._transaction_snapshot is not None
-        assert cloned._transaction_snapshot is not None
-        assert cloned._transaction_snapshot is not gf._transaction_snapshot
+        assert cloned.graph._undo_log is not gf.graph._undo_log
+
+        # Rolling back the clone reverts the clone only
+        cloned.rollback()
+        results = cloned.execute("MATCH (p:Person) RETURN p.name AS name, p.age IS NULL AS no_age")
+        assert [(r["name"].value, r["no_age"].value) for r in results] == [("Alice", True)]
+        assert gf.execute("MATCH (p:Person) RETURN count(p) AS c")[0]["c"].value == 2
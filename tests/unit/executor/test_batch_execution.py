@@ -0,0 +1,141 @@
+"""Tests for batched execution of node scans, filters and projections."""
+
+import pytest
+
+from graphforge import GraphForge
+from graphforge.ast.expression import BinaryOp, Literal, PropertyAccess
+from graphforge.executor.batch import BatchCompiler
+from graphforge.executor.evaluator import ExecutionContext
+
+
+def populate(gf):
+    """Create :P nodes with mixed property types, a few linked by :R."""
+    gf.execute(
+        "UNWIND range(1, 20) AS i "
+        "CREATE (:P {i: i, score: i % 7, f: i / 4.0, name: 'p' + toString(i), "
+        "flag: i % 3 = 0})"
+    )
+    gf.execute("CREATE (:P {name: 'no-i'}), (:P {i: 'text', name: 'str-i'}), (:Q {i: 5})")
+    gf.execute("MATCH (a:P {i: 1}), (b:P {i: 2}) CREATE (a)-[:R]->(b)")
+
+
+@pytest.fixture
+def graphs():
+    """The same graph with row-at-a-time and batched execution (batches of 3)."""
+    row, batched = GraphForge(), GraphForge(scan_batch_size=3)
+    populate(row)
+    populate(batched)
+    return row, batched
+
+
+def normalize(rows):
+    """Order-insensitive comparable form of result rows."""
+
+    def value(v):
+        if hasattr(v, "id"):
+            return ("node", v.id)
+        return v.value
+
+    return sorted(repr(sorted((key, value(v)) for key, v in row.items())) for row in rows)
+
+
+QUERIES = [
+    "MATCH (n:P) RETURN n.i AS i",
+    "MATCH (n:P) WHERE n.i > 10 RETURN n.i AS i, n.name AS name",
+    "MATCH (n:P) WHERE n.i >= 3 AND n.i <= 6 OR n.name = 'p20' RETURN n.name AS name",
+    "MATCH (n:P) WHERE n.f < 2.5 RETURN n.i AS i, n.f * 2 AS f2",
+    "MATCH (n:P) WHERE n.i <> 4 AND n.score = 1 RETURN n.i + 1 AS i, n.i - n.score AS d",
+    "MATCH (n:P) WHERE n.name STARTS WITH 'p1' RETURN toUpper(n.name) AS u",
+    "MATCH (n:P) WHERE NOT n.flag RETURN n.i AS i",
+    "MATCH (n:P) WHERE n.i IS NULL RETURN n.name AS name",
+    "MATCH (n:P) WHERE n.i IS NOT NULL RETURN n.i > 5 AS big, n.i = 'text' AS t",
+    "MATCH (n:P) WHERE n.flag XOR n.i > 10 RETURN n.i AS i",
+    "MATCH (n:P) WHERE n.i IN [1, 2, 3] RETURN n",
+    "MATCH (n:P) WHERE n.name <> 'str-i' RETURN n.i < n.score AS lt, n.i % 4 AS m, 1 AS one",
+    "MATCH (n:P) WHERE n.i > 15 RETURN n.i AS i, CASE WHEN n.flag THEN 'y' ELSE 'n' END AS c",
+    "MATCH (n:P:Q) RETURN n.i AS i",
+    "MATCH (n:P) WHERE n.i < 4 MATCH (n)-[:R]->(m) RETURN n.i AS a, m.i AS b",
+    "MATCH (n:P) WHERE n.i > 1 WITH n WHERE n.score = 2 RETURN n.i AS i",
+    "MATCH (n:P) WHERE n.i > 3 RETURN n.i AS i ORDER BY i LIMIT 4",
+    "MATCH (n:P) WHERE n.i > 3 RETURN count(*) AS c",
+    "MATCH (a:P {i: 1}) MATCH (a:P) WHERE a.score = 1 RETURN a.i AS i",
+]
+
+
+@pytest.mark.unit
+class TestBatchedResults:
+    """Batched execution returns exactly the rows of row-at-a-time execution."""
+
+    @pytest.mark.parametrize("query", QUERIES)
+    def test_same_rows(self, graphs, query):
+        """Results match for filters, projections and downstream operators."""
+        row, batched = graphs
+        assert normalize(batched.execute(query)) == normalize(row.execute(query))
+
+    def test_parameters(self, graphs):
+        """Parameters are compared column-wise like literals."""
+        row, batched = graphs
+        query = "MATCH (n:P) WHERE n.i >= $low AND n.name <> $name RETURN n.i AS i"
+        params = {"low": 15, "name": "p17"}
+        assert normalize(batched.execute(query, params)) == normalize(row.execute(query, params))
+
+    def test_short_circuit_avoids_errors(self):
+        """The right side of AND is not evaluated for rows the left side rejects."""
+        # Without the optimizer, conjuncts are evaluated in query order
+        row = GraphForge(enable_optimizer=False)
+        batched = GraphForge(enable_optimizer=False, scan_batch_size=3)
+        populate(row)
+        populate(batched)
+        query = (
+            "MATCH (n:P) WHERE n.i IS NOT NULL AND n.name <> 'str-i' AND n.i - 1 > 5 "
+            "RETURN n.i AS i"
+        )
+        assert normalize(batched.execute(query)) == normalize(row.execute(query))
+
+    def test_errors_are_raised(self, graphs):
+        """Errors raised row-at-a-time are raised by batches too."""
+        _, batched = graphs
+        with pytest.raises(TypeError):
+            batched.execute("MATCH (n:P) WHERE n.i - 1 > 5 RETURN n.i AS i")
+        with pytest.raises(TypeError):
+            batched.execute("MATCH (n:P) WHERE NOT n.name RETURN n")
+
+
+@pytest.mark.unit
+class TestBatchConfiguration:
+    """Tests for enabling batched execution."""
+
+    def test_disabled_by_default(self):
+        """GraphForge executes row at a time unless scan_batch_size is given."""
+        assert GraphForge().executor.scan_batch_size is None
+
+    @pytest.mark.parametrize("size", [0, -1])
+    def test_invalid_scan_batch_size(self, size):
+        """scan_batch_size must be positive."""
+        with pytest.raises(ValueError, match="scan_batch_size"):
+            GraphForge(scan_batch_size=size)
+
+    def test_clone_keeps_scan_batch_size(self):
+        """Clones execute in the same mode."""
+        assert GraphForge(scan_batch_size=64).clone().executor.scan_batch_size == 64
+
+    def test_freeze_keeps_scan_batch_size(self):
+        """Frozen snapshots keep the scan batch size."""
+        assert GraphForge(scan_batch_size=64).freeze().executor.scan_batch_size == 64
+
+
+@pytest.mark.unit
+class TestBatchCompiler:
+    """Tests for column and predicate evaluation over a batch of nodes."""
+
+    def test_predicate_truth_values(self, graphs):
+        """Predicates yield True, False or None per node."""
+        _, gf = graphs
+        nodes = sorted(gf.graph.get_nodes_by_label("P"), key=lambda node: node.id)
+        # i = 1, 2, 3 and a node without i
+        nodes = [*nodes[:3], nodes[20]]
+        expr = BinaryOp(
+            op=">", left=PropertyAccess(variable="n", property="i"), right=Literal(value=2)
+        )
+        truths = BatchCompiler(gf.executor, "n").predicate(expr)(nodes, ExecutionContext())
+        assert truths == [False, False, True, None]
@@ -0,0 +1,84 @@
+"""Tests for ExecutionContext bindings shared between parent and child contexts."""
+
+import pytest
+
+from graphforge.executor.evaluator import _MAX_CONTEXT_DEPTH, ExecutionContext
+from graphforge.types.values import CypherInt
+
+
+@pytest.fixture
+def parent():
+    """Context binding ``a`` and ``b``."""
+    ctx = ExecutionContext()
+    ctx.bind("a", CypherInt(1))
+    ctx.bind("b", CypherInt(2))
+    return ctx
+
+
+@pytest.mark.unit
+class TestChildContexts:
+    """Tests for ExecutionContext.child()."""
+
+    def test_child_sees_parent_bindings(self, parent):
+        """Variables bound on the parent are visible through the child."""
+        child = parent.child()
+        assert child.get("a").value == 1
+        assert child.has("b")
+        assert not child.has("c")
+        with pytest.raises(KeyError):
+            child.get("c")
+
+    def test_child_bindings_do_not_leak(self, parent):
+        """Binding on a child shadows the parent without modifying it."""
+        child = parent.child()
+        child.bind("a", CypherInt(10))
+        child.bind("c", CypherInt(3))
+        assert child.get("a").value == 10
+        assert parent.get("a").value == 1
+        assert not parent.has("c")
+
+    def test_siblings_are_independent(self, parent):
+        """Children of one parent do not see each other's bindings."""
+        left, right = parent.child(), parent.child()
+        left.bind("x", CypherInt(1))
+        right.bind("x", CypherInt(2))
+        assert (left.get("x").value, right.get("x").value) == (1, 2)
+
+    def test_bindings_flattens_the_chain(self, parent):
+        """The bindings dict holds every visible variable, innermost first."""
+        child = parent.child()
+        child.bind("a", CypherInt(10))
+        grandchild = child.child()
+        grandchild.bind("c", CypherInt(3))
+        assert {name: value.value for name, value in grandchild.bindings.items()} == {
+            "a": 10,
+            "b": 2,
+            "c": 3,
+        }
+        # The flattened dict belongs to the context: writes to it stick
+        grandchild.bindings["d"] = CypherInt(4)
+        assert grandchild.get("d").value == 4
+        assert not child.has("d")
+
+    def test_assigning_bindings_replaces_them(self, parent):
+        """Assigning bindings detaches the context from its parent."""
+        child = parent.child()
+        child.bindings = {"z": CypherInt(0)}
+        assert not child.has("a")
+        assert child.get("z").value == 0
+
+    def test_deep_chains_are_flattened(self, parent):
+        """Lookups never walk more than the maximum chain depth."""
+        ctx = parent
+        for i in range(3 * _MAX_CONTEXT_DEPTH):
+            ctx = ctx.child()
+            ctx.bind(f"v{i}", CypherInt(i))
+        depth = 0
+        link = ctx
+        while link._parent is not None:
+            link = link._parent
+            depth += 1
+        assert depth <= _MAX_CONTEXT_DEPTH
+        assert ctx.get("a").value == 1
+        assert ctx.get("v0").value == 0
+        assert len(ctx.bindings) == 2 + 3 * _MAX_CONTEXT_DEPTH
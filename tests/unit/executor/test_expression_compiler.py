@@ -0,0 +1,162 @@
+"""Tests for compiling expressions into closures.
+
+Compiled expressions must agree with evaluate_expression() on every value,
+including NULL propagation and three-valued logic, and raise the same errors.
+"""
+
+import pytest
+
+from graphforge import GraphForge
+from graphforge.ast.expression import BinaryOp, Literal, Variable
+from graphforge.executor.compiler import compile_expression
+from graphforge.executor.evaluator import ExecutionContext, evaluate_expression
+from graphforge.types.values import CypherInt, CypherMap, CypherNull, CypherString
+
+
+@pytest.fixture
+def gf():
+    """GraphForge instance holding one :Person node."""
+    gf = GraphForge()
+    gf.execute("CREATE (:Person {name: 'Ada', age: 36, tags: ['a', 'b']})")
+    return gf
+
+
+@pytest.fixture
+def ctx(gf):
+    """Context binding a node, a map, a NULL, an integer and a string."""
+    ctx = ExecutionContext()
+    ctx.bind("n", gf.graph.get_nodes_by_label("Person")[0])
+    ctx.bind("m", CypherMap({"k": CypherInt(1)}))
+    ctx.bind("z", CypherNull())
+    ctx.bind("i", CypherInt(7))
+    ctx.bind("s", CypherString("graph"))
+    return ctx
+
+
+def parse_expression(gf, text):
+    """Parse a single Cypher expression."""
+    return gf.parser.parse(f"RETURN {text} AS x").clauses[-1].items[0].expression
+
+
+def to_python(value):
+    """Comparable representation of a CypherValue."""
+    if isinstance(value, CypherNull):
+        return None
+    if isinstance(value.value, list):
+        return [to_python(item) for item in value.value]
+    return value.value
+
+
+EXPRESSIONS = [
+    "n.age + 1",
+    "n.age * 2 - i",
+    "n.missing",
+    "m.k",
+    "z.k",
+    "n.age > 30 AND n.name STARTS WITH 'A'",
+    "n.age < 30 OR z",
+    "z AND false",
+    "z OR true",
+    "z XOR true",
+    "NOT z",
+    "NOT (n.age = 36)",
+    "n.missing IS NULL",
+    "n.name IS NOT NULL",
+    "i IN [1, 7, 9]",
+    "i IN [1, z]",
+    "s CONTAINS 'ra'",
+    "n.age / 5",
+    "n.age % 5",
+    "-i",
+    "-9223372036854775808",
+    "toUpper(s)",
+    "size(n.tags)",
+    "toUpper(z)",
+    "coalesce(z, s)",
+    "length(s)",
+    "reverse(s)",
+    "head(n.tags)",
+    "abs(-i)",
+    "CASE WHEN i > 5 THEN 'big' WHEN z THEN 'null' ELSE 'small' END",
+    "CASE WHEN z THEN 1 END",
+    "[x IN n.tags WHERE x <> 'a']",
+    "[i, s, 1 + 2]",
+    "1 + 2 * 3",
+    "id(n) >= 0",
+    "labels(n)",
+]
+
+
+@pytest.mark.unit
+class TestCompiledEquivalence:
+    """Compiled expressions evaluate to the same values as the interpreter."""
+
+    @pytest.mark.parametrize("text", EXPRESSIONS)
+    def test_same_value(self, gf, ctx, text):
+        """The closure and evaluate_expression() agree."""
+        expr = parse_expression(gf, text)
+        expected = evaluate_expression(expr, ctx, gf.executor)
+        assert to_python(compile_expression(expr, gf.executor)(ctx)) == to_python(expected)
+
+    @pytest.mark.parametrize(
+        ("text", "error"),
+        [
+            ("i.k", TypeError),
+            ("NOT i", TypeError),
+            ("i AND true", TypeError),
+            ("unbound + 1", KeyError),
+            ("$missing", ValueError),
+            ("'a' - 1", TypeError),
+        ],
+    )
+    def test_same_errors(self, gf, ctx, text, error):
+        """Errors are raised when the closure runs, not when it is compiled."""
+        expr = parse_expression(gf, text)
+        with pytest.raises(error):
+            evaluate_expression(expr, ctx, gf.executor)
+        compiled = compile_expression(expr, gf.executor)
+        with pytest.raises(error):
+            compiled(ctx)
+
+
+@pytest.mark.unit
+class TestCompilation:
+    """Compile-time behavior of compiled expressions."""
+
+    def test_constant_folding(self, gf):
+        """Operators over literals are evaluated once, at compile time."""
+        compiled = compile_expression(parse_expression(gf, "2 * 3 + 1"), gf.executor)
+        assert compiled.constant_value.value == 7
+
+    def test_variables_are_not_folded(self):
+        """Expressions reading the row are evaluated per row."""
+        compiled = compile_expression(
+            BinaryOp(op="+", left=Variable(name="a"), right=Literal(value=1))
+        )
+        assert not hasattr(compiled, "constant_value")
+        ctx = ExecutionContext()
+        ctx.bind("a", CypherInt(1))
+        assert compiled(ctx).value == 2
+
+    def test_list_literals_are_rebuilt_per_row(self, gf, ctx):
+        """Mutable literal values are not shared between rows."""
+        compiled = compile_expression(parse_expression(gf, "[1, 2]"), gf.executor)
+        assert compiled(ctx) is not compiled(ctx)
+
+    def test_parameters_are_read_per_execution(self, gf):
+        """Parameters bound after compilation are used."""
+        rows = gf.prepare("UNWIND [1, 2] AS i WITH i WHERE i > $min RETURN i")
+        assert [row["i"].value for row in rows.execute({"min": 0})] == [1, 2]
+        assert [row["i"].value for row in rows.execute({"min": 1})] == [2]
+
+    def test_custom_functions_override_builtins(self, gf):
+        """Functions registered after compilation take precedence, as when interpreted."""
+        query = gf.prepare("UNWIND ['a'] AS s RETURN toUpper(s) AS u")
+        assert query.execute()[0]["u"].value == "A"
+        gf.register_function("toUpper", lambda _args, _ctx, _executor: CypherString("custom"))
+        assert query.execute()[0]["u"].value == "custom"
+
+    def test_executor_reuses_compiled_closures(self, gf):
+        """An executor compiles each expression of a plan once."""
+        expr = parse_expression(gf, "n.age > 30")
+        assert gf.executor._compile_expression(expr) is gf.executor._compile_expression(expr)
@@ -0,0 +1,85 @@
+"""Tests for linked traversal paths."""
+
+from itertools import pairwise
+
+import pytest
+
+from graphforge import GraphForge
+from graphforge.executor.evaluator import ExecutionContext
+from graphforge.executor.paths import PathLink, path_edges, path_lists
+from graphforge.planner.operators import ExpandVariableLength
+from graphforge.types.graph import EdgeRef, NodeRef
+
+
+@pytest.fixture
+def chain():
+    """Nodes 0-3 and edges 0->1, 1->2, 2->3."""
+    nodes = [NodeRef(id=i, labels=frozenset(), properties={}) for i in range(4)]
+    edges = [
+        EdgeRef(id=10 + i, type="R", src=nodes[i], dst=nodes[i + 1], properties={})
+        for i in range(3)
+    ]
+    return nodes, edges
+
+
+@pytest.mark.unit
+class TestPathLink:
+    """Tests for building lists from linked paths."""
+
+    def test_empty_path(self, chain):
+        """No link is the path holding only the start node."""
+        nodes, _ = chain
+        assert path_lists(nodes[0], None) == ([nodes[0]], [])
+        assert path_edges(None) == []
+
+    def test_lists_in_path_order(self, chain):
+        """Nodes and relationships come out first step first."""
+        nodes, edges = chain
+        link = None
+        for edge in edges:
+            link = PathLink(edge, edge.dst, link)
+        assert path_lists(nodes[0], link) == (nodes, edges)
+        assert path_edges(link) == edges
+
+    def test_shared_prefix(self, chain):
+        """Extending a path leaves the path it extends unchanged."""
+        nodes, edges = chain
+        prefix = PathLink(edges[0], nodes[1], None)
+        longer = PathLink(edges[1], nodes[2], prefix)
+        back = EdgeRef(id=20, type="R", src=nodes[1], dst=nodes[0], properties={})
+        other = PathLink(back, nodes[0], prefix)
+        assert longer.previous is other.previous
+        assert path_edges(prefix) == [edges[0]]
+        assert path_lists(nodes[0], other)[0] == [nodes[0], nodes[1], nodes[0]]
+
+
+@pytest.mark.unit
+class TestLinkedTraversals:
+    """Traversals build path values only for bound variables."""
+
+    def test_deep_variable_length_paths(self):
+        """Long chains expand with correct paths and relationship lists."""
+        gf = GraphForge()
+        nodes = [gf.create_node(["C"], i=i) for i in range(300)]
+        for a, b in pairwise(nodes):
+            gf.create_relationship(a, b, "NEXT")
+        rows = gf.execute(
+            "MATCH p = (a:C {i: 0})-[rs:NEXT*]->(b:C {i: 299}) RETURN p, rs, length(p) AS n"
+        )
+        assert rows[0]["n"].value == 299
+        assert [node.id for node in rows[0]["p"].nodes] == [node.id for node in nodes]
+        assert rows[0]["rs"] == rows[0]["p"].relationships
+
+    def test_anonymous_relationship_list_not_bound(self):
+        """Planner-generated relationship variables get no edge list."""
+        gf = GraphForge()
+        a, b = gf.create_node(["C"]), gf.create_node(["C"])
+        gf.create_relationship(a, b, "NEXT")
+        ctx = ExecutionContext()
+        ctx.bind("a", a)
+        expand = ExpandVariableLength(
+            src_var="a", edge_var="__anon_0", dst_var="b", edge_types=[], direction="OUT"
+        )
+        [row] = gf.executor._execute_variable_expand(expand, [ctx])
+        assert row.get("b") == b
+        assert not row.has("__anon_0")
@@ -0,0 +1,190 @@
+"""Tests for built-in procedures and the CALL procedure clause."""
+
+import pytest
+
+from graphforge import GraphForge
+from graphforge.ast.clause import ProcedureCallClause
+from graphforge.ast.expression import Literal, Variable
+from graphforge.executor.procedures import (
+    PROCEDURES,
+    _point_distance,
+    _search,
+    call_procedure,
+    get_procedure,
+)
+from graphforge.parser.parser import parse_cypher
+from graphforge.types.values import (
+    CypherBool,
+    CypherFloat,
+    CypherInt,
+    CypherMap,
+    CypherPoint,
+    CypherString,
+)
+
+
+@pytest.mark.unit
+class TestProcedureCallParsing:
+    """Tests for parsing CALL name(args) YIELD ..."""
+
+    def test_arguments_and_yield(self):
+        """Dotted names, argument expressions and YIELD aliases are parsed."""
+        ast = parse_cypher("MATCH (a) CALL my.proc(a, 1) YIELD x, y AS z RETURN z")
+        clause = ast.clauses[1]
+        assert isinstance(clause, ProcedureCallClause)
+        assert clause.name == "my.proc"
+        assert clause.arguments == [Variable(name="a"), Literal(value=1)]
+        assert clause.yield_items == [("x", "x"), ("y", "z")]
+
+    def test_without_arguments_or_yield(self):
+        """Arguments and YIELD are optional."""
+        clause = parse_cypher("CALL my.proc() RETURN 1").clauses[0]
+        assert clause.arguments == []
+        assert clause.yield_items is None
+
+
+@pytest.mark.unit
+class TestProcedureRegistry:
+    """Tests for looking up and calling procedures."""
+
+    def test_lookup_is_case_insensitive(self):
+        """Procedure names are matched regardless of case."""
+        procedure = get_procedure("GRAPHFORGE.SHORTESTPATH.DIJKSTRA")
+        assert procedure is PROCEDURES["graphforge.shortestpath.dijkstra"]
+
+    def test_unknown_procedure(self):
+        """Unknown names raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown procedure"):
+            get_procedure("graphforge.nope")
+
+    @pytest.mark.parametrize("count", [1, 4])
+    def test_argument_count(self, count):
+        """Calls must give every parameter except a trailing config."""
+        procedure = get_procedure("graphforge.shortestPath.dijkstra")
+        gf = GraphForge()
+        with pytest.raises(ValueError, match="expects arguments"):
+            call_procedure(procedure, gf.graph, [gf.create_node([])] * count)
+
+
+@pytest.mark.unit
+class TestSearch:
+    """Tests for the heap-based search behind the shortest path procedures."""
+
+    @pytest.fixture
+    def grid(self):
+        """A 6x6 grid of Cartesian points joined both ways by edges of weight 1."""
+        gf = GraphForge()
+        nodes = {}
+        for x in range(6):
+            for y in range(6):
+                nodes[x, y] = gf.execute(
+                    f"CREATE (n:G {{location: point({{x: {x}, y: {y}}})}}) RETURN n"
+                )[0]["n"]
+        for (x, y), node in nodes.items():
+            for neighbour in ((x + 1, y), (x, y + 1)):
+                if neighbour in nodes:
+                    gf.create_relationship(node, nodes[neighbour], "E")
+                    gf.create_relationship(nodes[neighbour], node, "E")
+        return gf, nodes
+
+    def steps(self, gf):
+        def steps(node):
+            for edge in gf.graph.get_outgoing_edges(node.id):
+                yield edge, edge.dst, 1.0
+
+        return steps
+
+    def test_settles_cheapest_first(self, grid):
+        """Without a heuristic nodes come out in non-decreasing cost order."""
+        gf, nodes = grid
+        settled = list(_search(nodes[0, 0], self.steps(gf), {}))
+        assert len(settled) == len(nodes)
+        assert [cost for _, cost in settled] == sorted(cost for _, cost in settled)
+        costs = {node.id: cost for node, cost in settled}
+        assert costs[nodes[5, 5].id] == 10.0
+
+    def test_heuristic_settles_fewer_nodes(self, grid):
+        """A* reaches the goal after settling fewer nodes than Dijkstra."""
+        gf, nodes = grid
+        source, goal = nodes[0, 0], nodes[5, 0]
+        goal_point = goal.properties["location"]
+
+        def settled_until_goal(heuristic):
+            for settled, (node, cost) in enumerate(
+                _search(source, self.steps(gf), {}, heuristic), start=1
+            ):
+                if node.id == goal.id:
+                    return settled, cost
+            raise AssertionError("goal not reached")
+
+        dijkstra = settled_until_goal(None)
+        astar = settled_until_goal(
+            lambda node: _point_distance(node.properties["location"], goal_point)
+        )
+        assert dijkstra[1] == astar[1] == 5.0
+        assert astar[0] < dijkstra[0]
+
+
+@pytest.mark.unit
+class TestPointDistance:
+    """Tests for the A* heuristic distance."""
+
+    def test_cartesian(self):
+        """Cartesian points use Euclidean distance."""
+        a = CypherPoint({"x": 0.0, "y": 0.0})
+        b = CypherPoint({"x": 3.0, "y": 4.0})
+        assert _point_distance(a, b) == 5.0
+
+    def test_wgs84(self):
+        """Geographic points use the great-circle distance in meters."""
+        a = CypherPoint({"latitude": 0.0, "longitude": 0.0})
+        b = CypherPoint({"latitude": 0.0, "longitude": 1.0})
+        assert _point_distance(a, b) == pytest.approx(111_195, rel=1e-3)
+
+    def test_mixed_coordinate_systems(self):
+        """Points in different coordinate systems are estimated at 0."""
+        a = CypherPoint({"x": 0.0, "y": 0.0})
+        b = CypherPoint({"latitude": 0.0, "longitude": 1.0})
+        assert _point_distance(a, b) == 0.0
+
+
+@pytest.mark.unit
+class TestConfig:
+    """Tests for the config map argument."""
+
+    def test_unknown_key(self):
+        """Misspelled config keys are rejected."""
+        gf = GraphForge()
+        node = gf.create_node([])
+        procedure = get_procedure("graphforge.shortestPath.singleSource")
+        config = CypherMap({"weight": CypherString("w")})
+        with pytest.raises(ValueError, match="unknown config keys: weight"):
+            list(call_procedure(procedure, gf.graph, [node, config]))
+
+    def test_invalid_direction(self):
+        """Direction must be OUT, IN or UNDIRECTED."""
+        gf = GraphForge()
+        node = gf.create_node([])
+        procedure = get_procedure("graphforge.shortestPath.singleSource")
+        config = CypherMap({"direction": CypherString("sideways")})
+        with pytest.raises(ValueError, match="direction"):
+            list(call_procedure(procedure, gf.graph, [node, config]))
+
+    @pytest.mark.parametrize(
+        ("weight", "error", "message"),
+        [
+            (CypherInt(-5), ValueError, "defaultWeight is negative"),
+            (CypherFloat(float("nan")), ValueError, "defaultWeight must be finite"),
+            (CypherFloat(float("inf")), ValueError, "defaultWeight must be finite"),
+            (CypherString("far"), TypeError, "defaultWeight must be a number"),
+            (CypherBool(True), TypeError, "defaultWeight must be a number"),
+        ],
+    )
+    def test_invalid_default_weight(self, weight, error, message):
+        """defaultWeight is checked like relationship weights."""
+        gf = GraphForge()
+        node = gf.create_node([])
+        procedure = get_procedure("graphforge.shortestPath.singleSource")
+        config = CypherMap({"defaultWeight": weight})
+        with pytest.raises(error, match=message):
+            list(call_procedure(procedure, gf.graph, [node, config]))
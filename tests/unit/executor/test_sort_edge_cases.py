@@ -5,11 +5,19 @@ Tests cover:
 2. Boolean comparison in ORDER BY
 3. List comparison in ORDER BY (lexicographic)
 4. Duration comparison in ORDER BY
+5. Ordering across types, nodes and temporal kinds
+6. Multiple keys with mixed directions
+7. ORDER BY items repeating an aggregate item
 """
 
+import math
+
+import isodate
 import pytest
 
 from graphforge.api import GraphForge
+from graphforge.executor.executor import _order_key
+from graphforge.types.values import CypherFloat, CypherInt, CypherNull
 
 
 @pytest.mark.unit
@@ -236,3 +244,168 @@ class TestMixedTypeOrdering:
         result = gf.execute("MATCH (i:Item) RETURN i.value AS value ORDER BY value ASC")
 
         assert len(result) == 4
+
+    def test_mixed_types_follow_type_rank(self):
+        """Different types sort lists < strings < booleans < numbers < NULL."""
+        gf = GraphForge()
+        result = gf.execute(
+            "UNWIND [2, null, 'b', true, [1], 1.5, 'a', false] AS value RETURN value ORDER BY value"
+        )
+
+        values = [row["value"].value for row in result]
+        assert [item.value for item in values[0]] == [1]
+        assert values[1:] == [
+            "a",
+            "b",
+            False,
+            True,
+            1.5,
+            2,
+            None,
+        ]
+
+    def test_mixed_types_descending_puts_null_first(self):
+        """DESC reverses the type rank, so NULL comes first."""
+        gf = GraphForge()
+        result = gf.execute("UNWIND [1, 'a', null, true] AS value RETURN value ORDER BY value DESC")
+
+        assert [row["value"].value for row in result] == [None, 1, True, "a"]
+
+    def test_nan_sorts_after_numbers(self):
+        """NaN is ordered after every other number and before NULL."""
+        values = [CypherFloat(math.nan), CypherNull(), CypherInt(2), CypherFloat(-1.5)]
+
+        ordered = sorted(values, key=_order_key)
+
+        assert [value.value for value in ordered[:2]] == [-1.5, 2]
+        assert math.isnan(ordered[2].value)
+        assert isinstance(ordered[3], CypherNull)
+
+
+@pytest.mark.unit
+class TestPreviouslyUnorderableValues:
+    """Values whose comparison used to raise now have a defined order."""
+
+    def test_order_by_node(self):
+        """Nodes are ordered by ID."""
+        gf = GraphForge()
+        gf.execute("UNWIND range(1, 3) AS i CREATE (:Item {i: i})")
+
+        result = gf.execute("MATCH (n:Item) RETURN n.i AS i ORDER BY n DESC")
+
+        assert [row["i"].value for row in result] == [3, 2, 1]
+
+    def test_durations_with_and_without_months(self):
+        """Durations are ordered by months first, then by their remaining time."""
+        gf = GraphForge()
+        result = gf.execute(
+            "UNWIND [duration('P1M'), duration('P40D'), duration('P1Y')] AS d RETURN d ORDER BY d"
+        )
+
+        assert [isodate.duration_isoformat(row["d"].value) for row in result] == [
+            "P40D",
+            "P1M",
+            "P1Y",
+        ]
+
+    def test_zoned_and_local_datetimes(self):
+        """Zoned datetimes sort before local datetimes."""
+        gf = GraphForge()
+        result = gf.execute(
+            "UNWIND [localdatetime('2020-01-01T00:00:00'), datetime('2021-01-01T00:00:00Z'), "
+            "datetime('2020-06-01T00:00:00+02:00')] AS t RETURN t ORDER BY t"
+        )
+
+        years = [(row["t"].value.year, row["t"].value.tzinfo is None) for row in result]
+        assert years == [(2020, False), (2021, False), (2020, True)]
+
+
+@pytest.mark.unit
+class TestMultiKeyOrdering:
+    """Tests for ORDER BY with several keys and directions."""
+
+    def test_mixed_directions(self):
+        """Each key applies its own direction, with ties broken by the next key."""
+        gf = GraphForge()
+        result = gf.execute(
+            "UNWIND [[1, 'b'], [2, 'a'], [1, 'c'], [2, null], [1, 'a']] AS pair "
+            "RETURN pair[0] AS x, pair[1] AS y ORDER BY x DESC, y"
+        )
+
+        assert [(row["x"].value, row["y"].value) for row in result] == [
+            (2, "a"),
+            (2, None),
+            (1, "a"),
+            (1, "b"),
+            (1, "c"),
+        ]
+
+    def test_equal_keys_keep_input_order(self):
+        """Sorting is stable."""
+        gf = GraphForge()
+        result = gf.execute(
+            "UNWIND [[1, 'x'], [0, 'y'], [1, 'z'], [0, 'w']] AS pair "
+            "RETURN pair[1] AS tag ORDER BY pair[0] DESC"
+        )
+
+        assert [row["tag"].value for row in result] == ["x", "z", "y", "w"]
+
+
+@pytest.mark.unit
+class TestOrderByAggregates:
+    """Tests for ORDER BY expressions that contain an aggregation."""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (person) WITH avg(person.age) AS avgAge "
+            "ORDER BY $age + avg(person.age) - 1000 RETURN avgAge",
+            "MATCH (person) RETURN avg(person.age) AS avgAge "
+            "ORDER BY $age + avg(person.age) - 1000",
+        ],
+    )
+    def test_constants_and_parameters_around_aggregate(self, query):
+        """A global aggregate over an empty graph is one null row.
+
+        TCK WithOrderBy4 [16] and ReturnOrderBy6 [1].
+        """
+        gf = GraphForge()
+        result = gf.execute(query, {"age": 38})
+
+        assert len(result) == 1
+        assert isinstance(result[0]["avgAge"], CypherNull)
+
+    def test_single_row_not_evaluated(self):
+        """A single row is returned as is, without evaluating its order keys."""
+        gf = GraphForge()
+        gf.execute("CREATE ({age: 30})")
+        result = gf.execute("MATCH (person) RETURN count(person) AS c ORDER BY count(person) + 1")
+
+        assert [row["c"].value for row in result] == [1]
+
+    def test_aggregate_resolved_to_alias(self):
+        """ORDER BY sub-expressions repeating a WITH aggregate read its alias."""
+        gf = GraphForge()
+        gf.execute("CREATE ({age: 30}), ({age: 50}), ({age: 50})")
+        result = gf.execute(
+            "MATCH (p) WITH p.age AS a, count(p) AS c ORDER BY -count(p) + 1, a RETURN a, c"
+        )
+
+        assert [(row["a"].value, row["c"].value) for row in result] == [(50, 2), (30, 1)]
+
+    def test_aggregate_aliases_resolved_at_plan_time(self):
+        """The cached plan's Sort reads the alias, so it compiles once."""
+        from graphforge.ast.expression import Variable
+        from graphforge.planner.operators import Sort
+
+        gf = GraphForge()
+        gf.execute("CREATE ({age: 30}), ({age: 50})")
+        query = "MATCH (p) WITH p.age AS a, count(p) AS c ORDER BY count(p) DESC, a RETURN a, c"
+        gf.execute(query)
+        compiled = len(gf.executor._compiled_expressions)
+        gf.execute(query)
+
+        plan = gf.plan_cache.get(gf.plan_cache.normalize(query))
+        sort = next(op for op in plan if isinstance(op, Sort))
+        assert sort.items[0].expression == Variable(name="c")
+        assert len(gf.executor._compiled_expressions) == compiled
@@ -0,0 +1,96 @@
+"""Tests for the pull-based streaming executor."""
+
+from itertools import pairwise
+
+import pytest
+
+from graphforge import GraphForge
+from graphforge.types.values import CypherInt
+
+
+@pytest.fixture
+def chain():
+    """Graph of 100 :P nodes linked in a chain, counting adjacency lookups."""
+    gf = GraphForge()
+    gf.execute("UNWIND range(0, 99) AS i CREATE (:P {i: i})")
+    nodes = sorted(gf.graph.get_nodes_by_label("P"), key=lambda node: node.properties["i"].value)
+    for src, dst in pairwise(nodes):
+        gf.create_relationship(src, dst, "NEXT")
+
+    gf.expanded = 0
+    iter_neighbors = gf.graph.iter_neighbors
+
+    def counting(node_id, direction="OUT", types=None):
+        gf.expanded += 1
+        return iter_neighbors(node_id, direction, types)
+
+    gf.graph.iter_neighbors = counting
+    return gf
+
+
+@pytest.mark.unit
+class TestEarlyTermination:
+    """LIMIT and first-row checks stop pulling from upstream operators."""
+
+    def test_limit_stops_expansion(self, chain):
+        """Only as many nodes are expanded as needed to fill the LIMIT."""
+        rows = chain.execute("MATCH (a:P)-[:NEXT]->(b) RETURN b.i AS i LIMIT 3")
+        assert len(rows) == 3
+        assert chain.expanded <= 4
+
+    def test_with_limit_stops_expansion(self, chain):
+        """WITH ... LIMIT without ORDER BY streams too."""
+        rows = chain.execute("MATCH (a:P) WITH a LIMIT 2 MATCH (a)-[:NEXT]->(b) RETURN b")
+        assert len(rows) <= 2
+        assert chain.expanded == 2
+
+    def test_sort_still_sees_every_row(self, chain):
+        """Pipeline breakers drain their input before producing rows."""
+        rows = chain.execute("MATCH (a:P)-[:NEXT]->(b) RETURN b.i AS i ORDER BY i DESC LIMIT 1")
+        assert [row["i"].value for row in rows] == [99]
+        assert chain.expanded == 100
+
+    def test_writes_complete_despite_limit(self):
+        """Write operators run on every input row even when output is limited."""
+        gf = GraphForge()
+        rows = gf.execute("UNWIND range(1, 10) AS i CREATE (n:X {i: i}) WITH n LIMIT 2 RETURN n")
+        assert len(rows) == 2
+        assert len(gf.graph.get_nodes_by_label("X")) == 10
+
+    def test_exists_and_count_subqueries(self, chain):
+        """EXISTS stops at the first row; COUNT still counts all of them."""
+        rows = chain.execute(
+            "MATCH (a:P) WHERE a.i >= 98 "
+            "RETURN a.i AS i, EXISTS { MATCH (a)-[:NEXT]->(b) } AS more, "
+            "COUNT { MATCH (a)-[:NEXT]->(b) } AS n ORDER BY i"
+        )
+        assert [(row["more"].value, row["n"].value) for row in rows] == [(True, 1), (False, 0)]
+
+
+@pytest.mark.unit
+class TestExecuteIter:
+    """Tests for QueryExecutor.execute_iter()."""
+
+    def test_rows_are_produced_lazily(self, chain):
+        """Pulling one row expands only what that row needs."""
+        operators = chain._compile("MATCH (a:P)-[:NEXT]->(b) RETURN b.i AS i")
+        rows = chain.executor.execute_iter(operators)
+        assert chain.expanded == 0
+        next(rows)
+        assert chain.expanded == 1
+        rows.close()
+
+    def test_interleaved_iterators_keep_their_parameters(self, chain):
+        """Each iterator evaluates with its own parameters."""
+        operators = chain._compile("UNWIND range(1, 3) AS i RETURN i * $factor AS v")
+        tens = chain.executor.execute_iter(operators, {"factor": CypherInt(10)})
+        ones = chain.executor.execute_iter(operators, {"factor": CypherInt(1)})
+        pairs = [(a["v"].value, b["v"].value) for a, b in zip(tens, ones)]
+        assert pairs == [(10, 1), (20, 2), (30, 3)]
+
+    def test_query_without_return_runs_and_yields_nothing(self):
+        """Pipelines without RETURN are drained for their side effects."""
+        gf = GraphForge()
+        operators = gf._compile("UNWIND range(1, 5) AS i CREATE (:X {i: i})")
+        assert list(gf.executor.execute_iter(operators)) == []
+        assert len(gf.graph.get_nodes_by_label("X")) == 5
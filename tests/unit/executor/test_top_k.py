@@ -0,0 +1,66 @@
+"""Tests for ORDER BY ... LIMIT executed with the TopK operator."""
+
+import pytest
+
+from graphforge import GraphForge
+from graphforge.planner.operators import TopK
+
+SETUP = (
+    "UNWIND range(1, 60) AS i CREATE (:N {i: i, v: CASE WHEN i % 7 = 0 THEN null ELSE i % 10 END})"
+)
+
+
+def rows(gf, query):
+    """Run a query and unwrap each row's values."""
+    return [
+        {key: getattr(value, "value", None) for key, value in row.items()}
+        for row in gf.execute(query)
+    ]
+
+
+@pytest.fixture
+def graphs():
+    """The same graph with and without the optimizer."""
+    optimized, plain = GraphForge(), GraphForge(enable_optimizer=False)
+    optimized.execute(SETUP)
+    plain.execute(SETUP)
+    return optimized, plain
+
+
+@pytest.mark.unit
+class TestTopKResults:
+    """TopK returns exactly the rows of a full sort followed by SKIP/LIMIT."""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (n:N) RETURN n.i AS i, n.v AS v ORDER BY v LIMIT 7",
+            "MATCH (n:N) RETURN n.i AS i, n.v AS v ORDER BY v DESC LIMIT 7",
+            "MATCH (n:N) RETURN n.i AS i, n.v AS v ORDER BY v DESC, i SKIP 4 LIMIT 9",
+            "MATCH (n:N) RETURN n.i AS i ORDER BY n.v, n.i DESC LIMIT 12",
+            "MATCH (n:N) RETURN n.i AS i, n.s AS s ORDER BY s DESC LIMIT 10",
+            "MATCH (n:N) RETURN n.i AS i, n.s AS s ORDER BY s, i DESC LIMIT 10",
+            "MATCH (n:N) WITH n.v AS v, count(*) AS c ORDER BY c DESC, v LIMIT 3 RETURN v, c",
+            "MATCH (n:N) WITH n.v AS v, n.i AS i ORDER BY v, i DESC SKIP 3 LIMIT 5 RETURN v, i",
+            "MATCH (n:N) RETURN n.i AS i ORDER BY i LIMIT 0",
+            "MATCH (n:N) RETURN n.i AS i ORDER BY i DESC LIMIT 100",
+        ],
+    )
+    def test_matches_full_sort(self, graphs, query):
+        """Nulls, ties, mixed types and aliases order as with Sort + Limit."""
+        optimized, plain = graphs
+        assert rows(optimized, query) == rows(plain, query)
+
+    def test_plan_uses_top_k(self, graphs):
+        """The optimizer replaces the Sort of ORDER BY ... LIMIT."""
+        optimized, _ = graphs
+        operators = optimized._compile("MATCH (n:N) RETURN n.i AS i ORDER BY i LIMIT 3")
+        assert any(isinstance(op, TopK) for op in operators)
+
+    def test_ties_keep_input_order(self):
+        """Rows with equal sort values keep their relative order, as a stable sort does."""
+        gf = GraphForge()
+        result = gf.execute(
+            "UNWIND [3, 1, 2, 1, 3, 1] AS x WITH x, 0 AS k RETURN x ORDER BY k LIMIT 4"
+        )
+        assert [row["x"].value for row in result] == [3, 1, 2, 1]
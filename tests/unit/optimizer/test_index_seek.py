@@ -0,0 +1,208 @@
+"""Unit tests for the index seek optimization pass."""
+
+from graphforge.ast.clause import OrderByItem, ReturnItem
+from graphforge.ast.expression import (
+    BinaryOp,
+    FunctionCall,
+    Literal,
+    Parameter,
+    PropertyAccess,
+    Variable,
+)
+from graphforge.optimizer.optimizer import QueryOptimizer
+from graphforge.planner.operators import (
+    Limit,
+    NodeIndexScan,
+    NodeIndexSeek,
+    Project,
+    ScanNodes,
+    Skip,
+    Sort,
+)
+
+
+def equals(prop, value):
+    """Build n.<prop> = <value>."""
+    return BinaryOp(op="=", left=PropertyAccess(variable="n", property=prop), right=value)
+
+
+def compare(op, left, right):
+    """Build a binary comparison."""
+    return BinaryOp(op=op, left=left, right=right)
+
+
+def optimizer(*indexes, ordered=()):
+    """Optimizer with only the index seek pass and the given indexes."""
+    opt = QueryOptimizer(
+        enable_filter_pushdown=False,
+        enable_join_reorder=False,
+        enable_predicate_reorder=False,
+        enable_redundant_elimination=False,
+        enable_aggregate_pushdown=False,
+        enable_top_k=False,
+    )
+    opt.update_property_indexes([*indexes, *ordered], ordered=ordered)
+    return opt
+
+
+class TestIndexSeekPass:
+    """Tests for rewriting ScanNodes into NodeIndexSeek."""
+
+    def test_equality_on_indexed_property_becomes_seek(self):
+        """n.name = literal on an indexed pair turns into an index seek."""
+        predicate = BinaryOp(
+            op="AND",
+            left=equals("age", Literal(value=30)),
+            right=equals("name", Parameter(name="name")),
+        )
+        scan = ScanNodes(variable="n", labels=[["Person", "Employee"]], predicate=predicate)
+
+        [seek] = optimizer(("Employee", "name")).optimize([scan])
+
+        assert isinstance(seek, NodeIndexSeek)
+        assert seek.label == "Employee"
+        assert seek.property == "name"
+        assert seek.value == Parameter(name="name")
+        assert seek.labels == [["Person", "Employee"]]
+        assert seek.predicate == predicate
+
+    def test_reversed_equality(self):
+        """value = n.prop is recognized too."""
+        predicate = BinaryOp(
+            op="=", left=Literal(value="Alice"), right=PropertyAccess(variable="n", property="name")
+        )
+        scan = ScanNodes(variable="n", labels=[["Person"]], predicate=predicate)
+        [seek] = optimizer(("Person", "name")).optimize([scan])
+        assert isinstance(seek, NodeIndexSeek)
+        assert seek.value == Literal(value="Alice")
+
+    def test_no_index_keeps_scan(self):
+        """Scans on unindexed pairs are left alone."""
+        scan = ScanNodes(
+            variable="n", labels=[["Person"]], predicate=equals("name", Literal(value="A"))
+        )
+        assert optimizer(("Person", "age")).optimize([scan]) == [scan]
+
+    def test_label_disjunction_keeps_scan(self):
+        """Scans over several label groups are left alone."""
+        scan = ScanNodes(
+            variable="n",
+            labels=[["Person"], ["Company"]],
+            predicate=equals("name", Literal(value="A")),
+        )
+        assert optimizer(("Person", "name")).optimize([scan]) == [scan]
+
+    def test_non_equality_or_self_referencing_value_keeps_scan(self):
+        """Only equalities against values independent of the node qualify."""
+        scans = [
+            ScanNodes(
+                variable="n",
+                labels=[["Person"]],
+                predicate=BinaryOp(
+                    op=">",
+                    left=PropertyAccess(variable="n", property="name"),
+                    right=Literal(value="A"),
+                ),
+            ),
+            ScanNodes(
+                variable="n",
+                labels=[["Person"]],
+                predicate=equals("name", PropertyAccess(variable="n", property="nick")),
+            ),
+            ScanNodes(
+                variable="n",
+                labels=[["Person"]],
+                predicate=equals("name", FunctionCall(name="rand", args=[])),
+            ),
+        ]
+        assert optimizer(("Person", "name")).optimize(scans) == scans
+
+    def test_disabled_pass(self):
+        """enable_index_seek=False leaves scans alone."""
+        scan = ScanNodes(
+            variable="n", labels=[["Person"]], predicate=equals("name", Literal(value="A"))
+        )
+        opt = optimizer(("Person", "name"))
+        opt.enable_index_seek = False
+        assert opt.optimize([scan]) == [scan]
+
+
+class TestIndexRangeScanPass:
+    """Tests for rewriting ScanNodes (and a following Sort) into NodeIndexScan."""
+
+    def test_range_conjuncts_become_bounds(self):
+        """Comparisons on either side turn into lower and upper bounds."""
+        ts = PropertyAccess(variable="n", property="ts")
+        predicate = BinaryOp(
+            op="AND",
+            left=compare(">=", ts, Parameter(name="start")),
+            right=compare(">", Literal(value=10), ts),
+        )
+        scan = ScanNodes(variable="n", labels=[["Event"]], predicate=predicate)
+
+        [index_scan] = optimizer(ordered=[("Event", "ts")]).optimize([scan])
+
+        assert isinstance(index_scan, NodeIndexScan)
+        assert (index_scan.label, index_scan.property) == ("Event", "ts")
+        assert index_scan.lower == Parameter(name="start")
+        assert index_scan.lower_inclusive
+        assert index_scan.upper == Literal(value=10)
+        assert not index_scan.upper_inclusive
+        assert index_scan.descending is None
+        assert index_scan.predicate == predicate
+
+    def test_starts_with_becomes_prefix(self):
+        """STARTS WITH on a range-indexed property is a prefix scan."""
+        predicate = compare(
+            "STARTS WITH", PropertyAccess(variable="n", property="name"), Literal(value="Al")
+        )
+        scan = ScanNodes(variable="n", labels=[["Person"]], predicate=predicate)
+        [index_scan] = optimizer(ordered=[("Person", "name")]).optimize([scan])
+        assert isinstance(index_scan, NodeIndexScan)
+        assert index_scan.prefix == Literal(value="Al")
+
+    def test_equality_preferred_and_hash_index_ignored(self):
+        """Equalities still seek; hash indexes never serve ranges."""
+        ts = PropertyAccess(variable="n", property="ts")
+        both = BinaryOp(
+            op="AND",
+            left=compare("<", ts, Literal(value=5)),
+            right=equals("ts", Literal(value=3)),
+        )
+        scan = ScanNodes(variable="n", labels=[["Event"]], predicate=both)
+        assert isinstance(optimizer(ordered=[("Event", "ts")]).optimize([scan])[0], NodeIndexSeek)
+
+        ranged = ScanNodes(
+            variable="n", labels=[["Event"]], predicate=compare("<", ts, Literal(value=5))
+        )
+        assert optimizer(("Event", "ts")).optimize([ranged]) == [ranged]
+
+    def test_order_by_limit_served_from_index(self):
+        """A leading scan sorted by an indexed property absorbs Sort and LIMIT."""
+        ts = PropertyAccess(variable="n", property="ts")
+        operators = [
+            ScanNodes(variable="n", labels=[["Event"]]),
+            Sort(
+                items=[OrderByItem(expression=Variable(name="t"), ascending=False)],
+                return_items=[ReturnItem(expression=ts, alias="t")],
+            ),
+            Project(items=[ReturnItem(expression=ts, alias="t")]),
+            Skip(count=5),
+            Limit(count=10),
+        ]
+
+        index_scan, *rest = optimizer(ordered=[("Event", "ts")]).optimize(operators)
+
+        assert isinstance(index_scan, NodeIndexScan)
+        assert index_scan.descending is True
+        assert index_scan.limit == 15
+        assert rest == operators[2:]
+
+    def test_sort_on_other_property_kept(self):
+        """Sorting by an unindexed property or after other operators keeps the Sort."""
+        operators = [
+            ScanNodes(variable="n", labels=[["Event"]]),
+            Sort(items=[OrderByItem(expression=PropertyAccess(variable="n", property="id"))]),
+            Limit(count=1),
+        ]
+        assert optimizer(ordered=[("Event", "ts")]).optimize(operators) == operators
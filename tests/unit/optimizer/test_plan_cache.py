@@ -0,0 +1,172 @@
+"""Unit tests for the query plan cache and statistics drift."""
+
+import pytest
+
+from graphforge.api import GraphForge
+from graphforge.optimizer.plan_cache import PlanCache, PlanCacheStats
+from graphforge.optimizer.statistics import GraphStatistics
+from graphforge.planner.operators import Limit
+
+
+@pytest.mark.unit
+class TestStatisticsDrift:
+    """Tests for GraphStatistics.drift()."""
+
+    def test_identical_statistics_have_no_drift(self):
+        """Equal counts produce zero drift."""
+        stats = GraphStatistics(total_nodes=10, total_edges=5, node_counts_by_label={"A": 10})
+        assert stats.drift(stats.model_copy()) == 0.0
+
+    def test_drift_is_largest_relative_change(self):
+        """Drift reports the largest relative change across all counts."""
+        old = GraphStatistics(
+            total_nodes=100, total_edges=50, node_counts_by_label={"A": 10, "B": 90}
+        )
+        new = GraphStatistics(
+            total_nodes=110, total_edges=50, node_counts_by_label={"A": 20, "B": 90}
+        )
+        assert old.drift(new) == pytest.approx(1.0)
+
+    def test_new_type_counts_as_drift(self):
+        """A label or type missing from the old snapshot is measured from zero."""
+        old = GraphStatistics(total_nodes=100, total_edges=100)
+        new = GraphStatistics(total_nodes=100, total_edges=100, edge_counts_by_type={"R": 3})
+        assert old.drift(new) == 3.0
+
+
+@pytest.mark.unit
+class TestPlanCache:
+    """Tests for PlanCache LRU behavior and counters."""
+
+    def test_normalize_collapses_whitespace(self):
+        """Whitespace differences map to the same key."""
+        assert PlanCache.normalize("  MATCH (n)\n\t RETURN   n ") == "MATCH (n) RETURN n"
+
+    def test_normalize_preserves_string_literals(self):
+        """Whitespace inside string literals is significant."""
+        assert PlanCache.normalize("RETURN 'a  b'") != PlanCache.normalize("RETURN 'a b'")
+        assert PlanCache.normalize('RETURN "a  b"') == 'RETURN "a  b"'
+
+    def test_normalize_preserves_comment_line_breaks(self):
+        """A line comment keeps its line break so following clauses are not hidden."""
+        assert PlanCache.normalize("RETURN 1 // c\nRETURN 2") != PlanCache.normalize(
+            "RETURN 1 // c RETURN 2"
+        )
+
+    def test_hit_and_miss_counters(self):
+        """Lookups count hits and misses."""
+        cache = PlanCache()
+        plan = [Limit(count=1)]
+
+        assert cache.get("q") is None
+        cache.put("q", plan)
+        assert cache.get("q") is plan
+        assert cache.get("q") is plan
+
+        assert cache.stats() == PlanCacheStats(hits=2, misses=1, size=1, max_size=256)
+
+    def test_lru_eviction(self):
+        """The least recently used plan is evicted when the cache is full."""
+        cache = PlanCache(max_size=2)
+        cache.put("a", [Limit(count=1)])
+        cache.put("b", [Limit(count=2)])
+        cache.get("a")
+        cache.put("c", [Limit(count=3)])
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.stats().evictions == 1
+
+    def test_zero_size_disables_caching(self):
+        """max_size=0 never stores plans."""
+        cache = PlanCache(max_size=0)
+        cache.put("q", [Limit(count=1)])
+        assert len(cache) == 0
+        assert cache.get("q") is None
+
+    def test_invalid_configuration(self):
+        """Negative sizes and thresholds are rejected."""
+        with pytest.raises(ValueError, match="max_size"):
+            PlanCache(max_size=-1)
+        with pytest.raises(ValueError, match="drift_threshold"):
+            PlanCache(drift_threshold=-0.1)
+
+    def test_small_drift_keeps_plan(self):
+        """Plans survive statistics changes below the threshold."""
+        cache = PlanCache(drift_threshold=0.2)
+        plan = [Limit(count=1)]
+        cache.put("q", plan, GraphStatistics(total_nodes=100, total_edges=0))
+
+        assert cache.get("q", GraphStatistics(total_nodes=110, total_edges=0)) is plan
+
+    def test_large_drift_invalidates_plan(self):
+        """Plans are dropped once statistics drift past the threshold."""
+        cache = PlanCache(drift_threshold=0.2)
+        cache.put("q", [Limit(count=1)], GraphStatistics(total_nodes=100, total_edges=0))
+
+        assert cache.get("q", GraphStatistics(total_nodes=200, total_edges=0)) is None
+        assert "q" not in cache
+        stats = cache.stats()
+        assert stats.invalidations == 1
+        assert stats.misses == 1
+
+    def test_clear_resets_entries_and_counters(self):
+        """clear() empties the cache and resets counters."""
+        cache = PlanCache()
+        cache.put("q", [Limit(count=1)])
+        cache.get("q")
+        cache.clear()
+        assert cache.stats() == PlanCacheStats(max_size=256)
+
+
+@pytest.mark.unit
+class TestGraphForgePlanCache:
+    """Tests for plan caching in GraphForge.execute()."""
+
+    def test_repeated_query_hits_cache(self):
+        """Executing the same query twice reuses the compiled plan."""
+        gf = GraphForge()
+        gf.execute("RETURN 1 AS x")
+        results = gf.execute("RETURN   1 AS x")
+
+        assert results[0]["x"].value == 1
+        stats = gf.plan_cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+
+    def test_cache_size_is_configurable(self):
+        """plan_cache_size bounds the number of cached plans."""
+        gf = GraphForge(plan_cache_size=1)
+        gf.execute("RETURN 1 AS x")
+        gf.execute("RETURN 2 AS x")
+
+        assert len(gf.plan_cache) == 1
+        assert gf.plan_cache.stats().evictions == 1
+
+    def test_statistics_drift_recompiles_plan(self):
+        """Cached plans are recompiled after the graph grows substantially."""
+        gf = GraphForge()
+        query = "MATCH (n:Person) RETURN count(n) AS c"
+        assert gf.execute(query)[0]["c"].value == 0
+
+        for i in range(5):
+            gf.create_node(["Person"], idx=i)
+
+        assert gf.execute(query)[0]["c"].value == 5
+        assert gf.plan_cache.stats().invalidations == 1
+
+    def test_writes_are_correct_with_cached_plans(self):
+        """A cached write plan executes its side effects each time."""
+        gf = GraphForge()
+        for _ in range(3):
+            gf.execute("CREATE (:Item)")
+
+        assert gf.execute("MATCH (n:Item) RETURN count(n) AS c")[0]["c"].value == 3
+
+    def test_clear_drops_cached_plans(self):
+        """GraphForge.clear() empties the plan cache."""
+        gf = GraphForge()
+        gf.execute("RETURN 1 AS x")
+        gf.clear()
+        assert len(gf.plan_cache) == 0
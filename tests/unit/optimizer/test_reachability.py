@@ -0,0 +1,151 @@
+"""Unit tests for the reachability optimization pass."""
+
+import pytest
+
+from graphforge.ast.clause import ReturnItem
+from graphforge.ast.expression import FunctionCall, PropertyAccess, Variable, Wildcard
+from graphforge.ast.pattern import NodePattern
+from graphforge.optimizer.optimizer import QueryOptimizer
+from graphforge.planner.operators import (
+    Aggregate,
+    Create,
+    Distinct,
+    ExpandVariableLength,
+    Filter,
+    Limit,
+    Project,
+    ScanNodes,
+    With,
+)
+
+SCAN = ScanNodes(variable="a", labels=[["Person"]])
+EXPAND = ExpandVariableLength(
+    src_var="a", edge_var="r", dst_var="b", edge_types=["KNOWS"], direction="OUT", max_hops=6
+)
+RETURN_B = Project(items=[ReturnItem(expression=Variable(name="b"))])
+
+
+def optimize(*operators, **kwargs):
+    """Optimize a plan starting with SCAN and return the expansion."""
+    optimized = QueryOptimizer(**kwargs).optimize([SCAN, *operators])
+    return optimized[1]
+
+
+def aggregate(*agg_exprs):
+    """Aggregate grouping by a over the given aggregation functions."""
+    return Aggregate(
+        grouping_exprs=[Variable(name="a")],
+        agg_exprs=list(agg_exprs),
+        return_items=[ReturnItem(expression=Variable(name="a"))]
+        + [ReturnItem(expression=expr, alias=f"x{i}") for i, expr in enumerate(agg_exprs)],
+    )
+
+
+class TestReachabilityPass:
+    """Tests for switching variable-length expansions to reachability mode."""
+
+    def test_return_distinct(self):
+        """RETURN DISTINCT over the end node only needs reachable nodes."""
+        assert optimize(EXPAND, RETURN_B, Distinct()).reachability
+
+    def test_with_distinct(self):
+        """WITH DISTINCT deduplicates like RETURN DISTINCT."""
+        with_distinct = With(items=[ReturnItem(expression=Variable(name="b"))], distinct=True)
+        assert optimize(EXPAND, with_distinct, Distinct(), RETURN_B).reachability
+
+    @pytest.mark.parametrize(
+        "agg_exprs",
+        [
+            [FunctionCall(name="COUNT", args=[Variable(name="b")], distinct=True)],
+            [
+                FunctionCall(name="COLLECT", args=[Variable(name="b")], distinct=True),
+                FunctionCall(name="MAX", args=[PropertyAccess(variable="b", property="age")]),
+            ],
+        ],
+    )
+    def test_duplicate_insensitive_aggregates(self, agg_exprs):
+        """DISTINCT, MIN and MAX aggregates ignore repeated rows."""
+        assert optimize(EXPAND, aggregate(*agg_exprs)).reachability
+
+    def test_counting_aggregate(self):
+        """count(b) counts one row per path, so every path is kept."""
+        count = FunctionCall(name="COUNT", args=[Variable(name="b")])
+        assert not optimize(EXPAND, aggregate(count)).reachability
+
+    def test_without_distinct(self):
+        """Plain RETURN keeps one row per path."""
+        assert not optimize(EXPAND, RETURN_B).reachability
+
+    def test_limit_before_distinct(self):
+        """LIMIT counts rows before DISTINCT sees them."""
+        assert not optimize(EXPAND, Limit(count=3), RETURN_B, Distinct()).reachability
+
+    def test_write_before_distinct(self):
+        """Writes run once per row, so every row must reach them."""
+        create = Create(patterns=[[NodePattern(variable="c", labels=[], properties={})]])
+        assert not optimize(EXPAND, create, RETURN_B, Distinct()).reachability
+
+    def test_relationship_list_used(self):
+        """A relationship list referenced downstream needs every path."""
+        size = FunctionCall(name="SIZE", args=[Variable(name="r")])
+        project = Project(
+            items=[ReturnItem(expression=Variable(name="b")), ReturnItem(expression=size)]
+        )
+        assert not optimize(EXPAND, project, Distinct()).reachability
+
+    def test_wildcard(self):
+        """RETURN DISTINCT * projects the relationship list."""
+        project = Project(items=[ReturnItem(expression=Wildcard())])
+        assert not optimize(EXPAND, project, Distinct()).reachability
+
+    def test_unused_path_variable_dropped(self):
+        """A path variable nothing references is not built."""
+        expand = EXPAND.model_copy(update={"path_var": "p"})
+        optimized = optimize(expand, RETURN_B, Distinct())
+        assert optimized.reachability
+        assert optimized.path_var is None
+
+    def test_used_path_variable(self):
+        """A referenced path variable keeps path expansion."""
+        expand = EXPAND.model_copy(update={"path_var": "p"})
+        length = Filter(
+            predicate=FunctionCall(name="LENGTH", args=[Variable(name="p")]),
+        )
+        assert not optimize(expand, length, RETURN_B, Distinct()).reachability
+
+    def test_minimum_above_one(self):
+        """Nodes only reachable by paths longer than their distance need path expansion."""
+        expand = EXPAND.model_copy(update={"min_hops": 2})
+        assert not optimize(expand, RETURN_B, Distinct()).reachability
+
+    def test_disabled(self):
+        """enable_reachability=False keeps path expansion."""
+        assert not optimize(EXPAND, RETURN_B, Distinct(), enable_reachability=False).reachability
+
+
+class TestReachabilityValidation:
+    """Tests for ExpandVariableLength reachability mode validation."""
+
+    def test_path_variable_rejected(self):
+        """Reachability mode binds no path."""
+        with pytest.raises(ValueError, match="path variable"):
+            ExpandVariableLength(
+                src_var="a",
+                dst_var="b",
+                path_var="p",
+                edge_types=[],
+                direction="OUT",
+                reachability=True,
+            )
+
+    def test_minimum_hops_rejected(self):
+        """Reachability mode starts at 0 or 1 hops."""
+        with pytest.raises(ValueError, match="minimum hops of 0 or 1"):
+            ExpandVariableLength(
+                src_var="a",
+                dst_var="b",
+                edge_types=[],
+                direction="OUT",
+                min_hops=2,
+                reachability=True,
+            )
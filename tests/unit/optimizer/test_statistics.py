@@ -5,7 +5,7 @@ import tempfile
 
 import pytest
 
-from graphforge.optimizer.statistics import GraphStatistics
+from graphforge.optimizer.statistics import GraphStatistics, StatisticsCounters
 from graphforge.storage.memory import Graph
 from graphforge.storage.sqlite_backend import SQLiteBackend
 from graphforge.types.graph import EdgeRef, NodeRef
@@ -44,6 +44,64 @@ class TestGraphStatisticsModel:
         assert new_stats.total_edges == 10
 
 
+class TestStatisticsCounters:
+    """Test the mutable StatisticsCounters accumulator."""
+
+    def test_snapshot_of_empty_counters(self):
+        """Empty counters produce empty statistics."""
+        stats = StatisticsCounters().snapshot()
+        assert stats.total_nodes == 0
+        assert stats.total_edges == 0
+        assert stats.avg_degree_by_type == {}
+
+    def test_avg_degree_from_source_degrees(self):
+        """Average degree is edges per distinct source, per type."""
+        counters = StatisticsCounters()
+        for src_id in (1, 1, 1, 2):
+            counters.add_edge("KNOWS", src_id)
+        counters.add_edge("LIKES", 3)
+
+        stats = counters.snapshot()
+        assert stats.edge_counts_by_type == {"KNOWS": 4, "LIKES": 1}
+        assert stats.avg_degree_by_type == {"KNOWS": 2.0, "LIKES": 1.0}
+
+    def test_remove_edge_drops_empty_types_and_sources(self):
+        """Removing the last edge of a type or source removes its entries."""
+        counters = StatisticsCounters()
+        counters.add_edge("KNOWS", 1)
+        counters.add_edge("KNOWS", 2)
+        counters.remove_edge("KNOWS", 2)
+
+        assert counters.snapshot().avg_degree_by_type == {"KNOWS": 1.0}
+
+        counters.remove_edge("KNOWS", 1)
+        stats = counters.snapshot()
+        assert stats.total_edges == 0
+        assert stats.edge_counts_by_type == {}
+        assert counters.source_degrees_by_type == {}
+
+    def test_remove_node_drops_empty_labels(self):
+        """Removing the last node with a label removes the label count."""
+        counters = StatisticsCounters()
+        counters.add_node(["A", "B"])
+        counters.add_node(["A"])
+        counters.remove_node(["A", "B"])
+
+        stats = counters.snapshot()
+        assert stats.total_nodes == 1
+        assert stats.node_counts_by_label == {"A": 1}
+
+    def test_copy_is_independent(self):
+        """Mutating a copy does not affect the original."""
+        counters = StatisticsCounters()
+        counters.add_edge("KNOWS", 1)
+        clone = counters.copy()
+        clone.add_edge("KNOWS", 2)
+
+        assert counters.snapshot().edge_counts_by_type == {"KNOWS": 1}
+        assert clone.snapshot().avg_degree_by_type == {"KNOWS": 1.0}
+
+
 class TestGraphStatisticsTracking:
     """Test statistics tracking in Graph class."""
 
@@ -182,6 +240,49 @@ class TestGraphStatisticsTracking:
         assert stats.edge_counts_by_type == {"EMPLOYED_BY": 1}
         assert "WORKS_FOR" not in stats.edge_counts_by_type
 
+    def test_statistics_snapshot_reused_until_mutation(self):
+        """get_statistics() returns the same snapshot until the graph changes."""
+        graph = Graph()
+        graph.add_node(NodeRef(id=1, labels=frozenset(["Person"]), properties={}))
+
+        stats = graph.get_statistics()
+        assert graph.get_statistics() is stats
+
+        graph.add_node(NodeRef(id=2, labels=frozenset(["Person"]), properties={}))
+        new_stats = graph.get_statistics()
+        assert new_stats is not stats
+        assert stats.total_nodes == 1
+        assert new_stats.total_nodes == 2
+
+    def test_many_edges_from_few_sources(self):
+        """Average degree stays exact across many inserts of the same type."""
+        graph = Graph()
+        nodes = [NodeRef(id=i, labels=frozenset(), properties={}) for i in range(10)]
+        for node in nodes:
+            graph.add_node(node)
+        for edge_id in range(1000):
+            src = nodes[edge_id % 4]
+            graph.add_edge(EdgeRef(id=edge_id, type="R", src=src, dst=nodes[9], properties={}))
+
+        stats = graph.get_statistics()
+        assert stats.edge_counts_by_type == {"R": 1000}
+        assert stats.avg_degree_by_type == {"R": 250.0}
+
+    def test_replace_edge_moves_source_degree(self):
+        """Replacing an edge with a new source updates the distinct source count."""
+        graph = Graph()
+        a = NodeRef(id=1, labels=frozenset(), properties={})
+        b = NodeRef(id=2, labels=frozenset(), properties={})
+        graph.add_node(a)
+        graph.add_node(b)
+        graph.add_edge(EdgeRef(id=1, type="R", src=a, dst=b, properties={}))
+        graph.add_edge(EdgeRef(id=2, type="R", src=a, dst=b, properties={}))
+        graph.add_edge(EdgeRef(id=2, type="R", src=b, dst=a, properties={}))
+
+        stats = graph.get_statistics()
+        assert stats.total_edges == 2
+        assert stats.avg_degree_by_type == {"R": 1.0}
+
     def test_snapshot_includes_statistics(self):
         """Graph snapshot should include statistics."""
         graph = Graph()
@@ -0,0 +1,82 @@
+"""Unit tests for the Top-K optimization pass."""
+
+from graphforge.ast.clause import OrderByItem, ReturnItem
+from graphforge.ast.expression import Parameter, PropertyAccess, Variable
+from graphforge.optimizer.optimizer import QueryOptimizer
+from graphforge.planner.operators import (
+    Aggregate,
+    Distinct,
+    Limit,
+    Project,
+    ScanNodes,
+    Skip,
+    Sort,
+    TopK,
+)
+
+SCAN = ScanNodes(variable="n", labels=[["Person"]])
+ORDER = [OrderByItem(expression=Variable(name="age"), ascending=False)]
+RETURN_ITEMS = [ReturnItem(expression=PropertyAccess(variable="n", property="age"), alias="age")]
+SORT = Sort(items=ORDER, return_items=RETURN_ITEMS)
+PROJECT = Project(items=RETURN_ITEMS)
+
+
+def optimizer(**kwargs):
+    """Optimizer with the default passes."""
+    return QueryOptimizer(**kwargs)
+
+
+class TestTopKPass:
+    """Tests for replacing Sort with TopK."""
+
+    def test_sort_project_limit_becomes_top_k(self):
+        """A Sort reaching LIMIT through Project keeps LIMIT rows."""
+        operators = [SCAN, SORT, PROJECT, Limit(count=10)]
+
+        optimized = optimizer().optimize(operators)
+
+        assert optimized == [
+            SCAN,
+            TopK(items=ORDER, return_items=RETURN_ITEMS, count=10),
+            PROJECT,
+            Limit(count=10),
+        ]
+
+    def test_skip_is_added_to_count(self):
+        """SKIP rows are kept too, and SKIP/LIMIT stay in the plan."""
+        operators = [SCAN, SORT, PROJECT, Skip(count=5), Limit(count=10)]
+
+        top_k, *rest = optimizer().optimize(operators)[1:]
+
+        assert isinstance(top_k, TopK)
+        assert top_k.count == 15
+        assert rest == [PROJECT, Skip(count=5), Limit(count=10)]
+
+    def test_sort_without_limit_kept(self):
+        """Without LIMIT every row is needed, so the Sort stays."""
+        operators = [SCAN, SORT, PROJECT, Skip(count=5)]
+        assert optimizer().optimize(operators) == operators
+
+    def test_parameter_counts_kept(self):
+        """A $parameter SKIP or LIMIT is only known at run time, so the Sort stays."""
+        for operators in (
+            [SCAN, SORT, PROJECT, Limit(count=Parameter(name="k"))],
+            [SCAN, SORT, PROJECT, Skip(count=Parameter(name="s")), Limit(count=10)],
+        ):
+            assert optimizer().optimize(operators) == operators
+
+    def test_distinct_blocks_top_k(self):
+        """DISTINCT between Sort and LIMIT can drop rows, so the Sort stays."""
+        operators = [SCAN, SORT, PROJECT, Distinct(), Limit(count=3)]
+        assert optimizer().optimize(operators) == operators
+
+    def test_sort_before_aggregate_kept(self):
+        """Rows reaching LIMIT only after aggregation are not bounded by it."""
+        aggregate = Aggregate(grouping_exprs=[], agg_exprs=[], return_items=RETURN_ITEMS)
+        operators = [SCAN, SORT, aggregate, Limit(count=3)]
+        assert optimizer().optimize(operators) == operators
+
+    def test_disabled(self):
+        """enable_top_k=False leaves the Sort in place."""
+        operators = [SCAN, SORT, PROJECT, Limit(count=10)]
+        assert optimizer(enable_top_k=False).optimize(operators) == operators
@@ -0,0 +1,86 @@
+"""Tests for parsing CREATE INDEX and DROP INDEX schema commands."""
+
+from lark.exceptions import LarkError
+import pytest
+
+from graphforge.ast.clause import CreateClause, CreateIndexClause, DropIndexClause
+from graphforge.parser.parser import CypherParser
+
+
+@pytest.fixture
+def parser():
+    """Create parser instance."""
+    return CypherParser()
+
+
+@pytest.mark.unit
+class TestCreateIndexParsing:
+    """Tests for CREATE INDEX syntax."""
+
+    def test_create_index_for_on(self, parser):
+        """FOR (n:Label) ON (n.prop) parses to a CreateIndexClause."""
+        ast = parser.parse("CREATE INDEX FOR (p:Person) ON (p.name)")
+        assert ast.clauses == [CreateIndexClause(label="Person", property="name")]
+
+    def test_create_named_index_if_not_exists(self, parser):
+        """Index name and IF NOT EXISTS are captured."""
+        ast = parser.parse("create index person_name if not exists for (p:Person) on (p.name)")
+        assert ast.clauses == [
+            CreateIndexClause(
+                label="Person", property="name", name="person_name", if_not_exists=True
+            )
+        ]
+
+    def test_create_index_legacy_syntax(self, parser):
+        """CREATE INDEX ON :Label(prop) is accepted."""
+        ast = parser.parse("CREATE INDEX ON :Person(age)")
+        assert ast.clauses == [CreateIndexClause(label="Person", property="age")]
+
+    def test_create_range_index(self, parser):
+        """CREATE RANGE INDEX declares an ordered index, in both syntaxes."""
+        ast = parser.parse("CREATE RANGE INDEX event_ts FOR (e:Event) ON (e.ts)")
+        assert ast.clauses == [
+            CreateIndexClause(label="Event", property="ts", name="event_ts", kind="range")
+        ]
+        ast = parser.parse("create range index on :Event(ts)")
+        assert ast.clauses == [CreateIndexClause(label="Event", property="ts", kind="range")]
+
+    def test_range_is_still_a_function_name(self, parser):
+        """The RANGE keyword does not shadow range()."""
+        ast = parser.parse("RETURN range(1, 3) AS r")
+        assert ast.clauses[0].items[0].alias == "r"
+
+    def test_create_index_property_of_other_variable_rejected(self, parser):
+        """The ON property must belong to the FOR variable."""
+        with pytest.raises(LarkError, match="must index a property of 'p'"):
+            parser.parse("CREATE INDEX FOR (p:Person) ON (q.name)")
+
+    def test_index_keyword_prefix_still_identifier(self, parser):
+        """Identifiers starting with 'index' are not mistaken for the keyword."""
+        ast = parser.parse("CREATE indexed = (a) RETURN indexed")
+        assert isinstance(ast.clauses[0], CreateClause)
+
+
+@pytest.mark.unit
+class TestDropIndexParsing:
+    """Tests for DROP INDEX syntax."""
+
+    def test_drop_index_by_name(self, parser):
+        """DROP INDEX name parses to a DropIndexClause."""
+        ast = parser.parse("DROP INDEX person_name")
+        assert ast.clauses == [DropIndexClause(name="person_name")]
+
+    def test_drop_index_if_exists(self, parser):
+        """IF EXISTS is captured."""
+        ast = parser.parse("DROP INDEX person_name IF EXISTS")
+        assert ast.clauses == [DropIndexClause(name="person_name", if_exists=True)]
+
+    def test_drop_index_legacy_syntax(self, parser):
+        """DROP INDEX ON :Label(prop) identifies the index by label and property."""
+        ast = parser.parse("DROP INDEX ON :Person(name)")
+        assert ast.clauses == [DropIndexClause(label="Person", property="name")]
+
+    def test_schema_command_cannot_be_combined_with_clauses(self, parser):
+        """Schema commands are standalone queries."""
+        with pytest.raises(LarkError):
+            parser.parse("CREATE INDEX ON :Person(name) RETURN 1")
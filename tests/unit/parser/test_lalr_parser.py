@@ -0,0 +1,127 @@
+"""Tests for the LALR fast-path parser.
+
+The LALR grammar must build exactly the same AST as the Earley grammar for
+every query it accepts, and anything it cannot handle must fall back to the
+Earley parser (which remains the reference for syntax errors).
+"""
+
+from lark.exceptions import LarkError
+import pytest
+
+from graphforge.ast.query import CypherQuery, UnionQuery
+from graphforge.parser.parser import CypherParser, _get_lalr_parser
+
+EQUIVALENCE_QUERIES = [
+    "MATCH (n) RETURN n",
+    "MATCH (n:Person:Employee|Company {name: 'Alice', age: 30}) RETURN n.name AS name",
+    "MATCH (a)-[r:KNOWS|:LIKES*1..3]->(b)<-[:WORKS_AT]-(c) RETURN a, b, c",
+    "MATCH p = (a)-[*]-(b) RETURN p, length(p)",
+    "MATCH (a), (b) MATCH p = shortestPath((a)-[:KNOWS*..5]->(b)) RETURN p",
+    "MATCH allShortestPaths((a {id: 1})<-[r:R|:S*0..3]-(b:B)) RETURN r",
+    "MATCH (a)-[r WHERE r.weight > 2]->(b) RETURN r",
+    "MATCH (n) WHERE n.age >= 18 AND NOT n.name STARTS WITH 'A' OR n.x IS NULL RETURN n",
+    "MATCH (n) WHERE n.x = 1 XOR n.y <> 2 RETURN DISTINCT n ORDER BY n.x DESC, n.y SKIP 1 LIMIT 2",
+    "MATCH (n) OPTIONAL MATCH (n)-[r]->(m) WHERE m.x IN [1, 2] RETURN n, count(DISTINCT m)",
+    "MATCH (a), (b) CREATE (a)-[:KNOWS {since: 2020}]->(b) RETURN a",
+    "MERGE (n:Person {name: 'A'}) ON CREATE SET n.created = true ON MATCH SET n.seen = 1",
+    "MATCH (n) SET n.x = n.x + 1, n.y = -n.z REMOVE n.tmp, n:Temp DETACH DELETE n",
+    "UNWIND [1, 2, 3] AS x WITH x WHERE x > 1 RETURN collect(x) AS xs",
+    "WITH 1 AS a, 2.5 AS b RETURN a * b / 2 % 3 ^ 2 ^ 2 AS r",
+    "MATCH (n) WITH n ORDER BY n.age LIMIT 10 MATCH (n)-[]->(m) RETURN n, m",
+    "RETURN [x IN range(1, 10) WHERE x % 2 = 0 | x * x] AS squares",
+    "MATCH (a) RETURN [(a)-[:KNOWS]->(b) WHERE b.age > 3 | b.name] AS names",
+    "RETURN CASE WHEN 1 < 2 THEN 'yes' ELSE 'no' END AS answer",
+    "RETURN all(x IN [1, 2] WHERE x > 0), none(x IN [] WHERE x), single(x IN [1] WHERE true)",
+    "RETURN reduce(acc = 0, x IN [1, 2, 3] | acc + x) AS total",
+    "RETURN [1, 2, 3][0], [1, 2, 3][1..], [1, 2, 3][..2], 'abc'[0..1], {a: {b: 1}}.a",
+    "RETURN 0x1F, 0o17, 1.5, 'it\\'s', \"dq\", null, false, toUpper('a') AS up",
+    "MATCH (n) WHERE EXISTS { MATCH (n)-[]->() } AND COUNT { MATCH (n)-[]->() } > 1 RETURN n",
+    "MATCH (n) WHERE exists(n.name) RETURN count(*) AS count, labels(n) AS labels",
+    "MATCH (n) CALL { MATCH (m) RETURN m } RETURN n, m",
+    "MATCH (a), (b) CALL graphforge.shortestPath.dijkstra(a, b, {weightProperty: 'w'}) "
+    "YIELD path, cost AS c RETURN path, c",
+    "MATCH (a) CALL graphforge.shortestPath.singleSource(a) RETURN a",
+    "MATCH (n) RETURN n.name UNION ALL MATCH (m) RETURN m.name",
+    "MATCH (n) RETURN n UNION MATCH (m) RETURN m UNION MATCH (o) RETURN o",
+    "MATCH (n) // trailing comment\nRETURN n",
+    "match (n) where n.name contains 'x' return n as nodes order by nodes asc",
+    "MATCH (a) WITH a.num AS a, count(*) AS count RETURN count",
+    "MATCH (n {name: $name}) WHERE n.age > $0 RETURN $list[1..], $map.key AS k",
+    "MATCH (n) WITH n SKIP $0 LIMIT $1 RETURN n ORDER BY n.v SKIP $s LIMIT $k",
+    "CREATE INDEX person_name IF NOT EXISTS FOR (p:Person) ON (p.name)",
+    "DROP INDEX ON :Person(name)",
+    "CREATE RANGE INDEX ON :Event(ts)",
+]
+
+
+@pytest.fixture(scope="module")
+def earley():
+    """Earley-only reference parser."""
+    return CypherParser(use_lalr=False)
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """Default parser (LALR with Earley fallback)."""
+    return CypherParser()
+
+
+@pytest.mark.unit
+class TestLALRParser:
+    """Tests for LALR parsing and Earley fallback."""
+
+    def test_lalr_parser_is_cached(self):
+        """The LALR parser is compiled once and shared across instances."""
+        assert CypherParser()._lalr is CypherParser()._lalr
+        assert _get_lalr_parser() is _get_lalr_parser()
+
+    def test_lalr_can_be_disabled(self):
+        """use_lalr=False parses with Earley only."""
+        parser = CypherParser(use_lalr=False)
+        assert parser._lalr is None
+        assert isinstance(parser.parse("MATCH (n) RETURN n"), CypherQuery)
+
+    @pytest.mark.parametrize("query", EQUIVALENCE_QUERIES)
+    def test_lalr_builds_same_ast_as_earley(self, query, earley):
+        """The LALR parser builds the AST inline, identical to Earley + transformer."""
+        assert _get_lalr_parser().parse(query) == earley.parse(query)
+
+    def test_union_query(self, parser):
+        """UNION queries produce a UnionQuery node on the fast path."""
+        ast = _get_lalr_parser().parse("RETURN 1 AS x UNION ALL RETURN 2 AS x")
+        assert isinstance(ast, UnionQuery)
+        assert ast.all is True
+        assert len(ast.branches) == 2
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "RETURN [(a), 1] AS l",  # "[(" is read as a pattern comprehension first
+            "WITH [1] AS nodes RETURN [n IN nodes | n] AS l",
+        ],
+    )
+    def test_fallback_to_earley(self, query, parser, earley):
+        """Queries the LALR grammar cannot handle are parsed by Earley."""
+        assert parser.parse(query) == earley.parse(query)
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "RETURN 1 MATCH (n)",
+            "MATCH (n) RETURN n MATCH (m) RETURN m",
+            "CREATE (a) CREATE (b)",
+            "WITH 1 AS x RETURN x UNION RETURN 2 AS x",
+            "MATCH (n) WHERE EXISTS { WITH 1 AS x RETURN x } RETURN n",
+        ],
+    )
+    def test_rejects_clause_orders_earley_rejects(self, query, parser, earley):
+        """The permissive LALR clause sequence never accepts what Earley rejects."""
+        with pytest.raises(LarkError):
+            earley.parse(query)
+        with pytest.raises(LarkError):
+            parser.parse(query)
+
+    def test_syntax_error_raises_lark_error(self, parser):
+        """Syntax errors are reported by the Earley parser."""
+        with pytest.raises(LarkError):
+            parser.parse("MATCH (n RETURN n")
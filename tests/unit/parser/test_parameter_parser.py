@@ -0,0 +1,60 @@
+"""Tests for parsing $parameter references."""
+
+from lark.exceptions import LarkError
+import pytest
+
+from graphforge.ast.expression import BinaryOp, Parameter, PropertyAccess, Subscript
+from graphforge.parser.parser import CypherParser
+
+
+@pytest.fixture
+def parser():
+    """Create parser instance."""
+    return CypherParser()
+
+
+@pytest.mark.unit
+class TestParameterParsing:
+    """Tests for $name and $0 parameter syntax."""
+
+    def test_named_parameter_in_where(self, parser):
+        """$name parses to a Parameter expression."""
+        ast = parser.parse("MATCH (n) WHERE n.age > $min_age RETURN n")
+        predicate = ast.clauses[1].predicate
+        assert isinstance(predicate, BinaryOp)
+        assert predicate.right == Parameter(name="min_age")
+
+    def test_positional_parameter(self, parser):
+        """$0 parses to a Parameter with a numeric name."""
+        ast = parser.parse("RETURN $0 AS x")
+        assert ast.clauses[0].items[0].expression == Parameter(name="0")
+
+    def test_parameter_in_pattern_properties(self, parser):
+        """Parameters can be used as inline property values."""
+        ast = parser.parse("MATCH (n:Person {name: $name}) RETURN n")
+        node = ast.clauses[0].patterns[0]["parts"][0]
+        assert node.properties == {"name": Parameter(name="name")}
+
+    def test_parameter_property_access_and_subscript(self, parser):
+        """Parameters can be the base of property access and subscripts."""
+        ast = parser.parse("RETURN $map.key AS k, $list[0] AS first")
+        items = ast.clauses[0].items
+        assert items[0].expression == PropertyAccess(base=Parameter(name="map"), property="key")
+        assert isinstance(items[1].expression, Subscript)
+        assert items[1].expression.base == Parameter(name="list")
+
+    def test_parameter_skip_and_limit(self, parser):
+        """SKIP and LIMIT take a parameter in place of an integer."""
+        ast = parser.parse("MATCH (n) RETURN n SKIP $s LIMIT $k")
+        assert ast.clauses[2].count == Parameter(name="s")
+        assert ast.clauses[3].count == Parameter(name="k")
+
+    def test_bare_dollar_is_syntax_error(self, parser):
+        """A $ without a name is rejected."""
+        with pytest.raises(LarkError):
+            parser.parse("RETURN $ AS x")
+
+    def test_invalid_parameter_name_rejected(self):
+        """Parameter names are validated."""
+        with pytest.raises(ValueError):
+            Parameter(name="a-b")
@@ -253,3 +253,36 @@ class TestPathBindingEdgeCases:
         parts = pattern["parts"]
         rel = parts[1]
         assert rel.variable == "r"  # Relationship variable preserved
+
+
+class TestShortestPathParsing:
+    """Test parsing of shortestPath() and allShortestPaths() patterns."""
+
+    def test_parse_shortest_path(self):
+        """shortestPath() marks the pattern as a single shortest path."""
+        ast = parse_cypher("MATCH p = shortestPath((a)-[:KNOWS*..5]->(b)) RETURN p")
+
+        pattern = ast.clauses[0].patterns[0]
+        assert pattern["path_variable"] == "p"
+        assert pattern["shortest"] == "single"
+        rel = pattern["parts"][1]
+        assert rel.types == ["KNOWS"]
+        assert rel.direction == Direction.OUT
+        assert (rel.min_hops, rel.max_hops) == (1, 5)
+
+    def test_parse_all_shortest_paths_without_binding(self):
+        """allShortestPaths() can be used without a path variable."""
+        ast = parse_cypher("MATCH allShortestPaths((a)-[*]-(b)) RETURN a, b")
+
+        pattern = ast.clauses[0].patterns[0]
+        assert pattern["path_variable"] is None
+        assert pattern["shortest"] == "all"
+        assert len(pattern["parts"]) == 3
+
+    def test_function_names_are_still_identifiers(self):
+        """shortestPath is only a keyword when followed by a parenthesis."""
+        ast = parse_cypher("MATCH (shortestPath) RETURN shortestPath")
+
+        pattern = ast.clauses[0].patterns[0]
+        assert "shortest" not in pattern
+        assert pattern["parts"][0].variable == "shortestPath"
@@ -19,6 +19,7 @@ from graphforge.planner.operators import (
     Remove,
     ScanNodes,
     Set,
+    ShortestPath,
     Skip,
     Subquery,
     Union,
@@ -237,6 +238,34 @@ class TestExpandMultiHopValidation:
             )
 
 
+@pytest.mark.unit
+class TestShortestPathValidation:
+    """Test ShortestPath operator validation."""
+
+    def test_invalid_direction(self):
+        """ShortestPath rejects unknown directions."""
+        with pytest.raises(ValidationError):
+            ShortestPath(src_var="a", dst_var="b", edge_types=[], direction="SIDEWAYS")
+
+    @pytest.mark.parametrize("min_hops", [-1, 2])
+    def test_min_hops_must_be_zero_or_one(self, min_hops):
+        """ShortestPath only supports minimal lengths of 0 and 1."""
+        with pytest.raises(ValidationError):
+            ShortestPath(
+                src_var="a", dst_var="b", edge_types=[], direction="OUT", min_hops=min_hops
+            )
+
+    def test_max_less_than_min(self):
+        """ShortestPath rejects max_hops below min_hops."""
+        with pytest.raises(ValidationError):
+            ShortestPath(src_var="a", dst_var="b", edge_types=[], direction="OUT", max_hops=0)
+
+    def test_defaults(self):
+        """ShortestPath defaults to one path of unbounded length."""
+        op = ShortestPath(src_var="a", dst_var="b", edge_types=["R"], direction="UNDIRECTED")
+        assert (op.min_hops, op.max_hops, op.all_paths) == (1, None, False)
+
+
 @pytest.mark.unit
 class TestSetValidation:
     """Test Set operator validation."""
@@ -0,0 +1,205 @@
+"""Tests for the read-only CSR graph snapshot.
+
+Tests cover:
+- Node and edge lookups matching the source Graph
+- Adjacency lists and iterators, typed and untyped, in every direction
+- Non-integer IDs
+- Rejected mutations
+"""
+
+import pytest
+
+from graphforge.storage.csr import CSRGraph
+from graphforge.storage.memory import Graph
+from graphforge.types.graph import EdgeRef, NodeRef
+from graphforge.types.values import CypherInt
+
+
+@pytest.fixture
+def graph():
+    """Nodes 1-4 with :A and :B edges, a self-loop and one isolated node.
+
+    1 -[:A 10]-> 2, 1 -[:B 11]-> 3, 2 -[:A 12]-> 3, 3 -[:A 13]-> 1,
+    1 -[:B 14]-> 1
+    """
+    graph = Graph()
+    nodes = {
+        i: NodeRef(id=i, labels=frozenset(["Even" if i % 2 == 0 else "Odd"]), properties={})
+        for i in range(1, 5)
+    }
+    graph.add_nodes_bulk(nodes.values())
+    for edge_id, edge_type, src, dst in [
+        (10, "A", 1, 2),
+        (11, "B", 1, 3),
+        (12, "A", 2, 3),
+        (13, "A", 3, 1),
+        (14, "B", 1, 1),
+    ]:
+        graph.add_edge(
+            EdgeRef(
+                id=edge_id,
+                type=edge_type,
+                src=nodes[src],
+                dst=nodes[dst],
+                properties={"w": CypherInt(edge_id)},
+            )
+        )
+    return graph
+
+
+def ids(elements):
+    """IDs of nodes or edges, in order."""
+    return [element.id for element in elements]
+
+
+@pytest.mark.unit
+class TestCSRLookups:
+    """Node and edge lookups."""
+
+    def test_counts_and_lookups(self, graph):
+        """Counts and lookups match the source graph."""
+        frozen = graph.freeze()
+        assert isinstance(frozen, CSRGraph)
+        assert frozen.node_count() == 4
+        assert frozen.edge_count() == 5
+        assert frozen.get_node(2) is graph.get_node(2)
+        assert frozen.get_node(99) is None
+        assert frozen.has_node(4)
+        assert not frozen.has_edge(99)
+        assert not frozen.has_edge("10")
+        edge = frozen.get_edge(11)
+        assert (edge.type, edge.src.id, edge.dst.id) == ("B", 1, 3)
+        assert edge.properties["w"].value == 11
+        assert edge == graph.get_edge(11)
+
+    def test_scans(self, graph):
+        """Label, type and full scans return the same elements as the graph."""
+        frozen = graph.freeze()
+        assert ids(frozen.get_all_nodes()) == ids(graph.get_all_nodes())
+        assert sorted(ids(frozen.get_nodes_by_label("Odd"))) == [1, 3]
+        assert frozen.get_nodes_by_label("Missing") == []
+        assert ids(frozen.get_all_edges()) == [10, 11, 12, 13, 14]
+        assert ids(frozen.get_edges_by_type("A")) == [10, 12, 13]
+        assert frozen.get_edges_by_type("C") == []
+
+    def test_statistics_at_freeze_time(self, graph):
+        """Statistics are those of the graph when it was frozen."""
+        frozen = graph.freeze()
+        assert frozen.get_statistics() == graph.get_statistics()
+        assert frozen.get_statistics().total_edges == 5
+
+    def test_string_ids(self):
+        """Non-integer IDs are looked up through a dict."""
+        graph = Graph()
+        a = NodeRef(id="a", labels=frozenset(), properties={})
+        b = NodeRef(id="b", labels=frozenset(), properties={})
+        graph.add_nodes_bulk([a, b])
+        graph.add_edge(EdgeRef(id="ab", type="R", src=a, dst=b, properties={}))
+        frozen = graph.freeze()
+        assert frozen.get_edge("ab").dst is b
+        assert frozen.get_edge(1) is None
+        assert ids(frozen.iter_neighbor_nodes("b", "IN")) == ["a"]
+
+    def test_edge_endpoint_must_be_a_node(self):
+        """An edge to a node outside the snapshot is rejected."""
+        a = NodeRef(id=1, labels=frozenset(), properties={})
+        b = NodeRef(id=2, labels=frozenset(), properties={})
+        with pytest.raises(ValueError, match="not found"):
+            CSRGraph([a], [EdgeRef(id=1, type="R", src=a, dst=b, properties={})])
+
+
+@pytest.mark.unit
+class TestCSRAdjacency:
+    """Adjacency lists and iterators."""
+
+    @pytest.mark.parametrize("types", [["A"], ["B"], ["B", "A"], ["A", "A"], ["C"]])
+    def test_adjacency_matches_graph(self, graph, types):
+        """Adjacency lists of given types match the graph's, in the same order."""
+        frozen = graph.freeze()
+        for node_id in range(1, 6):
+            assert ids(frozen.get_outgoing_edges(node_id, types)) == ids(
+                graph.get_outgoing_edges(node_id, types)
+            )
+            assert ids(frozen.get_incoming_edges(node_id, types)) == ids(
+                graph.get_incoming_edges(node_id, types)
+            )
+            for direction in ("OUT", "IN", "UNDIRECTED"):
+                expected = [
+                    (edge.id, node.id)
+                    for edge, node in graph.iter_neighbors(node_id, direction, types)
+                ]
+                steps = frozen.iter_neighbors(node_id, direction, types)
+                assert [(edge.id, node.id) for edge, node in steps] == expected
+                assert ids(frozen.iter_neighbor_nodes(node_id, direction, types)) == [
+                    node_id for _, node_id in expected
+                ]
+
+    def test_untyped_adjacency(self, graph):
+        """Without types, every edge is listed, grouped by type in first-seen order."""
+        frozen = graph.freeze()
+        for node_id in range(1, 5):
+            for direction in ("OUT", "IN", "UNDIRECTED"):
+                steps = [
+                    (edge.type, edge.id, node.id)
+                    for edge, node in frozen.iter_neighbors(node_id, direction)
+                ]
+                expected = [
+                    (edge.type, edge.id, node.id)
+                    for edge, node in graph.iter_neighbors(node_id, direction)
+                ]
+                assert sorted(steps) == sorted(expected)
+            # :A edges were added to the graph first
+            outgoing = [edge.type for edge in frozen.iter_outgoing(node_id)]
+            assert outgoing == sorted(outgoing)
+
+    def test_undirected_self_loop_once(self, graph):
+        """An undirected self-loop is yielded once."""
+        frozen = graph.freeze()
+        steps = [(edge.id, node.id) for edge, node in frozen.iter_neighbors(1, "UNDIRECTED")]
+        assert steps.count((14, 1)) == 1
+
+    def test_invalid_direction(self, graph):
+        """An unknown direction is rejected when the iterator is created."""
+        frozen = graph.freeze()
+        with pytest.raises(ValueError, match="Unknown direction"):
+            frozen.iter_neighbors(1, "SIDEWAYS")
+        with pytest.raises(ValueError, match="Unknown direction"):
+            frozen.iter_neighbor_nodes(1, "SIDEWAYS")
+
+    def test_structure_fixed_at_freeze_time(self, graph):
+        """Edges added to the graph afterwards are not seen by the snapshot."""
+        frozen = graph.freeze()
+        graph.add_edge(
+            EdgeRef(id=15, type="A", src=graph.get_node(4), dst=graph.get_node(1), properties={})
+        )
+        assert ids(frozen.get_incoming_edges(1)) == [13, 14]
+        assert frozen.edge_count() == 5
+
+
+@pytest.mark.unit
+class TestCSRReadOnly:
+    """Mutations and property indexes."""
+
+    def test_mutations_rejected(self, graph):
+        """Every mutating method raises RuntimeError."""
+        frozen = graph.freeze()
+        node = NodeRef(id=9, labels=frozenset(), properties={})
+        with pytest.raises(RuntimeError, match="read-only"):
+            frozen.add_node(node)
+        with pytest.raises(RuntimeError, match="read-only"):
+            frozen.remove_edge(10)
+        with pytest.raises(RuntimeError, match="read-only"):
+            frozen.set_property(frozen.get_node(1), "x", CypherInt(1))
+        with pytest.raises(RuntimeError, match="read-only"):
+            frozen.begin_transaction()
+        assert frozen.edge_count() == 5
+
+    def test_no_property_indexes(self, graph):
+        """Property indexes are not carried over, so lookups fall back to scans."""
+        graph.create_property_index("Odd", "name")
+        frozen = graph.freeze()
+        assert frozen.property_indexes() == []
+        assert frozen.get_property_index("Odd", "name") is None
+        assert frozen.find_nodes_by_property("Odd", "name", CypherInt(1)) is None
+        assert frozen.index_version == 0
+        assert not frozen.in_transaction
@@ -10,6 +10,7 @@ Tests cover:
 
 import pytest
 
+from graphforge.optimizer.statistics import GraphStatistics
 from graphforge.storage.memory import Graph
 from graphforge.types.graph import EdgeRef, NodeRef
 from graphforge.types.values import CypherInt, CypherString
@@ -221,6 +222,93 @@ class TestAdjacencyNavigation:
         assert edge in graph.get_outgoing_edges(1)
         assert edge in graph.get_incoming_edges(1)
 
+    def test_typed_adjacency(self):
+        """Adjacency lookups can be restricted to some relationship types."""
+        graph = Graph()
+        hub = NodeRef(id=1, labels=frozenset(), properties={})
+        others = [NodeRef(id=i, labels=frozenset(), properties={}) for i in range(2, 6)]
+        graph.add_node(hub)
+        for node in others:
+            graph.add_node(node)
+        knows = [
+            EdgeRef(id=10, type="KNOWS", src=hub, dst=others[0], properties={}),
+            EdgeRef(id=12, type="KNOWS", src=hub, dst=others[2], properties={}),
+        ]
+        likes = EdgeRef(id=11, type="LIKES", src=hub, dst=others[1], properties={})
+        owns = EdgeRef(id=13, type="OWNS", src=others[3], dst=hub, properties={})
+        for edge in (knows[0], likes, knows[1], owns):
+            graph.add_edge(edge)
+
+        assert graph.get_outgoing_edges(1, ["KNOWS"]) == knows
+        assert graph.get_outgoing_edges(1, ["LIKES", "KNOWS", "LIKES"]) == [likes, *knows]
+        assert graph.get_outgoing_edges(1, ["OWNS"]) == []
+        assert graph.get_outgoing_edges(1, []) == []
+        assert graph.get_incoming_edges(1, ["OWNS"]) == [owns]
+        assert sorted(e.id for e in graph.get_outgoing_edges(1)) == [10, 11, 12]
+
+    def test_typed_adjacency_after_removal(self):
+        """Removing the last edge of a type leaves no bucket behind."""
+        graph = Graph()
+        a = NodeRef(id=1, labels=frozenset(), properties={})
+        b = NodeRef(id=2, labels=frozenset(), properties={})
+        graph.add_node(a)
+        graph.add_node(b)
+        edge = EdgeRef(id=10, type="KNOWS", src=a, dst=b, properties={})
+        graph.add_edge(edge)
+        graph.remove_edge(10)
+
+        assert graph.get_outgoing_edges(1, ["KNOWS"]) == []
+        assert graph.get_incoming_edges(2) == []
+        # Both nodes are edge-free again, so they can be removed
+        graph.remove_node(1)
+        graph.remove_node(2)
+        assert graph.node_count() == 0
+
+    def test_iter_adjacency(self):
+        """Adjacency iterators yield what the list lookups return, without copying."""
+        graph = Graph()
+        a = NodeRef(id=1, labels=frozenset(), properties={})
+        b = NodeRef(id=2, labels=frozenset(), properties={})
+        graph.add_node(a)
+        graph.add_node(b)
+        out = EdgeRef(id=10, type="KNOWS", src=a, dst=b, properties={})
+        back = EdgeRef(id=11, type="LIKES", src=b, dst=a, properties={})
+        loop = EdgeRef(id=12, type="KNOWS", src=a, dst=a, properties={})
+        for edge in (out, back, loop):
+            graph.add_edge(edge)
+
+        assert list(graph.iter_outgoing(1)) == graph.get_outgoing_edges(1)
+        assert list(graph.iter_incoming(1, ["LIKES"])) == [back]
+        assert list(graph.iter_neighbors(1, "OUT", ["KNOWS"])) == [(out, b), (loop, a)]
+        assert list(graph.iter_neighbors(1, "IN")) == [(back, b), (loop, a)]
+        # An undirected self-loop is yielded once
+        assert list(graph.iter_neighbors(1, "UNDIRECTED")) == [(out, b), (loop, a), (back, b)]
+        assert list(graph.iter_neighbors(99, "UNDIRECTED")) == []
+
+    def test_iter_adjacency_detects_mutation(self):
+        """Adding or removing an edge while iterating raises."""
+        graph = Graph()
+        a = NodeRef(id=1, labels=frozenset(), properties={})
+        graph.add_node(a)
+        for edge_id in (10, 11):
+            graph.add_edge(EdgeRef(id=edge_id, type="R", src=a, dst=a, properties={}))
+
+        edges = graph.iter_outgoing(1)
+        graph.remove_edge(next(edges).id)
+        with pytest.raises(RuntimeError, match="changed during adjacency iteration"):
+            next(edges)
+
+        neighbors = graph.iter_neighbors(1, "IN")
+        next(neighbors)
+        graph.add_edge(EdgeRef(id=12, type="S", src=a, dst=a, properties={}))
+        with pytest.raises(RuntimeError):
+            next(neighbors)
+
+    def test_iter_neighbors_invalid_direction(self):
+        """Unknown directions are rejected when the iterator is created."""
+        with pytest.raises(ValueError, match="Unknown direction"):
+            Graph().iter_neighbors(1, "BOTH")
+
 
 @pytest.mark.unit
 class TestLabelQueries:
@@ -418,3 +506,363 @@ class TestComplexGraph:
         # All are persons
         persons = graph.get_nodes_by_label("Person")
         assert len(persons) == 3
+
+
+@pytest.mark.unit
+class TestBulkInsert:
+    """Graph.add_nodes_bulk() and add_edges_bulk()."""
+
+    def _nodes(self, count, label="Person"):
+        return [NodeRef(id=i, labels=frozenset([label]), properties={}) for i in range(count)]
+
+    def test_add_nodes_bulk_updates_indexes_and_statistics(self):
+        """Bulk-added nodes are indexed by label and counted."""
+        graph = Graph()
+        graph.add_nodes_bulk(self._nodes(5))
+
+        assert graph.node_count() == 5
+        assert len(graph.get_nodes_by_label("Person")) == 5
+        stats = graph.get_statistics()
+        assert stats.total_nodes == 5
+        assert stats.node_counts_by_label == {"Person": 5}
+
+    def test_add_nodes_bulk_with_replacement(self):
+        """Batches that replace existing nodes use add_node() semantics."""
+        graph = Graph()
+        graph.add_nodes_bulk(self._nodes(2))
+        graph.add_nodes_bulk(self._nodes(3, label="Company"))
+
+        assert graph.node_count() == 3
+        assert graph.get_nodes_by_label("Person") == []
+        assert graph.get_statistics().node_counts_by_label == {"Company": 3}
+
+    def test_add_edges_bulk_updates_adjacency_and_statistics(self):
+        """Bulk-added edges are traversable, type-indexed and counted."""
+        graph = Graph()
+        nodes = self._nodes(3)
+        graph.add_nodes_bulk(nodes)
+        graph.add_edges_bulk(
+            [
+                EdgeRef(id=1, type="KNOWS", src=nodes[0], dst=nodes[1], properties={}),
+                EdgeRef(id=2, type="KNOWS", src=nodes[0], dst=nodes[2], properties={}),
+                EdgeRef(id=3, type="LIKES", src=nodes[1], dst=nodes[2], properties={}),
+            ]
+        )
+
+        assert len(graph.get_outgoing_edges(0)) == 2
+        assert len(graph.get_incoming_edges(2)) == 2
+        assert len(graph.get_edges_by_type("KNOWS")) == 2
+        stats = graph.get_statistics()
+        assert stats.total_edges == 3
+        assert stats.avg_degree_by_type == {"KNOWS": 2.0, "LIKES": 1.0}
+
+    def test_add_edges_bulk_validates_before_adding(self):
+        """A missing endpoint rejects the whole batch."""
+        graph = Graph()
+        nodes = self._nodes(2)
+        graph.add_nodes_bulk(nodes)
+        stranger = NodeRef(id=99, labels=frozenset(), properties={})
+
+        with pytest.raises(ValueError, match="Destination node 99 not found"):
+            graph.add_edges_bulk(
+                [
+                    EdgeRef(id=1, type="R", src=nodes[0], dst=nodes[1], properties={}),
+                    EdgeRef(id=2, type="R", src=nodes[0], dst=stranger, properties={}),
+                ]
+            )
+        assert graph.edge_count() == 0
+
+    def test_add_edges_bulk_with_replacement(self):
+        """Batches that repeat an edge ID use add_edge() semantics."""
+        graph = Graph()
+        nodes = self._nodes(2)
+        graph.add_nodes_bulk(nodes)
+        graph.add_edges_bulk(
+            [
+                EdgeRef(id=1, type="A", src=nodes[0], dst=nodes[1], properties={}),
+                EdgeRef(id=1, type="B", src=nodes[1], dst=nodes[0], properties={}),
+            ]
+        )
+
+        assert graph.edge_count() == 1
+        assert graph.get_outgoing_edges(0) == []
+        assert graph.get_statistics().edge_counts_by_type == {"B": 1}
+
+
+@pytest.mark.unit
+class TestBulkRemoval:
+    """Graph.remove_edges_bulk() and remove_nodes_bulk()."""
+
+    @staticmethod
+    def _star(leaves):
+        """Hub node 0 with an outgoing :R edge to each of the leaves 1..n."""
+        graph = Graph()
+        nodes = [
+            NodeRef(id=i, labels=frozenset(["Person"]), properties={}) for i in range(leaves + 1)
+        ]
+        graph.add_nodes_bulk(nodes)
+        graph.add_edges_bulk(
+            EdgeRef(id=100 + i, type="R", src=nodes[0], dst=nodes[i], properties={})
+            for i in range(1, leaves + 1)
+        )
+        return graph
+
+    def test_remove_edges_bulk(self):
+        """Edges leave storage, adjacency, the type index and statistics."""
+        graph = self._star(4)
+        graph.remove_edges_bulk([101, 103, 101, 999])
+
+        assert sorted(edge.id for edge in graph.get_outgoing_edges(0)) == [102, 104]
+        assert graph.get_incoming_edges(1) == []
+        assert sorted(edge.id for edge in graph.get_edges_by_type("R")) == [102, 104]
+        assert graph.get_statistics().edge_counts_by_type == {"R": 2}
+
+    def test_remove_nodes_bulk_detach(self):
+        """Detaching removes the nodes' edges, then the nodes."""
+        graph = self._star(3)
+        graph.remove_nodes_bulk([0, 2, 0], detach=True)
+
+        assert sorted(node.id for node in graph.get_all_nodes()) == [1, 3]
+        assert graph.edge_count() == 0
+        stats = graph.get_statistics()
+        assert stats.total_nodes == 2
+        assert stats.node_counts_by_label == {"Person": 2}
+        assert stats.total_edges == 0
+
+    def test_remove_nodes_bulk_checks_before_removing(self):
+        """Without detach, one connected node rejects the whole batch."""
+        graph = self._star(2)
+        isolated = NodeRef(id=9, labels=frozenset(), properties={})
+        graph.add_node(isolated)
+
+        with pytest.raises(ValueError, match="still has relationships"):
+            graph.remove_nodes_bulk([9, 1])
+        assert graph.node_count() == 4
+
+    def test_remove_hub_edges_in_any_order(self):
+        """Removing a hub's edges oldest first leaves the adjacency consistent."""
+        graph = self._star(50)
+        for edge_id in range(101, 151, 2):
+            graph.remove_edge(edge_id)
+
+        assert [edge.id for edge in graph.get_outgoing_edges(0)] == list(range(102, 151, 2))
+        graph.remove_nodes_bulk([0], detach=True)
+        assert graph.edge_count() == 0
+        assert all(graph.get_incoming_edges(i) == [] for i in range(1, 51))
+
+
+class TestGraphTransactions:
+    """Tests for undo-log transactions and savepoints."""
+
+    @staticmethod
+    def _node(node_id, label="Person", **properties):
+        return NodeRef(id=node_id, labels=frozenset([label]), properties=dict(properties))
+
+    def test_rollback_reverts_added_elements(self):
+        """Nodes and edges added in a transaction are removed on rollback."""
+        graph = Graph()
+        alice = self._node(1)
+        graph.add_node(alice)
+
+        graph.begin_transaction()
+        bob = self._node(2)
+        graph.add_node(bob)
+        graph.add_edge(EdgeRef(id=1, type="KNOWS", src=alice, dst=bob, properties={}))
+        graph.rollback_transaction()
+
+        assert not graph.in_transaction
+        assert graph.node_count() == 1
+        assert graph.edge_count() == 0
+        assert graph.get_outgoing_edges(1) == []
+        assert not graph.has_node(2)
+        assert graph.get_edges_by_type("KNOWS") == []
+        stats = graph.get_statistics()
+        assert stats.total_nodes == 1
+        assert stats.node_counts_by_label == {"Person": 1}
+        assert stats.edge_counts_by_type == {}
+
+    def test_rollback_reverts_replacements_and_removals(self):
+        """Replaced and removed elements are put back on rollback."""
+        graph = Graph()
+        alice, bob = self._node(1), self._node(2)
+        graph.add_node(alice)
+        graph.add_node(bob)
+        knows = EdgeRef(id=1, type="KNOWS", src=alice, dst=bob, properties={})
+        graph.add_edge(knows)
+
+        graph.begin_transaction()
+        graph.add_node(self._node(1, label="Company"))
+        graph.remove_edge(1)
+        graph.remove_node(2)
+        graph.rollback_transaction()
+
+        assert graph.get_node(1) is alice
+        assert graph.get_nodes_by_label("Company") == []
+        assert graph.get_node(2) is bob
+        assert graph.get_outgoing_edges(1) == [knows]
+        assert graph.get_incoming_edges(2) == [knows]
+        assert graph.get_statistics().node_counts_by_label == {"Person": 2}
+        assert graph.get_statistics().edge_counts_by_type == {"KNOWS": 1}
+
+    def test_rollback_reverts_property_changes(self):
+        """Property writes and removals are reverted in place."""
+        graph = Graph()
+        alice = self._node(1, name="Alice")
+        graph.add_node(alice)
+
+        graph.begin_transaction()
+        graph.set_property(alice, "name", "Alicia")
+        graph.set_property(alice, "age", 30)
+        graph.remove_property(alice, "name")
+        graph.rollback_transaction()
+
+        assert alice.properties == {"name": "Alice"}
+
+    def test_nested_savepoints(self):
+        """Rolling back to a savepoint keeps earlier changes and the transaction."""
+        graph = Graph()
+        graph.begin_transaction()
+        graph.add_node(self._node(1))
+        outer = graph.savepoint()
+        graph.add_node(self._node(2))
+        inner = graph.savepoint()
+        graph.add_node(self._node(3))
+
+        graph.rollback_to_savepoint(inner)
+        assert graph.node_count() == 2
+        graph.rollback_to_savepoint(outer)
+        assert graph.node_count() == 1
+        assert graph.in_transaction
+
+        with pytest.raises(ValueError, match="Invalid savepoint"):
+            graph.rollback_to_savepoint(inner)
+
+        graph.commit_transaction()
+        assert graph.node_count() == 1
+        assert not graph.in_transaction
+
+    def test_rollback_of_bulk_ingest(self):
+        """Bulk-added nodes and edges are reverted like single additions."""
+        graph = Graph()
+        graph.begin_transaction()
+        nodes = [self._node(i) for i in range(3)]
+        graph.add_nodes_bulk(nodes)
+        graph.add_edges_bulk(
+            [
+                EdgeRef(id=i, type="NEXT", src=nodes[i], dst=nodes[i + 1], properties={})
+                for i in range(2)
+            ]
+        )
+        graph.rollback_transaction()
+
+        assert graph.node_count() == 0
+        assert graph.edge_count() == 0
+        assert graph.get_statistics().total_edges == 0
+
+    def test_transaction_state_errors(self):
+        """Transaction methods enforce open/closed state."""
+        graph = Graph()
+        with pytest.raises(RuntimeError, match="no open transaction"):
+            graph.savepoint()
+        with pytest.raises(RuntimeError, match="no open transaction"):
+            graph.commit_transaction()
+
+        graph.begin_transaction()
+        with pytest.raises(RuntimeError, match="already has an open transaction"):
+            graph.begin_transaction()
+
+    def test_remove_node_with_edges_raises(self):
+        """Nodes must be detached before removal."""
+        graph = Graph()
+        alice, bob = self._node(1), self._node(2)
+        graph.add_node(alice)
+        graph.add_node(bob)
+        graph.add_edge(EdgeRef(id=1, type="KNOWS", src=alice, dst=bob, properties={}))
+
+        with pytest.raises(ValueError, match="still has relationships"):
+            graph.remove_node(1)
+
+
+class TestGraphChangeTracking:
+    """Tests for recording written and deleted element IDs."""
+
+    def test_take_changes_requires_tracking(self):
+        """take_changes() fails unless tracking was enabled."""
+        with pytest.raises(RuntimeError, match="not enabled"):
+            Graph().take_changes()
+
+    def test_tracks_writes_and_deletes(self):
+        """Latest mutation per element decides written vs deleted."""
+        graph = Graph()
+        alice = NodeRef(id=1, labels=frozenset(["Person"]), properties={})
+        bob = NodeRef(id=2, labels=frozenset(["Person"]), properties={})
+        graph.add_node(alice)
+        graph.add_node(bob)
+        graph.enable_change_tracking()
+
+        graph.add_edge(EdgeRef(id=1, type="KNOWS", src=alice, dst=bob, properties={}))
+        graph.set_property(alice, "age", 30)
+        graph.remove_edge(1)
+        graph.remove_node(2)
+        graph.add_node(NodeRef(id=3, labels=frozenset(), properties={}))
+
+        changes = graph.take_changes()
+        assert changes.nodes == {1, 3}
+        assert changes.deleted_nodes == {2}
+        assert changes.edges == set()
+        assert changes.deleted_edges == {1}
+        assert not graph.take_changes()
+
+    def test_rollback_marks_reverted_elements(self):
+        """Undone additions are recorded as deletions."""
+        graph = Graph()
+        graph.enable_change_tracking()
+        graph.begin_transaction()
+        graph.add_nodes_bulk([NodeRef(id=i, labels=frozenset(), properties={}) for i in range(3)])
+        graph.rollback_transaction()
+
+        changes = graph.take_changes()
+        assert changes.nodes == set()
+        assert changes.deleted_nodes == {0, 1, 2}
+
+
+class TestGraphLoadElements:
+    """Tests for the trusted cold-start load path."""
+
+    def test_load_elements_builds_indexes_and_counters(self):
+        """Loaded elements are traversable, indexed and counted."""
+        graph = Graph()
+        nodes = [NodeRef(id=i, labels=frozenset(["Person"]), properties={}) for i in range(3)]
+        edges = [
+            EdgeRef(id=1, type="KNOWS", src=nodes[0], dst=nodes[1], properties={}),
+            EdgeRef(id=2, type="KNOWS", src=nodes[0], dst=nodes[2], properties={}),
+        ]
+        graph.load_elements(nodes, edges)
+
+        assert graph.get_outgoing_edges(0) == edges
+        assert graph.get_incoming_edges(2) == [edges[1]]
+        assert len(graph.get_nodes_by_label("Person")) == 3
+        assert len(graph.get_edges_by_type("KNOWS")) == 2
+        stats = graph.get_statistics()
+        assert stats.total_nodes == 3
+        assert stats.avg_degree_by_type == {"KNOWS": 2.0}
+
+        # Counters keep working incrementally after the load
+        graph.remove_edge(2)
+        assert graph.get_statistics().edge_counts_by_type == {"KNOWS": 1}
+
+    def test_load_elements_uses_given_statistics(self):
+        """Persisted statistics are returned until the next mutation."""
+        persisted = GraphStatistics(total_nodes=1)
+        graph = Graph()
+        graph.load_elements([NodeRef(id=1, labels=frozenset(), properties={})], [], persisted)
+
+        assert graph.get_statistics() is persisted
+
+    def test_load_elements_requires_empty_graph(self):
+        """Loading into a populated graph is rejected."""
+        graph = Graph()
+        graph.add_node(NodeRef(id=1, labels=frozenset(), properties={}))
+
+        with pytest.raises(ValueError, match="requires an empty graph"):
+            graph.load_elements([], [])
@@ -0,0 +1,269 @@
+"""Tests for property indexes on the in-memory graph."""
+
+import math
+
+import pytest
+
+from graphforge.storage.indexes import OrderedPropertyIndex, PropertyIndex, index_key
+from graphforge.storage.memory import Graph
+from graphforge.types.graph import NodeRef
+from graphforge.types.values import (
+    CypherBool,
+    CypherFloat,
+    CypherInt,
+    CypherList,
+    CypherNull,
+    CypherString,
+)
+
+
+def person(node_id, **properties):
+    """Build a Person node with the given properties."""
+    return NodeRef(id=node_id, labels=frozenset(["Person"]), properties=properties)
+
+
+def ids(nodes):
+    """IDs of a list of nodes (None passes through)."""
+    return None if nodes is None else {node.id for node in nodes}
+
+
+@pytest.mark.unit
+class TestIndexKey:
+    """Tests for index_key() and PropertyIndex lookups."""
+
+    def test_int_and_float_share_keys(self):
+        """1 and 1.0 are equal in Cypher, so they share a key."""
+        assert index_key(CypherInt(1)) == index_key(CypherFloat(1.0))
+
+    def test_booleans_are_not_numbers(self):
+        """true is not equal to 1."""
+        assert index_key(CypherBool(True)) != index_key(CypherInt(1))
+
+    def test_unkeyed_values(self):
+        """NaN and non-scalar values have no key."""
+        assert index_key(CypherFloat(math.nan)) is None
+        assert index_key(CypherList([CypherInt(1)])) is None
+
+    def test_lookup_null_and_nan_match_nothing(self):
+        """null and NaN equal nothing, so lookups return no IDs."""
+        index = PropertyIndex("i", "Person", "x")
+        index.add(1, CypherInt(1))
+        assert index.lookup(CypherNull()) == set()
+        assert index.lookup(CypherFloat(math.nan)) == set()
+
+    def test_lookup_non_scalar_requires_scan(self):
+        """Lookups with non-scalar values return None."""
+        index = PropertyIndex("i", "Person", "x")
+        assert index.lookup(CypherList([CypherInt(1)])) is None
+
+
+@pytest.mark.unit
+class TestGraphPropertyIndexes:
+    """Tests for creating, maintaining and dropping property indexes."""
+
+    def test_create_index_builds_from_existing_nodes(self):
+        """Existing nodes with the label and property are indexed."""
+        graph = Graph()
+        graph.add_node(person(1, name=CypherString("Alice")))
+        graph.add_node(person(2, name=CypherString("Bob")))
+        graph.add_node(
+            NodeRef(id=3, labels=frozenset(["Robot"]), properties={"name": CypherString("Alice")})
+        )
+
+        index = graph.create_property_index("Person", "name")
+        assert index.name == "index_Person_name"
+        assert ids(graph.find_nodes_by_property("Person", "name", CypherString("Alice"))) == {1}
+
+    def test_find_without_index_returns_none(self):
+        """Unindexed pairs signal the caller to scan."""
+        graph = Graph()
+        graph.add_node(person(1, name=CypherString("Alice")))
+        assert graph.find_nodes_by_property("Person", "name", CypherString("Alice")) is None
+
+    def test_duplicate_index_rejected(self):
+        """A label/property pair or a name can only be indexed once."""
+        graph = Graph()
+        graph.create_property_index("Person", "name", name="by_name")
+        with pytest.raises(ValueError, match="already exists"):
+            graph.create_property_index("Person", "name")
+        with pytest.raises(ValueError, match="already exists"):
+            graph.create_property_index("Person", "age", name="by_name")
+
+    def test_index_maintained_by_add_set_remove_and_delete(self):
+        """Every mutation path keeps the index in sync."""
+        graph = Graph()
+        graph.create_property_index("Person", "age")
+        alice = person(1, age=CypherInt(30))
+        graph.add_node(alice)
+        graph.add_nodes_bulk([person(2, age=CypherInt(30)), person(3)])
+
+        def find(age):
+            return ids(graph.find_nodes_by_property("Person", "age", CypherInt(age)))
+
+        assert find(30) == {1, 2}
+
+        graph.set_property(alice, "age", CypherInt(31))
+        assert find(30) == {2}
+        assert find(31) == {1}
+
+        graph.set_property(graph.get_node(3), "age", CypherFloat(30.0))
+        assert find(30) == {2, 3}
+
+        graph.remove_property(graph.get_node(2), "age")
+        assert find(30) == {3}
+
+        graph.remove_node(3)
+        assert find(30) == set()
+
+        # Replacing a node re-indexes it from its new labels and properties
+        graph.add_node(
+            NodeRef(id=1, labels=frozenset(["Robot"]), properties={"age": CypherInt(31)})
+        )
+        assert find(31) == set()
+
+    def test_drop_index(self):
+        """Dropped indexes are no longer used or maintained."""
+        graph = Graph()
+        graph.create_property_index("Person", "name", name="by_name")
+        version = graph.index_version
+
+        assert graph.drop_property_index("by_name").label == "Person"
+        assert graph.index_version > version
+        assert graph.property_indexes() == []
+        with pytest.raises(ValueError, match="No index named"):
+            graph.drop_property_index("by_name")
+
+    def test_rollback_restores_index_entries_and_definitions(self):
+        """Undo keeps indexes consistent and reverts index DDL."""
+        graph = Graph()
+        graph.create_property_index("Person", "age", name="by_age")
+        alice = person(1, age=CypherInt(30))
+        graph.add_node(alice)
+
+        graph.begin_transaction()
+        graph.set_property(alice, "age", CypherInt(40))
+        graph.add_node(person(2, age=CypherInt(30)))
+        graph.drop_property_index("by_age")
+        graph.create_property_index("Person", "name")
+        graph.rollback_transaction()
+
+        assert [index.name for index in graph.property_indexes()] == ["by_age"]
+        assert ids(graph.find_nodes_by_property("Person", "age", CypherInt(30))) == {1}
+        assert ids(graph.find_nodes_by_property("Person", "age", CypherInt(40))) == set()
+
+    def test_load_elements_fills_indexes(self):
+        """Indexes declared before a bulk load are populated by it."""
+        graph = Graph()
+        graph.create_property_index("Person", "name")
+        graph.load_elements([person(1, name=CypherString("Alice"))], [])
+        assert ids(graph.find_nodes_by_property("Person", "name", CypherString("Alice"))) == {1}
+
+    def test_index_changes_are_tracked(self):
+        """Creating or dropping an index is recorded for persistence."""
+        graph = Graph()
+        graph.enable_change_tracking()
+        graph.create_property_index("Person", "name")
+        changes = graph.take_changes()
+        assert changes
+        assert changes.indexes_changed
+        assert not graph.take_changes()
+
+
+def ordered(*values):
+    """OrderedPropertyIndex with node i + 1 entered under values[i]."""
+    index = OrderedPropertyIndex("i", "Event", "x")
+    for node_id, value in enumerate(values, start=1):
+        index.add(node_id, value)
+    return index
+
+
+@pytest.mark.unit
+class TestOrderedPropertyIndex:
+    """Tests for range, prefix and ordered scans over an OrderedPropertyIndex."""
+
+    def test_range_bounds(self):
+        """Inclusive and exclusive bounds select the right sorted slice."""
+        index = ordered(*(CypherInt(value) for value in (5, 1, 9, 3, 7)))
+        assert list(index.scan(lower=CypherInt(3), upper=CypherInt(7))) == [4, 1, 5]
+        assert list(
+            index.scan(
+                lower=CypherInt(3),
+                lower_inclusive=False,
+                upper=CypherFloat(7.0),
+                upper_inclusive=False,
+            )
+        ) == [1]
+        assert list(index.scan(upper=CypherInt(3), descending=True)) == [4, 2]
+
+    def test_prefix(self):
+        """STARTS WITH scans the contiguous run of strings with the prefix."""
+        index = ordered(*(CypherString(value) for value in ("abd", "b", "ab", "abc", "a")))
+        assert list(index.scan(prefix=CypherString("ab"))) == [3, 4, 1]
+
+    def test_ordered_iteration(self):
+        """Without bounds, a direction yields every entry in value order."""
+        index = ordered(CypherInt(2), CypherInt(1), CypherFloat(1.5))
+        assert list(index.scan(descending=False)) == [2, 3, 1]
+        assert list(index.scan(descending=True)) == [1, 3, 2]
+        assert index.scan() is None
+
+    def test_mixed_types(self):
+        """Values of other types are candidates for ranges and block ordering."""
+        index = ordered(CypherInt(1), CypherString("a"), CypherList([CypherInt(1)]))
+        assert set(index.scan(lower=CypherInt(0))) == {1, 2, 3}
+        assert index.scan(descending=False) is None
+        assert index.scan(lower=CypherInt(0), descending=False) is None
+        assert index.scan(lower=CypherInt(0), upper=CypherString("z")) is None
+
+    def test_null_bound_matches_nothing(self):
+        """Comparisons with null are never true."""
+        index = ordered(CypherInt(1))
+        assert list(index.scan(lower=CypherNull())) == []
+
+    def test_remove_keeps_sorted_values(self):
+        """Removing the last node with a value drops it from the sorted list."""
+        index = ordered(CypherInt(1), CypherInt(2), CypherInt(2), CypherNull())
+        assert index.size == 3
+        index.remove(2, CypherInt(2))
+        index.remove(1, CypherInt(1))
+        assert index.size == 1
+        assert list(index.scan(descending=False)) == [3]
+        assert index.lookup(CypherInt(1)) == set()
+
+
+@pytest.mark.unit
+class TestGraphRangeIndexes:
+    """Tests for range indexes on the Graph."""
+
+    def test_unknown_kind_rejected(self):
+        """Only hash and range indexes exist."""
+        with pytest.raises(ValueError, match="Unknown index kind"):
+            Graph().create_property_index("Person", "age", kind="btree")
+
+    def test_find_nodes_in_range_requires_range_index(self):
+        """Hash indexes cannot answer range scans."""
+        graph = Graph()
+        graph.create_property_index("Person", "age")
+        assert graph.find_nodes_in_range("Person", "age", lower=CypherInt(1)) is None
+        graph.drop_property_index("index_Person_age")
+        graph.create_property_index("Person", "age", kind="range")
+        assert graph.find_nodes_in_range("Person", "age", lower=CypherInt(1)) is not None
+
+    def test_ordered_scan_places_missing_values_like_order_by(self):
+        """Nodes without the property sort last ascending and first descending."""
+        graph = Graph()
+        graph.add_nodes_bulk(
+            [person(1, age=CypherInt(30)), person(2), person(3, age=CypherInt(20))]
+        )
+        graph.create_property_index("Person", "age", kind="range")
+
+        def scan(descending):
+            nodes = graph.find_nodes_in_range("Person", "age", descending=descending)
+            return [node.id for node in nodes]
+
+        assert scan(descending=False) == [3, 1, 2]
+        assert scan(descending=True) == [2, 1, 3]
+
+        graph.set_property(graph.get_node(2), "age", CypherInt(25))
+        assert scan(descending=False) == [3, 2, 1]
+        assert ids(graph.find_nodes_by_property("Person", "age", CypherInt(25))) == {2}
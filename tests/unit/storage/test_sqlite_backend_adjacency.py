@@ -177,3 +177,93 @@ class TestSQLiteBackendAdjacency:
                 backend.close()
             if db_path.exists():
                 db_path.unlink()
+
+    def test_save_edges_replaces_adjacency_of_rewritten_edge(self):
+        """Rewriting an edge with new endpoints leaves no stale adjacency rows."""
+        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
+            db_path = Path(tmp.name)
+
+        backend = None
+        try:
+            backend = SQLiteBackend(db_path)
+            nodes = [NodeRef(id=i, labels=frozenset(), properties={}) for i in (1, 2, 3)]
+            backend.save_nodes(nodes)
+            backend.save_edges(
+                [EdgeRef(id=10, type="REL", src=nodes[0], dst=nodes[1], properties={})]
+            )
+            backend.save_edges(
+                [EdgeRef(id=10, type="REL", src=nodes[2], dst=nodes[0], properties={})]
+            )
+            backend.commit()
+
+            assert backend.load_adjacency_out() == {3: [10]}
+            assert backend.load_adjacency_in() == {1: [10]}
+        finally:
+            if backend is not None:
+                backend.close()
+            if db_path.exists():
+                db_path.unlink()
+
+    def test_delete_edges_and_nodes(self):
+        """Deleted edges disappear from the edge and adjacency tables."""
+        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
+            db_path = Path(tmp.name)
+
+        backend = None
+        try:
+            backend = SQLiteBackend(db_path)
+            node1 = NodeRef(id=1, labels=frozenset(), properties={})
+            node2 = NodeRef(id=2, labels=frozenset(), properties={})
+            backend.save_nodes([node1, node2])
+            backend.save_edges([EdgeRef(id=10, type="REL", src=node1, dst=node2, properties={})])
+            backend.commit()
+
+            backend.delete_edges([10])
+            backend.delete_nodes([2])
+            backend.commit()
+
+            assert backend.load_all_edges() == {}
+            assert backend.load_adjacency_out() == {}
+            assert backend.load_adjacency_in() == {}
+            assert [node.id for node in backend.load_all_nodes()] == [1]
+        finally:
+            if backend is not None:
+                backend.close()
+            if db_path.exists():
+                db_path.unlink()
+
+    def test_iter_batches_stream_all_rows(self):
+        """Node and edge batches respect batch_size and cover every row."""
+        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
+            db_path = Path(tmp.name)
+
+        backend = None
+        try:
+            backend = SQLiteBackend(db_path)
+            nodes = [
+                NodeRef(id=i, labels=frozenset(["Person"]), properties={"i": CypherString(str(i))})
+                for i in range(1, 6)
+            ]
+            backend.save_nodes(nodes)
+            backend.save_edges(
+                [
+                    EdgeRef(id=10 + i, type="REL", src=nodes[i], dst=nodes[i + 1], properties={})
+                    for i in range(4)
+                ]
+            )
+            backend.commit()
+
+            node_batches = list(backend.iter_node_batches(batch_size=2))
+            assert [len(batch) for batch in node_batches] == [2, 2, 1]
+            assert node_batches[2][0].properties["i"].value == "5"
+            # Identical label blobs decode to one shared frozenset
+            assert node_batches[0][0].labels is node_batches[2][0].labels
+
+            edge_batches = list(backend.iter_edge_batches(batch_size=3))
+            assert [len(batch) for batch in edge_batches] == [3, 1]
+            assert edge_batches[1][0] == (13, "REL", 4, 5, {})
+        finally:
+            if backend is not None:
+                backend.close()
+            if db_path.exists():
+                db_path.unlink()